@@ -0,0 +1,75 @@
+"""Benchmark OutsetGrid construction and marquee rendering across grid
+engines, for catalog-style grids with many outset panels."""
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib import pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+import outset  # noqa: E402
+
+
+class GridEngineSuite:
+    """Time `OutsetGrid` stages for the "facetgrid" and "gridspec" engines."""
+
+    params = ([16, 128, 512], ["facetgrid", "gridspec"])
+    param_names = ["num_outsets", "grid_engine"]
+    timeout = 600
+
+    def setup(self, num_outsets: int, grid_engine: str) -> None:
+        rng = np.random.default_rng(1)
+        corners = rng.uniform(0, 0.9, size=(num_outsets, 2))
+        self.frames = [(x, y, x + 0.1, y + 0.1) for x, y in corners]
+        self.xs = np.linspace(0, 1, 1000)
+        self.ys = np.sin(self.xs * 20) / 2 + 0.5
+
+    def teardown(self, num_outsets: int, grid_engine: str) -> None:
+        plt.close("all")
+
+    def _make_grid(self, grid_engine: str) -> outset.OutsetGrid:
+        return outset.OutsetGrid(
+            self.frames, col_wrap=16, grid_engine=grid_engine
+        )
+
+    def time_init(self, num_outsets: int, grid_engine: str) -> None:
+        self._make_grid(grid_engine)
+
+    def time_broadcast(self, num_outsets: int, grid_engine: str) -> None:
+        grid = self._make_grid(grid_engine)
+        grid.broadcast(plt.plot, self.xs, self.ys)
+
+    def time_marqueeplot(self, num_outsets: int, grid_engine: str) -> None:
+        grid = self._make_grid(grid_engine)
+        grid.broadcast(plt.plot, self.xs, self.ys)
+        grid.marqueeplot()
+
+
+class GridPoolSuite:
+    """Time small-grid build-plot-save cycles with and without a warm
+    `GridPool`, as in a long-running rendering service."""
+
+    params = ([4, 16], [False, True])
+    param_names = ["num_outsets", "pooled"]
+
+    def setup(self, num_outsets: int, pooled: bool) -> None:
+        self.frames = [(0.1, 0.1, 0.2, 0.2)] * num_outsets
+        self.pool = outset.util.GridPool()
+        if pooled:  # warm up
+            self.pool.release(self._make_grid(pooled))
+
+    def _make_grid(self, pooled: bool) -> outset.OutsetGrid:
+        return outset.OutsetGrid(
+            self.frames,
+            grid_engine="gridspec",
+            grid_pool=self.pool if pooled else None,
+            pyplot=False,
+        )
+
+    def time_build_release(self, num_outsets: int, pooled: bool) -> None:
+        grid = self._make_grid(pooled)
+        grid.broadcast(lambda *, ax: ax.plot([0, 1], [0, 1]))
+        grid.marqueeplot()
+        if pooled:
+            self.pool.release(grid)
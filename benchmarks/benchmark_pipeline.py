@@ -0,0 +1,258 @@
+"""Benchmark `OutsetGrid` pipeline stages, scaling data rows, marquee
+frames, outset panels, and hue cardinality.
+
+Each suite is parametrized over pipeline stage. Stages preceding the
+benchmarked stage run untimed in setup, so results isolate each stage.
+Besides wall time, peak memory allocated during each stage is recorded with
+`tracemalloc`.
+
+Runs offline, in the current environment, storing results for comparison
+against a baseline commit:
+
+    asv run --python=same --set-commit-hash $(git rev-parse HEAD)
+    asv compare <baseline-commit> <candidate-commit>
+"""
+
+import abc
+import functools
+import io
+import os
+import tracemalloc
+import typing
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from matplotlib import pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import seaborn as sns  # noqa: E402
+
+import outset  # noqa: E402
+from outset import stub as otst_stub  # noqa: E402
+
+# stages run before each stage, in order
+_PREREQUISITES = {
+    "init": (),
+    "broadcast": ("init",),
+    "map_dataframe_outset": ("init", "broadcast"),
+    "map_dataframe_source": ("init", "broadcast", "map_dataframe_outset"),
+    "marqueeplot": (
+        "init",
+        "broadcast",
+        "map_dataframe_outset",
+        "map_dataframe_source",
+    ),
+    "rescale_clip_outliers": (
+        "init",
+        "broadcast",
+        "map_dataframe_outset",
+        "map_dataframe_source",
+        "marqueeplot",
+    ),
+    "stub_all_clipped_values": (
+        "init",
+        "broadcast",
+        "map_dataframe_outset",
+        "map_dataframe_source",
+        "marqueeplot",
+        "rescale_clip_outliers",
+    ),
+    "inset_outsets": (
+        "init",
+        "broadcast",
+        "map_dataframe_outset",
+        "map_dataframe_source",
+        "marqueeplot",
+    ),
+    **{
+        f"savefig_{format_}": (
+            "init",
+            "broadcast",
+            "map_dataframe_outset",
+            "map_dataframe_source",
+            "marqueeplot",
+        )
+        for format_ in ("png", "pdf", "svg")
+    },
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _make_data(num_rows: int, num_outsets: int, num_hues: int) -> pd.DataFrame:
+    """Generate clustered points, one cluster per outset, with uniformly
+    assigned hues."""
+    bytes_per_row = 64  # generated columns, plus working copies
+    available = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    if num_rows * bytes_per_row > available // 2:
+        raise NotImplementedError("insufficient memory")  # skips benchmark
+
+    rng = np.random.default_rng(1)
+    centers = rng.uniform(0, 1, size=(num_outsets, 2))
+    outsets = rng.integers(num_outsets, size=num_rows)
+    xy = centers[outsets] + rng.normal(scale=0.02, size=(num_rows, 2))
+    return pd.DataFrame(
+        {
+            "x": xy[:, 0],
+            "y": xy[:, 1],
+            "outset": outsets,
+            "hue": rng.integers(num_hues, size=num_rows),
+        },
+    )
+
+
+def _trace_peak(func: typing.Callable[[], None]) -> int:
+    """Measure peak memory allocated while running `func`, in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class _PipelineSuite(abc.ABC):
+    """Run one `OutsetGrid` pipeline stage per benchmark, after untimed
+    setup of its prerequisites.
+
+    Subclasses set `params`, with stage name last, and override
+    `_configure` to map leading params to data dimensions.
+    """
+
+    number = 1  # fresh setup for each sample, as stages mutate the grid
+    repeat = (1, 5, 60.0)
+    timeout = 1200
+
+    @abc.abstractmethod
+    def _configure(self, *params) -> typing.Tuple[int, int, int]:
+        """Get `(num_rows, num_outsets, num_hues)` for params."""
+
+    def setup(self, *params) -> None:
+        *params, stage = params
+        self.data = _make_data(*self._configure(*params))
+        self.grid = None
+        for prerequisite in _PREREQUISITES[stage]:
+            self._run(prerequisite)
+
+    def teardown(self, *params) -> None:
+        plt.close("all")
+
+    def _run(self, stage: str) -> None:
+        if stage == "init":
+            self.grid = outset.OutsetGrid(
+                self.data, x="x", y="y", col="outset", hue="hue", col_wrap=16
+            )
+        elif stage == "broadcast":
+            self.grid.broadcast(
+                plt.plot, [0.0, 1.0], [0.0, 1.0], color="gray", zorder=-1
+            )
+        elif stage == "map_dataframe_outset":
+            self.grid.map_dataframe_outset(
+                sns.scatterplot, x="x", y="y", s=1, legend=False
+            )
+        elif stage == "map_dataframe_source":
+            self.grid.map_dataframe_source(
+                sns.scatterplot, x="x", y="y", s=1, legend=False
+            )
+        elif stage == "marqueeplot":
+            self.grid.marqueeplot()
+        elif stage == "rescale_clip_outliers":
+            otst_stub.rescale_clip_outliers(self.grid.source_axes)
+        elif stage == "stub_all_clipped_values":
+            otst_stub.stub_all_clipped_values(self.grid.source_axes)
+        elif stage == "inset_outsets":
+            outset.inset_outsets(self.grid)
+        elif stage.startswith("savefig_"):
+            __, fmt = stage.split("_", 1)
+            self.grid.savefig(io.BytesIO(), format=fmt)
+        else:
+            raise ValueError(f"unknown stage {stage}")
+
+    def time_stage(self, *params) -> None:
+        self._run(params[-1])
+
+    def track_peak_traced_memory(self, *params) -> int:
+        return _trace_peak(lambda: self._run(params[-1]))
+
+    track_peak_traced_memory.unit = "bytes"
+
+
+class RowsSuite(_PipelineSuite):
+    """Scale number of data rows, with 4 outsets and 2 hues."""
+
+    params = (
+        [10**3, 10**5, 10**7, 10**8],
+        [
+            "init",
+            "map_dataframe_outset",
+            "marqueeplot",
+            "rescale_clip_outliers",
+            "stub_all_clipped_values",
+        ],
+    )
+    param_names = ["num_rows", "stage"]
+
+    def _configure(self, num_rows: int) -> typing.Tuple[int, int, int]:
+        return num_rows, 4, 2
+
+
+class OutsetsSuite(_PipelineSuite):
+    """Scale number of outset panels, with 10,000 rows and 2 hues."""
+
+    params = ([1, 16, 64, 256], [*_PREREQUISITES])
+    param_names = ["num_outsets", "stage"]
+
+    def _configure(self, num_outsets: int) -> typing.Tuple[int, int, int]:
+        return 10**4, num_outsets, 2
+
+
+class HueSuite(_PipelineSuite):
+    """Scale hue cardinality, with 10,000 rows and 4 outsets."""
+
+    params = (
+        [1, 8, 64],
+        ["init", "map_dataframe_outset", "marqueeplot", "savefig_png"],
+    )
+    param_names = ["num_hues", "stage"]
+
+    def _configure(self, num_hues: int) -> typing.Tuple[int, int, int]:
+        return 10**4, 4, num_hues
+
+
+class FramesSuite:
+    """Scale number of marquee frames drawn on one axes."""
+
+    params = ([1, 50, 500, 5000], ["marqueeplot", "savefig_png"])
+    param_names = ["num_frames", "stage"]
+    number = 1
+    repeat = (1, 5, 60.0)
+    timeout = 1200
+
+    def setup(self, num_frames: int, stage: str) -> None:
+        self.data = _make_data(10 * num_frames, num_frames, 1)
+        self.fig, self.ax = plt.subplots()
+        self.ax.scatter(self.data["x"], self.data["y"], s=1)
+        if stage != "marqueeplot":
+            self._run("marqueeplot")
+
+    def teardown(self, num_frames: int, stage: str) -> None:
+        plt.close("all")
+
+    def _run(self, stage: str) -> None:
+        if stage == "marqueeplot":
+            outset.marqueeplot(
+                self.data, x="x", y="y", outset="outset", ax=self.ax
+            )
+        elif stage == "savefig_png":
+            self.fig.savefig(io.BytesIO(), format="png")
+        else:
+            raise ValueError(f"unknown stage {stage}")
+
+    def time_stage(self, num_frames: int, stage: str) -> None:
+        self._run(stage)
+
+    def track_peak_traced_memory(self, num_frames: int, stage: str) -> int:
+        return _trace_peak(lambda: self._run(stage))
+
+    track_peak_traced_memory.unit = "bytes"
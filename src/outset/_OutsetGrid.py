@@ -1,10 +1,16 @@
 from collections import abc
 import copy
+import dataclasses
+import inspect
+import types
 import typing
 import warnings
 
 import frozendict
+from matplotlib import artist as mpl_artist
 from matplotlib import axes as mpl_axes
+from matplotlib import collections as mpl_collections
+from matplotlib import lines as mpl_lines
 from matplotlib import patches as mpl_patches
 from matplotlib import pyplot as plt
 import numpy as np
@@ -13,15 +19,185 @@ import pandas as pd
 import seaborn as sns
 
 from ._auxlib.calc_aspect_ import calc_aspect
+from ._auxlib.count_path_vertices_ import count_path_vertices
+from ._auxlib.cull_axes_ import cull_axes
+from ._auxlib.dedupe_axes_images_ import dedupe_axes_images
 from ._auxlib.equalize_aspect_ import equalize_aspect
+from ._auxlib.fingerprint_ import fingerprint
+from ._auxlib.make_gridspec_axes_ import make_gridspec_axes
+from ._auxlib.marquee_artists_ import get_marquees, pad_frame, update_marquee
+from ._auxlib.marquee_geometry_ import AxesState, layout_marqueeplot
+from ._auxlib.profile_stage_ import profiled
+from ._auxlib.record_artists_ import record_artists
+from ._auxlib.render_lock_ import render_lock
+from ._auxlib.rescale_lim_ import rescale_lim
 from ._auxlib.set_aspect_ import set_aspect
 from ._marqueeplot import marqueeplot, _prepad_axlim
 from .mark._MarkMagnifyingGlass import MarkMagnifyingGlass
 from .mark._MarkNumericalBadges import MarkNumericalBadges
+from .util._DrawCost import DrawCost
+from .util._ExtentStore import ExtentStore
+from .util._GridPool import GridPool
+from .util._MarqueeGeometry import MarqueeGeometry
 from .util._NamedFrames import NamedFrames
 from .util._SplitKwarg import SplitKwarg
 
 
+@dataclasses.dataclass
+class _MarqueeplotConfig:
+    """Pending marquee annotation configuration for an `OutsetGrid`.
+
+    Held as plain data, rather than closed over, so that grids can be
+    pickled before marquees are drawn.
+    """
+
+    data: pd.DataFrame
+    x: str
+    y: str
+    col: str
+    col_order: typing.List
+    hue: typing.Optional[str]
+    hue_order: typing.Optional[typing.List]
+    color: typing.Optional[str]
+    palette: typing.Optional[typing.Sequence]
+    row: typing.Optional[str]
+    row_order: typing.Optional[typing.List]
+    zorder: float
+    default_frame_inner_pad: float
+    default_frame_outer_pad_outset: float
+    default_frame_outer_pad_source: float
+    default_mark_glyph: typing.Type
+    marqueeplot_kws: typing.Dict
+    marqueeplot_outset_kws: typing.Dict
+    marqueeplot_source_kws: typing.Dict
+
+
+@dataclasses.dataclass(frozen=True)
+class _PlanStep:
+    """Plotting call recorded by a lazy `OutsetGrid` for deferred execution."""
+
+    method: str
+    args: typing.Tuple
+    kwargs: typing.Dict
+
+    def describe(self: "_PlanStep") -> str:
+        """Summarize call for display."""
+
+        def describe_value(value: typing.Any) -> str:
+            if isinstance(value, pd.DataFrame):
+                return f"<DataFrame {len(value)}x{len(value.columns)}>"
+            if isinstance(value, (pd.Series, np.ndarray)):
+                return f"<{type(value).__name__} {np.shape(value)}>"
+            if callable(value) and hasattr(value, "__qualname__"):
+                return value.__qualname__
+            value_repr = repr(value)
+            return value_repr if len(value_repr) <= 40 else "..."
+
+        args = [*map(describe_value, self.args)]
+        args.extend(f"{k}={describe_value(v)}" for k, v in self.kwargs.items())
+        return f"{self.method}({', '.join(args)})"
+
+
+@dataclasses.dataclass
+class _BoundArtist:
+    """Artist drawn from a data subset by `map_dataframe`, for in-place
+    updates by `OutsetGrid.update_data`."""
+
+    ax: mpl_axes.Axes
+    artist: mpl_artist.Artist
+    x: typing.Optional[str]
+    y: typing.Optional[str]
+    # (col, hue) values of the data subset plotted; None for all values
+    key: typing.Tuple[typing.Any, typing.Any]
+    # per-point face and edge colors, by level of hue column; None if uniform
+    hue: typing.Optional[str] = None
+    hue_colors: typing.Optional[typing.Tuple[typing.Dict, typing.Dict]] = None
+
+
+def _frames_to_data(
+    frames: typing.Union[
+        typing.Sequence[typing.Tuple[float, float, float, float]],
+        NamedFrames,
+    ],
+    *,
+    x: str,
+    y: str,
+    col: typing.Any,
+    hue: typing.Any,
+) -> pd.DataFrame:
+    """Spoof tidy data with one row per frame boundary point."""
+    data = pd.DataFrame.from_records(
+        [
+            {
+                x: x_,
+                y: y_,
+                col: i,
+                hue: i,
+            }
+            for i, boundary_points in (
+                frames.items()
+                if isinstance(frames, NamedFrames)
+                else enumerate(frames, start=1)
+            )
+            for x_, y_ in (
+                boundary_points
+                if len(boundary_points) == 2
+                else (boundary_points[:2], boundary_points[2:])
+            )
+        ],
+    )
+    if len(data) == 0:
+        data = pd.DataFrame({x: [], y: [], col: [], hue: []})
+    return data
+
+
+def _get_points(artist: mpl_artist.Artist) -> np.ndarray:
+    """Get data coordinates plotted by a scatter or line artist."""
+    if isinstance(artist, mpl_collections.PathCollection):
+        return np.asarray(artist.get_offsets(), dtype=float).reshape(-1, 2)
+    return np.asarray(artist.get_xydata(), dtype=float).reshape(-1, 2)
+
+
+def _calc_bounds(
+    points: typing.Iterable[np.ndarray],
+) -> typing.Optional[np.ndarray]:
+    """Find `[[xmin, ymin], [xmax, ymax]]` over point arrays, or None if no
+    finite points."""
+    points = np.concatenate([np.empty((0, 2)), *points])
+    points = points[np.isfinite(points).all(axis=1)]
+    if not len(points):
+        return None
+    return np.array([points.min(axis=0), points.max(axis=0)])
+
+
+def _is_stateless(obj: typing.Any) -> bool:
+    """Is `obj`, as a plan step argument, fully described by its fingerprint?
+
+    Bound methods and callable objects (e.g., glyph functors) may carry state
+    that changes from call to call, so repeated calls are not redundant.
+    """
+    if isinstance(obj, (list, tuple)):
+        return all(map(_is_stateless, obj))
+    elif isinstance(obj, abc.Mapping):
+        return all(map(_is_stateless, obj.values()))
+    elif not callable(obj) or isinstance(obj, type):
+        return True
+    instance = getattr(obj, "__self__", None)
+    return isinstance(
+        obj, (types.FunctionType, types.BuiltinFunctionType)
+    ) and (instance is None or isinstance(instance, types.ModuleType))
+
+
+# steps only affecting source axes, skipped if source axes are absent
+_SOURCE_METHODS = ("broadcast_source", "map_dataframe_source")
+# steps that grow axes limits on every call, so are never deduplicated
+_CUMULATIVE_METHODS = ("marqueeplot_outset", "marqueeplot_source")
+# marqueeplot kwargs affecting geometry, see `calc_marquee_geometry`
+_LAYOUT_PARAMS = frozenset(inspect.signature(layout_marqueeplot).parameters)
+# steps whose marquee geometry depends on axes layout
+_LAYOUT_SENSITIVE_METHODS = ("marqueeplot_outset", "marqueeplot_source")
+
+
 class OutsetGrid(sns.axisgrid.FacetGrid):
     """Facilitates co-display of zoomed-in axis regions transplanted across a
     subplot grid.
@@ -56,40 +232,390 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
     """
 
     __data: pd.DataFrame
-    _marqueeplot_outset: typing.Callable
-    _marqueeplot_source: typing.Callable
+    _bound_artists: typing.List[_BoundArtist]
+    _deferring_layout: bool
+    _grid_engine: str
+    _layout_stale: bool
+    _marqueeplot_config: "_MarqueeplotConfig"
+    _marqueeplot_outset_drawn: bool
+    _marqueeplot_source_drawn: bool
+    _plan: typing.Optional[typing.List[_PlanStep]]
+    _pyplot: bool
+    _unequalized_lims: typing.Optional[
+        typing.List[typing.Tuple[typing.Tuple[float, float], ...]]
+    ]
 
     source_axes: typing.Optional[mpl_axes.Axes]
     outset_axes: typing.Sequence[mpl_axes.Axes]
 
     def add_legend(self: "OutsetGrid", *args, **kwargs) -> None:
-        for ax in self.axes.flat:
-            ax.legend().set_visible(False)
-        if not self._legend_data and self._colors and self.hue_names:
-            super().add_legend(
-                title=self._hue_var,
-                handles=[
-                    mpl_patches.Patch(color=c, label=l)
-                    for c, l in zip(self._colors, self.hue_names)
-                ],
-                labels=self.hue_names,
-            )
-        else:
-            super().add_legend(*args, **kwargs)
+        if self._record("add_legend", *args, **kwargs):
+            return
+        with render_lock:  # legend placement lays out text
+            for ax in self.axes.flat:
+                ax.legend().set_visible(False)
+            if not self._legend_data and self._colors and self.hue_names:
+                labels = [*map(str, self.hue_names)]
+                super().add_legend(
+                    legend_data={
+                        l: mpl_patches.Patch(color=c, label=l)
+                        for c, l in zip(self._colors, labels)
+                    },
+                    title=self._hue_var,
+                    label_order=labels,
+                )
+            else:
+                super().add_legend(*args, **kwargs)
 
+    @profiled("OutsetGrid.tight_layout")
     def tight_layout(self: "OutsetGrid") -> None:
-        self.figure.tight_layout()
+        with render_lock:
+            self.figure.tight_layout()
+        self._layout_stale = False
+
+    @profiled("OutsetGrid.savefig")
+    def savefig(self: "OutsetGrid", *args, **kwargs) -> None:
+        """Save an image of the plot.
+
+        Wraps `matplotlib.figure.Figure.savefig`, using `bbox_inches="tight"`
+        by default. Applies any layout pass deferred by the "gridspec" grid
+        engine before saving. If the grid is lazy, recorded plotting calls are
+        executed first.
+        """
+        with render_lock:
+            self.finalize()
+            super().savefig(*args, **kwargs)
+
+    def finalize(self: "OutsetGrid") -> "OutsetGrid":
+        """Bring the figure up to date for drawing.
+
+        Executes any plotting calls recorded by a lazy grid, then applies any
+        pending layout pass. Called automatically by `savefig`; call before
+        drawing the figure by other means (e.g., interactively or by
+        blitting). No-op if the figure is already up to date.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+        """
+        if self._plan:
+            self.execute()
+        if self._layout_stale and not self._is_inset():
+            self.tight_layout()
+        return self
 
     def _finalize_grid(
         self: "OutsetGrid",
         axlabels: typing.Optional[typing.Sequence[str]] = None,
     ) -> None:
         """Finalize the annotations and layout."""
-        if not self._is_inset():
+        if self._deferring_layout:
+            # lazy execution applies one layout pass after all steps
+            self._layout_stale = True
+        elif self._grid_engine == "gridspec":
+            # defer costly layout pass over many axes until save
+            self._layout_stale = True
+        elif not self._is_inset():
             # calls to tight layout sometimes cause unwanted reversions
             # of axes insetting --- not sure why
             self.tight_layout()
 
+    def facet_axis(
+        self: "OutsetGrid",
+        row_i: int,
+        col_j: int,
+        modify_state: bool = True,
+    ) -> mpl_axes.Axes:
+        """Get the axis identified by these indices, making it active in
+        pyplot unless the grid was created with `pyplot=False`."""
+        return super().facet_axis(
+            row_i, col_j, modify_state=modify_state and self._pyplot
+        )
+
+    def facet_data(
+        self: "OutsetGrid",
+    ) -> typing.Iterator[
+        typing.Tuple[typing.Tuple[int, int, int], pd.DataFrame]
+    ]:
+        """Generator for name indices and data subsets for each facet.
+
+        For the "gridspec" grid engine, subsets are found in one pass over a
+        stable sort of the data rather than by testing every col-hue mask
+        combination. Only nonempty subsets are yielded.
+        """
+        if self._grid_engine == "facetgrid":
+            yield from super().facet_data()
+            return
+
+        data = self.data[self._not_na]
+
+        def lookup(
+            var: typing.Optional[str], names: typing.Optional[typing.List]
+        ) -> np.ndarray:
+            if not names:
+                return np.zeros(len(data), int)
+            codes = data[var].map(
+                {name: i for i, name in enumerate(names) if name is not None},
+            )
+            return codes.fillna(-1).to_numpy(int)
+
+        col_codes = lookup(self._col_var, self.col_names)
+        hue_codes = lookup(self._hue_var, self.hue_names)
+        order = np.lexsort((hue_codes, col_codes))  # stable
+        order = order[(col_codes[order] >= 0) & (hue_codes[order] >= 0)]
+        if not len(order):
+            return
+
+        keys = np.stack([col_codes[order], hue_codes[order]], axis=1)
+        bounds = np.flatnonzero(np.any(np.diff(keys, axis=0), axis=1)) + 1
+        for group in np.split(order, bounds):
+            col_j, hue_k = col_codes[group[0]], hue_codes[group[0]]
+            yield (0, int(col_j), int(hue_k)), data.iloc[group]
+
+    def _bind_artists(
+        self: "OutsetGrid",
+        ax: mpl_axes.Axes,
+        artists: typing.Sequence[mpl_artist.Artist],
+        num_marquees: int,
+        data: pd.DataFrame,
+        key: typing.Tuple[typing.Any, typing.Any],
+        plot_args: typing.Sequence,
+        plot_kwargs: typing.Dict,
+    ) -> None:
+        """Track artists drawn from a data subset by a `map_dataframe` call,
+        and tag marquees drawn with their subset's col and hue values, for
+        in-place updates by `update_data`."""
+        marquees = get_marquees(ax)[num_marquees:]
+        for marquee in marquees:
+            marquee.key = tuple(
+                facet if tag is None else tag
+                for tag, facet in zip(marquee.key, key)
+            )
+
+        marquee_artists = {
+            id(artist)
+            for marquee in marquees
+            for group in (
+                marquee.frame_patches,
+                marquee.leader_patches,
+                marquee.leader_images,
+                marquee.glyph_artists,
+            )
+            for artist in group
+        }
+        semantics = {
+            **dict(zip(("x", "y"), plot_args)),
+            **plot_kwargs,
+        }
+        hue = semantics.get("hue", None)
+        for artist in artists:
+            if id(artist) in marquee_artists:
+                continue
+            bound = _BoundArtist(
+                ax=ax,
+                artist=artist,
+                x=semantics.get("x", None),
+                y=semantics.get("y", None),
+                key=key,
+            )
+            if (
+                isinstance(artist, mpl_collections.PathCollection)
+                and isinstance(hue, str)
+                and len(artist.get_offsets()) == len(data)
+            ):
+                bound.hue = hue
+                bound.hue_colors = tuple(
+                    (
+                        dict(zip(data[hue], colors))
+                        if len(colors) == len(data)
+                        else None
+                    )
+                    for colors in (
+                        artist.get_facecolors(),
+                        artist.get_edgecolors(),
+                    )
+                )
+            self._bound_artists.append(bound)
+
+    def _facet_plot(
+        self: "OutsetGrid",
+        func: typing.Callable,
+        ax: mpl_axes.Axes,
+        plot_args: typing.Sequence,
+        plot_kwargs: typing.Dict,
+    ) -> None:
+        data = plot_kwargs.get("data", None)
+        if not isinstance(data, pd.DataFrame) or not len(data):
+            self._facet_plot_unbound(func, ax, plot_args, plot_kwargs)
+            return
+
+        num_marquees = len(get_marquees(ax))
+        with record_artists(ax) as artists:
+            self._facet_plot_unbound(func, ax, plot_args, plot_kwargs)
+        key = (
+            data[self._col_var].iloc[0],
+            None if self._hue_var is None else data[self._hue_var].iloc[0],
+        )
+        self._bind_artists(
+            ax, artists, num_marquees, data, key, plot_args, plot_kwargs
+        )
+
+    def _facet_plot_unbound(
+        self: "OutsetGrid",
+        func: typing.Callable,
+        ax: mpl_axes.Axes,
+        plot_args: typing.Sequence,
+        plot_kwargs: typing.Dict,
+    ) -> None:
+        if self._grid_engine == "facetgrid":
+            super()._facet_plot(func, ax, plot_args, plot_kwargs)
+            return
+
+        # as FacetGrid, but skip legend bookkeeping; add_legend falls back to
+        # hue palette patches
+        if str(func.__module__).startswith("seaborn"):
+            plot_kwargs = plot_kwargs.copy()
+            semantics = ["x", "y", "hue", "size", "style"]
+            for key, val in zip(semantics, plot_args):
+                plot_kwargs[key] = val
+            plot_args = []
+            plot_kwargs["ax"] = ax
+        elif not self._pyplot:
+            # no current axes to fall back on, so target axes explicitly
+            plot_kwargs = {**plot_kwargs, "ax": ax}
+        func(*plot_args, **plot_kwargs)
+        if ax.legend_ is not None:
+            ax.legend_.remove()
+
+    def _init_gridspec(
+        self: "OutsetGrid",
+        data: pd.DataFrame,
+        *,
+        col: str,
+        col_order: typing.Sequence,
+        col_wrap: typing.Optional[int],
+        hue: typing.Optional[str],
+        hue_order: typing.Optional[typing.Sequence],
+        palette: typing.Optional[typing.Sequence],
+        aspect: float = 1,
+        despine: bool = True,
+        dropna: bool = False,
+        gridspec_kws: typing.Optional[typing.Dict] = None,
+        grid_pool: typing.Optional[GridPool] = None,
+        height: float = 3,
+        hue_kws: typing.Optional[typing.Dict] = None,
+        legend_out: bool = True,
+        pyplot: bool = True,
+        sharex: bool = False,
+        sharey: bool = False,
+        subplot_kws: typing.Optional[typing.Dict] = None,
+        xlim: typing.Optional[typing.Tuple[float, float]] = None,
+        ylim: typing.Optional[typing.Tuple[float, float]] = None,
+    ) -> None:
+        """Lightweight alternative to `FacetGrid.__init__`, setting up the
+        same grid state with axes laid out over a single GridSpec.
+
+        Skips facet titles, tick label visibility bookkeeping, and layout
+        passes.
+        """
+        if sharex or sharey:
+            raise ValueError(
+                "gridspec grid engine does not support shared axes",
+            )
+        sns.axisgrid.Grid.__init__(self)
+
+        hue_names = None if hue is None else [*hue_order]
+        col_names = [*col_order]
+
+        not_na = np.ones(len(data), bool)
+        if dropna:
+            not_na &= ~data[col].isnull().to_numpy()
+            if hue is not None:
+                not_na &= ~data[hue].isnull().to_numpy()
+
+        ncol = len(col_names) if col_wrap is None else col_wrap
+        nrow = 1 if col_wrap is None else -(-len(col_names) // col_wrap)
+
+        fig, axes = (
+            make_gridspec_axes if grid_pool is None else grid_pool.acquire
+        )(
+            len(col_names),
+            nrow,
+            ncol,
+            figsize=(ncol * height * aspect, nrow * height),
+            gridspec_kws=gridspec_kws,
+            subplot_kws=subplot_kws,
+            pyplot=pyplot,
+        )
+        for ax in axes:
+            if xlim is not None:
+                ax.set_xlim(xlim)
+            if ylim is not None:
+                ax.set_ylim(ylim)
+        if col_wrap is None:
+            axes = axes.reshape(1, ncol)
+
+        self._figure = fig
+        self._axes = axes
+        self._axes_dict = dict(zip(col_names, axes.flat))
+        self._legend = None
+
+        self.data = data
+        self.row_names = []
+        self.col_names = col_names
+        self.hue_names = hue_names
+        self.hue_kws = {} if hue_kws is None else hue_kws
+
+        self._n_facets = len(col_names)
+        self._nrow = nrow
+        self._row_var = None
+        self._ncol = ncol
+        self._col_var = col
+        self._margin_titles = False
+        self._margin_titles_texts = []
+        self._col_wrap = col_wrap
+        self._hue_var = hue
+        self._colors = self._get_palette(data, hue, hue_order, palette)
+        self._legend_out = legend_out
+        self._legend_data = {}
+        self._x_var = None
+        self._y_var = None
+        self._sharex = sharex
+        self._sharey = sharey
+        self._dropna = dropna
+        self._not_na = not_na
+
+        if despine:
+            self.despine()
+
+    def __getstate__(self: "OutsetGrid") -> typing.Dict:
+        """Support pickling, e.g., to finish a partially-built grid in another
+        process.
+
+        Figure, axes, and any pending marquee configuration are pickled by
+        value. Mapped plotters and marquee kwargs (e.g., `mark_glyph`) must be
+        picklable.
+        """
+        state = self.__dict__.copy()
+        # axes sequences are views into axes array; re-derive on unpickle to
+        # keep them in sync with the grid's axes
+        state["_include_sourceplot"] = state.pop("source_axes") is not None
+        del state["outset_axes"]
+        return state
+
+    def __setstate__(self: "OutsetGrid", state: typing.Dict) -> None:
+        """Restore pickled state, as produced by `__getstate__`."""
+        state = state.copy()
+        include_sourceplot = state.pop("_include_sourceplot")
+        self.__dict__.update(state)
+        if include_sourceplot:
+            self.source_axes = self.axes.flat[0]
+            self.outset_axes = self.axes.flat[1:]
+        else:
+            self.source_axes = None
+            self.outset_axes = self.axes.flat[:]
+
     def _is_inset(self: "OutsetGrid") -> bool:
         """Are outset axes inset over source axes?"""
         return (
@@ -99,6 +625,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
             < self.source_axes.get_position().corners()[-1][0]
         )
 
+    @profiled("OutsetGrid")
     def __init__(
         self: "OutsetGrid",
         data: typing.Union[
@@ -117,10 +644,14 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         hue_order: typing.Optional[typing.Sequence[str]] = None,
         color: typing.Optional[str] = None,  # pass to override outset hues
         include_sourceplot: bool = True,
+        grid_engine: typing.Literal["facetgrid", "gridspec"] = "facetgrid",
         marqueeplot_kws: typing.Dict = frozendict.frozendict(),
         marqueeplot_outset_kws: typing.Dict = frozendict.frozendict(),
         marqueeplot_source_kws: typing.Dict = frozendict.frozendict(),
+        grid_pool: typing.Optional[GridPool] = None,
+        lazy: bool = False,
         palette: typing.Optional[typing.Sequence] = None,
+        pyplot: bool = True,
         zorder: float = 0.0,
         **kwargs,
     ) -> None:
@@ -196,6 +727,16 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
             Color for all outset annotations. Overrides the palette.
         include_sourceplot : bool, default True
             Whether to include the original source plot in the grid.
+        grid_engine : Literal["facetgrid", "gridspec"], default "facetgrid"
+            How should subplot axes be constructed?
+
+            If "facetgrid", axes are set up by seaborn's `FacetGrid`. If
+            "gridspec", axes are laid out over a single matplotlib GridSpec,
+            skipping facet titles, legend data bookkeeping, and per-call
+            layout passes (layout is applied once, by `savefig` or
+            `tight_layout`). Prefer "gridspec" for grids with many outset
+            panels. The "gridspec" engine does not support `row` faceting or
+            shared axes.
         marqueeplot_kws : Dict, default frozendict()
             Keyword arguments to adjust marquee placement and styling over all
             plots.
@@ -211,8 +752,34 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
             source plot, if present.
 
             See `outset.marqueeplot` for available options.
+        grid_pool : Optional[outset.util.GridPool], default None
+            Pool to check out figure and axes from, rather than creating them
+            anew. Requires the "gridspec" grid engine.
+
+            Call `grid_pool.release` on the grid once finished with it, to
+            return its figure and axes to the pool.
+        lazy : bool, default False
+            Should plotting calls be recorded as a plan, rather than run
+            immediately?
+
+            If True, calls to `broadcast`, `map_dataframe`, `marqueeplot`,
+            `equalize_aspect`, and `add_legend` (and their outset/source
+            variants) are deferred until `execute` or `savefig`. The whole
+            plan is then optimized before drawing: identical calls repeated
+            with nothing drawn in between are skipped, layout passes are
+            batched (rather than applied after every call), and data outside
+            each panel's final viewport is culled. See `explain`.
         palette : Optional[Sequence], default None
             Color palette for the outset hue sequence.
+        pyplot : bool, default True
+            Should the grid's figure be managed through pyplot?
+
+            If False, the figure is not registered with pyplot's figure
+            manager, and no pyplot global state (i.e., current figure and
+            axes) is read or modified; independent grids may then be built
+            concurrently across threads. Requires the "gridspec" grid engine.
+            Non-seaborn plotters passed to `map_dataframe` or `broadcast` must
+            accept an `ax` kwarg. Use `savefig` to render.
         zorder : float, default 0.0
             The z-order for plotting elements.
         **kwargs : dict
@@ -274,32 +841,10 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
                 col = hue if isinstance(hue, str) else "_outset"
             if hue is True:
                 hue = col
-            data = pd.DataFrame.from_records(
-                [
-                    {
-                        x: x_,
-                        y: y_,
-                        col: i,
-                        hue: i,
-                    }
-                    for i, boundary_points in (
-                        data.items()
-                        if isinstance(data, NamedFrames)
-                        else enumerate(data, start=1)
-                    )
-                    for x_, y_ in (
-                        boundary_points
-                        if len(boundary_points) == 2
-                        else (boundary_points[:2], boundary_points[2:])
-                    )
-                ],
-            )
+            data = _frames_to_data(data, x=x, y=y, col=col, hue=hue)
             default_frame_inner_pad = 0
             default_frame_outer_pad_source = 0
 
-            if len(data) == 0:
-                data = pd.DataFrame({x: [], y: [], col: [], hue: []})
-
         if not x in data.columns:
             raise ValueError(f"kwarg x={x} must be provided as column in data")
         if not y in data.columns:
@@ -347,24 +892,59 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
 
         # initialize axes
         #######################################################################
-        super().__init__(  # initialize parent FacetGrid
-            data,
-            col=col,
-            col_order=col_order,
-            col_wrap=col_wrap,
-            hue=hue,
-            hue_order=hue_order,
-            palette=palette,
-            **{
-                "legend_out": True,
-                "sharex": False,
-                "sharey": False,
-                **kwargs,
-            },
-        )
-
-        if col in ("_dummy_col", "_outset"):
-            self.set_titles(col_template="")
+        self._bound_artists = []
+        self._deferring_layout = False
+        self._grid_engine = grid_engine
+        self._layout_stale = False
+        self._plan = None  # run setup calls below immediately
+        self._unequalized_lims = None
+        self._pyplot = pyplot
+        if grid_engine == "facetgrid":
+            if not pyplot:
+                raise ValueError(
+                    "pyplot=False requires the 'gridspec' grid engine",
+                )
+            if grid_pool is not None:
+                raise ValueError(
+                    "grid_pool requires the 'gridspec' grid engine",
+                )
+            super().__init__(  # initialize parent FacetGrid
+                data,
+                col=col,
+                col_order=col_order,
+                col_wrap=col_wrap,
+                hue=hue,
+                hue_order=hue_order,
+                palette=palette,
+                **{
+                    "legend_out": True,
+                    "sharex": False,
+                    "sharey": False,
+                    **kwargs,
+                },
+            )
+            if col in ("_dummy_col", "_outset"):
+                self.set_titles(col_template="")
+        elif grid_engine == "gridspec":
+            if kwargs.get("row", None) is not None:
+                raise ValueError("gridspec grid engine does not support row")
+            self._init_gridspec(
+                data,
+                col=col,
+                col_order=col_order,
+                col_wrap=col_wrap,
+                hue=hue,
+                hue_order=hue_order,
+                grid_pool=grid_pool,
+                palette=palette,
+                pyplot=pyplot,
+                **{k: v for k, v in kwargs.items() if k != "row_order"},
+            )
+        else:
+            raise ValueError(
+                "grid_engine must be 'facetgrid' or 'gridspec', "
+                f"not {grid_engine}",
+            )
 
         if "_x" in data.columns:
             self.set_axis_labels(x_var="")
@@ -386,7 +966,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
 
         # ensure axlims set when no marqueeplot call
         def initialize_axlims(data: pd.DataFrame, **kwargs: dict) -> None:
-            ax = kwargs.get("ax", plt.gca())
+            ax = kwargs["ax"] if "ax" in kwargs else plt.gca()
             xs, ys = data[x].dropna(), data[y].dropna()
             if len(xs):
                 lowerx, upperx = xs.min(), xs.max()
@@ -401,161 +981,838 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
 
         self.map_dataframe_outset(initialize_axlims)
 
-        # draw sourceplot
+        # stash marquee configuration for deferred drawing
         #######################################################################
-        default_draw_glyph_functor_class = (
-            MarkMagnifyingGlass
-            if len(self.outset_axes) == 1
-            and (hue is None or len(hue_order) == 1)
-            else MarkNumericalBadges
+        self._marqueeplot_config = _MarqueeplotConfig(
+            data=data,
+            x=x,
+            y=y,
+            col=col,
+            col_order=[*col_order],
+            hue=hue,
+            hue_order=opyt.apply_if(hue_order, list),
+            color=color,
+            palette=palette,
+            row=kwargs.get("row", None),
+            row_order=opyt.apply_if(kwargs.get("row_order", None), list),
+            zorder=zorder,
+            default_frame_inner_pad=default_frame_inner_pad,
+            default_frame_outer_pad_outset=default_frame_outer_pad_outset,
+            default_frame_outer_pad_source=default_frame_outer_pad_source,
+            default_mark_glyph=(
+                MarkMagnifyingGlass
+                if len(self.outset_axes) == 1
+                and (hue is None or len(hue_order) == 1)
+                else MarkNumericalBadges
+            ),
+            marqueeplot_kws={**marqueeplot_kws},
+            marqueeplot_outset_kws={**marqueeplot_outset_kws},
+            marqueeplot_source_kws={**marqueeplot_source_kws},
         )
+        self._marqueeplot_outset_drawn = False
+        self._marqueeplot_source_drawn = False
+        self._plan = [] if lazy else None
 
-        def marqueeplot_source(self_: "OutsetGrid") -> None:
-            data_ = data
-            if self_.source_axes is None:
-                return
-            if kwargs.get("row", None) is not None:
-                row = kwargs["row"]
-                row_order = [*kwargs.get("row_order", [])]
-                if len(row_order) != 1:
-                    raise NotImplementedError(
-                        "row_order must be provided and length 1",
-                    )
-                data_ = data_[data_[row].isin(row_order)].reset_index()
-            marqueeplot(
-                data_,
-                x=x,
-                y=y,
-                hue=hue,
-                hue_order=hue_order,
-                outset=col,
-                outset_order=col_order,
-                ax=self_.source_axes,
-                **{
-                    "color": color,
-                    "palette": palette,
-                    "frame_inner_pad": default_frame_inner_pad,
-                    "frame_outer_pad": default_frame_outer_pad_source,
-                    "mark_glyph": default_draw_glyph_functor_class,
-                    "tight_axlim": False,
-                    "zorder": zorder,
-                    **copy.deepcopy(marqueeplot_kws),  # for mark_glyph
-                    **marqueeplot_source_kws,
-                    "frame_edge_kws": {
-                        **marqueeplot_kws.get("frame_edge_kws", {}),
-                        **marqueeplot_source_kws.get("frame_edge_kws", {}),
-                    },
-                    "frame_face_kws": {
-                        **marqueeplot_kws.get("frame_face_kws", {}),
-                        **marqueeplot_source_kws.get("frame_face_kws", {}),
-                    },
-                    "leader_edge_kws": {
-                        **marqueeplot_kws.get("leader_edge_kws", {}),
-                        **marqueeplot_source_kws.get("leader_edge_kws", {}),
-                    },
-                    "leader_face_kws": {
-                        **marqueeplot_kws.get("leader_face_kws", {}),
-                        **marqueeplot_source_kws.get("leader_face_kws", {}),
-                    },
-                    "mark_glyph_kws": {
-                        "markersize": 16,
-                        "zorder": zorder + 1.01,
-                        **marqueeplot_kws.get("mark_glyph_kws", {}),
-                        **marqueeplot_source_kws.get("mark_glyph_kws", {}),
+    def _record(self: "OutsetGrid", method: str, *args, **kwargs) -> bool:
+        """If lazy, record call to `method` for deferred execution.
+
+        Returns
+        -------
+        bool
+            Was the call recorded, rather than to be run immediately?
+        """
+        if self._plan is None:
+            return False
+        self._plan.append(_PlanStep(method, args, kwargs))
+        return True
+
+    def _optimize_plan(
+        self: "OutsetGrid",
+    ) -> typing.List[typing.Tuple[_PlanStep, typing.Optional[str]]]:
+        """Pair each recorded step with the reason it will be skipped, or None
+        if it will run."""
+        # key of last step run on source and on outset axes, as a step only
+        # duplicates an earlier one if no other step drew in between
+        optimized, previous = [], {"source": None, "outset": None}
+        for step in self._plan:
+            try:
+                key = (
+                    fingerprint(step.method, step.args, step.kwargs)
+                    if _is_stateless((step.args, step.kwargs))
+                    else None
+                )
+            except ValueError:  # e.g., lambda plotter; never deduplicated
+                key = None
+            targets = [
+                target
+                for target in previous
+                if not step.method.endswith(("_source", "_outset"))
+                or step.method.endswith(f"_{target}")
+            ]
+
+            if self.source_axes is None and step.method in _SOURCE_METHODS:
+                reason = "no source axes"
+            elif key is None or step.method in _CUMULATIVE_METHODS:
+                reason = None
+            elif all(previous[target] == key for target in targets):
+                reason = "repeats previous step"
+            else:
+                reason = None
+
+            if reason is None:
+                previous.update((target, key) for target in targets)
+            optimized.append((step, reason))
+        return optimized
+
+    def explain(self: "OutsetGrid") -> str:
+        """Describe how recorded plotting calls will be run by `execute`.
+
+        Requires the grid to be created with `lazy=True`.
+
+        Returns
+        -------
+        str
+            Human-readable listing of planned steps, in order, with skipped
+            steps annotated.
+        """
+        if self._plan is None:
+            raise ValueError("explain requires a grid created with lazy=True")
+
+        optimized = self._optimize_plan()
+        num_run = sum(reason is None for __, reason in optimized)
+        lines = [f"OutsetGrid plan: {num_run} of {len(optimized)} calls to run"]
+        step_num, layout_stale = 0, False
+        for step, reason in optimized:
+            if reason is not None:
+                lines.append(f"   -  {step.describe()}  [skip: {reason}]")
+                continue
+            if layout_stale and step.method in _LAYOUT_SENSITIVE_METHODS:
+                lines.append("      <layout pass>")
+                layout_stale = False
+            layout_stale |= self._grid_engine == "facetgrid"
+            step_num += 1
+            lines.append(f"  {step_num:>2}. {step.describe()}")
+        lines.extend(
+            [
+                "      <layout pass>",
+                "      <cull points outside final axes viewports>",
+            ]
+        )
+        return "\n".join(lines)
+
+    def calc_draw_cost(self: "OutsetGrid") -> typing.List[DrawCost]:
+        """Tally artists and draw workload on each axes.
+
+        If the grid is lazy, recorded plotting calls are executed first.
+
+        Returns
+        -------
+        List[outset.util.DrawCost]
+            Tally for each axes, in `axes.flat` order (i.e., source axes
+            first, if included). Sum for grid totals.
+        """
+        if self._plan:
+            self.execute()
+        return [DrawCost.measure(ax) for ax in self.axes.flat]
+
+    def calc_marquee_geometry(
+        self: "OutsetGrid",
+        equalize_aspect: bool = True,
+        preserve_aspect: bool = False,
+    ) -> typing.List[MarqueeGeometry]:
+        """Compute marquee geometry as `marqueeplot` would draw it on each
+        axes, without creating artists or rendering.
+
+        Axes are not modified. Geometry is computed from axes limits and sizes
+        as they currently stand, so plotting calls still pending on a lazy
+        grid are not accounted for. Likewise, axes resizing by the layout
+        pass that follows drawing is not accounted for, which may shift final
+        axes limits under `preserve_aspect`.
+
+        Parameters
+        ----------
+        equalize_aspect : bool, optional, default: True
+            As for `marqueeplot`.
+        preserve_aspect : bool, optional, default: False
+            As for `marqueeplot`.
+
+        Returns
+        -------
+        List[outset.util.MarqueeGeometry]
+            Geometry for each axes, in `axes.flat` order (i.e., source axes
+            first, if included).
+        """
+        cfg = self._marqueeplot_config
+        states = {ax: AxesState.from_axes(ax) for ax in self.axes.flat}
+        layouts = {ax: [] for ax in self.axes.flat}
+
+        def select_kws(*kws: typing.Dict) -> typing.Dict:
+            return {
+                k: v for d in kws for k, v in d.items() if k in _LAYOUT_PARAMS
+            }
+
+        # as _draw_marqueeplot_source
+        if self.source_axes is not None:
+            data = cfg.data
+            if cfg.row is not None:
+                data = data[data[cfg.row].isin(cfg.row_order)].reset_index()
+            state = states[self.source_axes]
+            aspect = state.calc_aspect()
+            layouts[self.source_axes] = layout_marqueeplot(
+                state,
+                data,
+                x=cfg.x,
+                y=cfg.y,
+                hue=cfg.hue,
+                hue_order=cfg.hue_order,
+                outset=cfg.col,
+                outset_order=cfg.col_order,
+                ax=self.source_axes,
+                **select_kws(
+                    {
+                        "frame_inner_pad": cfg.default_frame_inner_pad,
+                        "frame_outer_pad": cfg.default_frame_outer_pad_source,
+                        "tight_axlim": False,
                     },
-                },
+                    cfg.marqueeplot_kws,
+                    cfg.marqueeplot_source_kws,
+                ),
             )
+            if preserve_aspect:
+                state.set_aspect(aspect)
+
+        # as _draw_marqueeplot_outset, mapped over data facets; prepadding
+        # across hues leaves outset axes limits unchanged, so is skipped
+        aspects = [states[ax].calc_aspect() for ax in self.outset_axes]
+        outset_kws = select_kws(
+            {
+                "frame_inner_pad": cfg.default_frame_inner_pad,
+                "frame_outer_pad": cfg.default_frame_outer_pad_outset,
+                "frame_outer_pad_unit": "axes",
+                "leader_stretch": 0.2,
+                "leader_stretch_unit": "inchesfrom",
+                "tight_axlim": cfg.hue is None or cfg.hue == cfg.col,
+            },
+            cfg.marqueeplot_kws,
+            cfg.marqueeplot_outset_kws,
+        )
+        for (row_i, col_j, __), data in self.facet_data():
+            if not data.values.size:
+                continue
+            if self._dropna:
+                data = data.dropna()
+            ax = self.facet_axis(row_i, col_j, modify_state=False)
+            key = (
+                data[self._col_var].iloc[0],
+                None if self._hue_var is None else data[self._hue_var].iloc[0],
+            )
+            for layout in layout_marqueeplot(
+                states[ax], data, x=cfg.x, y=cfg.y, ax=ax, **outset_kws
+            ):
+                layout.key = key
+                layouts[ax].append(layout)
+        if preserve_aspect:
+            for ax, aspect in zip(self.outset_axes, aspects):
+                states[ax].set_aspect(aspect)
 
-        self._marqueeplot_source = marqueeplot_source
+        # as equalize_aspect
+        if equalize_aspect and self.source_axes is not None:
+            aspect = states[self.source_axes].calc_aspect()
+            for ax in self.outset_axes:
+                states[ax].set_aspect(aspect)
+        elif equalize_aspect and len(self.axes.flat):
+            aspects = [state.calc_aspect() for state in states.values()]
+            aspect = np.sqrt(min(aspects) * max(aspects))  # geometric mean
+            for state in states.values():
+                state.set_aspect(aspect)
+
+        return [
+            MarqueeGeometry._from_layouts(
+                layouts[ax], states[ax].xlim, states[ax].ylim
+            )
+            for ax in self.axes.flat
+        ]
 
-        # draw outplots
+    @profiled("OutsetGrid.optimize_vector_export")
+    def optimize_vector_export(
+        self: "OutsetGrid",
+        *,
+        cull: bool = True,
+        dedupe_images: bool = True,
+        rasterize_vertices: typing.Optional[int] = 10_000,
+    ) -> "OutsetGrid":
+        """Reduce vector output (e.g., PDF, SVG) file size toward proportion
+        with visible content, before saving.
+
+        Broadcast plotting calls draw the full dataset on every axes, which
+        vector formats otherwise embed in full, clipped only visually.
+        Marquee annotations are kept vector.
+
+        Call after all plotting, including `marqueeplot`. Culled points are
+        not restored if axes limits are later changed. If the grid is lazy,
+        recorded plotting calls are executed first.
+
+        Parameters
+        ----------
+        cull : bool, default True
+            Should scatter points and line vertices outside each axes'
+            viewport, plus marker size and stroke width, be dropped?
+        dedupe_images : bool, default True
+            Should identical callout leader gradient images be embedded once?
+
+            Takes effect for backends that reuse image objects (e.g., PDF).
+            For SVG, see `outset.save_marquee_svg`, which replaces gradient
+            images entirely.
+        rasterize_vertices : int, optional, default 10_000
+            Rasterize artists drawing more path vertices than this, counting
+            marker paths once per marker. Rasterized at savefig dpi.
+
+            If None, no artists are rasterized.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+        """
+        if self._plan:
+            self.execute(cull=cull)
+        elif cull:
+            for ax in self.axes.flat:
+                cull_axes(ax)
+
+        for ax in self.axes.flat:
+            marquee_artists = {
+                id(artist)
+                for marquee in get_marquees(ax)
+                for artist in (
+                    *marquee.frame_patches,
+                    *marquee.leader_patches,
+                    *marquee.leader_images,
+                    *marquee.glyph_artists,
+                )
+            }
+            if dedupe_images:
+                dedupe_axes_images(
+                    image
+                    for marquee in get_marquees(ax)
+                    for image in marquee.leader_images
+                )
+            if rasterize_vertices is None:
+                continue
+            for artist in (*ax.collections, *ax.lines, *ax.patches):
+                if (
+                    id(artist) not in marquee_artists
+                    and count_path_vertices(artist) > rasterize_vertices
+                ):
+                    artist.set_rasterized(True)
+        return self
+
+    def assert_budget(
+        self: "OutsetGrid",
+        *,
+        max_artists: typing.Optional[int] = None,
+        max_clip_paths: typing.Optional[int] = None,
+        max_cost: typing.Optional[float] = None,
+        max_mathtext: typing.Optional[int] = None,
+        max_path_vertices: typing.Optional[int] = None,
+        per_axes: bool = False,
+    ) -> "OutsetGrid":
+        """Check draw cost against limits, e.g., to catch regressions that
+        multiply artists.
+
+        Parameters
+        ----------
+        max_artists : Optional[int], default None
+            Maximum number of artists, marquee and data artists combined.
+        max_clip_paths : Optional[int], default None
+            Maximum number of path-clipped artists.
+        max_cost : Optional[float], default None
+            Maximum estimated draw cost, in approximate milliseconds.
+
+            See `outset.util.DrawCost.estimated_cost`.
+        max_mathtext : Optional[int], default None
+            Maximum number of mathtext strings rendered.
+        max_path_vertices : Optional[int], default None
+            Maximum number of path vertices drawn.
+        per_axes : bool, default False
+            If True, apply limits to each axes individually, rather than to
+            grid totals.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+
+        Raises
+        ------
+        AssertionError
+            If any limit is exceeded, listing all exceeded limits.
+        """
+        costs = self.calc_draw_cost()
+        if not per_axes:
+            costs = [sum(costs, DrawCost())]
+
+        limits = {
+            "num_artists": max_artists,
+            "clip_paths": max_clip_paths,
+            "estimated_cost": max_cost,
+            "mathtext": max_mathtext,
+            "path_vertices": max_path_vertices,
+        }
+        exceeded = [
+            f"{'grid' if not per_axes else f'axes {i}'} {name} "
+            f"{getattr(cost, name):g} exceeds budget {limit:g}"
+            for i, cost in enumerate(costs)
+            for name, limit in limits.items()
+            if limit is not None and getattr(cost, name) > limit
+        ]
+        if exceeded:
+            raise AssertionError("; ".join(exceeded))
+        return self
+
+    @profiled("OutsetGrid.execute")
+    def execute(self: "OutsetGrid", *, cull: bool = True) -> "OutsetGrid":
+        """Run plotting calls recorded by a lazy grid, as shown by `explain`.
+
+        Called automatically by `savefig`. No-op if no calls are pending.
+
+        Parameters
+        ----------
+        cull : bool, default True
+            Should scatter points and line vertices outside each axes' final
+            viewport be dropped after plotting, to reduce rendering cost?
+
+            Culled points are not restored if axes limits are later changed.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+        """
+        if not self._plan:
+            return self
+
+        steps = [step for step, reason in self._optimize_plan() if not reason]
+        self._plan = None  # run steps directly, rather than recording them
+        self._deferring_layout = True
+        try:
+            for step in steps:
+                if self._layout_stale and step.method in (
+                    _LAYOUT_SENSITIVE_METHODS
+                ):
+                    # marquee geometry depends on axes layout, so catch up
+                    self._deferring_layout = False
+                    self._finalize_grid()
+                    self._deferring_layout = True
+                getattr(self, step.method)(*step.args, **step.kwargs)
+        finally:
+            self._plan = []
+            self._deferring_layout = False
+
+        if self._layout_stale:
+            self._finalize_grid()  # single layout pass, or defer to save
+        if cull:
+            for ax in self.axes.flat:
+                cull_axes(ax)
+        return self
+
+    @profiled("OutsetGrid.update_data")
+    def update_data(
+        self: "OutsetGrid",
+        data: pd.DataFrame,
+        *,
+        extents: typing.Optional[ExtentStore] = None,
+    ) -> "OutsetGrid":
+        """Swap in new data, updating the existing figure in place.
+
+        Treats the grid as a template: artists drawn by `map_dataframe`
+        calls, and marquee annotations, are moved to reflect `data` without
+        creating new axes or artists. Axes viewports are shifted and rescaled
+        so framed regions keep their placement, and aspect is re-equalized
+        if previously equalized. Artists drawn by `broadcast` calls are left
+        unchanged.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            New data, with the same columns as the grid's initial data.
+
+            Every col and hue value framed by a marquee must be present.
+        extents : Optional[outset.util.ExtentStore], default None
+            Incrementally maintained extents to position marquee frames from,
+            rather than recomputing extents over all of `data`.
+
+            Must be grouped by the grid's col and hue, and hold every framed
+            col and hue value. May cover a trailing window of rows.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+
+        Raises
+        ------
+        ValueError
+            If `data` cannot be swapped in place --- e.g., if it lacks a framed
+            subset, or if plotted artists aren't scatter points or lines, or
+            map per-point properties other than `hue`.
+
+        Notes
+        -----
+        Scatter points and line vertices are updated from `data` rows in
+        order. Aggregating plotters (e.g., `seaborn.lineplot` with error
+        bands) are not supported.
+        """
+        if self._plan:
+            self.execute()
+
+        cfg = self._marqueeplot_config
+        x, y, col, hue = cfg.x, cfg.y, cfg.col, cfg.hue
+        if col == "_dummy_col":
+            data = data.assign(_dummy_col=0)
+        for column in (x, y, col, hue):
+            if column is not None and column not in data.columns:
+                raise ValueError(f"data is missing column {column}")
+        if extents is not None and (
+            (extents.x, extents.y) != (x, y)
+            or col not in (extents.col, "_dummy_col")
+            or extents.hue != hue
+        ):
+            raise ValueError("extents columns must match grid x, y, col, hue")
+
+        def select(key: typing.Tuple[typing.Any, typing.Any]) -> pd.DataFrame:
+            mask = np.ones(len(data), bool)
+            for column, value in zip((col, hue), key):
+                if value is not None:
+                    mask &= (data[column] == value).to_numpy()
+            return data[mask]
+
+        # plan updates, before modifying anything
         #######################################################################
-        def marqueeplot_outset(self_: "OutsetGrid") -> None:
-            # setup
-            for d in marqueeplot_kws, marqueeplot_outset_kws:
-                for k, v in d.items():
-                    if k == "mark_glyph" and isinstance(v, type):
-                        d[k] = v()
-
-            needs_prepad = not (hue is None or hue == col)
-            if needs_prepad:
-                # need to prepad without split by hue
-                prepad_kws = {
-                    "frame_inner_pad": default_frame_inner_pad,
-                    "frame_outer_pad": default_frame_outer_pad_outset,
-                    "frame_outer_pad_unit": "axes",
-                }
-                fil = data[col].isin(col_order)
-                if hue is not None:
-                    assert hue_order is not None
-                    fil &= data[hue].isin(hue_order)
-                self.broadcast_outset(
-                    _prepad_axlim,
-                    data=data[fil],
-                    x=x,
-                    y=y,
-                    hue=hue,
-                    outset=col,
-                    tight_axlim=True,
-                    **{
-                        **prepad_kws,
-                        **{
-                            k: v
-                            for k, v in marqueeplot_kws.items()
-                            if k in prepad_kws
-                        },
-                        **{
-                            k: v
-                            for k, v in marqueeplot_outset_kws.items()
-                            if k in prepad_kws
-                        },
-                    },
+        bound_updates = []
+        for bound in self._bound_artists:
+            if isinstance(bound.artist, mpl_collections.PathCollection):
+                num_points = len(bound.artist.get_offsets())
+                per_point = [
+                    len(values) == num_points > 1
+                    for values in (
+                        bound.artist.get_sizes(),
+                        bound.artist.get_facecolors(),
+                        bound.artist.get_edgecolors(),
+                    )
+                ]
+                if per_point[0] or (
+                    any(per_point[1:]) and bound.hue_colors is None
+                ):
+                    raise ValueError(
+                        "cannot update scatter with per-point properties "
+                        "other than hue in place",
+                    )
+            elif not isinstance(bound.artist, mpl_lines.Line2D):
+                raise ValueError(
+                    f"cannot update {type(bound.artist).__name__} in place",
+                )
+            if not isinstance(bound.x, str) or not isinstance(bound.y, str):
+                raise ValueError("cannot update artists without x and y")
+            subset = select(bound.key)
+            colors = [None, None]  # facecolors, edgecolors
+            for i, hue_colors in enumerate(bound.hue_colors or ()):
+                if hue_colors is not None:
+                    try:
+                        colors[i] = [hue_colors[v] for v in subset[bound.hue]]
+                    except KeyError as e:
+                        raise ValueError(f"unknown hue value {e}") from e
+            bound_updates.append(
+                (bound, colors, subset[[bound.x, bound.y]].to_numpy(float)),
+            )
+
+        marquee_updates = []
+        for ax in self.axes.flat:
+            for marquee in get_marquees(ax):
+                if extents is not None:
+                    x0, y0, x1, y1 = extents.get_extent(marquee.key)
+                else:
+                    subset = select(marquee.key)[[x, y]].dropna()
+                    if not len(subset):
+                        raise ValueError(f"data has no rows for {marquee.key}")
+                    x0, x1 = subset[x].min(), subset[x].max()
+                    y0, y1 = subset[y].min(), subset[y].max()
+                frame_lims = pad_frame(
+                    ax, [x0, x1], [y0, y1], marquee.frame_inner_pad
                 )
+                marquee_updates.append((ax, marquee, frame_lims))
+
+        # rescale viewports to fit updated content
+        #######################################################################
+        for i, ax in enumerate(self.axes.flat):
+            old_bounds = _calc_bounds(
+                [
+                    *(
+                        _get_points(bound.artist)
+                        for bound, __, __ in bound_updates
+                        if bound.ax is ax
+                    ),
+                    *(
+                        np.column_stack((m.frame_xlim, m.frame_ylim))
+                        for ax_, m, __ in marquee_updates
+                        if ax_ is ax
+                    ),
+                ]
+            )
+            new_bounds = _calc_bounds(
+                [
+                    *(
+                        points
+                        for bound, __, points in bound_updates
+                        if bound.ax is ax
+                    ),
+                    *(
+                        np.column_stack(frame_lims)
+                        for ax_, __, frame_lims in marquee_updates
+                        if ax_ is ax
+                    ),
+                ]
+            )
+            if old_bounds is None or new_bounds is None:
+                continue
+            if self._unequalized_lims is None:
+                lims = ax.get_xlim(), ax.get_ylim()
+            else:  # start over from limits before aspect equalization
+                lims = self._unequalized_lims[i]
+            # also map data limits, which aspect adjustment draws on
+            data_lims = ax.dataLim.get_points().copy()
+            for dim, lim, set_lim in zip(
+                range(2), lims, (ax.set_xlim, ax.set_ylim)
+            ):
+                set_lim(
+                    *rescale_lim(lim, old_bounds[:, dim], new_bounds[:, dim]),
+                )
+                data_lims[:, dim] = rescale_lim(
+                    data_lims[:, dim], old_bounds[:, dim], new_bounds[:, dim]
+                )
+            if np.isfinite(data_lims).all():
+                ax.dataLim.set_points(data_lims)
+        if self._unequalized_lims is not None:
+            self.equalize_aspect()
+
+        # apply updates
+        #######################################################################
+        for bound, colors, points in bound_updates:
+            if isinstance(bound.artist, mpl_lines.Line2D):
+                bound.artist.set_data(points[:, 0], points[:, 1])
+                continue
+            bound.artist.set_offsets(points)
+            for values, set_colors in zip(
+                colors,
+                (bound.artist.set_facecolors, bound.artist.set_edgecolors),
+            ):
+                if values is not None:
+                    set_colors(values)
+
+        for ax, marquee, frame_lims in marquee_updates:
+            update_marquee(ax, marquee, *frame_lims)
+
+        self.__data = self.data = cfg.data = data
+        self._not_na = np.ones(len(data), bool)
+        if self._dropna:
+            for column in (col, hue):
+                if column is not None:
+                    self._not_na &= ~data[column].isnull().to_numpy()
+        self._finalize_grid()
+        return self
+
+    @profiled("OutsetGrid.update_frames")
+    def update_frames(
+        self: "OutsetGrid",
+        frames: typing.Union[
+            typing.Sequence[typing.Tuple[float, float, float, float]],
+            NamedFrames,
+        ],
+    ) -> "OutsetGrid":
+        """Swap in new outset frame coordinates, updating the existing figure
+        in place.
+
+        For grids created from frames, rather than a DataFrame. See
+        `update_data` for details.
+
+        Parameters
+        ----------
+        frames : Sequence of Tuple[float, float, float, float] or
+        outset.util.NamedFrames
+            New frame "extents" `(x0, y0, x1, y1)` or "boundary points" `((x0,
+            y0), (x1, y1))`, with the same number (or names) of frames as the
+            grid's initial frames.
+
+        Returns
+        -------
+        OutsetGrid
+            Returns self.
+        """
+        cfg = self._marqueeplot_config
+        return self.update_data(
+            _frames_to_data(frames, x=cfg.x, y=cfg.y, col=cfg.col, hue=cfg.hue),
+        )
+
+    def _draw_marqueeplot_source(self: "OutsetGrid") -> None:
+        """Draw marquee annotations over source axes, as configured at
+        initialization."""
+        cfg = self._marqueeplot_config
+        data, x, y = cfg.data, cfg.x, cfg.y
+        col, hue, hue_order = cfg.col, cfg.hue, cfg.hue_order
+        col_order, color, palette = cfg.col_order, cfg.color, cfg.palette
+        zorder = cfg.zorder
+        marqueeplot_kws = cfg.marqueeplot_kws
+        marqueeplot_source_kws = cfg.marqueeplot_source_kws
+
+        data_ = data
+        if self.source_axes is None:
+            return
+        if cfg.row is not None:
+            row, row_order = cfg.row, opyt.or_value(cfg.row_order, [])
+            if len(row_order) != 1:
+                raise NotImplementedError(
+                    "row_order must be provided and length 1",
+                )
+            data_ = data_[data_[row].isin(row_order)].reset_index()
+        marqueeplot(
+            data_,
+            x=x,
+            y=y,
+            hue=hue,
+            hue_order=hue_order,
+            outset=col,
+            outset_order=col_order,
+            ax=self.source_axes,
+            **{
+                "color": color,
+                "palette": palette,
+                "frame_inner_pad": cfg.default_frame_inner_pad,
+                "frame_outer_pad": cfg.default_frame_outer_pad_source,
+                "mark_glyph": cfg.default_mark_glyph,
+                "tight_axlim": False,
+                "zorder": zorder,
+                **copy.deepcopy(marqueeplot_kws),  # for mark_glyph
+                **marqueeplot_source_kws,
+                "frame_edge_kws": {
+                    **marqueeplot_kws.get("frame_edge_kws", {}),
+                    **marqueeplot_source_kws.get("frame_edge_kws", {}),
+                },
+                "frame_face_kws": {
+                    **marqueeplot_kws.get("frame_face_kws", {}),
+                    **marqueeplot_source_kws.get("frame_face_kws", {}),
+                },
+                "leader_edge_kws": {
+                    **marqueeplot_kws.get("leader_edge_kws", {}),
+                    **marqueeplot_source_kws.get("leader_edge_kws", {}),
+                },
+                "leader_face_kws": {
+                    **marqueeplot_kws.get("leader_face_kws", {}),
+                    **marqueeplot_source_kws.get("leader_face_kws", {}),
+                },
+                "mark_glyph_kws": {
+                    "markersize": 16,
+                    "zorder": zorder + 1.01,
+                    **marqueeplot_kws.get("mark_glyph_kws", {}),
+                    **marqueeplot_source_kws.get("mark_glyph_kws", {}),
+                },
+            },
+        )
 
-            self_.map_dataframe_outset(
-                marqueeplot,
+    def _draw_marqueeplot_outset(self: "OutsetGrid") -> None:
+        """Draw marquee annotations over outset axes, as configured at
+        initialization."""
+        cfg = self._marqueeplot_config
+        data, x, y = cfg.data, cfg.x, cfg.y
+        col, hue, hue_order = cfg.col, cfg.hue, cfg.hue_order
+        col_order, color, palette = cfg.col_order, cfg.color, cfg.palette
+        zorder = cfg.zorder
+        marqueeplot_kws = cfg.marqueeplot_kws
+        marqueeplot_outset_kws = cfg.marqueeplot_outset_kws
+
+        # setup
+        for d in marqueeplot_kws, marqueeplot_outset_kws:
+            for k, v in d.items():
+                if k == "mark_glyph" and isinstance(v, type):
+                    d[k] = v()
+
+        needs_prepad = not (hue is None or hue == col)
+        if needs_prepad:
+            # need to prepad without split by hue
+            prepad_kws = {
+                "frame_inner_pad": cfg.default_frame_inner_pad,
+                "frame_outer_pad": cfg.default_frame_outer_pad_outset,
+                "frame_outer_pad_unit": "axes",
+            }
+            fil = data[col].isin(col_order)
+            if hue is not None:
+                assert hue_order is not None
+                fil &= data[hue].isin(hue_order)
+            self.broadcast_outset(
+                _prepad_axlim,
+                data=data[fil],
                 x=x,
                 y=y,
+                hue=hue,
+                outset=col,
+                tight_axlim=True,
                 **{
-                    "color": color,
-                    "palette": palette,
-                    "frame_inner_pad": default_frame_inner_pad,
-                    "frame_outer_pad": default_frame_outer_pad_outset,
-                    "frame_outer_pad_unit": "axes",
-                    "leader_stretch": 0.2,
-                    "leader_stretch_unit": "inchesfrom",
-                    "mark_glyph": default_draw_glyph_functor_class(),
-                    "tight_axlim": not needs_prepad,
-                    "zorder": zorder,
-                    **marqueeplot_kws,
-                    **marqueeplot_outset_kws,
-                    "frame_edge_kws": {
-                        **marqueeplot_kws.get("frame_edge_kws", {}),
-                        **marqueeplot_outset_kws.get("frame_edge_kws", {}),
-                    },
-                    "frame_face_kws": {
-                        **marqueeplot_kws.get("frame_face_kws", {}),
-                        **marqueeplot_outset_kws.get("frame_face_kws", {}),
-                    },
-                    "leader_edge_kws": {
-                        **marqueeplot_kws.get("leader_edge_kws", {}),
-                        **marqueeplot_outset_kws.get("leader_edge_kws", {}),
-                    },
-                    "leader_face_kws": {
-                        **marqueeplot_kws.get("leader_face_kws", {}),
-                        **marqueeplot_outset_kws.get("leader_face_kws", {}),
+                    **prepad_kws,
+                    **{
+                        k: v
+                        for k, v in marqueeplot_kws.items()
+                        if k in prepad_kws
                     },
-                    "mark_glyph_kws": {
-                        **({"markersize": 16} if self_._is_inset() else {}),
-                        "zorder": zorder + 1.01,
-                        **marqueeplot_kws.get("mark_glyph_kws", {}),
-                        **marqueeplot_outset_kws.get("mark_glyph_kws", {}),
+                    **{
+                        k: v
+                        for k, v in marqueeplot_outset_kws.items()
+                        if k in prepad_kws
                     },
                 },
             )
 
-        self._marqueeplot_outset = marqueeplot_outset
+        self.map_dataframe_outset(
+            marqueeplot,
+            x=x,
+            y=y,
+            **{
+                "color": color,
+                "palette": palette,
+                "frame_inner_pad": cfg.default_frame_inner_pad,
+                "frame_outer_pad": cfg.default_frame_outer_pad_outset,
+                "frame_outer_pad_unit": "axes",
+                "leader_stretch": 0.2,
+                "leader_stretch_unit": "inchesfrom",
+                "mark_glyph": cfg.default_mark_glyph(),
+                "tight_axlim": not needs_prepad,
+                "zorder": zorder,
+                **marqueeplot_kws,
+                **marqueeplot_outset_kws,
+                "frame_edge_kws": {
+                    **marqueeplot_kws.get("frame_edge_kws", {}),
+                    **marqueeplot_outset_kws.get("frame_edge_kws", {}),
+                },
+                "frame_face_kws": {
+                    **marqueeplot_kws.get("frame_face_kws", {}),
+                    **marqueeplot_outset_kws.get("frame_face_kws", {}),
+                },
+                "leader_edge_kws": {
+                    **marqueeplot_kws.get("leader_edge_kws", {}),
+                    **marqueeplot_outset_kws.get("leader_edge_kws", {}),
+                },
+                "leader_face_kws": {
+                    **marqueeplot_kws.get("leader_face_kws", {}),
+                    **marqueeplot_outset_kws.get("leader_face_kws", {}),
+                },
+                "mark_glyph_kws": {
+                    **({"markersize": 16} if self._is_inset() else {}),
+                    "zorder": zorder + 1.01,
+                    **marqueeplot_kws.get("mark_glyph_kws", {}),
+                    **marqueeplot_outset_kws.get("mark_glyph_kws", {}),
+                },
+            },
+        )
 
+    @profiled("OutsetGrid.equalize_aspect")
     def equalize_aspect(self: "OutsetGrid") -> "OutsetGrid":
         """Adjust axes {x,y}lims to ensure an equal xlim-to-ylim ratio across
         all axes.
@@ -565,12 +1822,18 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         OutsetGrid
             Returns self.
         """
+        if self._record("equalize_aspect"):
+            return self
+        # remember limits before equalization, for rescaling by update_data
+        self._unequalized_lims = [
+            (ax.get_xlim(), ax.get_ylim()) for ax in self.axes.flat
+        ]
         if self.source_axes is not None:
             aspect = calc_aspect(self.source_axes)
             for ax in self.outset_axes:
                 set_aspect(ax, aspect)
         else:
-            equalize_aspect(self.axes.flat)
+            equalize_aspect([*self.axes.flat])
         return self
 
     def marqueeplot(
@@ -604,6 +1867,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
             self.equalize_aspect()
         return self
 
+    @profiled("OutsetGrid.marqueeplot_outset")
     def marqueeplot_outset(
         self: "OutsetGrid",
         *,
@@ -630,18 +1894,29 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
                 "may only specify one of {preserve,equalize}_aspect",
             )
 
+        if self._record(
+            "marqueeplot_outset",
+            equalize_aspect=equalize_aspect,
+            preserve_aspect=preserve_aspect,
+        ):
+            return self
         aspects = [calc_aspect(ax) for ax in self.outset_axes]
-        self._marqueeplot_outset(self)
+        if self._marqueeplot_outset_drawn:
+            warnings.warn(
+                "Redundant call to marqueeplot_outset, "
+                "marquees were already drawn",
+            )
+        else:
+            self._draw_marqueeplot_outset()
         if preserve_aspect:
             for ax, aspect in zip(self.outset_axes, aspects):
                 set_aspect(ax, aspect)
-        self._marqueeplot_outset = lambda self_: warnings.warn(
-            "Redundant call to marqueeplot_outset, marquees were already drawn",
-        )
+        self._marqueeplot_outset_drawn = True
         if equalize_aspect:
             self.equalize_aspect()
         return self
 
+    @profiled("OutsetGrid.marqueeplot_source")
     def marqueeplot_source(
         self: "OutsetGrid",
         *,
@@ -669,14 +1944,24 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
                 "may only specify one of {preserve,equalize}_aspect",
             )
 
+        if self._record(
+            "marqueeplot_source",
+            equalize_aspect=equalize_aspect,
+            preserve_aspect=preserve_aspect,
+        ):
+            return self
         if self.source_axes is not None:
             aspect = calc_aspect(self.source_axes)
-        self._marqueeplot_source(self)
+        if self._marqueeplot_source_drawn:
+            warnings.warn(
+                "Redundant call to marqueeplot_source, "
+                "marquees were already drawn",
+            )
+        else:
+            self._draw_marqueeplot_source()
         if preserve_aspect and self.source_axes is not None:
             set_aspect(self.source_axes, aspect)
-        self._marqueeplot_source = lambda self_: warnings.warn(
-            "Redundant call to marqueeplot_source, marquees were already drawn",
-        )
+        self._marqueeplot_source_drawn = True
         if equalize_aspect:
             self.equalize_aspect()
         return self
@@ -741,6 +2026,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         )
         return self
 
+    @profiled("OutsetGrid.map_dataframe_outset")
     def map_dataframe_outset(
         self: "OutsetGrid", plotter: typing.Callable, *args, **kwargs
     ) -> "OutsetGrid":
@@ -763,6 +2049,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         OutsetGrid
             Returns self.
         """
+        if self._record("map_dataframe_outset", plotter, *args, **kwargs):
+            return self
         if "hue" in kwargs and self._hue_var is not None:
             raise ValueError("Cannot map `hue` if FacetGrid `hue` is set.")
         elif "hue" in kwargs and kwargs.get("hue_order", None) is None:
@@ -786,6 +2074,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
                 ax.set_ylabel(ylabel)
         return self
 
+    @profiled("OutsetGrid.map_dataframe_source")
     def map_dataframe_source(
         self: "OutsetGrid", plotter: typing.Callable, *args, **kwargs
     ) -> "OutsetGrid":
@@ -810,6 +2099,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         OutsetGrid
             Returns self.
         """
+        if self._record("map_dataframe_source", plotter, *args, **kwargs):
+            return self
         if self._hue_var is not None and "hue" in kwargs:
             raise ValueError("Cannot map `hue` if FacetGrid `hue` is set.")
         if "hue_order" in kwargs and not (
@@ -832,7 +2123,18 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
                 self.source_axes.get_xlabel(),
                 self.source_axes.get_ylabel(),
             )
-            plotter(self.__data, *args, ax=self.source_axes, **kwargs)
+            num_marquees = len(get_marquees(self.source_axes))
+            with record_artists(self.source_axes) as artists:
+                plotter(self.__data, *args, ax=self.source_axes, **kwargs)
+            self._bind_artists(
+                self.source_axes,
+                artists,
+                num_marquees,
+                self.__data,
+                (None, None),
+                args,
+                kwargs,
+            )
             if (
                 np.array_equal(kwargs.get("x", None), self._x_var)
                 and self._x_var is not None
@@ -903,6 +2205,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         )
         return self
 
+    @profiled("OutsetGrid.broadcast_outset")
     def broadcast_outset(
         self: "OutsetGrid",
         plotter: typing.Callable,
@@ -935,6 +2238,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
 
         Preserves axis limits.
         """
+        if self._record("broadcast_outset", plotter, *args, **kwargs):
+            return self
         xlabels = [ax.get_xlabel() for ax in self.axes.flat]
         ylabels = [ax.get_ylabel() for ax in self.axes.flat]
         for ax in self.outset_axes:
@@ -943,6 +2248,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
             try:
                 plotter(*args, ax=ax, **kwargs)
             except (TypeError, AttributeError):
+                if not self._pyplot:
+                    raise
                 plt.sca(ax)
                 plotter(*args, **kwargs)
             ax.set_xlim(*xlim)
@@ -962,6 +2269,7 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         self._finalize_grid()
         return self
 
+    @profiled("OutsetGrid.broadcast_source")
     def broadcast_source(
         self: "OutsetGrid",
         plotter: typing.Callable,
@@ -994,6 +2302,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
 
         Doesn't preserve axis limits.
         """
+        if self._record("broadcast_source", plotter, *args, **kwargs):
+            return self
         if self.source_axes is None:
             return self
         xlabel, ylabel = (
@@ -1004,6 +2314,8 @@ class OutsetGrid(sns.axisgrid.FacetGrid):
         try:
             plotter(*args, ax=ax, **kwargs)
         except (TypeError, AttributeError):
+            if not self._pyplot:
+                raise
             plt.sca(ax)
             plotter(*args, **kwargs)
         self._finalize_grid()
@@ -1,15 +1,45 @@
 """Top-level package for outset."""
 
+import typing
+
+from ._auxlib.lazy_attach_ import lazy_attach
+
 __version__ = "0.1.9"
 
-from ._draw_marquee import draw_marquee
-from ._inset_outsets import inset_outsets
-from ._marqueeplot import marqueeplot
-from ._OutsetGrid import OutsetGrid
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from . import aio, mark, patched, profiling, stub, tweak, util  # noqa: F401
+    from ._animate_outsets import animate_outsets
+    from ._draw_marquee import draw_marquee
+    from ._inset_outsets import inset_outsets
+    from ._marqueeplot import marqueeplot
+    from ._OutsetGrid import OutsetGrid
+    from ._paginate_outsets import paginate_outsets
+    from ._render_many import render_many
+    from ._save_marquee_svg import save_marquee_svg
+
+# defer importing matplotlib.pyplot, pandas, and seaborn until first use
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodules=["aio", "mark", "patched", "profiling", "stub", "tweak", "util"],
+    submodule_attrs={
+        "._animate_outsets": ["animate_outsets"],
+        "._draw_marquee": ["draw_marquee"],
+        "._inset_outsets": ["inset_outsets"],
+        "._marqueeplot": ["marqueeplot"],
+        "._OutsetGrid": ["OutsetGrid"],
+        "._paginate_outsets": ["paginate_outsets"],
+        "._render_many": ["render_many"],
+        "._save_marquee_svg": ["save_marquee_svg"],
+    },
+)
 
 __all__ = [
+    "animate_outsets",
     "draw_marquee",
     "inset_outsets",
     "marqueeplot",
     "OutsetGrid",
+    "paginate_outsets",
+    "render_many",
+    "save_marquee_svg",
 ]
@@ -0,0 +1,169 @@
+import typing
+
+from matplotlib import animation as mpl_animation
+import numpy as np
+
+from ._auxlib.cull_axes_ import cull_axes
+from ._auxlib.marquee_artists_ import (
+    MarqueeArtists,
+    get_marquees,
+    update_marquee,
+)
+from ._OutsetGrid import OutsetGrid
+from .util._StreamingGifWriter import StreamingGifWriter
+
+# (xlim, ylim)
+_View = np.ndarray
+
+
+def _calc_target_view(
+    full_view: _View, marquee: MarqueeArtists, zoom_pad: float
+) -> _View:
+    """Fit view around marquee frame, matching aspect of `full_view`."""
+    view = np.array([marquee.frame_xlim, marquee.frame_ylim], dtype=float)
+    spans = np.ptp(view, axis=1) * (1 + 2 * zoom_pad)
+    full_spans = np.abs(np.diff(full_view, axis=1)).ravel()
+    # grow short dimension to match full view aspect
+    scale = np.max(spans / full_spans)
+    half_spans = full_spans * scale / 2
+    centers = view.mean(axis=1)
+    signs = np.sign(np.diff(full_view, axis=1)).ravel()
+    return np.column_stack(
+        (centers - signs * half_spans, centers + signs * half_spans),
+    )
+
+
+def _interpolate_view(start: _View, stop: _View, t: float) -> _View:
+    """Interpolate between views with smooth, geometric zoom.
+
+    Spans interpolate geometrically, so zoom rate is perceptually constant,
+    and centers move in proportion to zoom progress, so the zoom target
+    holds its place on screen.
+    """
+    s = t * t * (3 - 2 * t)  # smoothstep easing
+    view = np.empty_like(start)
+    for dim in range(2):
+        (lo0, hi0), (lo1, hi1) = start[dim], stop[dim]
+        w0, w1 = hi0 - lo0, hi1 - lo1
+        w = np.sign(w0) * np.abs(w0) ** (1 - s) * np.abs(w1) ** s
+        c0, c1 = (lo0 + hi0) / 2, (lo1 + hi1) / 2
+        if np.isclose(w0, w1):
+            c = c0 + (c1 - c0) * s
+        else:
+            c = c0 + (c1 - c0) * (w0 - w) / (w0 - w1)
+        view[dim] = c - w / 2, c + w / 2
+    return view
+
+
+def animate_outsets(
+    outset_grid: OutsetGrid,
+    outpath: typing.Optional[str] = None,
+    *,
+    cull: bool = True,
+    dpi: typing.Optional[float] = None,
+    fps: float = 24.0,
+    hold_frames: int = 12,
+    transition_frames: int = 24,
+    writer: typing.Optional[mpl_animation.AbstractMovieWriter] = None,
+    zoom_pad: float = 0.1,
+) -> mpl_animation.FuncAnimation:
+    """Animate source axes zooming from the full view into each marquee in
+    turn, and back out.
+
+    Frames are produced by moving source axes limits and recomposing marquee
+    leaders and glyphs in place; plotted data is not re-plotted, and outset
+    axes are left unchanged.
+
+    Parameters
+    ----------
+    outset_grid : OutsetGrid
+        Grid to animate, with a source plot and marquee annotation complete.
+    outpath : Optional[str], default None
+        If provided, the animation is saved to this path.
+
+        Frames are written out as they are drawn, rather than accumulated
+        in memory. Paths ending in ".gif" are written with
+        `outset.util.StreamingGifWriter`; other formats (e.g., ".mp4") are
+        piped to ffmpeg with `matplotlib.animation.FFMpegWriter`.
+    cull : bool, default True
+        Whether to cull plotted points that never come into view.
+
+        Outset axes are culled to their viewport, and source axes to the
+        union of animated viewports, once before animating; each frame then
+        draws only data it may show. Culling modifies `outset_grid`'s
+        artists.
+    dpi : Optional[float], default None
+        Resolution of saved frames. If None, defaults to rc
+        `savefig.dpi`.
+    fps : float, default 24.0
+        Frame rate.
+    hold_frames : int, default 12
+        Number of frames to pause on the full view and on each marquee.
+    transition_frames : int, default 24
+        Number of frames spent zooming between views.
+    writer : Optional[matplotlib.animation.AbstractMovieWriter], default None
+        Writer used to save to `outpath`, overriding default by format.
+    zoom_pad : float, default 0.1
+        Margin kept around each marquee frame when zoomed in, as a fraction
+        of frame size.
+
+    Returns
+    -------
+    matplotlib.animation.FuncAnimation
+        The animation, e.g., for display with `to_jshtml` or for saving.
+    """
+    if outset_grid.source_axes is None:
+        raise ValueError("animate_outsets requires a grid with source axes")
+    if transition_frames < 1 or hold_frames < 0:
+        raise ValueError(
+            "transition_frames must be positive and hold_frames nonnegative",
+        )
+    outset_grid.finalize()
+
+    ax = outset_grid.source_axes
+    marquees = get_marquees(ax)
+    if not marquees:
+        raise ValueError("source axes have no marquees to zoom into")
+
+    full_view = np.array([ax.get_xlim(), ax.get_ylim()])
+    steps = np.linspace(0, 1, transition_frames + 1)[1:]
+    views = [full_view] * hold_frames
+    for marquee in marquees:
+        target_view = _calc_target_view(full_view, marquee, zoom_pad)
+        for start, stop in (full_view, target_view), (target_view, full_view):
+            views.extend(_interpolate_view(start, stop, t) for t in steps)
+            views.extend([stop] * hold_frames)
+
+    if cull:
+        for outset_ax in outset_grid.outset_axes:
+            cull_axes(outset_ax)
+        # cull source axes to union of animated viewports
+        lo, hi = np.min(views, axis=(0, 2)), np.max(views, axis=(0, 2))
+        ax.set_xlim(lo[0], hi[0])
+        ax.set_ylim(lo[1], hi[1])
+        cull_axes(ax)
+        ax.set_xlim(*full_view[0])
+        ax.set_ylim(*full_view[1])
+
+    def draw_frame(view: _View) -> typing.List:
+        ax.set_xlim(*view[0])
+        ax.set_ylim(*view[1])
+        for marquee in marquees:  # leader geometry depends on axes limits
+            update_marquee(ax, marquee, marquee.frame_xlim, marquee.frame_ylim)
+        return []
+
+    animation = mpl_animation.FuncAnimation(
+        outset_grid.figure,
+        draw_frame,
+        frames=views,
+        interval=1000 / fps,
+        repeat=False,
+        cache_frame_data=False,
+    )
+    if outpath is not None:
+        if writer is None and str(outpath).lower().endswith(".gif"):
+            writer = StreamingGifWriter(fps=fps)
+        elif writer is None:
+            writer = mpl_animation.FFMpegWriter(fps=fps)
+        animation.save(outpath, writer=writer, dpi=dpi)
+    return animation
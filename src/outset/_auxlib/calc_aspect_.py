@@ -1,3 +1,5 @@
+import typing
+
 from matplotlib import axes as mpl_axes
 import numpy as np
 
@@ -11,3 +13,14 @@ def calc_aspect(ax: mpl_axes.Axes) -> float:
     ax.set_ylim(ylim)
     assert (xlim, ylim) == (ax.get_xlim(), ax.get_ylim())
     return res
+
+
+def calc_aspect_from_limits(
+    xlim: typing.Tuple[float, float],
+    ylim: typing.Tuple[float, float],
+    axes_size: typing.Tuple[float, float],
+) -> float:
+    """Calculate the aspect ratio of axes with limits `xlim` and `ylim`,
+    rendered at `axes_size` inches."""
+    width, height = axes_size
+    return height * np.ptp(xlim) / (width * np.ptp(ylim))
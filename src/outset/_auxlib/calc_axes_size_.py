@@ -0,0 +1,10 @@
+import typing
+
+from matplotlib import axes as mpl_axes
+
+
+def calc_axes_size(ax: mpl_axes.Axes) -> typing.Tuple[float, float]:
+    """Calculate the rendered width and height of the axes, in inches."""
+    position = ax.get_position()
+    fig_width, fig_height = ax.figure.get_size_inches()
+    return position.width * fig_width, position.height * fig_height
@@ -5,6 +5,8 @@ import warnings
 import numpy as np
 from matplotlib import axes as mpl_axes
 
+from .calc_axes_size_ import calc_axes_size
+
 # for several implementations, we need to calculate the padding size that will
 # create the correct proportions AFTER padding has been set
 # here's the math:
@@ -23,36 +25,47 @@ from matplotlib import axes as mpl_axes
 # epdw = paf * sadw / (1 - paf * 2)
 
 
-def _calc_pad_x(ax: mpl_axes.Axes, x_axfrac: float) -> float:
+def _calc_pad_x(xspan: float, x_axfrac: float) -> float:
     if x_axfrac >= 0.5:
         warnings.warn("x outer pad exceeds half axis size, clipping to 0.5")
         x_axfrac = 0.5
-    pad_x = x_axfrac * np.ptp(ax.get_xlim()) / (1 - x_axfrac * 2)
-    assert np.isclose((np.ptp(ax.get_xlim()) + 2 * pad_x) * x_axfrac, pad_x)
+    pad_x = x_axfrac * xspan / (1 - x_axfrac * 2)
+    assert np.isclose((xspan + 2 * pad_x) * x_axfrac, pad_x)
     assert np.isfinite(pad_x)
     return pad_x
 
 
-def _calc_pad_y(ax: mpl_axes.Axes, y_axfrac: float) -> float:
+def _calc_pad_y(yspan: float, y_axfrac: float) -> float:
     if y_axfrac >= 0.5:
         warnings.warn("x outer pad exceeds half axis size, clipping to 0.5")
         y_axfrac = 0.5
-    pad_y = y_axfrac * np.ptp(ax.get_ylim()) / (1 - y_axfrac * 2)
-    assert np.isclose((np.ptp(ax.get_ylim()) + 2 * pad_y) * y_axfrac, pad_y)
+    pad_y = y_axfrac * yspan / (1 - y_axfrac * 2)
+    assert np.isclose((yspan + 2 * pad_y) * y_axfrac, pad_y)
     assert np.isfinite(pad_y)
     return pad_y
 
 
 def _calc_outer_pad_axes(
-    ax: mpl_axes.Axes, frame_outer_pad: float
+    xspan: float,
+    yspan: float,
+    frame_outer_pad: float,
+    axes_size: typing.Tuple[float, float],
+    figure_size: typing.Tuple[float, float],
 ) -> typing.Tuple[float, float]:
     """Calculate width in data units necessary for pad to be a fraction
     `frame_outer_pad` of axes size."""
-    return _calc_pad_x(ax, frame_outer_pad), _calc_pad_y(ax, frame_outer_pad)
+    return (
+        _calc_pad_x(xspan, frame_outer_pad),
+        _calc_pad_y(yspan, frame_outer_pad),
+    )
 
 
 def _calc_outer_pad_figure(
-    ax: mpl_axes.Axes, frame_outer_pad: float
+    xspan: float,
+    yspan: float,
+    frame_outer_pad: float,
+    axes_size: typing.Tuple[float, float],
+    figure_size: typing.Tuple[float, float],
 ) -> typing.Tuple[float, float]:
     """Calculate width in data units necessary for pad to be a fraction
     `frame_outer_pad` of figure size."""
@@ -61,37 +74,74 @@ def _calc_outer_pad_figure(
             "frame_outer_pad must be less than 0.5 when "
             "frame_outer_pad_unit='figure'",
         )
-    pad_x_axfrac = frame_outer_pad / ax.get_position().width
-    pad_y_axfrac = frame_outer_pad / ax.get_position().height
-    return _calc_pad_x(ax, pad_x_axfrac), _calc_pad_y(ax, pad_y_axfrac)
+    (axwidth_inches, axheight_inches), (fig_width, fig_height) = (
+        axes_size,
+        figure_size,
+    )
+    pad_x_axfrac = frame_outer_pad * fig_width / axwidth_inches
+    pad_y_axfrac = frame_outer_pad * fig_height / axheight_inches
+    return _calc_pad_x(xspan, pad_x_axfrac), _calc_pad_y(yspan, pad_y_axfrac)
 
 
 def _calc_outer_pad_inches(
-    ax: mpl_axes.Axes, frame_outer_pad: float
+    xspan: float,
+    yspan: float,
+    frame_outer_pad: float,
+    axes_size: typing.Tuple[float, float],
+    figure_size: typing.Tuple[float, float],
 ) -> typing.Tuple[float, float]:
     """Calculate width in data units necessary for pad to be rendered as `frame_outer_pad` inches."""
-    axwidth_inches = ax.get_position().width * ax.figure.get_figwidth()
-    axheight_inches = ax.get_position().height * ax.figure.get_figheight()
+    axwidth_inches, axheight_inches = axes_size
     pad_x_axfrac = frame_outer_pad / axwidth_inches
     pad_y_axfrac = frame_outer_pad / axheight_inches
-    return _calc_pad_x(ax, pad_x_axfrac), _calc_pad_y(ax, pad_y_axfrac)
+    return _calc_pad_x(xspan, pad_x_axfrac), _calc_pad_y(yspan, pad_y_axfrac)
 
 
-def calc_outer_pad(
-    ax: mpl_axes.Axes, frame_outer_pad: float, frame_outer_pad_unit: str
+def calc_outer_pad_from_limits(
+    xlim: typing.Tuple[float, float],
+    ylim: typing.Tuple[float, float],
+    frame_outer_pad: float,
+    frame_outer_pad_unit: str,
+    axes_size: typing.Optional[typing.Tuple[float, float]] = None,
+    figure_size: typing.Optional[typing.Tuple[float, float]] = None,
 ) -> typing.Tuple[float, float]:
-    """Calculate pad width in data units."""
+    """Calculate pad width in data units for axes with limits `xlim` and
+    `ylim`, rendered at `axes_size` inches within a figure of `figure_size`
+    inches.
+
+    Sizes are required only for "figure" and "inches" units.
+    """
     if isinstance(frame_outer_pad, numbers.Number):
         try:
-            return {
+            calc = {
                 "axes": _calc_outer_pad_axes,
                 "figure": _calc_outer_pad_figure,
                 "inches": _calc_outer_pad_inches,
-            }[frame_outer_pad_unit](ax, frame_outer_pad)
+            }[frame_outer_pad_unit]
         except KeyError:
             raise ValueError(
                 "frame_outer_pad_unit must be 'axes', 'figure', or 'inches',"
                 f"not '{frame_outer_pad_unit}'",
             )
+        return calc(
+            np.ptp(xlim), np.ptp(ylim), frame_outer_pad, axes_size, figure_size
+        )
     else:
         return frame_outer_pad
+
+
+def calc_outer_pad(
+    ax: mpl_axes.Axes, frame_outer_pad: float, frame_outer_pad_unit: str
+) -> typing.Tuple[float, float]:
+    """Calculate pad width in data units."""
+    needs_size = isinstance(frame_outer_pad, numbers.Number) and (
+        frame_outer_pad_unit in ("figure", "inches")
+    )
+    return calc_outer_pad_from_limits(
+        ax.get_xlim(),
+        ax.get_ylim(),
+        frame_outer_pad,
+        frame_outer_pad_unit,
+        axes_size=calc_axes_size(ax) if needs_size else None,
+        figure_size=ax.figure.get_size_inches() if needs_size else None,
+    )
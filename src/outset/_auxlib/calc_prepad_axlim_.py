@@ -0,0 +1,93 @@
+import numbers
+import typing
+
+import numpy as np
+
+from .calc_outer_pad_ import calc_outer_pad_from_limits
+from .is_axes_unset_ import is_axlim_unset
+
+
+def calc_prepad_axlim(
+    xlim: typing.Tuple[float, float],
+    ylim: typing.Tuple[float, float],
+    data_xlims: np.ndarray,
+    data_ylims: np.ndarray,
+    *,
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]],
+    frame_outer_pad: typing.Union[float, typing.Tuple[float, float]],
+    frame_outer_pad_unit: str,
+    tight_axlim: bool,
+    populated: bool,
+    axes_size: typing.Optional[typing.Tuple[float, float]] = None,
+    figure_size: typing.Optional[typing.Tuple[float, float]] = None,
+) -> typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]:
+    """Calculate axes limits grown to include padded frames around data
+    extents, given as one `(min, max)` row per marquee.
+
+    Current axes limits are `xlim` and `ylim`, and `populated` tells whether
+    axes hold plotted content, as for `is_axlim_unset`. Sizes are required
+    only for "figure" and "inches" outer pad units.
+    """
+    data_xlims = np.reshape(data_xlims, (-1, 2))
+    data_ylims = np.reshape(data_ylims, (-1, 2))
+    if isinstance(frame_inner_pad, numbers.Number):
+        # convert to absolute units to prevent weird effects from
+        # successive calls to draw_marquee
+        spans_x = np.ptp(data_xlims, axis=1)
+        spans_y = np.ptp(data_ylims, axis=1)
+        pads_x = frame_inner_pad * np.where(spans_x, spans_x, np.ptp(xlim))
+        pads_y = frame_inner_pad * np.where(spans_y, spans_y, np.ptp(ylim))
+    else:
+        pads_x, pads_y = frame_inner_pad
+    framex_values = data_xlims + np.outer(pads_x, [-1, 1])
+    framey_values = data_ylims + np.outer(pads_y, [-1, 1])
+
+    if is_axlim_unset(xlim, ylim, populated) or tight_axlim:
+        if framex_values.size and np.ptp(framex_values):
+            xlim = (np.min(framex_values), np.max(framex_values))
+        if framey_values.size and np.ptp(framey_values):
+            ylim = (np.min(framey_values), np.max(framey_values))
+    else:
+        (x0, x1), (y0, y1) = xlim, ylim
+        xlim = (
+            np.min(framex_values, initial=x0),
+            np.max(framex_values, initial=x1),
+        )
+        ylim = (
+            np.min(framey_values, initial=y0),
+            np.max(framey_values, initial=y1),
+        )
+
+    pad_x, pad_y = calc_outer_pad_from_limits(
+        xlim,
+        ylim,
+        frame_outer_pad,
+        frame_outer_pad_unit,
+        axes_size=axes_size,
+        figure_size=figure_size,
+    )
+    assert np.isfinite(pad_x), np.isfinite(pad_y)
+    if framex_values.size:
+        lowerx, upperx = (
+            np.min(framex_values) - pad_x,
+            np.max(framex_values) + pad_x,
+        )
+        lowery, uppery = (
+            np.min(framey_values) - pad_y,
+            np.max(framey_values) + pad_y,
+        )
+    else:
+        (lowerx, upperx), (lowery, uppery) = xlim, ylim
+
+    if not (tight_axlim or is_axlim_unset(xlim, ylim, populated)):
+        lowerx = min(lowerx, xlim[0])
+        lowery = min(lowery, ylim[0])
+        upperx = max(upperx, xlim[1])
+        uppery = max(uppery, ylim[1])
+
+    # apply axis limit to incorporate outer padding
+    if lowerx == upperx:  # prevent singularity
+        lowerx, upperx = lowerx - 0.05, upperx + 0.05
+    if lowery == uppery:  # prevent singularity
+        lowery, uppery = lowery - 0.05, uppery + 0.05
+    return (lowerx, upperx), (lowery, uppery)
@@ -3,13 +3,18 @@ import typing
 from matplotlib import axes as mpl_axes
 import numpy as np
 
+from .calc_axes_size_ import calc_axes_size
 
-def compose_callout_leader(
+
+def calc_callout_leader(
     frame_xlim: typing.Tuple[float, float],
     frame_ylim: typing.Tuple[float, float],
-    ax: mpl_axes.Axes,
+    ax_xlim: typing.Tuple[float, float],
+    ax_ylim: typing.Tuple[float, float],
     stretch: float,
     stretch_unit: typing.Literal["axes", "figure", "inches", "inchesfrom"],
+    axes_size: typing.Optional[typing.Tuple[float, float]] = None,
+    figure_size: typing.Optional[typing.Tuple[float, float]] = None,
 ) -> typing.List[typing.Tuple[float, float]]:
     """Decide shape, size, and position of callout leader triangle.
 
@@ -41,12 +46,22 @@ def compose_callout_leader(
         The x-axis limits (min, max) of the rectangle.
     frame_ylim : typing.Tuple[float, float]
         The y-axis limits (min, max) of the rectangle.
-    ax : mpl_axes.Axes
-        The axes object where the callout leader will be drawn.
+    ax_xlim : typing.Tuple[float, float]
+        The x-axis limits of the axes where the callout leader will be drawn.
+    ax_ylim : typing.Tuple[float, float]
+        The y-axis limits of the axes where the callout leader will be drawn.
     stretch : float
         The stretch factor for the zoom effect.
     stretch_unit : {"axes", "figure", "inches", "inchesfrom"}, default "axes"
         How should stretch be specified?
+    axes_size : typing.Tuple[float, float], optional
+        Rendered width and height of the axes, in inches.
+
+        Required if `stretch_unit` is "inches" or "inchesfrom".
+    figure_size : typing.Tuple[float, float], optional
+        Width and height of the figure, in inches.
+
+        Required if `stretch_unit` is "figure".
 
     Returns
     -------
@@ -59,7 +74,7 @@ def compose_callout_leader(
     if stretch < 0.0:
         raise ValueError("Leader stretch must be non-negative.")
 
-    ax_width, ax_height = np.ptp(ax.get_xlim()), np.ptp(ax.get_ylim())
+    ax_width, ax_height = np.ptp(ax_xlim), np.ptp(ax_ylim)
     frame_width, frame_height = np.ptp(frame_xlim), np.ptp(frame_ylim)
     (
         (frame_lower_left, frame_upper_right),
@@ -67,12 +82,7 @@ def compose_callout_leader(
     ) = zip(frame_xlim, frame_ylim), zip(frame_xlim, reversed(frame_ylim))
 
     if frame_width:
-        theta = np.arctan(
-            frame_height
-            / frame_width
-            * np.ptp(ax.get_xlim())
-            / np.ptp(ax.get_ylim())
-        )
+        theta = np.arctan(frame_height / frame_width * ax_width / ax_height)
     elif frame_height:
         theta = np.pi / 2
     else:
@@ -82,17 +92,11 @@ def compose_callout_leader(
     if stretch_unit == "axes":
         height, width = stretch_y * ax_height, stretch_x * ax_width
     elif stretch_unit == "figure":
-        fig_width, fig_height = ax.figure.get_size_inches()
-        pixel_width, pixel_height = ax.transData.transform(
-            [fig_width * stretch_x, fig_height * stretch_y],
-        )
-        # Convert display coordinates back to data coordinates
-        height, width = ax.transData.inverted().transform(
-            [(pixel_width, pixel_height)],
-        )[0]
+        fig_width, fig_height = figure_size
+        # n.b., round trip through display coordinates is an identity
+        height, width = fig_width * stretch_x, fig_height * stretch_y
     elif stretch_unit == "inches":
-        axwidth_inches = ax.get_position().width * ax.figure.get_figwidth()
-        axheight_inches = ax.get_position().height * ax.figure.get_figheight()
+        axwidth_inches, axheight_inches = axes_size
         stretch_x_axfrac = stretch_x / axwidth_inches
         stretch_y_axfrac = stretch_y / axheight_inches
         height, width = (
@@ -100,8 +104,7 @@ def compose_callout_leader(
             stretch_x_axfrac * ax_width,
         )
     elif stretch_unit == "inchesfrom":
-        axwidth_inches = ax.get_position().width * ax.figure.get_figwidth()
-        axheight_inches = ax.get_position().height * ax.figure.get_figheight()
+        axwidth_inches, axheight_inches = axes_size
         stretch_x_axfrac = stretch_x / axwidth_inches
         stretch_y_axfrac = stretch_y / axheight_inches
         width, height = (
@@ -132,3 +135,32 @@ def compose_callout_leader(
     ]
 
     return leader_vertices
+
+
+def compose_callout_leader(
+    frame_xlim: typing.Tuple[float, float],
+    frame_ylim: typing.Tuple[float, float],
+    ax: mpl_axes.Axes,
+    stretch: float,
+    stretch_unit: typing.Literal["axes", "figure", "inches", "inchesfrom"],
+) -> typing.List[typing.Tuple[float, float]]:
+    """Decide shape, size, and position of callout leader triangle on `ax`.
+
+    See `calc_callout_leader` for details.
+    """
+    return calc_callout_leader(
+        frame_xlim,
+        frame_ylim,
+        ax.get_xlim(),
+        ax.get_ylim(),
+        stretch,
+        stretch_unit,
+        axes_size=(
+            calc_axes_size(ax)
+            if stretch_unit in ("inches", "inchesfrom")
+            else None
+        ),
+        figure_size=(
+            ax.figure.get_size_inches() if stretch_unit == "figure" else None
+        ),
+    )
@@ -0,0 +1,25 @@
+from matplotlib.artist import Artist as mpl_Artist
+from matplotlib import collections as mpl_collections
+from matplotlib import lines as mpl_lines
+from matplotlib import markers as mpl_markers
+from matplotlib import patches as mpl_patches
+
+
+def count_path_vertices(artist: mpl_Artist) -> int:
+    """Count path vertices drawn by `artist`, counting marker paths once per
+    marker drawn."""
+    if isinstance(artist, mpl_lines.Line2D):
+        num_points = len(artist.get_xydata())
+        marker = artist.get_marker()
+        if marker in (None, "None", "none", "", " "):
+            return num_points
+        marker_path = mpl_markers.MarkerStyle(marker).get_path()
+        return num_points * (1 + len(marker_path.vertices))
+    elif isinstance(artist, mpl_collections.Collection):
+        paths = artist.get_paths()
+        if len(paths) == 1:  # e.g., one marker path, drawn at each offset
+            return max(len(artist.get_offsets()), 1) * len(paths[0].vertices)
+        return sum(len(path.vertices) for path in paths)
+    elif isinstance(artist, mpl_patches.Patch):
+        return len(artist.get_path().vertices)
+    return 0
@@ -0,0 +1,116 @@
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib import collections as mpl_collections
+from matplotlib import lines as mpl_lines
+import numpy as np
+
+from .profile_stage_ import profiled
+
+
+def _to_axes_coords(ax: mpl_Axes, xy: np.ndarray) -> np.ndarray:
+    """Transform data coordinates to axes-fraction coordinates."""
+    return ax.transAxes.inverted().transform(ax.transData.transform(xy))
+
+
+def _calc_visible(ax: mpl_Axes, xy: np.ndarray, margin_px: float) -> np.ndarray:
+    """Mask points within `margin_px` pixels of the axes viewport."""
+    width, height = ax.bbox.width or 1.0, ax.bbox.height or 1.0
+    # pad generously, as layout passes may yet shrink axes
+    margin_x = 2 * (margin_px + 1) / width
+    margin_y = 2 * (margin_px + 1) / height
+    with np.errstate(invalid="ignore"):
+        axy = _to_axes_coords(ax, xy)
+        return (
+            (axy[:, 0] >= -margin_x)
+            & (axy[:, 0] <= 1 + margin_x)
+            & (axy[:, 1] >= -margin_y)
+            & (axy[:, 1] <= 1 + margin_y)
+        )
+
+
+def _cull_collection(
+    ax: mpl_Axes, collection: mpl_collections.PathCollection
+) -> int:
+    offsets = np.asarray(collection.get_offsets())
+    num_points = len(offsets)
+    if num_points < 2 or len(collection.get_paths()) != 1:
+        return 0
+
+    sizes = collection.get_sizes()
+    radius_pt = np.sqrt(sizes.max()) / 2 if len(sizes) else 0.0
+    linewidths = collection.get_linewidths()
+    radius_pt += max(linewidths) if len(linewidths) else 0.0
+    margin_px = radius_pt * ax.figure.dpi / 72
+    keep = _calc_visible(ax, offsets, margin_px)
+    if keep.all():
+        return 0
+
+    def select(values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values)
+        return values[keep] if len(values) == num_points else values
+
+    collection.set_offsets(offsets[keep])
+    collection.set_sizes(select(sizes))
+    collection.set_linewidths(select(linewidths))
+    collection.set_facecolors(select(collection.get_facecolors()))
+    collection.set_edgecolors(select(collection.get_edgecolors()))
+    if collection.get_array() is not None:
+        collection.set_array(select(collection.get_array()))
+    return int(num_points - keep.sum())
+
+
+def _cull_line(ax: mpl_Axes, line: mpl_lines.Line2D) -> int:
+    if line.get_drawstyle() != "default" or line.get_markevery() is not None:
+        return 0
+    xy = np.asarray(line.get_xydata(), dtype=float)
+    num_points = len(xy)
+    if num_points < 3:
+        return 0
+
+    margin_pt = line.get_markersize() / 2 + line.get_linewidth()
+    margin_px = margin_pt * ax.figure.dpi / 72
+    visible = _calc_visible(ax, xy, margin_px)
+    # keep neighbors of visible points, so segments crossing viewport edges
+    # are drawn
+    keep = visible.copy()
+    keep[1:] |= visible[:-1]
+    keep[:-1] |= visible[1:]
+    if keep.all():
+        return 0
+
+    # break line where points are dropped, to prevent bridging segments
+    indices = np.flatnonzero(keep)
+    gaps = np.flatnonzero(np.diff(indices) > 1) + 1
+    culled = np.insert(xy[indices], gaps, np.nan, axis=0)
+    line.set_data(culled[:, 0], culled[:, 1])
+    return int(num_points - len(indices))
+
+
+@profiled("cull_axes")
+def cull_axes(ax: mpl_Axes) -> int:
+    """Drop scatter points and line vertices that fall outside the current
+    axes viewport, to reduce rendering cost.
+
+    Only scatter collections and default-drawstyle lines plotted in data
+    coordinates are culled. Points within a marker's size of the viewport
+    edge are kept, as are line vertices adjacent to visible vertices. Later
+    changes to axes limits will not restore culled points.
+
+    Returns
+    -------
+    int
+        Number of points culled.
+    """
+    # apply any pending autoscale to viewport
+    ax.get_xlim()
+    ax.get_ylim()
+    num_culled = 0
+    for collection in ax.collections:
+        if (
+            isinstance(collection, mpl_collections.PathCollection)
+            and collection.get_offset_transform() == ax.transData
+        ):
+            num_culled += _cull_collection(ax, collection)
+    for line in ax.lines:
+        if line.get_transform() == ax.transData:
+            num_culled += _cull_line(ax, line)
+    return num_culled
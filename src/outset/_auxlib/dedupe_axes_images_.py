@@ -0,0 +1,81 @@
+import typing
+import weakref
+
+from matplotlib import axes as mpl_axes
+from matplotlib import image as mpl_image
+from matplotlib import rcParams
+import numpy as np
+
+# rendered image data, by content, while referenced by an output file
+_rendered_images: "weakref.WeakValueDictionary[typing.Tuple, np.ndarray]"
+_rendered_images = weakref.WeakValueDictionary()
+
+
+class DedupedAxesImage(mpl_image.AxesImage):
+    """AxesImage that shares unsampled rendered data with identical images.
+
+    Vector backends that reuse image objects by identity (e.g., PDF) then
+    embed each distinct image once, rather than once per image drawn.
+    """
+
+    def make_image(
+        self: "DedupedAxesImage",
+        renderer: typing.Any,
+        magnification: float = 1.0,
+        unsampled: bool = False,
+    ) -> typing.Tuple:
+        im, left, bottom, trans = super().make_image(
+            renderer, magnification, unsampled=unsampled
+        )
+        if unsampled and im is not None:
+            key = (im.shape, im.dtype.str, im.tobytes())
+            im = _rendered_images.setdefault(key, im)
+        return im, left, bottom, trans
+
+
+def imshow_deduped(
+    ax: mpl_axes.Axes,
+    X: np.ndarray,
+    *,
+    aspect: typing.Union[str, float, None] = None,
+    alpha: typing.Optional[float] = None,
+    vmin: typing.Optional[float] = None,
+    vmax: typing.Optional[float] = None,
+    url: typing.Optional[str] = None,
+    **kwargs,
+) -> DedupedAxesImage:
+    """Display data `X` as an image, as `ax.imshow`, but drawn as a
+    `DedupedAxesImage`.
+
+    Keyword arguments are as for `ax.imshow`.
+    """
+    image = DedupedAxesImage(ax, **kwargs)
+    ax.set_aspect(rcParams["image.aspect"] if aspect is None else aspect)
+    image.set_data(X)
+    image.set_alpha(alpha)
+    if image.get_clip_path() is None:
+        image.set_clip_path(ax.patch)
+    if vmin is not None or vmax is not None:
+        image.set_clim(vmin, vmax)
+    image.autoscale_None()
+    image.set_url(url)
+    # update data limits and, if autoscaling, view limits, as imshow
+    image.set_extent(image.get_extent())
+    ax.add_image(image)
+    return image
+
+
+def dedupe_axes_images(images: typing.Iterable[mpl_image.AxesImage]) -> None:
+    """Share rendered data among identical `images` in vector output.
+
+    Images are switched to unsampled rendering (i.e., interpolation "none"),
+    so vector backends embed native-resolution data to be scaled by the
+    viewer, rather than data resampled to each image's extent. Only images
+    drawn as `DedupedAxesImage` (e.g., leader gradients) are affected.
+
+    Note that unsampled data is cropped to each image's clip box, so images
+    should be clipped by clip path instead, as leader gradients are.
+    """
+    for image in images:
+        if isinstance(image, DedupedAxesImage):
+            image.set_interpolation("none")
@@ -3,16 +3,23 @@ import typing
 
 import frozendict
 import numpy as np
+from matplotlib import artist as mpl_artist
 from matplotlib import axes as mpl_axes
 from matplotlib import colors as mpl_colors
+from matplotlib import image as mpl_image
 from matplotlib import patches as mpl_patches
 from matplotlib import pyplot as plt
 
 from .compose_callout_leader_ import compose_callout_leader
+from .dedupe_axes_images_ import imshow_deduped
 from .get_vertices_extent_ import get_vertices_extent
+from .identity_ import identity
 from .make_radial_gradient_ import make_radial_gradient
+from .profile_stage_ import profile_stage, profiled
+from .record_artists_ import record_children
 
 
+@profiled("draw_callout")
 def draw_callout(
     frame_xlim: typing.Tuple[float, float],
     frame_ylim: typing.Tuple[float, float],
@@ -29,13 +36,17 @@ def draw_callout(
         "inches",
         "inchesfrom",
     ] = "axes",
-    leader_tweak: typing.Callable = lambda x, *args, **kwargs: x,
+    leader_tweak: typing.Callable = identity,
     mark_glyph: typing.Optional[typing.Callable] = None,
     mark_glyph_kws: typing.Dict = frozendict.frozendict(),
     mark_retract: float = 0.1,
     zorder: float = 0,
     **kwargs,
-) -> mpl_axes.Axes:
+) -> typing.Tuple[
+    typing.List[mpl_patches.Polygon],
+    typing.List[mpl_image.AxesImage],
+    typing.List[mpl_artist.Artist],
+]:
     """Annotate a rectangular region with a flyaway "zoom" indication upwards
     and to the right.
 
@@ -83,8 +94,9 @@ def draw_callout(
 
     Returns
     -------
-    mpl_axes.Axes
-        The modified matplotlib axes object with the drawing elements added.
+    Tuple[List[Polygon], List[AxesImage], List[Artist]]
+        The leader underlay and outline patches, the leader gradient image,
+        and artists added by `mark_glyph`, in drawing order.
     """
     if ax is None:
         ax = plt.gca()
@@ -133,28 +145,32 @@ def draw_callout(
     ax.add_patch(leader_patch)
 
     # ... gradient fill, clipped insideleader_polygon
-    img = ax.imshow(
-        make_radial_gradient(),
-        **{
-            "alpha": 0.5,
-            "aspect": "auto",
-            "cmap": mpl_colors.LinearSegmentedColormap.from_list(
-                "gradient",
-                ["white", color],
-            ),
-            "extent": get_vertices_extent(leader_vertices),
-            "interpolation": "nearest",
-            "zorder": zorder,
+    with profile_stage("gradient"):
+        img = imshow_deduped(
+            ax,
+            make_radial_gradient(),
             **{
-                k: v
-                for k, v in it.chain(kwargs.items(), leader_face_kws.items())
-                if k not in ("linestyle",)
+                "alpha": 0.5,
+                "aspect": "auto",
+                "cmap": mpl_colors.LinearSegmentedColormap.from_list(
+                    "gradient",
+                    ["white", color],
+                ),
+                "extent": get_vertices_extent(leader_vertices),
+                "interpolation": "nearest",
+                "zorder": zorder,
+                **{
+                    k: v
+                    for k, v in it.chain(
+                        kwargs.items(), leader_face_kws.items()
+                    )
+                    if k not in ("linestyle",)
+                },
             },
-        },
-    )
-    if not clip_on:
-        img.set_clip_box(ax.bbox.shrunk(10, 10))  # grow axis clipping box
-    img.set_clip_path(leader_patch)
+        )
+        if not clip_on:  # grow axis clipping box, tracking savefig dpi
+            img.set_clip_box(ax.figure.bbox)
+        img.set_clip_path(leader_patch)
 
     # Draw callout glyph
     ###########################################################################
@@ -167,16 +183,18 @@ def draw_callout(
         weights=np.array([1.0 - mark_retract, mark_retract]),
         axis=0,
     )
+    glyph_artists = []
     if mark_glyph is not None:
-        mark_glyph(
-            *mark_coordinates,
-            ax=ax,
-            **{
-                "color": color,
-                "clip_on": clip_on,
-                "zorder": zorder,
-                **mark_glyph_kws,
-            },
-        )
+        with profile_stage("mark_glyph"), record_children(ax) as glyph_artists:
+            mark_glyph(
+                *mark_coordinates,
+                ax=ax,
+                **{
+                    "color": color,
+                    "clip_on": clip_on,
+                    "zorder": zorder,
+                    **mark_glyph_kws,
+                },
+            )
 
-    return ax
+    return [underlay_patch, leader_patch], [img], glyph_artists
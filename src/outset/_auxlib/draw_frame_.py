@@ -5,7 +5,10 @@ from matplotlib import axes as mpl_axes
 from matplotlib import patches as mpl_patches
 from matplotlib import pyplot as plt
 
+from .profile_stage_ import profiled
 
+
+@profiled("draw_frame")
 def draw_frame(
     frame_xlim: typing.Tuple[float, float],
     frame_ylim: typing.Tuple[float, float],
@@ -13,7 +16,7 @@ def draw_frame(
     frame_edge_kws: typing.Dict = frozendict.frozendict(),
     frame_face_kws: typing.Dict = frozendict.frozendict(),
     **kwargs,
-) -> mpl_axes.Axes:
+) -> typing.List[mpl_patches.Rectangle]:
     """Mark a rectangular region with a frame border and an underlaid color
     underlay fill.
 
@@ -37,8 +40,8 @@ def draw_frame(
 
     Returns
     -------
-    mpl_axes.Axes
-        The modified matplotlib axes object with the frame drawing elements added.
+    List[matplotlib.patches.Rectangle]
+        The frame face and edge patches added, in drawing order.
     """
     if ax is None:
         ax = plt.gca()
@@ -69,4 +72,4 @@ def draw_frame(
     )
     ax.add_patch(frame_edge_patch)
 
-    return ax
+    return [frame_face_patch, frame_edge_patch]
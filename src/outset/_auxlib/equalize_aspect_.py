@@ -4,9 +4,11 @@ from matplotlib import axes as mpl_axes
 import numpy as np
 
 from .calc_aspect_ import calc_aspect
+from .profile_stage_ import profiled
 from .set_aspect_ import set_aspect
 
 
+@profiled("equalize_aspect")
 def equalize_aspect(axs: typing.List[mpl_axes.Axes]) -> float:
     """Equalize the aspect ratio across multiple matplotlib Axes objects.
 
@@ -0,0 +1,87 @@
+import hashlib
+import numbers
+import pickle
+import types
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+def _update_array(hasher: "hashlib._Hash", values: np.ndarray) -> None:
+    hasher.update(f"ndarray:{values.dtype.str}:{values.shape}".encode())
+    if values.dtype.kind in "biufcmM":
+        hasher.update(memoryview(np.ascontiguousarray(values)).cast("B"))
+    else:  # e.g., object or string columns
+        values = pd.Series(values.ravel())
+        hasher.update(pd.util.hash_pandas_object(values, index=False).values)
+
+
+def _update_pickled(hasher: "hashlib._Hash", obj: typing.Any) -> None:
+    try:
+        pickled = pickle.dumps(obj, protocol=4)
+    except Exception as e:
+        raise ValueError(f"cannot fingerprint {obj!r}") from e
+    hasher.update(f"{type(obj).__qualname__}:{len(pickled)}:".encode())
+    hasher.update(pickled)
+
+
+def update_fingerprint(hasher: "hashlib._Hash", obj: typing.Any) -> None:
+    """Feed a stable, content-based description of `obj` into `hasher`.
+
+    DataFrame and array buffers are hashed column by column, without
+    building a serialized copy of the data. Functions and classes are
+    identified by qualified name, so lambdas and closures are rejected with
+    `ValueError`; bound methods are additionally identified by the pickled
+    content of the instance they are bound to. Other objects fall back to
+    their pickled representation.
+    """
+    if obj is None or isinstance(obj, (bool, str, bytes, numbers.Number)):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, pd.DataFrame):
+        hasher.update(f"DataFrame:{obj.shape}".encode())
+        update_fingerprint(hasher, obj.index)
+        for name, series in obj.items():
+            update_fingerprint(hasher, name)
+            update_fingerprint(hasher, series)
+    elif isinstance(obj, (pd.Series, pd.Index)):
+        hasher.update(f"{type(obj).__name__}:{obj.dtype};".encode())
+        if isinstance(obj.dtype, pd.CategoricalDtype):
+            update_fingerprint(hasher, obj.dtype.categories)
+            update_fingerprint(hasher, obj.dtype.ordered)
+        _update_array(hasher, np.asarray(obj))
+    elif isinstance(obj, np.ndarray):
+        _update_array(hasher, obj)
+    elif isinstance(obj, typing.Mapping):
+        hasher.update(f"{type(obj).__name__}:{len(obj)}{{".encode())
+        for key, value in sorted(obj.items(), key=lambda item: repr(item[0])):
+            update_fingerprint(hasher, key)
+            update_fingerprint(hasher, value)
+        hasher.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}:{len(obj)}[".encode())
+        for item in obj:
+            update_fingerprint(hasher, item)
+        hasher.update(b"]")
+    elif callable(obj) and hasattr(obj, "__qualname__"):
+        if "<" in obj.__qualname__:  # lambda or closure; name is ambiguous
+            raise ValueError(f"cannot fingerprint {obj!r}")
+        module = getattr(obj, "__module__", None)
+        hasher.update(f"callable:{module}.{obj.__qualname__};".encode())
+        instance = getattr(obj, "__self__", None)
+        if instance is not None and not isinstance(instance, types.ModuleType):
+            # bound method; name alone is shared by all instances
+            _update_pickled(hasher, instance)
+    else:
+        _update_pickled(hasher, obj)
+
+
+def fingerprint(*objs: typing.Any, digest_size: int = 20) -> str:
+    """Hex digest of content-based fingerprint of `objs`.
+
+    See `update_fingerprint` for details.
+    """
+    hasher = hashlib.blake2b(digest_size=digest_size)
+    for obj in objs:
+        update_fingerprint(hasher, obj)
+    return hasher.hexdigest()
@@ -0,0 +1,9 @@
+import typing
+
+
+def identity(x: typing.Any, *args, **kwargs) -> typing.Any:
+    """Return `x` unchanged, ignoring other arguments.
+
+    Picklable stand-in for `lambda x, *args, **kwargs: x`.
+    """
+    return x
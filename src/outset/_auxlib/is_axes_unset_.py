@@ -1,11 +1,28 @@
+import typing
+
 from matplotlib.axes import Axes as mpl_Axes
 
 
-def is_axes_unset(ax: mpl_Axes) -> bool:
-    """Test if axes limits have been set."""
+def is_axes_populated(ax: mpl_Axes) -> bool:
+    """Test if axes hold plotted content."""
     # see https://matplotlib.org/stable/users/faq.html#check-whether-a-figure-is-empty
+    return len(ax.get_children()) > 10  # 10 objs in empty ax
+
+
+def is_axlim_unset(
+    xlim: typing.Tuple[float, float],
+    ylim: typing.Tuple[float, float],
+    populated: bool,
+) -> bool:
+    """Test if axes limits `xlim` and `ylim` have been set, for axes that do
+    or do not hold plotted content, according to `populated`."""
     return not (
-        len(ax.get_children()) > 10  # 10 objs in empty ax
-        or ax.get_xlim() != (0.0, 1.0)  # in case axlim set manually...
-        or ax.get_ylim() != (0.0, 1.0)
+        populated
+        or tuple(xlim) != (0.0, 1.0)  # in case axlim set manually...
+        or tuple(ylim) != (0.0, 1.0)
     )
+
+
+def is_axes_unset(ax: mpl_Axes) -> bool:
+    """Test if axes limits have been set."""
+    return is_axlim_unset(ax.get_xlim(), ax.get_ylim(), is_axes_populated(ax))
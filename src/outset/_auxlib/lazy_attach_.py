@@ -0,0 +1,55 @@
+import importlib
+import typing
+
+
+def lazy_attach(
+    package_name: str,
+    submodules: typing.Sequence[str] = (),
+    submodule_attrs: typing.Optional[
+        typing.Mapping[str, typing.Sequence[str]]
+    ] = None,
+) -> typing.Tuple[
+    typing.Callable[[str], typing.Any], typing.Callable[[], typing.List[str]]
+]:
+    """Create PEP 562 module `__getattr__` and `__dir__` that import
+    subpackages and re-exported attributes on first access.
+
+    Parameters
+    ----------
+    package_name : str
+        Fully qualified name of the package, i.e., its `__name__`.
+    submodules : Sequence[str], default ()
+        Names of subpackages to expose as attributes, e.g., `"mark"`.
+    submodule_attrs : Mapping[str, Sequence[str]], optional
+        Attributes to re-export, keyed by relative name of the module that
+        defines them, e.g., `{"._OutsetGrid": ["OutsetGrid"]}`.
+
+    Returns
+    -------
+    tuple of Callable
+        The module `__getattr__` and `__dir__`.
+    """
+    package = importlib.import_module(package_name)
+    origins = {
+        attr: module_name
+        for module_name, attrs in (submodule_attrs or {}).items()
+        for attr in attrs
+    }
+
+    def __getattr__(name: str) -> typing.Any:
+        if name in submodules:
+            value = importlib.import_module(f".{name}", package_name)
+        elif name in origins:
+            module = importlib.import_module(origins[name], package_name)
+            value = getattr(module, name)
+        else:
+            raise AttributeError(
+                f"module {package_name!r} has no attribute {name!r}",
+            )
+        setattr(package, name, value)  # bypass __getattr__ hereafter
+        return value
+
+    def __dir__() -> typing.List[str]:
+        return sorted({*vars(package), *submodules, *origins})
+
+    return __getattr__, __dir__
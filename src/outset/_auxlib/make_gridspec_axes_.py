@@ -0,0 +1,71 @@
+import typing
+
+import matplotlib as mpl
+from matplotlib import pyplot as plt
+from matplotlib.figure import Figure as mpl_Figure
+import numpy as np
+
+
+def make_gridspec_axes(
+    num_axes: int,
+    nrow: int,
+    ncol: int,
+    figsize: typing.Tuple[float, float],
+    gridspec_kws: typing.Optional[typing.Dict] = None,
+    subplot_kws: typing.Optional[typing.Dict] = None,
+    pyplot: bool = True,
+) -> typing.Tuple[mpl_Figure, np.ndarray]:
+    """Create a figure with axes laid out over a single GridSpec.
+
+    Axes are filled row-major. Unlike `FacetGrid`, no titles, tick label
+    visibility adjustments, or layout passes are applied.
+
+    Parameters
+    ----------
+    num_axes : int
+        Number of axes to create.
+    nrow : int
+        Number of GridSpec rows.
+    ncol : int
+        Number of GridSpec columns.
+    figsize : Tuple[float, float]
+        Figure width and height, in inches.
+    gridspec_kws : Dict, optional
+        Keyword arguments forwarded to `Figure.add_gridspec`.
+    subplot_kws : Dict, optional
+        Keyword arguments forwarded to `Figure.add_subplot`.
+    pyplot : bool, default True
+        Should the figure be created through, and registered with, pyplot?
+
+        If False, the figure is constructed directly and no global pyplot or
+        rcParams state is modified, so figures may be built concurrently
+        across threads.
+
+    Returns
+    -------
+    Tuple[matplotlib.figure.Figure, np.ndarray]
+        The created figure and a flat object array of its axes.
+    """
+    if num_axes > nrow * ncol:
+        raise ValueError(
+            f"cannot fit {num_axes} axes in {nrow}x{ncol} grid",
+        )
+
+    if pyplot:
+        with mpl.rc_context(
+            {
+                "figure.autolayout": False,
+                "figure.constrained_layout.use": False,
+            },
+        ):
+            fig = plt.figure(figsize=figsize)
+    else:
+        fig = mpl_Figure(figsize=figsize, layout="none")
+    gs = fig.add_gridspec(max(nrow, 1), max(ncol, 1), **(gridspec_kws or {}))
+
+    axes = np.empty(num_axes, object)
+    for i in range(num_axes):
+        row, col = divmod(i, ncol)
+        axes[i] = fig.add_subplot(gs[row, col], **(subplot_kws or {}))
+
+    return fig, axes
@@ -0,0 +1,19 @@
+import typing
+
+from matplotlib import markers as mpl_markers
+
+from .render_lock_ import render_lock
+
+
+def make_marker_style(
+    marker: typing.Union[str, mpl_markers.MarkerStyle],
+) -> mpl_markers.MarkerStyle:
+    """Create a MarkerStyle, serializing marker path construction across
+    threads.
+
+    Mathtext markers (e.g., "$1$") are parsed into paths eagerly, through a
+    parser matplotlib shares process-wide and does not guard for concurrent
+    use. Passing the resulting MarkerStyle to `plot` reuses its cached path.
+    """
+    with render_lock:
+        return mpl_markers.MarkerStyle(marker)
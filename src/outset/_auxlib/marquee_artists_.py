@@ -0,0 +1,149 @@
+import dataclasses
+import numbers
+import typing
+
+from matplotlib.artist import Artist as mpl_Artist
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib import image as mpl_image
+from matplotlib import lines as mpl_lines
+from matplotlib import patches as mpl_patches
+from matplotlib import text as mpl_text
+import numpy as np
+
+from .compose_callout_leader_ import compose_callout_leader
+from .get_vertices_extent_ import get_vertices_extent
+
+
+@dataclasses.dataclass
+class MarqueeArtists:
+    """Artists composing one drawn marquee, with the settings needed to
+    recompute its geometry in place."""
+
+    frame_patches: typing.List[mpl_patches.Rectangle]
+    leader_patches: typing.List[mpl_patches.Polygon]
+    leader_images: typing.List[mpl_image.AxesImage]
+    glyph_artists: typing.List[mpl_Artist]
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]]
+    leader_stretch: float
+    leader_stretch_unit: str
+    leader_tweak: typing.Callable
+    mark_retract: float
+    mark_xy: np.ndarray  # glyph position
+    frame_xlim: np.ndarray  # padded frame bounds, as drawn
+    frame_ylim: np.ndarray
+    # (outset, hue) values of the data subset framed, if known
+    key: typing.Tuple[typing.Any, typing.Any] = (None, None)
+
+
+def calc_mark_xy(
+    leader_vertices: typing.Sequence[typing.Tuple[float, float]],
+    mark_retract: float,
+) -> np.ndarray:
+    """Position glyph near outer vertex of callout leader."""
+    return np.average(
+        np.array([leader_vertices[-1], leader_vertices[1]]),
+        weights=np.array([1.0 - mark_retract, mark_retract]),
+        axis=0,
+    )
+
+
+def get_marquees(ax: mpl_Axes) -> typing.List[MarqueeArtists]:
+    """Get marquees drawn on `ax` by `draw_marquee`, in drawing order."""
+    return ax.__dict__.setdefault("_outset_marquees", [])
+
+
+def pad_frame(
+    ax: mpl_Axes,
+    frame_xlim: typing.Tuple[float, float],
+    frame_ylim: typing.Tuple[float, float],
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]],
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Pad frame coordinates out from data, as `draw_marquee` does."""
+    if isinstance(frame_inner_pad, typing.Iterable):
+        pad_x, pad_y = frame_inner_pad
+    elif isinstance(frame_inner_pad, numbers.Number):
+        pad_x = (np.ptp(frame_xlim) or np.ptp(ax.get_xlim())) * frame_inner_pad
+        pad_y = (np.ptp(frame_ylim) or np.ptp(ax.get_ylim())) * frame_inner_pad
+    else:
+        raise ValueError(
+            f"frame_inner_pad must be float or tuple, not {frame_inner_pad}",
+        )
+    return (
+        np.array(frame_xlim) + np.array([-pad_x, pad_x]),
+        np.array(frame_ylim) + np.array([-pad_y, pad_y]),
+    )
+
+
+def unpad_frame(
+    frame_xlim: typing.Tuple[float, float],
+    frame_ylim: typing.Tuple[float, float],
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]],
+) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Invert `pad_frame`, recovering frame coordinates from padded bounds.
+
+    Assumes frame coordinates span a nonzero extent on both axes.
+    """
+    frame_xlim, frame_ylim = np.array(frame_xlim), np.array(frame_ylim)
+    if isinstance(frame_inner_pad, typing.Iterable):
+        pad_x, pad_y = frame_inner_pad
+    elif isinstance(frame_inner_pad, numbers.Number):
+        pad_x = np.ptp(frame_xlim) * frame_inner_pad / (1 + 2 * frame_inner_pad)
+        pad_y = np.ptp(frame_ylim) * frame_inner_pad / (1 + 2 * frame_inner_pad)
+    else:
+        raise ValueError(
+            f"frame_inner_pad must be float or tuple, not {frame_inner_pad}",
+        )
+    return (
+        frame_xlim + np.array([pad_x, -pad_x]),
+        frame_ylim + np.array([pad_y, -pad_y]),
+    )
+
+
+def update_marquee(
+    ax: mpl_Axes,
+    marquee: MarqueeArtists,
+    frame_xlim: np.ndarray,
+    frame_ylim: np.ndarray,
+) -> None:
+    """Move and resize a drawn marquee's artists in place to frame padded
+    bounds `frame_xlim` and `frame_ylim`.
+
+    Axes limits should be final before calling, as leader geometry depends
+    on them.
+    """
+    # discard any cached hit-testing index, see `marquee_index_`
+    ax.__dict__.pop("_outset_marquee_index", None)
+    for patch in marquee.frame_patches:
+        patch.set_bounds(
+            frame_xlim[0],
+            frame_ylim[0],
+            frame_xlim[1] - frame_xlim[0],
+            frame_ylim[1] - frame_ylim[0],
+        )
+
+    leader_vertices = compose_callout_leader(
+        frame_xlim,
+        frame_ylim,
+        ax,
+        stretch=marquee.leader_stretch,
+        stretch_unit=marquee.leader_stretch_unit,
+    )
+    leader_vertices = marquee.leader_tweak(leader_vertices, ax)
+    for patch in marquee.leader_patches:
+        patch.set_xy(leader_vertices)
+    for image in marquee.leader_images:
+        image.set_extent(get_vertices_extent(leader_vertices))
+
+    mark_xy = calc_mark_xy(leader_vertices, marquee.mark_retract)
+    dx, dy = mark_xy - marquee.mark_xy
+    for artist in marquee.glyph_artists:
+        if isinstance(artist, mpl_lines.Line2D):
+            xdata, ydata = artist.get_data()
+            artist.set_data(np.add(xdata, dx), np.add(ydata, dy))
+        elif isinstance(artist, mpl_text.Text):
+            x, y = artist.get_position()
+            artist.set_position((x + dx, y + dy))
+
+    marquee.mark_xy = mark_xy
+    marquee.frame_xlim = np.array(frame_xlim)
+    marquee.frame_ylim = np.array(frame_ylim)
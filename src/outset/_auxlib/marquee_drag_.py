@@ -0,0 +1,112 @@
+import typing
+
+from matplotlib import artist as mpl_artist
+from matplotlib import axes as mpl_axes
+import numpy as np
+
+from .marquee_artists_ import MarqueeArtists, get_marquees, update_marquee
+from .render_lock_ import render_lock
+from .rescale_lim_ import rescale_lim
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+
+def _get_artists(marquee: MarqueeArtists) -> typing.List[mpl_artist.Artist]:
+    return [
+        *marquee.frame_patches,
+        *marquee.leader_patches,
+        *marquee.leader_images,
+        *marquee.glyph_artists,
+    ]
+
+
+class MarqueeDrag:
+    """Blitted, in-place repositioning of one source axes marquee, with
+    matching outset axes limits and marquees following.
+
+    On creation, caches a figure background without the marquee or matching
+    outset axes. Each `move` then redraws only those, over the cached
+    background.
+    """
+
+    marquee: MarqueeArtists
+    frame_xlim: np.ndarray  # at creation
+    frame_ylim: np.ndarray
+
+    _background: typing.Any
+    _grid: "OutsetGrid"
+    # matching outset axes and marquees, with axes limits and frames at
+    # creation
+    _outsets: typing.List[
+        typing.Tuple[
+            mpl_axes.Axes, MarqueeArtists, typing.Tuple[np.ndarray, ...]
+        ]
+    ]
+
+    def __init__(
+        self: "MarqueeDrag", grid: "OutsetGrid", marquee: MarqueeArtists
+    ) -> None:
+        self.marquee = marquee
+        self.frame_xlim = marquee.frame_xlim.copy()
+        self.frame_ylim = marquee.frame_ylim.copy()
+        self._grid = grid
+        self._outsets = [
+            (
+                ax,
+                outset_marquee,
+                (
+                    np.array(ax.get_xlim()),
+                    np.array(ax.get_ylim()),
+                    outset_marquee.frame_xlim.copy(),
+                    outset_marquee.frame_ylim.copy(),
+                ),
+            )
+            for ax in grid.outset_axes
+            for outset_marquee in get_marquees(ax)
+            if outset_marquee.key == marquee.key and marquee.key != (None, None)
+        ]
+
+        canvas = grid.figure.canvas
+        for artist in _get_artists(marquee):
+            artist.set_animated(True)
+        for ax, __, __ in self._outsets:
+            ax.set_visible(False)
+        with render_lock:
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(grid.figure.bbox)
+        for ax, __, __ in self._outsets:
+            ax.set_visible(True)
+
+    def move(
+        self: "MarqueeDrag", frame_xlim: np.ndarray, frame_ylim: np.ndarray
+    ) -> None:
+        """Reposition marquee to padded frame bounds, rescale matching
+        outset axes limits to follow, and redraw by blitting."""
+        update_marquee(
+            self._grid.source_axes, self.marquee, frame_xlim, frame_ylim
+        )
+        for ax, marquee, (ax_xlim, ax_ylim, m_xlim, m_ylim) in self._outsets:
+            new_xlim = rescale_lim(m_xlim, self.frame_xlim, frame_xlim)
+            new_ylim = rescale_lim(m_ylim, self.frame_ylim, frame_ylim)
+            ax.set_xlim(*rescale_lim(ax_xlim, m_xlim, new_xlim))
+            ax.set_ylim(*rescale_lim(ax_ylim, m_ylim, new_ylim))
+            update_marquee(ax, marquee, new_xlim, new_ylim)
+
+        fig = self._grid.figure
+        with render_lock:
+            fig.canvas.restore_region(self._background)
+            for artist in _get_artists(self.marquee):
+                self._grid.source_axes.draw_artist(artist)
+            # draw outset axes last, as they may be inset over source axes
+            for ax, __, __ in self._outsets:
+                fig.draw_artist(ax)
+            fig.canvas.blit(fig.bbox)
+
+    def finish(self: "MarqueeDrag", redraw: bool = True) -> None:
+        """Restore marquee artists to ordinary drawing, and optionally
+        request a full redraw."""
+        for artist in _get_artists(self.marquee):
+            artist.set_animated(False)
+        if redraw:
+            self._grid.figure.canvas.draw_idle()
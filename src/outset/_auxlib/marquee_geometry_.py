@@ -0,0 +1,277 @@
+import dataclasses
+import numbers
+import typing
+
+from matplotlib import axes as mpl_axes
+import numpy as np
+import pandas as pd
+
+from .calc_aspect_ import calc_aspect_from_limits
+from .calc_axes_size_ import calc_axes_size
+from .calc_prepad_axlim_ import calc_prepad_axlim
+from .compose_callout_leader_ import calc_callout_leader
+from .identity_ import identity
+from .is_axes_unset_ import is_axes_populated, is_axlim_unset
+from .marquee_artists_ import calc_mark_xy
+from .set_aspect_ import calc_aspect_axlim
+
+
+@dataclasses.dataclass
+class MarqueeLayout:
+    """Geometry of one marquee, as it would be drawn."""
+
+    key: typing.Tuple[typing.Any, typing.Any]  # (outset, hue) values framed
+    frame_xlim: np.ndarray  # padded frame bounds
+    frame_ylim: np.ndarray
+    leader_vertices: np.ndarray  # after tweak
+    mark_xy: np.ndarray  # glyph position
+
+
+@dataclasses.dataclass
+class AxesState:
+    """Limits and size of an axes, standing in for the axes itself to lay out
+    marquees without creating artists.
+
+    Methods mirror the effect of their counterparts in `marqueeplot`,
+    `draw_marquee`, and `set_aspect` on axes limits.
+    """
+
+    xlim: typing.Tuple[float, float]
+    ylim: typing.Tuple[float, float]
+    axes_size: typing.Tuple[float, float]  # inches
+    figure_size: typing.Tuple[float, float]  # inches
+    has_artists: bool = False  # has plotted content, see `is_axes_unset`
+
+    @classmethod
+    def from_axes(
+        cls: typing.Type["AxesState"], ax: mpl_axes.Axes
+    ) -> "AxesState":
+        return cls(
+            xlim=tuple(ax.get_xlim()),
+            ylim=tuple(ax.get_ylim()),
+            axes_size=calc_axes_size(ax),
+            figure_size=tuple(ax.figure.get_size_inches()),
+            has_artists=is_axes_populated(ax),
+        )
+
+    def is_unset(self: "AxesState") -> bool:
+        """Test if axes limits have been set, as `is_axes_unset`."""
+        return is_axlim_unset(self.xlim, self.ylim, self.has_artists)
+
+    def calc_aspect(self: "AxesState") -> float:
+        """Calculate display aspect ratio, as `calc_aspect`."""
+        return calc_aspect_from_limits(self.xlim, self.ylim, self.axes_size)
+
+    def set_aspect(self: "AxesState", aspect: float) -> None:
+        """Symmetrically extend one axis' limits to achieve display aspect
+        ratio `aspect`, as `set_aspect`."""
+        self.xlim, self.ylim = calc_aspect_axlim(
+            self.xlim, self.ylim, self.axes_size, aspect
+        )
+
+    def prepad_axlim(
+        self: "AxesState",
+        data_xlims: np.ndarray,
+        data_ylims: np.ndarray,
+        frame_inner_pad: typing.Union[float, typing.Tuple[float, float]],
+        frame_outer_pad: typing.Union[float, typing.Tuple[float, float]],
+        frame_outer_pad_unit: str,
+        tight_axlim: bool,
+    ) -> None:
+        """Grow limits to include padded frames around data extents, given as
+        one `(min, max)` row per marquee, as `_prepad_axlim`."""
+        self.xlim, self.ylim = calc_prepad_axlim(
+            self.xlim,
+            self.ylim,
+            data_xlims,
+            data_ylims,
+            frame_inner_pad=frame_inner_pad,
+            frame_outer_pad=frame_outer_pad,
+            frame_outer_pad_unit=frame_outer_pad_unit,
+            tight_axlim=tight_axlim,
+            populated=self.has_artists,
+            axes_size=self.axes_size,
+            figure_size=self.figure_size,
+        )
+
+    def layout_marquee(
+        self: "AxesState",
+        data_xlim: typing.Tuple[float, float],
+        data_ylim: typing.Tuple[float, float],
+        *,
+        frame_inner_pad: typing.Union[float, typing.Tuple[float, float]],
+        leader_stretch: float,
+        leader_stretch_unit: str,
+        leader_tweak: typing.Callable,
+        mark_retract: float,
+        ax: typing.Optional[mpl_axes.Axes] = None,
+    ) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Lay out a marquee around data extent, as `draw_marquee` with zero
+        outer pad.
+
+        Returns
+        -------
+        tuple of np.ndarray
+            Padded frame x and y limits, leader vertices, and glyph position.
+        """
+        if isinstance(frame_inner_pad, numbers.Number):
+            pad_x = (np.ptp(data_xlim) or np.ptp(self.xlim)) * frame_inner_pad
+            pad_y = (np.ptp(data_ylim) or np.ptp(self.ylim)) * frame_inner_pad
+        else:
+            pad_x, pad_y = frame_inner_pad
+        frame_xlim = np.array(data_xlim) + np.array([-pad_x, pad_x])
+        frame_ylim = np.array(data_ylim) + np.array([-pad_y, pad_y])
+
+        if self.is_unset():
+            if np.ptp(frame_xlim):
+                self.xlim = tuple(frame_xlim)
+            if np.ptp(frame_ylim):
+                self.ylim = tuple(frame_ylim)
+        else:  # ensure no viewport shrink
+            (x0, x1), (y0, y1) = self.xlim, self.ylim
+            self.xlim = (min(frame_xlim[0], x0), max(frame_xlim[1], x1))
+            self.ylim = (min(frame_ylim[0], y0), max(frame_ylim[1], y1))
+        self.has_artists = True
+
+        leader_vertices = calc_callout_leader(
+            frame_xlim,
+            frame_ylim,
+            self.xlim,
+            self.ylim,
+            leader_stretch,
+            leader_stretch_unit,
+            axes_size=self.axes_size,
+            figure_size=self.figure_size,
+        )
+        leader_vertices = np.array(leader_tweak(leader_vertices, ax), float)
+        mark_xy = calc_mark_xy(leader_vertices, mark_retract)
+        return frame_xlim, frame_ylim, leader_vertices, mark_xy
+
+
+def _encode(
+    values: typing.Any, order: typing.Optional[typing.Sequence]
+) -> typing.Tuple[np.ndarray, typing.List]:
+    """Find position of each value within `order`, or -1 if absent.
+
+    If `order` is None, sorted unique values are used.
+    """
+    codes, uniques = pd.factorize(np.asarray(values))
+    order = sorted(uniques) if order is None else list(order)
+    lookup = {value: i for i, value in enumerate(order)}
+    # factorize codes missing values as -1, i.e., last entry
+    recode = np.array([*(lookup.get(u, -1) for u in uniques), -1], dtype=int)
+    return recode[codes], order
+
+
+def layout_marqueeplot(
+    state: AxesState,
+    data: typing.Any,
+    *,
+    x: str,
+    y: str,
+    hue: typing.Optional[str] = None,
+    hue_order: typing.Optional[typing.Sequence] = None,
+    outset: typing.Optional[str] = None,
+    outset_order: typing.Optional[typing.Sequence] = None,
+    ax: typing.Optional[mpl_axes.Axes] = None,
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
+    frame_outer_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
+    frame_outer_pad_unit: str = "axes",
+    leader_stretch: float = 0.2,
+    leader_stretch_unit: str = "inches",
+    leader_tweak: typing.Union[typing.Callable, typing.Type] = identity,
+    mark_retract: float = 0.1,
+    preserve_aspect: typing.Optional[bool] = False,
+    tight_axlim: bool = False,
+) -> typing.List[MarqueeLayout]:
+    """Lay out marquees as `marqueeplot` would draw them, updating `state`
+    as `marqueeplot` would update axes limits.
+
+    Data may be a DataFrame or a mapping of column names to arrays. Marquees
+    are ordered as drawn, by outset then by hue.
+    """
+    if x not in data or y not in data:
+        raise ValueError(
+            f"data does not contain both coordinate columns x={x} and y={y}",
+        )
+    xs = np.asarray(data[x], dtype=float)
+    ys = np.asarray(data[y], dtype=float)
+    if np.isnan(xs).any():
+        raise ValueError(f"col x={x} contains {np.isnan(xs).sum()} na values")
+    if np.isnan(ys).any():
+        raise ValueError(f"col y={y} contains {np.isnan(ys).sum()} na values")
+
+    if isinstance(leader_tweak, type):
+        leader_tweak = leader_tweak()
+
+    if preserve_aspect or (preserve_aspect is None and not state.is_unset()):
+        initial_aspect = state.calc_aspect()
+    else:
+        initial_aspect = None
+    initial_axlim = state.xlim, state.ylim
+
+    zeros = np.zeros(len(xs), dtype=int)
+    hue_codes, hue_order = (
+        (zeros, [None]) if hue is None else _encode(data[hue], hue_order)
+    )
+    outset_codes, outset_order = (
+        (zeros, [None])
+        if outset is None
+        else _encode(data[outset], outset_order)
+    )
+
+    # group by outset then by hue, as drawn
+    keep = np.flatnonzero((hue_codes >= 0) & (outset_codes >= 0))
+    group_ids = outset_codes[keep] * len(hue_order) + hue_codes[keep]
+    order = keep[np.argsort(group_ids, kind="stable")]
+    group_ids = group_ids[np.argsort(group_ids, kind="stable")]
+    starts = np.flatnonzero(np.diff(group_ids, prepend=-1))
+    data_xlims, data_ylims = (
+        np.stack(
+            [
+                np.minimum.reduceat(values[order], starts),
+                np.maximum.reduceat(values[order], starts),
+            ],
+            axis=1,
+        )
+        if len(order)
+        else np.empty((0, 2))
+        for values in (xs, ys)
+    )
+
+    state.prepad_axlim(
+        data_xlims,
+        data_ylims,
+        frame_inner_pad=frame_inner_pad,
+        frame_outer_pad=frame_outer_pad,
+        frame_outer_pad_unit=frame_outer_pad_unit,
+        tight_axlim=tight_axlim,
+    )
+
+    layouts = []
+    for group_id, data_xlim, data_ylim in zip(
+        group_ids[starts], data_xlims, data_ylims
+    ):
+        outset_code, hue_code = divmod(group_id, len(hue_order))
+        layouts.append(
+            MarqueeLayout(
+                (outset_order[outset_code], hue_order[hue_code]),
+                *state.layout_marquee(
+                    data_xlim,
+                    data_ylim,
+                    frame_inner_pad=frame_inner_pad,
+                    leader_stretch=leader_stretch,
+                    leader_stretch_unit=leader_stretch_unit,
+                    leader_tweak=leader_tweak,
+                    mark_retract=mark_retract,
+                    ax=ax,
+                ),
+            ),
+        )
+
+    if initial_aspect is not None and not np.allclose(
+        np.array(initial_axlim), np.array((state.xlim, state.ylim))
+    ):
+        state.set_aspect(initial_aspect)
+
+    return layouts
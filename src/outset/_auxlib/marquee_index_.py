@@ -0,0 +1,114 @@
+import collections
+import math
+import typing
+
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib import patches as mpl_patches
+import numpy as np
+
+from .marquee_artists_ import MarqueeArtists, get_marquees
+
+
+def _get_hit_patches(marquee: MarqueeArtists) -> typing.List[mpl_patches.Patch]:
+    return [*marquee.frame_patches, *marquee.leader_patches]
+
+
+class MarqueeIndex:
+    """Uniform grid index over display coordinate bounding boxes of an axes'
+    marquee frames and leaders.
+
+    Indexed patches are bucketed into every grid cell their bounding box
+    overlaps, with about one cell per patch, so point queries check only
+    the few patches near the point.
+    """
+
+    # (marquee position in drawing order, patch) in drawing order
+    _items: typing.List[typing.Tuple[int, mpl_patches.Patch]]
+    _extents: np.ndarray  # item bounding boxes, rows of (x0, y0, x1, y1)
+    _cells: typing.Dict[typing.Tuple[int, int], typing.List[int]]
+    _origin: np.ndarray
+    _cell_size: np.ndarray
+
+    def __init__(self: "MarqueeIndex", ax: mpl_Axes) -> None:
+        self._items = [
+            (i, patch)
+            for i, marquee in enumerate(get_marquees(ax))
+            for patch in _get_hit_patches(marquee)
+        ]
+        self._extents = np.array(
+            [
+                # pad for contains_point, which hits within linewidth of edge
+                patch.get_window_extent().padded(patch.get_linewidth()).extents
+                for __, patch in self._items
+            ],
+        ).reshape(-1, 4)
+        self._cells = collections.defaultdict(list)
+        if not len(self._items):
+            self._origin, self._cell_size = np.zeros(2), np.ones(2)
+            return
+
+        lo = self._extents[:, :2].min(axis=0)
+        hi = self._extents[:, 2:].max(axis=0)
+        num_cells = math.ceil(math.sqrt(len(self._items)))
+        self._origin = lo
+        self._cell_size = np.maximum((hi - lo) / num_cells, 1.0)
+        cell_lo = self._to_cell(self._extents[:, :2])
+        cell_hi = self._to_cell(self._extents[:, 2:])
+        for item, ((cx0, cy0), (cx1, cy1)) in enumerate(zip(cell_lo, cell_hi)):
+            for cx in range(cx0, cx1 + 1):
+                for cy in range(cy0, cy1 + 1):
+                    self._cells[cx, cy].append(item)
+
+    def _to_cell(self: "MarqueeIndex", xy: np.ndarray) -> np.ndarray:
+        return np.floor((xy - self._origin) / self._cell_size).astype(int)
+
+    def query(self: "MarqueeIndex", x: float, y: float) -> typing.List[int]:
+        """Find marquees with a frame or leader containing display point
+        `(x, y)`, as positions in drawing order, topmost first."""
+        cx, cy = self._to_cell(np.array([x, y]))
+        hits = []
+        for item in reversed(self._cells.get((cx, cy), ())):
+            i, patch = self._items[item]
+            x0, y0, x1, y1 = self._extents[item]
+            if (
+                i not in hits
+                and x0 <= x <= x1
+                and y0 <= y <= y1
+                and patch.contains_point((x, y))
+            ):
+                hits.append(i)
+        return sorted(hits, reverse=True)
+
+
+def _get_index_signature(ax: mpl_Axes) -> typing.Tuple:
+    """Summarize state that display coordinate extents depend on."""
+    return (
+        tuple(ax.bbox.bounds),
+        tuple(ax.viewLim.bounds),
+        len(get_marquees(ax)),
+    )
+
+
+def query_marquees(
+    ax: mpl_Axes, x: float, y: float
+) -> typing.List[MarqueeArtists]:
+    """Find marquees drawn on `ax` with a frame or leader containing display
+    point `(x, y)`, topmost first.
+
+    Uses an index cached on `ax`, rebuilt only when axes position or limits
+    change, a marquee is added, or `invalidate_marquee_index` is called.
+    """
+    signature = _get_index_signature(ax)
+    cached = ax.__dict__.get("_outset_marquee_index")
+    if cached is None or cached[0] != signature:
+        cached = signature, MarqueeIndex(ax)
+        ax.__dict__["_outset_marquee_index"] = cached
+
+    marquees = get_marquees(ax)
+    return [marquees[i] for i in cached[1].query(x, y)]
+
+
+def invalidate_marquee_index(ax: mpl_Axes) -> None:
+    """Discard index cached on `ax` by `query_marquees`, e.g., after a
+    marquee is moved in place."""
+    ax.__dict__.pop("_outset_marquee_index", None)
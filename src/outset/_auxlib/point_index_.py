@@ -0,0 +1,93 @@
+import math
+import typing
+
+from matplotlib import path as mpl_path
+import numpy as np
+
+
+class PointIndex:
+    """Static bucket grid index over 2D points, for rectangle and polygon
+    queries.
+
+    Points are sorted by row-major grid cell, with about 16 points per cell
+    on average, so each grid row's cells overlapping a query rectangle map
+    to one contiguous slice of sorted points.
+    """
+
+    xy: np.ndarray
+
+    _order: np.ndarray  # point indices, sorted by cell
+    _starts: np.ndarray  # position in `_order` of each cell's first point
+    _origin: np.ndarray
+    _cell_size: np.ndarray
+    _num_cells: int  # per dimension
+
+    def __init__(
+        self: "PointIndex", xy: np.ndarray, points_per_cell: int = 16
+    ) -> None:
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        num_points = len(self.xy)
+        self._num_cells = max(
+            math.ceil(math.sqrt(num_points / points_per_cell)), 1
+        )
+        if num_points:
+            lo, hi = self.xy.min(axis=0), self.xy.max(axis=0)
+        else:
+            lo, hi = np.zeros(2), np.ones(2)
+        self._origin = lo
+        self._cell_size = np.where(hi > lo, (hi - lo) / self._num_cells, 1.0)
+
+        cell_ids = self._to_cell_id(self._to_cell(self.xy))
+        self._order = np.argsort(cell_ids, kind="stable")
+        self._starts = np.searchsorted(
+            cell_ids[self._order], np.arange(self._num_cells**2 + 1)
+        )
+
+    def _to_cell(self: "PointIndex", xy: np.ndarray) -> np.ndarray:
+        cell = np.floor((xy - self._origin) / self._cell_size).astype(int)
+        return np.clip(cell, 0, self._num_cells - 1)
+
+    def _to_cell_id(self: "PointIndex", cell: np.ndarray) -> np.ndarray:
+        return cell[..., 1] * self._num_cells + cell[..., 0]
+
+    def query_bbox(
+        self: "PointIndex", x0: float, y0: float, x1: float, y1: float
+    ) -> np.ndarray:
+        """Find indices of points within rectangle `(x0, y0, x1, y1)`."""
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        (cx0, cy0), (cx1, cy1) = self._to_cell(np.array([[x0, y0], [x1, y1]]))
+        # each grid row's overlapping cells are contiguous in sorted order
+        row_offsets = np.arange(cy0, cy1 + 1) * self._num_cells
+        candidates = np.concatenate(
+            [
+                self._order[start:stop]
+                for start, stop in zip(
+                    self._starts[row_offsets + cx0],
+                    self._starts[row_offsets + cx1 + 1],
+                )
+            ],
+        )
+        xy = self.xy[candidates]
+        return candidates[
+            (xy[:, 0] >= x0)
+            & (xy[:, 0] <= x1)
+            & (xy[:, 1] >= y0)
+            & (xy[:, 1] <= y1)
+        ]
+
+    def query_polygon(
+        self: "PointIndex",
+        vertices: typing.Sequence[typing.Tuple[float, float]],
+    ) -> np.ndarray:
+        """Find indices of points within polygon `vertices`, sorted.
+
+        Only points within the polygon's bounding box are tested against it.
+        """
+        vertices = np.asarray(vertices, dtype=float).reshape(-1, 2)
+        if len(vertices) < 3:
+            return np.empty(0, dtype=int)
+        (x0, y0), (x1, y1) = vertices.min(axis=0), vertices.max(axis=0)
+        candidates = self.query_bbox(x0, y0, x1, y1)
+        inside = mpl_path.Path(vertices).contains_points(self.xy[candidates])
+        return np.sort(candidates[inside])
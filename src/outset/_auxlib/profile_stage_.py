@@ -0,0 +1,187 @@
+import contextlib
+import dataclasses
+import functools
+import threading
+import time
+import typing
+
+from matplotlib import axes as mpl_axes
+from matplotlib import figure as mpl_figure
+
+# axes or figure to count artists within, or a list of axes
+_Scope = typing.Union[
+    mpl_axes.Axes, mpl_figure.Figure, typing.Sequence[mpl_axes.Axes]
+]
+
+
+def _find_scope(objs: typing.Iterable) -> typing.Optional[_Scope]:
+    """Find the first axes, figure, list of axes, or grid (e.g.,
+    `OutsetGrid`) among `objs`."""
+    for obj in objs:
+        if isinstance(obj, (mpl_axes.Axes, mpl_figure.Figure)):
+            return obj
+        elif isinstance(obj, (list, tuple)):
+            if obj and all(isinstance(item, mpl_axes.Axes) for item in obj):
+                return obj
+        elif isinstance(getattr(obj, "figure", None), mpl_figure.Figure):
+            return obj.figure  # e.g., grid
+    return None
+
+
+def _count_artists(scope: typing.Optional[_Scope]) -> int:
+    """Count artists held directly by `scope` and by its axes."""
+    if scope is None:
+        return 0
+    elif isinstance(scope, mpl_figure.Figure):
+        return len(scope.get_children()) + _count_artists(scope.axes)
+    elif isinstance(scope, mpl_axes.Axes):
+        return len(scope.get_children())
+    return sum(map(_count_artists, scope))
+
+
+@dataclasses.dataclass
+class StageNode:
+    """Timing and artist counts accumulated over calls to one stage, at one
+    position in the stage hierarchy."""
+
+    name: str
+    elapsed: float = 0.0  # seconds, including child stages
+    calls: int = 0
+    artists: int = 0  # net artists added, including within child stages
+    children: typing.Dict[str, "StageNode"] = dataclasses.field(
+        default_factory=dict,
+    )
+
+
+def _sum_artists(nodes: typing.Dict[str, StageNode]) -> int:
+    return sum(node.artists for node in nodes.values())
+
+
+class Profiler:
+    """Records a hierarchy of stage timings for stages entered by the thread
+    that created it.
+
+    Artists are counted as the change in the number of artists held by the
+    axes or figure a stage draws on, so artists created concurrently on
+    other figures are not counted.
+    """
+
+    root: StageNode
+
+    # open stages, with axes or figure their artists are counted within
+    _stack: typing.List[typing.Tuple[StageNode, typing.Optional[_Scope]]]
+
+    def __init__(self: "Profiler") -> None:
+        self.root = StageNode("root", calls=1)
+        self._stack = [(self.root, None)]
+
+    @contextlib.contextmanager
+    def stage(
+        self: "Profiler", name: str, objs: typing.Sequence = ()
+    ) -> typing.Iterator[None]:
+        """Time the enclosed block as stage `name`, counting artists added
+        within the axes, figure, or grid found among `objs`.
+
+        If none is found, artists are counted within the enclosing stage's
+        axes or figure, or else only within child stages.
+        """
+        parent, parent_scope = self._stack[-1]
+        node = parent.children.setdefault(name, StageNode(name))
+        scope = _find_scope(objs) or parent_scope
+        num_artists = _count_artists(scope)
+        num_child_artists = _sum_artists(node.children)
+        self._stack.append((node, scope))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            node.elapsed += time.perf_counter() - start
+            node.calls += 1
+            self._stack.pop()
+            if scope is None:  # e.g., figure created within stage
+                scope, num_artists = _find_scope(objs), 0
+            if scope is None:
+                node.artists += _sum_artists(node.children) - num_child_artists
+            else:
+                node.artists += _count_artists(scope) - num_artists
+
+
+# profilers active on each thread, outermost first
+_local = threading.local()
+# number of profilers active across all threads
+_num_active = 0
+_num_active_lock = threading.Lock()
+_null_context = contextlib.nullcontext()
+
+
+@contextlib.contextmanager
+def _stage_all(
+    profilers: typing.Sequence[Profiler], name: str, objs: typing.Sequence
+) -> typing.Iterator[None]:
+    with contextlib.ExitStack() as stack:
+        for profiler in profilers:
+            stack.enter_context(profiler.stage(name, objs))
+        yield
+
+
+def profile_stage(name: str, *objs: typing.Any) -> typing.ContextManager[None]:
+    """Time the enclosed block as stage `name`, if profiling is enabled on
+    the calling thread.
+
+    Artists added are counted within the first axes, figure, or grid among
+    `objs`, or else within the enclosing stage's.
+    """
+    if not _num_active:
+        return _null_context
+    profilers = getattr(_local, "profilers", None)
+    if not profilers:
+        return _null_context
+    elif len(profilers) == 1:
+        return profilers[0].stage(name, objs)
+    return _stage_all([*profilers], name, objs)
+
+
+def profiled(name: str) -> typing.Callable[[typing.Callable], typing.Callable]:
+    """Decorate a function to time its calls as stage `name`, if profiling is
+    enabled on the calling thread.
+
+    Artists added are counted within the first axes, figure, or grid among
+    call arguments.
+    """
+
+    def decorator(func: typing.Callable) -> typing.Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> typing.Any:
+            if not _num_active:
+                return func(*args, **kwargs)
+            with profile_stage(name, *args, *kwargs.values()):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextlib.contextmanager
+def enable_profiling() -> typing.Iterator[Profiler]:
+    """Record stage timings within the context, from the calling thread.
+
+    Contexts may be nested, with stages recorded by each enclosing context.
+    """
+    global _num_active
+    profiler = Profiler()
+    if not hasattr(_local, "profilers"):
+        _local.profilers = []
+    _local.profilers.append(profiler)
+    with _num_active_lock:
+        _num_active += 1
+
+    start = time.perf_counter()
+    try:
+        yield profiler
+    finally:
+        profiler.root.elapsed = time.perf_counter() - start
+        profiler.root.artists = _sum_artists(profiler.root.children)
+        _local.profilers.remove(profiler)
+        with _num_active_lock:
+            _num_active -= 1
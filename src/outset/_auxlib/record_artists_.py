@@ -0,0 +1,35 @@
+import contextlib
+import typing
+
+from matplotlib.artist import Artist as mpl_Artist
+from matplotlib.axes import Axes as mpl_Axes
+
+
+@contextlib.contextmanager
+def record_artists(ax: mpl_Axes) -> typing.Iterator[typing.List[mpl_Artist]]:
+    """Collect artists added to `ax` within the context.
+
+    Yields a list, which is populated with added artists, in drawing order,
+    on context exit.
+    """
+    before = {id(artist) for artist in ax.get_children()}
+    added = []
+    yield added
+    added.extend(
+        artist for artist in ax.get_children() if id(artist) not in before
+    )
+
+
+@contextlib.contextmanager
+def record_children(ax: mpl_Axes) -> typing.Iterator[typing.List[mpl_Artist]]:
+    """Collect artists added to `ax`'s child artist list (e.g., by `ax.plot`,
+    `ax.add_patch`, or `ax.text`) within the context.
+
+    Unlike `record_artists`, takes time proportional to artists added rather
+    than to artists on `ax`, but misses artists held elsewhere (e.g., a
+    legend). Artists must not be removed from `ax` within the context.
+    """
+    num_before = len(ax._children)
+    added = []
+    yield added
+    added.extend(ax._children[num_before:])
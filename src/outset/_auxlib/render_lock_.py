@@ -0,0 +1,7 @@
+import threading
+
+# matplotlib's text engine (font caches, mathtext parser) is shared
+# process-wide and is not guarded for concurrent use; hold this lock around
+# operations that lay out or render text, so independent figures may be built
+# across threads
+render_lock = threading.RLock()
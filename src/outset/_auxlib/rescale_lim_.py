@@ -0,0 +1,20 @@
+import typing
+
+import numpy as np
+
+
+def rescale_lim(
+    values: typing.Sequence[float],
+    old_bounds: typing.Tuple[float, float],
+    new_bounds: typing.Tuple[float, float],
+) -> np.ndarray:
+    """Map axis coordinates affinely, carrying `old_bounds` onto
+    `new_bounds`.
+
+    Used to shift and rescale axes limits so that content keeps its
+    placement within the viewport. If either bounds are degenerate, values
+    are shifted without rescaling.
+    """
+    (old_lo, old_hi), (new_lo, new_hi) = old_bounds, new_bounds
+    scale = (new_hi - new_lo) / (old_hi - old_lo or np.inf) or 1.0
+    return new_lo + (np.asarray(values, dtype=float) - old_lo) * scale
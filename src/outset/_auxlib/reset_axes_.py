@@ -0,0 +1,85 @@
+import typing
+
+import matplotlib as mpl
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib import transforms as mpl_transforms
+
+
+def get_tick_kws(ax: mpl_Axes) -> typing.Tuple[typing.Dict, ...]:
+    """Snapshot major and minor tick parameters of x and y axes, for use with
+    `reset_axes`."""
+    return tuple(
+        {**tick_kw}
+        for axis in (ax.xaxis, ax.yaxis)
+        for tick_kw in (axis._major_tick_kw, axis._minor_tick_kw)
+    )
+
+
+def reset_axes(
+    ax: mpl_Axes,
+    tick_kws: typing.Optional[typing.Tuple[typing.Dict, ...]] = None,
+) -> None:
+    """Restore axes to a freshly-created state, for reuse.
+
+    Removes plotted artists and legend, and resets titles, labels, limits,
+    aspect, scales, layering, color cycle, and spine visibility. If
+    `tick_kws` are provided (see `get_tick_kws`), tick parameters that have
+    changed are restored.
+
+    Cheaper than `Axes.clear`, which rebuilds axis and tick machinery from
+    scratch. Falls back to `Axes.clear` for non-rectilinear axes or axes with
+    units (e.g., categorical) registered.
+    """
+    if (
+        ax.name != "rectilinear"
+        or ax.xaxis.units is not None
+        or ax.yaxis.units is not None
+    ):
+        ax.clear()
+        return
+
+    for artist in [
+        *ax.artists,
+        *ax.collections,
+        *ax.images,
+        *ax.lines,
+        *ax.patches,
+        *ax.tables,
+        *ax.texts,
+    ]:
+        artist.remove()
+    if ax.legend_ is not None:
+        ax.legend_.remove()
+
+    for loc in "left", "center", "right":
+        ax.set_title("", loc=loc)
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+
+    if ax.get_xscale() != "linear":
+        ax.set_xscale("linear")
+    if ax.get_yscale() != "linear":
+        ax.set_yscale("linear")
+    if tick_kws is not None and get_tick_kws(ax) != tuple(tick_kws):
+        # rebuilding ticks is costly, so only reset if changed
+        for (axis, which), tick_kw in zip(
+            [
+                (ax.xaxis, "major"),
+                (ax.xaxis, "minor"),
+                (ax.yaxis, "major"),
+                (ax.yaxis, "minor"),
+            ],
+            tick_kws,
+        ):
+            axis.set_tick_params(which=which, reset=True, **tick_kw)
+    for spine in ax.spines.values():
+        spine.set_visible(True)
+
+    ax.set_aspect("auto", adjustable="box")
+    ax.set_axisbelow(mpl.rcParams["axes.axisbelow"])
+    ax.set_prop_cycle(None)  # restart color cycle
+    ax.dataLim.set_points(mpl_transforms.Bbox.null().get_points())
+    ax.ignore_existing_data_limits = True
+    ax.set_xlim(0.0, 1.0)
+    ax.set_ylim(0.0, 1.0)
+    ax.set_autoscale_on(True)
@@ -1,11 +1,45 @@
+import typing
 import warnings
 
 from matplotlib import axes as mpl_axes
 import numpy as np
 
-from .calc_aspect_ import calc_aspect
+from .calc_aspect_ import calc_aspect, calc_aspect_from_limits
+from .calc_axes_size_ import calc_axes_size
+from .profile_stage_ import profiled
 
 
+def calc_aspect_axlim(
+    xlim: typing.Tuple[float, float],
+    ylim: typing.Tuple[float, float],
+    axes_size: typing.Tuple[float, float],
+    aspect: float,
+) -> typing.Tuple[typing.Tuple[float, float], typing.Tuple[float, float]]:
+    """Calculate axes limits that achieve display aspect ratio `aspect`, for
+    axes with limits `xlim` and `ylim` rendered at `axes_size` inches.
+
+    One of `xlim` or `ylim` is extended symmetrically; the other is returned
+    unchanged. If the aspect ratio is already within 1% of `aspect`, both are
+    returned unchanged.
+    """
+    xlim, ylim = tuple(xlim), tuple(ylim)
+    before_aspect = calc_aspect_from_limits(xlim, ylim, axes_size)
+    if 0.99 < aspect / before_aspect < 1.01:
+        return xlim, ylim
+
+    width, height = axes_size
+    (x0, x1), (y0, y1) = xlim, ylim
+    if aspect > before_aspect:  # plot is too tall, so increase width
+        pad = (aspect * width * (y1 - y0) / height - (x1 - x0)) / 2
+        assert pad >= 0
+        return (x0 - pad, x1 + pad), ylim
+    else:  # plot is too wide, so increase height
+        pad = (height * (x1 - x0) / (width * aspect) - (y1 - y0)) / 2
+        assert pad >= 0
+        return xlim, (y0 - pad, y1 + pad)
+
+
+@profiled("set_aspect")
 def set_aspect(ax: mpl_axes.Axes, aspect: float) -> None:
     """Adjust the ratio between ylim span length and xlim span length.
 
@@ -18,61 +52,29 @@ def set_aspect(ax: mpl_axes.Axes, aspect: float) -> None:
     Note that axes limits are only ever extended. Data limit extension is
     performed symmetrically.
     """
-    before_aspect = calc_aspect(ax)
-    if 0.99 < aspect / before_aspect < 1.01:
-        return
-
     (x0_, x1_), (y0_, y1_) = ax.get_xlim(), ax.get_ylim()
-    before_width, before_height = np.ptp(ax.get_xlim()), np.ptp(ax.get_ylim())
+    axes_size = calc_axes_size(ax)
+    # matplotlib may apply a previously set aspect here, see `calc_aspect`
+    ax.set_xlim(x0_, x1_)
+    ax.set_ylim(y0_, y1_)
 
-    before_ratio = before_height / before_width
-    ax.set_aspect(aspect, adjustable="datalim")
-    ax.apply_aspect()
-    assert [*ax.get_xlim(), *ax.get_ylim()] != [x0_, x1_, y0_, y1_]
-    assert np.isclose(ax.get_aspect(), aspect)
-    after_ratio = np.ptp(ax.get_ylim()) / np.ptp(ax.get_xlim())
+    xlim, ylim = calc_aspect_axlim((x0_, x1_), (y0_, y1_), axes_size, aspect)
+    if xlim == (x0_, x1_) and ylim == (y0_, y1_):
+        return
 
-    # manual touch-up to ensure growth (not shrink) that is symmetrical
-    if before_ratio == after_ratio:
-        # The current aspect ratio matches the targeted one, no action needed
-        # just need to ensure matplotlib didn't arbitrarily move axis limits
-        ax.set_xlim(x0_, x1_)
-        ax.set_ylim(y0_, y1_)
-        assert ax.get_xlim() == (x0_, x1_) and ax.get_ylim() == (y0_, y1_)
-    elif after_ratio < before_ratio:
-        # plot is too tall so we need to increase the width.
-        # in this case, before_height == after_height
-        after_width = before_height / after_ratio
-        assert after_width >= before_width
-        pad = (after_width - before_width) / 2
-        assert pad >= 0
-        ax.set_xlim(x0_ - pad, x1_ + pad)
-        assert ax.get_xlim() != (x0_, x1_)
-        ax.set_ylim(y0_, y1_)
-    elif after_ratio > before_ratio:
-        # plot is too wide so we need to increase the height.
-        # in this case, before_width == after_width
-        after_height = before_width * after_ratio
-        assert after_height >= before_height
-        pad = (after_height - before_height) / 2
-        assert pad >= 0
-        ax.set_xlim(x0_, x1_)
-        ax.set_ylim(y0_ - pad, y1_ + pad)
-        assert ax.get_ylim() != (y0_, y1_)
-    else:
-        assert False
+    # retain target aspect on redraw, as if applied by matplotlib
+    ax.set_aspect(aspect, adjustable="datalim")
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
 
     # check postconditions...
-    if before_ratio != after_ratio:
-        assert [*ax.get_xlim(), *ax.get_ylim()] != [x0_, x1_, y0_, y1_]
+    assert [*ax.get_xlim(), *ax.get_ylim()] != [x0_, x1_, y0_, y1_]
     # ...targeted aspect ratio was achieved
     # ...axes limit pad-out was outwards and symmetrical
     (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
     aspect_err = aspect / calc_aspect(ax) - 1
     info = (
         f"aspect={aspect}, aspect_err={aspect_err}, "
-        f"before_ratio == after_ratio {before_ratio == after_ratio}, "
-        f"before_ratio={before_ratio}, after_ratio={after_ratio}, "
         f"x0_={x0_}, x1_={x1_}, y0_={y0_}, y1_={y1_}, "
         f"x0={x0}, x1={x1}, y0={y0}, y1={y1}"
     )
@@ -0,0 +1,96 @@
+import dataclasses
+from multiprocessing import shared_memory
+import typing
+
+import numpy as np
+import pandas as pd
+
+
+@dataclasses.dataclass(frozen=True)
+class SharedColumn:
+    """Picklable reference to a numeric column held in shared memory."""
+
+    shm_name: str
+    dtype: str
+    shape: typing.Tuple[int, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class SharedFrame:
+    """Picklable stand-in for a DataFrame, with large numeric columns held in
+    shared memory and remaining columns carried inline."""
+
+    columns: typing.Tuple[
+        typing.Tuple[typing.Hashable, typing.Union[SharedColumn, pd.Series]],
+        ...,
+    ]
+    index: pd.Index
+
+
+def share_frame(
+    data: pd.DataFrame,
+    threshold: int = 0,
+) -> typing.Tuple[SharedFrame, typing.List[shared_memory.SharedMemory]]:
+    """Copy numeric columns of at least `threshold` bytes into shared memory
+    blocks.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to share.
+    threshold : int, default 0
+        Minimum column size, in bytes, to place in shared memory. Smaller
+        and non-numeric columns are carried inline, to be pickled.
+
+    Returns
+    -------
+    Tuple[SharedFrame, List[shared_memory.SharedMemory]]
+        Picklable reference to shared data, and the created shared memory
+        blocks.
+
+        The caller owns the returned blocks, and is responsible for closing
+        and unlinking them once consumers are finished.
+    """
+    columns, blocks = [], []
+    for name, series in data.items():
+        values = series.to_numpy()
+        if (
+            values.dtype.kind not in "biufcmM"
+            or values.nbytes < threshold
+            or values.nbytes == 0
+        ):
+            columns.append((name, series))
+            continue
+
+        block = shared_memory.SharedMemory(create=True, size=values.nbytes)
+        blocks.append(block)
+        view = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        view[...] = values
+        del view  # release export of block buffer
+        columns.append(
+            (name, SharedColumn(block.name, values.dtype.str, values.shape)),
+        )
+
+    return SharedFrame(columns=tuple(columns), index=data.index), blocks
+
+
+def attach_frame(shared: SharedFrame) -> pd.DataFrame:
+    """Reconstitute a DataFrame from a `SharedFrame` reference.
+
+    Shared columns are copied into process-local memory, so shared memory
+    blocks are detached before returning.
+    """
+    columns = {}
+    for name, column in shared.columns:
+        if isinstance(column, SharedColumn):
+            block = shared_memory.SharedMemory(name=column.shm_name)
+            try:
+                columns[name] = np.array(
+                    np.ndarray(column.shape, column.dtype, buffer=block.buf),
+                )
+            finally:
+                block.close()
+        else:
+            columns[name] = column.array
+
+    return pd.DataFrame(columns, index=shared.index)
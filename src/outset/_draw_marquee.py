@@ -10,10 +10,19 @@ import seaborn as sns
 
 from ._auxlib.draw_callout_ import draw_callout
 from ._auxlib.draw_frame_ import draw_frame
+from ._auxlib.identity_ import identity
 from ._auxlib.is_axes_unset_ import is_axes_unset
+from ._auxlib.marquee_artists_ import (
+    MarqueeArtists,
+    calc_mark_xy,
+    get_marquees,
+    pad_frame,
+)
+from ._auxlib.profile_stage_ import profiled
 from .mark._MarkMagnifyingGlass import mark_magnifying_glass
 
 
+@profiled("draw_marquee")
 def draw_marquee(
     frame_xlim: typing.Tuple[float, float],
     frame_ylim: typing.Tuple[float, float],
@@ -36,7 +45,7 @@ def draw_marquee(
         "inches",
         "inchesfrom",
     ] = "inches",
-    leader_tweak: typing.Callable = lambda x, *args, **kwargs: x,
+    leader_tweak: typing.Callable = identity,
     mark_glyph: typing.Optional[typing.Callable] = mark_magnifying_glass,
     mark_glyph_kws: typing.Dict = frozendict.frozendict(),
     mark_retract: float = 0.1,
@@ -141,17 +150,9 @@ def draw_marquee(
         color = sns.color_palette()[0]
 
     # pad frame coordinates out from data
-    if isinstance(frame_inner_pad, typing.Iterable):
-        pad_x, pad_y = frame_inner_pad
-    elif isinstance(frame_inner_pad, numbers.Number):
-        pad_x = (np.ptp(frame_xlim) or np.ptp(ax.get_xlim())) * frame_inner_pad
-        pad_y = (np.ptp(frame_ylim) or np.ptp(ax.get_ylim())) * frame_inner_pad
-    else:
-        raise ValueError(
-            f"frame_inner_pad must be float or tuple, not {frame_inner_pad}",
-        )
-    frame_xlim = np.array(frame_xlim) + np.array([-pad_x, pad_x])
-    frame_ylim = np.array(frame_ylim) + np.array([-pad_y, pad_y])
+    frame_xlim, frame_ylim = pad_frame(
+        ax, frame_xlim, frame_ylim, frame_inner_pad
+    )
 
     # pad axis viewport out from frame
     ax_xlim, ax_ylim = ax.get_xlim(), ax.get_ylim()
@@ -195,7 +196,7 @@ def draw_marquee(
 
     # Frame outset region
     ###########################################################################
-    draw_frame(
+    frame_patches = draw_frame(
         frame_xlim,
         frame_ylim,
         ax=ax,
@@ -209,7 +210,7 @@ def draw_marquee(
 
     # Draw callout
     ###########################################################################
-    draw_callout(
+    leader_patches, leader_images, glyph_artists = draw_callout(
         frame_xlim,
         frame_ylim,
         ax,
@@ -226,6 +227,26 @@ def draw_marquee(
         zorder=zorder,
     )
 
+    # register artists for in-place updates, e.g., by OutsetGrid.update_data
+    leader_xy = leader_patches[-1].get_xy()
+    get_marquees(ax).append(
+        MarqueeArtists(
+            frame_patches=frame_patches,
+            leader_patches=leader_patches,
+            leader_images=leader_images,
+            glyph_artists=glyph_artists,
+            frame_inner_pad=frame_inner_pad,
+            leader_stretch=leader_stretch,
+            leader_stretch_unit=leader_stretch_unit,
+            leader_tweak=leader_tweak,
+            mark_retract=mark_retract,
+            # polygon vertices are stored closed, so drop repeated vertex
+            mark_xy=calc_mark_xy(leader_xy[:-1], mark_retract),
+            frame_xlim=frame_xlim,
+            frame_ylim=frame_ylim,
+        ),
+    )
+
     # Finalize
     ###########################################################################
     ax.set_axisbelow(True)  # ensure annotations above if outside bounds
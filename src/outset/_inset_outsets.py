@@ -2,10 +2,8 @@ import itertools as it
 import math
 import typing
 
-from matplotlib.transforms import Bbox as mpl_Bbox
-
-from ._auxlib.resize_figure_to_axes_ import resize_figure_to_axes
 from ._OutsetGrid import OutsetGrid
+from .util._InsetLayout import InsetLayout
 from .util._layout_corner_insets import layout_corner_insets
 
 
@@ -17,12 +15,13 @@ def inset_outsets(
     ] = "NE",
     *,
     equalize_aspect: bool = True,
+    layout: typing.Optional[InsetLayout] = None,
     strip_axes: bool = False,
     strip_labels: bool = True,
     strip_spines: bool = False,
     strip_ticks: bool = True,
     strip_titles: bool = True,
-) -> None:
+) -> InsetLayout:
     """Rearrange OutsetGrid figure to superimpose outset axes over source axes.
 
     Parameters
@@ -39,6 +38,13 @@ def inset_outsets(
         sourceplot.
     equalize_aspect : bool, default True
         Should the aspect ratio of the inset plots be equalized?
+    layout : outset.util.InsetLayout, optional
+        Previously measured layout to apply, overriding `insets`.
+
+        If None, figure layout is fit to source axes tick and label extents,
+        which requires a renderer draw pass. Pass the `InsetLayout` returned
+        from an earlier call to reuse its measurement on figures with the same
+        template, skipping the draw pass.
     strip_label : bool, default True
         Should x and y labels be stripped from inset plots.
     strip_spines : bool, default False
@@ -50,10 +56,14 @@ def inset_outsets(
 
     Returns
     -------
-    None
+    outset.util.InsetLayout
+        The applied layout, which may be reused for other figures with the
+        same template.
 
     See Also
     --------
+    outset.util.InsetLayout
+        Cached layout geometry, reusable across figures.
     outset.util.layout_corner_insets
         Underlying engine implementing corner inset layout when "NE", "NW",
         "SE", or "SW" is passed to `inset_outsets`. The function
@@ -63,46 +73,27 @@ def inset_outsets(
     if outset_grid.source_axes is None:
         raise ValueError("OutsetGrid missing source axes to inset outset axes")
 
-    if isinstance(insets, str):
-        insets = layout_corner_insets(len(outset_grid.outset_axes), insets)
-
-    if len(insets) != len(outset_grid.outset_axes):
-        raise ValueError(
-            "Num specified insets must equal number outset axes; "
-            f"{len(insets)} insets were specified "
-            f"for {len(outset_grid.outset_axes)} outset axes.",
-        )
-
-    outset_grid.figure.tight_layout()
+    if layout is None:
+        if isinstance(insets, str):
+            insets = layout_corner_insets(len(outset_grid.outset_axes), insets)
 
-    # Shrink axes to fit the source axes
-    resize_figure_to_axes(outset_grid.figure, outset_grid.source_axes)
-
-    # Get position and size of the source axes
-    source_pos = outset_grid.source_axes.get_position()
-
-    # Create and customize inset subplots based on the provided rectangles
-    for ax, (rel_x0, rel_y0, rel_w, rel_h) in zip(
-        outset_grid.outset_axes,
-        insets,
-        strict=True,
-    ):
-        # Calculate absolute position and size of each inset subplot
-        abs_x0 = source_pos.x0 + rel_x0 * source_pos.width
-        abs_y0 = source_pos.y0 + rel_y0 * source_pos.height
-        abs_w = rel_w * source_pos.width
-        abs_h = rel_h * source_pos.height
+        if len(insets) != len(outset_grid.outset_axes):
+            raise ValueError(
+                "Num specified insets must equal number outset axes; "
+                f"{len(insets)} insets were specified "
+                f"for {len(outset_grid.outset_axes)} outset axes.",
+            )
 
-        assert -0.01 <= abs_x0 <= 1.01, abs_x0
-        assert -0.01 <= abs_y0 <= 1.01, abs_y0
-        assert -0.01 <= abs_w <= 1.01, abs_w
-        assert -0.01 <= abs_h <= 1.01, abs_h
-        assert -0.01 <= abs_x0 + abs_w <= 1.01, abs_x0 + abs_w
-        assert -0.01 <= abs_y0 + abs_h <= 1.01, abs_y0 + abs_h
+        layout = InsetLayout.measure(
+            outset_grid.figure, outset_grid.source_axes, insets
+        )
 
-        # Set position of each inset subplot
-        ax.set_position(mpl_Bbox.from_bounds(abs_x0, abs_y0, abs_w, abs_h))
+    layout.apply(
+        outset_grid.figure, outset_grid.source_axes, outset_grid.outset_axes
+    )
 
+    # Customize inset subplots
+    for ax in outset_grid.outset_axes:
         # Additional customization (removing labels, spines, etc.)
         if strip_axes:
             ax.set_axis_off()
@@ -122,3 +113,5 @@ def inset_outsets(
     # Equalize aspect ratios
     if equalize_aspect:
         outset_grid.equalize_aspect()
+
+    return layout
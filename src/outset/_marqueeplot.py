@@ -1,5 +1,4 @@
 import itertools as it
-import numbers
 import typing
 
 import matplotlib.pyplot as plt
@@ -9,14 +8,19 @@ import seaborn as sns
 from matplotlib.axes import Axes as mpl_Axes
 
 from ._auxlib.calc_aspect_ import calc_aspect
-from ._auxlib.calc_outer_pad_ import calc_outer_pad
-from ._auxlib.is_axes_unset_ import is_axes_unset
+from ._auxlib.calc_axes_size_ import calc_axes_size
+from ._auxlib.calc_prepad_axlim_ import calc_prepad_axlim
+from ._auxlib.identity_ import identity
+from ._auxlib.is_axes_unset_ import is_axes_populated, is_axes_unset
+from ._auxlib.marquee_artists_ import get_marquees
+from ._auxlib.profile_stage_ import profile_stage, profiled
 from ._auxlib.robust_groupby_ import robust_groupby
 from ._auxlib.set_aspect_ import set_aspect
 from ._draw_marquee import draw_marquee
 from .mark._MarkNumericalBadges import MarkNumericalBadges
 
 
+@profiled("marqueeplot")
 def marqueeplot(
     data: pd.DataFrame,
     *,
@@ -31,9 +35,7 @@ def marqueeplot(
     frame_inner_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
     frame_outer_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
     frame_outer_pad_unit: typing.Literal["axes", "figure", "inches"] = "axes",
-    leader_tweak: typing.Union[
-        typing.Callable, typing.Type
-    ] = lambda x, *args, **kwargs: x,
+    leader_tweak: typing.Union[typing.Callable, typing.Type] = identity,
     mark_glyph: typing.Union[
         typing.Callable, typing.Type, None
     ] = MarkNumericalBadges,
@@ -203,26 +205,37 @@ def marqueeplot(
         tight_axlim=tight_axlim,
     )
 
-    for (__, __, __, hue_value), subset in data.groupby(
-        ["_dummy_outset_key", "_dummy_hue_key", outset, hue],
-        observed=True,
-        sort=True,  # sort by outset key then hue key
-    ):
-        assert len(subset)
-        xlim = [subset[x].min(), subset[x].max()]
-        ylim = [subset[y].min(), subset[y].max()]
-        selected_color = color_lookup[hue_value]
-        draw_marquee(
-            frame_xlim=xlim,
-            frame_ylim=ylim,
-            ax=ax,
-            color=selected_color,
-            frame_inner_pad=frame_inner_pad,
-            frame_outer_pad=(0, 0),  # already padded by prepad_axlim...
-            leader_tweak=leader_tweak,
-            mark_glyph=mark_glyph,
-            **kwargs,
-        )
+    with profile_stage("groupby"):
+        groups = [
+            *data.groupby(
+                ["_dummy_outset_key", "_dummy_hue_key", outset, hue],
+                observed=True,
+                sort=True,  # sort by outset key then hue key
+            )
+        ]
+
+    with profile_stage("draw_marquees"):
+        for (__, __, outset_value, hue_value), subset in groups:
+            assert len(subset)
+            xlim = [subset[x].min(), subset[x].max()]
+            ylim = [subset[y].min(), subset[y].max()]
+            selected_color = color_lookup[hue_value]
+            draw_marquee(
+                frame_xlim=xlim,
+                frame_ylim=ylim,
+                ax=ax,
+                color=selected_color,
+                frame_inner_pad=frame_inner_pad,
+                frame_outer_pad=(0, 0),  # already padded by prepad_axlim...
+                leader_tweak=leader_tweak,
+                mark_glyph=mark_glyph,
+                **kwargs,
+            )
+            # tag marquee with framed subset, for in-place updates
+            get_marquees(ax)[-1].key = (
+                None if outset == "_dummy_outset" else outset_value,
+                None if hue == "_dummy_hue" else hue_value,
+            )
 
     if initial_aspect is not None and not np.allclose(
         np.array(initial_axlim),
@@ -238,6 +251,7 @@ def marqueeplot(
     return ax
 
 
+@profiled("_prepad_axlim")
 def _prepad_axlim(
     data: pd.DataFrame,
     x: str,
@@ -257,73 +271,26 @@ def _prepad_axlim(
 
     assert not any(data[x].isna()) and not any(data[y].isna())
 
-    # precalculate frames with inner padding
-    framex_values, framey_values = [], []
+    # precalculate data extents to frame, with inner padding applied later
+    data_xlims, data_ylims = [], []
     for _, subset in robust_groupby(data, by=[outset, hue], sort=False):
         assert len(subset)
-
-        is_number = isinstance(frame_inner_pad, numbers.Number)
-        if is_number:
-            # convert to absolute units to prevent weird effects from
-            # successive calls to draw_marquee
-            frame_inner_pad_x, frame_inner_pad_y = (
-                frame_inner_pad * (np.ptp(subset[x]) or np.ptp(ax.get_xlim())),
-                frame_inner_pad * (np.ptp(subset[y]) or np.ptp(ax.get_ylim())),
-            )
-        else:
-            frame_inner_pad_x, frame_inner_pad_y = frame_inner_pad
-
-        framex_values.extend(
-            [
-                subset[x].min() - frame_inner_pad_x,
-                subset[x].max() + frame_inner_pad_x,
-            ],
-        )
-        framey_values.extend(
-            [
-                subset[y].min() - frame_inner_pad_y,
-                subset[y].max() + frame_inner_pad_y,
-            ],
-        )
-
-    if is_axes_unset(ax) or tight_axlim:
-        if framex_values and np.ptp(framex_values):
-            ax.set_xlim(min(framex_values), max(framex_values))
-        if framey_values and np.ptp(framey_values):
-            ax.set_ylim(min(framey_values), max(framey_values))
-    else:
-        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
-        ax.set_xlim(min(*framex_values, x0), max(*framex_values, x1))
-        ax.set_ylim(min(*framey_values, y0), max(*framey_values, y1))
-
-    pad_x, pad_y = calc_outer_pad(ax, frame_outer_pad, frame_outer_pad_unit)
-    assert np.isfinite(pad_x), np.isfinite(pad_y)
-    if len(data):
-        lowerx, upperx = (
-            np.min(framex_values) - pad_x,
-            np.max(framex_values) + pad_x,
-        )
-        lowery, uppery = (
-            np.min(framey_values) - pad_y,
-            np.max(framey_values) + pad_y,
-        )
-    else:
-        lowerx, upperx = ax.get_xlim()
-        lowery, uppery = ax.get_ylim()
-
-    if tight_axlim or is_axes_unset(ax):
-        pass
-    else:
-        lowerx = min(lowerx, ax.get_xlim()[0])
-        lowery = min(lowery, ax.get_ylim()[0])
-        upperx = max(upperx, ax.get_xlim()[1])
-        uppery = max(uppery, ax.get_ylim()[1])
-
-    # apply axis limit to incorporate outer padding
-    if lowerx == upperx:  # prevent singularity
-        lowerx, upperx = lowerx - 0.05, upperx + 0.05
-    ax.set_xlim(lowerx, upperx)
-
-    if lowery == uppery:  # prevent singularity
-        lowery, uppery = lowery - 0.05, uppery + 0.05
-    ax.set_ylim(lowery, uppery)
+        data_xlims.append([subset[x].min(), subset[x].max()])
+        data_ylims.append([subset[y].min(), subset[y].max()])
+
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()  # before aspect may apply
+    xlim, ylim = calc_prepad_axlim(
+        xlim,
+        ylim,
+        data_xlims,
+        data_ylims,
+        frame_inner_pad=frame_inner_pad,
+        frame_outer_pad=frame_outer_pad,
+        frame_outer_pad_unit=frame_outer_pad_unit,
+        tight_axlim=tight_axlim,
+        populated=is_axes_populated(ax),
+        axes_size=calc_axes_size(ax),
+        figure_size=ax.figure.get_size_inches(),
+    )
+    ax.set_xlim(xlim)
+    ax.set_ylim(ylim)
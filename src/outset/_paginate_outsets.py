@@ -0,0 +1,250 @@
+import copy
+import itertools as it
+import typing
+
+import frozendict
+from matplotlib import pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+import pandas as pd
+import seaborn as sns
+
+from ._OutsetGrid import OutsetGrid
+from .mark._MarkNumericalBadges import MarkNumericalBadges
+from .util._NamedFrames import NamedFrames
+
+
+def _marqueeplot_all(outset_grid: OutsetGrid) -> None:
+    outset_grid.marqueeplot()
+
+
+def _advance_glyph(mark_glyph: typing.Any, num_glyphs: int) -> typing.Any:
+    """Copy glyph functor, with count advanced past `num_glyphs` already-drawn
+    glyphs if functor is counter-based (e.g., `MarkNumericalBadges`)."""
+    if isinstance(mark_glyph, type):
+        mark_glyph = mark_glyph()
+    mark_glyph = copy.deepcopy(mark_glyph)
+    advance = getattr(mark_glyph, "advance", None)
+    if advance is not None:
+        advance(num_glyphs)
+    return mark_glyph
+
+
+def _rotate_palette(palette: typing.Sequence, offset: int) -> typing.List:
+    """Rotate palette so that color assignment continues from `offset`."""
+    return [*it.islice(it.cycle(palette), offset, offset + len(palette))]
+
+
+def _iter_page_kws(
+    data: typing.Union[
+        pd.DataFrame,
+        typing.Sequence[typing.Tuple[float, float, float, float]],
+        NamedFrames,
+        int,
+    ],
+    outsets_per_page: int,
+    *,
+    col: typing.Optional[str],
+    col_order: typing.Optional[typing.Sequence],
+    hue: typing.Optional[str],
+    hue_order: typing.Optional[typing.Sequence],
+    palette: typing.Optional[typing.Sequence],
+) -> typing.Iterator[typing.Tuple[typing.Dict, int]]:
+    """Yield OutsetGrid initializer kwargs for each page, alongside the number
+    of marquee glyphs the page's outset axes will draw."""
+    if isinstance(data, int):
+        data = [(0, 0, 1, 1)] * data
+
+    if isinstance(data, pd.DataFrame):
+        if col is None:
+            col = hue
+        if col is None:
+            raise ValueError("col or hue must be provided to paginate outsets")
+        if col_order is None:
+            col_order = sorted(data[col].unique())
+        if hue is not None and hue != col and hue_order is None:
+            hue_order = sorted(data[hue].unique())  # consistent across pages
+        palette = sns.color_palette() if palette is None else palette
+        for page_start in range(0, len(col_order), outsets_per_page):
+            page_stop = page_start + outsets_per_page
+            page_order = [*col_order[page_start:page_stop]]
+            page_data = data[data[col].isin(page_order)]
+            page_kws = {"data": data, "col": col, "col_order": page_order}
+            if hue == col:
+                # rotate palette so colors continue across pages
+                page_kws["hue"] = hue
+                page_kws["hue_order"] = page_order
+                page_kws["palette"] = _rotate_palette(palette, page_start)
+                num_glyphs = len(page_order)
+            elif hue is not None:
+                page_kws["hue"] = hue
+                page_kws["hue_order"] = hue_order
+                page_kws["palette"] = palette
+                page_data = page_data[page_data[hue].isin(hue_order)]
+                num_glyphs = len(page_data[[col, hue]].drop_duplicates())
+            else:
+                num_glyphs = len(page_order)
+            yield page_kws, num_glyphs
+    else:
+        if not isinstance(data, NamedFrames):
+            # preserve global frame numbering, as OutsetGrid would assign
+            data = NamedFrames(enumerate(data, start=1))
+        if col is not None or col_order is not None or hue_order is not None:
+            raise ValueError(
+                "col, col_order, and hue_order unsupported for direct frames",
+            )
+        palette = sns.color_palette() if palette is None else palette
+        names = [*data.keys()]
+        for page_start in range(0, len(names), outsets_per_page):
+            page_stop = page_start + outsets_per_page
+            page_names = names[page_start:page_stop]
+            yield {
+                "data": NamedFrames({name: data[name] for name in page_names}),
+                "hue": hue,
+                "palette": _rotate_palette(palette, page_start),
+            }, len(page_names)
+
+
+def paginate_outsets(
+    data: typing.Union[
+        pd.DataFrame,
+        typing.Sequence[typing.Tuple[float, float, float, float]],
+        NamedFrames,
+        int,
+    ],
+    *,
+    outsets_per_page: int,
+    output: typing.Union[str, PdfPages],
+    col: typing.Optional[str] = None,
+    col_order: typing.Optional[typing.Sequence] = None,
+    hue: typing.Union[str, bool, None] = None,
+    hue_order: typing.Optional[typing.Sequence] = None,
+    include_sourceplot: bool = True,
+    marqueeplot_kws: typing.Dict = frozendict.frozendict(),
+    palette: typing.Optional[typing.Sequence] = None,
+    plot: typing.Callable[[OutsetGrid], typing.Any] = _marqueeplot_all,
+    repeat_sourceplot: bool = True,
+    savefig_kws: typing.Dict = frozendict.frozendict(),
+    **kwargs,
+) -> int:
+    """Split outsets across a series of OutsetGrid pages, rendering and
+    writing out each page in turn.
+
+    Only one page is held in memory at a time --- each page's figure is
+    closed after it is written, before the next page is built. Marquee glyph
+    numbering and hue palette colors continue across pages.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Sequence of Tuple[float, float, float, float] or
+    outset.util.NamedFrames or int
+        Data or outset frames, as for `OutsetGrid`.
+    outsets_per_page : int
+        Maximum number of outset axes per page.
+    output : Union[str, matplotlib.backends.backend_pdf.PdfPages]
+        Where to write pages.
+
+        If a `PdfPages` object or a path ending in ".pdf", pages are written
+        as successive pages of a multi-page PDF. Otherwise, `output` is
+        treated as a format string with a `page` field (e.g.,
+        "zoom-{page:03d}.png"), and each page is written to a numbered file.
+    col : Optional[str], default None
+        Column name in `data` to split outsets across, as for `OutsetGrid`.
+    col_order : Optional[Sequence], default None
+        Order of outsets across pages.
+    hue : Union[str, bool, None], default None
+        Column name in `data` for marquee color, as for `OutsetGrid`.
+    hue_order : Optional[Sequence], default None
+        Order to assign palette colors to `hue` values.
+    include_sourceplot : bool, default True
+        Whether to include the source plot on pages.
+    marqueeplot_kws : Dict, default frozendict()
+        Keyword arguments to adjust marquee placement and styling, as for
+        `OutsetGrid`.
+
+        If a counter-based `mark_glyph` functor (i.e., one with an `advance`
+        method, like `MarkNumericalBadges`) is provided, its count is
+        advanced for each page.
+    palette : Optional[Sequence], default None
+        Color palette for outset hues.
+    plot : Callable[[OutsetGrid], Any], default marqueeplot only
+        Populates each page's OutsetGrid (e.g., by calling `map_dataframe`,
+        `broadcast`, and `marqueeplot`).
+    repeat_sourceplot : bool, default True
+        If `include_sourceplot`, should the source plot be repeated on every
+        page or shown on the first page only?
+    savefig_kws : Dict, default frozendict()
+        Keyword arguments forwarded to `OutsetGrid.savefig`.
+    **kwargs : dict
+        Additional keyword arguments forward to `OutsetGrid`.
+
+    Returns
+    -------
+    int
+        Number of pages written.
+
+    See Also
+    --------
+    outset.OutsetGrid
+        Figure-level interface for creating plots with marquee annotations.
+    """
+    if outsets_per_page < 1:
+        raise ValueError("outsets_per_page must be positive")
+
+    if isinstance(output, str) and output.lower().endswith(".pdf"):
+        with PdfPages(output) as pdf:
+            return paginate_outsets(
+                data,
+                outsets_per_page=outsets_per_page,
+                output=pdf,
+                col=col,
+                col_order=col_order,
+                hue=hue,
+                hue_order=hue_order,
+                include_sourceplot=include_sourceplot,
+                marqueeplot_kws=marqueeplot_kws,
+                palette=palette,
+                plot=plot,
+                repeat_sourceplot=repeat_sourceplot,
+                savefig_kws=savefig_kws,
+                **kwargs,
+            )
+
+    mark_glyph = marqueeplot_kws.get("mark_glyph", MarkNumericalBadges)
+    num_glyphs, num_pages = 0, 0
+    for page_kws, page_num_glyphs in _iter_page_kws(
+        data,
+        outsets_per_page,
+        col=col,
+        col_order=col_order,
+        hue=hue,
+        hue_order=hue_order,
+        palette=palette,
+    ):
+        outset_grid = OutsetGrid(
+            **{k: v for k, v in page_kws.items() if v is not None},
+            include_sourceplot=include_sourceplot
+            and (repeat_sourceplot or num_pages == 0),
+            marqueeplot_kws={
+                **marqueeplot_kws,
+                "mark_glyph": (
+                    mark_glyph
+                    if mark_glyph is None
+                    else _advance_glyph(mark_glyph, num_glyphs)
+                ),
+            },
+            **kwargs,
+        )
+        plot(outset_grid)
+
+        if isinstance(output, PdfPages):
+            outset_grid.savefig(output, **{"format": "pdf", **savefig_kws})
+        else:
+            outset_grid.savefig(output.format(page=num_pages), **savefig_kws)
+
+        # release page before building next
+        plt.close(outset_grid.figure)
+        del outset_grid
+        num_glyphs += page_num_glyphs
+        num_pages += 1
+
+    return num_pages
@@ -0,0 +1,190 @@
+from concurrent import futures
+import dataclasses
+import os
+import time
+import typing
+
+import matplotlib as mpl
+from matplotlib import pyplot as plt
+import pandas as pd
+
+from ._auxlib.share_frame_ import SharedFrame, attach_frame, share_frame
+from ._OutsetGrid import OutsetGrid
+from .util._RenderCache import RenderCache
+from .util._RenderResult import RenderResult
+from .util._RenderSpec import RenderSpec
+
+
+def _init_worker(memory_limit: typing.Optional[int]) -> None:
+    """Set up headless rendering and address space cap in worker process."""
+    mpl.use("Agg", force=True)
+    if memory_limit is not None:
+        import resource
+
+        __, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+
+
+def _build_grid(spec: RenderSpec) -> OutsetGrid:
+    """Build and plot the grid described by `spec`."""
+    data = spec.data
+    if isinstance(data, SharedFrame):
+        data = attach_frame(data)
+
+    outset_grid = OutsetGrid(
+        data=data,
+        marqueeplot_kws=spec.marqueeplot_kws,
+        **spec.grid_kws,
+    )
+    try:
+        for method, plotter, args, kwargs in spec.calls:
+            getattr(outset_grid, method)(plotter, *args, **kwargs)
+        if spec.marqueeplot:
+            outset_grid.marqueeplot()
+    except BaseException:
+        plt.close(outset_grid.figure)
+        raise
+    return outset_grid
+
+
+def _render_one(spec: RenderSpec) -> RenderResult:
+    """Build, plot, and save the figure described by `spec`."""
+    start = time.perf_counter()
+
+    outset_grid = _build_grid(spec)
+    try:
+        outset_grid.savefig(spec.output, **spec.savefig_kws)
+    finally:
+        plt.close(outset_grid.figure)
+
+    return RenderResult(
+        output=spec.output,
+        elapsed=time.perf_counter() - start,
+        pid=os.getpid(),
+    )
+
+
+def render_many(
+    specs: typing.Iterable[RenderSpec],
+    *,
+    cache: typing.Optional[RenderCache] = None,
+    max_workers: typing.Optional[int] = None,
+    memory_limit: typing.Optional[int] = None,
+    mp_context: typing.Optional[typing.Any] = None,
+    shared_memory_threshold: typing.Optional[int] = 1 << 20,
+) -> typing.List[RenderResult]:
+    """Render many OutsetGrid figures in parallel across a process pool.
+
+    Workers render headlessly with matplotlib's Agg backend. Large numeric
+    DataFrame columns are handed to workers through shared memory, instead of
+    being pickled with each spec; a DataFrame referenced by several specs is
+    placed in shared memory only once.
+
+    Parameters
+    ----------
+    specs : Iterable[outset.util.RenderSpec]
+        Figures to render.
+    cache : Optional[outset.util.RenderCache], default None
+        Cache of previously rendered figures.
+
+        If provided, cached figures are written out directly, without
+        rendering, and newly rendered figures are added to the cache.
+    max_workers : Optional[int], default None
+        Number of worker processes.
+
+        If None, defaults to the number of processors on the machine.
+    memory_limit : Optional[int], default None
+        Cap on each worker's address space, in bytes.
+
+        Workers exceeding the cap fail with `MemoryError`. Requires the POSIX
+        `resource` module. If None, worker memory is uncapped.
+    mp_context : Optional[multiprocessing.context.BaseContext], default None
+        Multiprocessing context used to start workers.
+
+        If None, the platform default start method is used.
+    shared_memory_threshold : Optional[int], default 1 MiB
+        Minimum size, in bytes, of a numeric DataFrame column to hand off
+        through shared memory.
+
+        If None, all data is pickled.
+
+    Returns
+    -------
+    List[outset.util.RenderResult]
+        Per-figure output path, timing, and worker process id, in the same
+        order as `specs`.
+
+        Figures served from `cache` report the calling process's id.
+
+    See Also
+    --------
+    outset.util.RenderSpec
+        Picklable recipe for one OutsetGrid figure.
+    """
+    if memory_limit is not None:
+        try:
+            import resource  # noqa: F401
+        except ImportError:  # pragma: no cover
+            raise ValueError("memory_limit is unsupported on this platform")
+
+    specs = [*specs]
+    if any(spec.output is None for spec in specs):
+        raise ValueError("render_many requires an output path for every spec")
+
+    results = [None] * len(specs)
+    keys = [None] * len(specs)
+    if cache is not None:
+        for i, spec in enumerate(specs):
+            start = time.perf_counter()
+            keys[i] = cache.key(spec)
+            content = cache.get(keys[i])
+            if content is not None:
+                with open(spec.output, "wb") as file:
+                    file.write(content)
+                results[i] = RenderResult(
+                    output=spec.output,
+                    elapsed=time.perf_counter() - start,
+                    pid=os.getpid(),
+                )
+    pending = [i for i, result in enumerate(results) if result is None]
+    if not pending:
+        return results
+
+    shared, blocks = {}, []
+    try:
+        if shared_memory_threshold is not None:
+            for i in pending:
+                spec = specs[i]
+                if not isinstance(spec.data, pd.DataFrame):
+                    continue
+                if id(spec.data) not in shared:
+                    shared_frame, spec_blocks = share_frame(
+                        spec.data, threshold=shared_memory_threshold
+                    )
+                    blocks.extend(spec_blocks)
+                    # hold reference to data, so id is not recycled
+                    shared[id(spec.data)] = spec.data, shared_frame
+                __, shared_frame = shared[id(spec.data)]
+                specs[i] = dataclasses.replace(spec, data=shared_frame)
+
+        with futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(memory_limit,),
+        ) as executor:
+            for i, result in zip(
+                pending, executor.map(_render_one, [specs[i] for i in pending])
+            ):
+                results[i] = result
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    if cache is not None:
+        for i in pending:
+            with open(results[i].output, "rb") as file:
+                cache.put(keys[i], file.read())
+
+    return results
@@ -0,0 +1,419 @@
+import io
+import os
+import typing
+from xml.etree import ElementTree as ET
+
+from matplotlib import artist as mpl_artist
+from matplotlib import colors as mpl_colors
+from matplotlib import figure as mpl_figure
+from matplotlib import image as mpl_image
+from matplotlib import lines as mpl_lines
+from matplotlib import markers as mpl_markers
+from matplotlib import patches as mpl_patches
+from matplotlib import path as mpl_path
+from matplotlib import transforms as mpl_transforms
+import numpy as np
+
+from ._auxlib.marquee_artists_ import get_marquees
+from ._auxlib.profile_stage_ import profiled
+
+_SVG_NS = "http://www.w3.org/2000/svg"
+_XLINK_NS = "http://www.w3.org/1999/xlink"
+# namespaces used by matplotlib's svg backend, to keep prefixes on rewrite
+_NAMESPACES = {
+    "": _SVG_NS,
+    "cc": "http://creativecommons.org/ns#",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "xlink": _XLINK_NS,
+}
+for _prefix, _uri in _NAMESPACES.items():
+    ET.register_namespace(_prefix, _uri)
+
+# marquee artists written directly, others are rendered by matplotlib
+_WRITTEN_TYPES = (mpl_image.AxesImage, mpl_patches.Patch, mpl_lines.Line2D)
+
+# fractional distance from the gradient's upper right focus, see
+# `make_radial_gradient`
+_GRADIENT_STOPS = np.linspace(0.0, 1.0, 6)
+
+
+def _tag(name: str) -> str:
+    return f"{{{_SVG_NS}}}{name}"
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _fmt_points(xy: np.ndarray) -> str:
+    return " ".join(f"{_fmt(x)},{_fmt(y)}" for x, y in xy)
+
+
+def _paint_attrs(
+    prefix: str, rgba: typing.Tuple[float, float, float, float]
+) -> typing.Dict[str, str]:
+    """Format `fill` or `stroke` color and opacity attributes."""
+    if rgba[3] == 0:
+        return {prefix: "none"}
+    attrs = {prefix: mpl_colors.to_hex(rgba)}
+    if rgba[3] < 1:
+        attrs[f"{prefix}-opacity"] = _fmt(rgba[3])
+    return attrs
+
+
+def _stroke_attrs(
+    rgba: typing.Tuple[float, float, float, float],
+    linewidth: float,
+    dashes: typing.Tuple[float, typing.Optional[typing.Sequence[float]]],
+) -> typing.Dict[str, str]:
+    """Format stroke attributes, with `linewidth` and `dashes` in pixels."""
+    if linewidth == 0:
+        return {"stroke": "none"}
+    attrs = _paint_attrs("stroke", rgba)
+    if attrs["stroke"] == "none":
+        return attrs
+    attrs["stroke-width"] = _fmt(linewidth)
+    offset, seq = dashes
+    if seq is not None:
+        attrs["stroke-dasharray"] = ",".join(map(_fmt, seq))
+        if offset:
+            attrs["stroke-dashoffset"] = _fmt(offset)
+    return attrs
+
+
+def _path_data(path: mpl_path.Path, transform: mpl_transforms.Affine2D) -> str:
+    """Format path as SVG path data, after applying `transform`."""
+    commands = []
+    for vertices, code in path.iter_segments(transform, simplify=False):
+        if code == mpl_path.Path.CLOSEPOLY:
+            commands.append("Z")
+        else:
+            letter = {
+                mpl_path.Path.MOVETO: "M",
+                mpl_path.Path.LINETO: "L",
+                mpl_path.Path.CURVE3: "Q",
+                mpl_path.Path.CURVE4: "C",
+            }[code]
+            commands.append(letter + " ".join(map(_fmt, vertices)))
+    return "".join(commands)
+
+
+class _SvgDefs:
+    """Shared gradients and glyph symbols, deduplicated by content."""
+
+    gradients: typing.Dict[typing.Tuple, str]
+    symbols: typing.Dict[typing.Tuple, str]
+
+    def __init__(self: "_SvgDefs") -> None:
+        self.gradients = {}
+        self.symbols = {}
+        self.element = ET.Element(_tag("defs"))
+
+    def gradient(self: "_SvgDefs", stop_colors: typing.Tuple) -> str:
+        """Get id of radial gradient through `stop_colors`, brightest at the
+        upper right corner of the filled shape's bounding box."""
+        if stop_colors not in self.gradients:
+            gid = f"outset-gradient-{len(self.gradients)}"
+            gradient = ET.SubElement(
+                self.element,
+                _tag("radialGradient"),
+                id=gid,
+                cx="1",
+                cy="0",
+                r=_fmt(np.sqrt(2)),
+            )
+            for offset, color in zip(_GRADIENT_STOPS, stop_colors):
+                ET.SubElement(
+                    gradient,
+                    _tag("stop"),
+                    offset=_fmt(offset),
+                    **{"stop-color": color},
+                )
+            self.gradients[stop_colors] = gid
+        return self.gradients[stop_colors]
+
+    def symbol(self: "_SvgDefs", path_data: str, attrs: typing.Dict) -> str:
+        """Get id of symbol drawing `path_data`, centered on the origin."""
+        key = (path_data, *sorted(attrs.items()))
+        if key not in self.symbols:
+            sid = f"outset-glyph-{len(self.symbols)}"
+            symbol = ET.SubElement(
+                self.element, _tag("symbol"), id=sid, overflow="visible"
+            )
+            ET.SubElement(symbol, _tag("path"), d=path_data, **attrs)
+            self.symbols[key] = sid
+        return self.symbols[key]
+
+
+class _SvgAnchor(mpl_artist.Artist):
+    """Stand-in for a hidden marquee artist.
+
+    When drawn, records the hidden artist's display geometry and style, and
+    marks its place in the SVG document's drawing order with an empty group.
+    """
+
+    hidden: mpl_artist.Artist
+    clip_patch: typing.Optional[mpl_patches.Patch]  # for gradient images
+    capture: typing.Optional[typing.Dict]
+
+    def __init__(
+        self: "_SvgAnchor",
+        hidden: mpl_artist.Artist,
+        gid: str,
+        clip_patch: typing.Optional[mpl_patches.Patch] = None,
+    ) -> None:
+        super().__init__()
+        self.hidden = hidden
+        self.clip_patch = clip_patch
+        self.capture = None
+        self.set_gid(gid)
+        self.set_zorder(hidden.get_zorder())
+
+    def draw(self: "_SvgAnchor", renderer: typing.Any) -> None:
+        artist, to_pixels = self.hidden, renderer.points_to_pixels
+        if isinstance(artist, mpl_image.AxesImage):
+            assert self.clip_patch is not None
+            alpha = artist.get_alpha()
+            self.capture = {
+                "xy": self.clip_patch.get_verts(),
+                "stop_colors": tuple(
+                    mpl_colors.to_hex(artist.cmap(artist.norm(value)))
+                    for value in (1 - _GRADIENT_STOPS) ** 2
+                ),
+                "opacity": 1.0 if alpha is None else alpha,
+            }
+        elif isinstance(artist, mpl_patches.Patch):
+            self.capture = {
+                "xy": artist.get_verts(),
+                "is_rect": isinstance(artist, mpl_patches.Rectangle),
+                "facecolor": artist.get_facecolor(),
+                "edgecolor": artist.get_edgecolor(),
+                "linewidth": to_pixels(artist.get_linewidth()),
+                "dashes": _scale_dashes(artist, to_pixels),
+            }
+        elif isinstance(artist, mpl_lines.Line2D):
+            marker = mpl_markers.MarkerStyle(
+                artist.get_marker(), artist.get_fillstyle()
+            )
+            marker_transform = (
+                marker.get_transform()
+                + mpl_transforms.Affine2D()
+                .scale(to_pixels(artist.get_markersize()))
+                .scale(1, -1)  # svg y axis points down
+            )
+            alpha = artist.get_alpha()
+            self.capture = {
+                "xy": artist.get_transform().transform(artist.get_xydata()),
+                "marker_path": (
+                    _path_data(marker.get_path(), marker_transform)
+                    if artist.get_marker() not in ("None", "none", "", " ")
+                    else None
+                ),
+                "marker_facecolor": (
+                    mpl_colors.to_rgba(artist.get_markerfacecolor(), alpha)
+                    if marker.is_filled()
+                    else (0, 0, 0, 0)
+                ),
+                "marker_edgecolor": mpl_colors.to_rgba(
+                    artist.get_markeredgecolor(), alpha
+                ),
+                "marker_edgewidth": to_pixels(artist.get_markeredgewidth()),
+                "color": mpl_colors.to_rgba(artist.get_color(), alpha),
+                "linewidth": (
+                    to_pixels(artist.get_linewidth())
+                    if artist.get_linestyle() not in ("None", "none", "", " ")
+                    else 0
+                ),
+                "dashes": _scale_dashes(artist, to_pixels),
+            }
+        else:
+            raise NotImplementedError(
+                f"cannot write {type(artist).__name__} as svg",
+            )
+        renderer.open_group("outset_marquee", gid=self.get_gid())
+        renderer.close_group("outset_marquee")
+
+
+def _scale_dashes(
+    artist: mpl_artist.Artist, to_pixels: typing.Callable
+) -> typing.Tuple[float, typing.Optional[typing.List[float]]]:
+    # linewidth-scaled dash pattern, as passed to renderer by artist.draw
+    offset, seq = getattr(artist, "_dash_pattern", (0, None))
+    if seq is None:
+        return offset, None
+    return to_pixels(offset), [to_pixels(dash) for dash in seq]
+
+
+def _emit_capture(
+    capture: typing.Dict, height: float, defs: _SvgDefs
+) -> typing.List[ET.Element]:
+    """Write elements reproducing captured artist, for SVG document of
+    `height` points."""
+    xy = np.array(capture["xy"], dtype=float).reshape(-1, 2)
+    xy[:, 1] = height - xy[:, 1]  # svg y axis points down
+    if "stop_colors" in capture:
+        return [
+            ET.Element(
+                _tag("polygon"),
+                points=_fmt_points(xy[:-1]),
+                fill=f"url(#{defs.gradient(capture['stop_colors'])})",
+                **{"fill-opacity": _fmt(capture["opacity"])},
+                stroke="none",
+            )
+        ]
+    if "is_rect" in capture:
+        attrs = {
+            **_paint_attrs("fill", capture["facecolor"]),
+            **_stroke_attrs(
+                capture["edgecolor"], capture["linewidth"], capture["dashes"]
+            ),
+        }
+        if capture["is_rect"]:
+            (x0, y0), (x1, y1) = xy.min(axis=0), xy.max(axis=0)
+            return [
+                ET.Element(
+                    _tag("rect"),
+                    x=_fmt(x0),
+                    y=_fmt(y0),
+                    width=_fmt(x1 - x0),
+                    height=_fmt(y1 - y0),
+                    **attrs,
+                )
+            ]
+        return [
+            ET.Element(_tag("polygon"), points=_fmt_points(xy[:-1]), **attrs)
+        ]
+
+    elements = []
+    stroke_attrs = _stroke_attrs(
+        capture["color"], capture["linewidth"], capture["dashes"]
+    )
+    if len(xy) > 1 and stroke_attrs["stroke"] != "none":
+        elements.append(
+            ET.Element(
+                _tag("polyline"),
+                points=_fmt_points(xy),
+                fill="none",
+                **stroke_attrs,
+            )
+        )
+    if capture["marker_path"] is not None:
+        sid = defs.symbol(
+            capture["marker_path"],
+            {
+                **_paint_attrs("fill", capture["marker_facecolor"]),
+                **_stroke_attrs(
+                    capture["marker_edgecolor"],
+                    capture["marker_edgewidth"],
+                    (0, None),
+                ),
+            },
+        )
+        elements.extend(
+            ET.Element(
+                _tag("use"),
+                {f"{{{_XLINK_NS}}}href": f"#{sid}"},
+                x=_fmt(x),
+                y=_fmt(y),
+            )
+            for x, y in xy
+        )
+    return elements
+
+
+@profiled("save_marquee_svg")
+def save_marquee_svg(
+    figure: typing.Union[mpl_figure.Figure, typing.Any],
+    fname: typing.Union[str, os.PathLike, typing.BinaryIO],
+    **savefig_kws,
+) -> None:
+    """Save figure as SVG, writing marquee annotations directly as compact SVG
+    elements rather than through matplotlib's artist pipeline.
+
+    Everything else (i.e., the data layer, axes, and labels) is rendered by
+    matplotlib's SVG backend, as usual. Marquee elements are slotted into the
+    matplotlib-rendered document at their artists' places in drawing order.
+
+    Frames are written as `<rect>` elements and callout leaders as `<polygon>`
+    elements. Leader gradient fills, which matplotlib embeds as a clipped PNG
+    image per callout, are instead filled from a `<radialGradient>` defined
+    once per color. Glyph markers are defined once each as a `<symbol>` and
+    placed with `<use>`.
+
+    Parameters
+    ----------
+    figure : matplotlib.figure.Figure or OutsetGrid
+        Figure to save. Marquees drawn by `draw_marquee` (including via
+        `marqueeplot` and `OutsetGrid`) on any of its axes are written
+        directly.
+
+        Grids are saved via `OutsetGrid.savefig`, so recorded plotting calls
+        are executed and `bbox_inches="tight"` applies by default.
+    fname : str, path-like, or binary file-like
+        Output destination.
+    **savefig_kws
+        Additional keyword arguments forwarded to `savefig`. Format is always
+        SVG.
+
+    Notes
+    -----
+    Directly written elements are not clipped to axes bounds. Leader gradients
+    are approximated with a few color stops. Glyph artists other than lines
+    and patches (e.g., text) are rendered by matplotlib, as usual.
+
+    See Also
+    --------
+    outset.OutsetGrid.savefig
+        Saves figures through matplotlib's artist pipeline, in any format.
+    """
+    if "format" in savefig_kws and savefig_kws["format"] != "svg":
+        raise ValueError(f"format must be svg, not {savefig_kws['format']}")
+    if hasattr(figure, "execute"):  # OutsetGrid, create any recorded marquees
+        figure.execute()
+    fig = figure if isinstance(figure, mpl_figure.Figure) else figure.figure
+
+    anchors = []
+    for ax in fig.axes:
+        for marquee in get_marquees(ax):
+            for artist in (
+                *marquee.frame_patches,
+                *marquee.leader_patches,
+                *marquee.leader_images,
+                *marquee.glyph_artists,
+            ):
+                if not (
+                    artist.get_visible() and isinstance(artist, _WRITTEN_TYPES)
+                ):
+                    continue  # e.g., text glyphs, left to matplotlib
+                anchor = _SvgAnchor(
+                    artist,
+                    f"outset-marquee-{len(anchors)}",
+                    clip_patch=marquee.leader_patches[-1],
+                )
+                ax.add_artist(anchor)
+                artist.set_visible(False)
+                anchors.append(anchor)
+
+    buf = io.BytesIO()
+    try:
+        figure.savefig(buf, **{**savefig_kws, "format": "svg"})
+    finally:
+        for anchor in anchors:
+            anchor.hidden.set_visible(True)
+            anchor.remove()
+
+    root = ET.fromstring(buf.getvalue())
+    height = float(root.get("viewBox").split()[3])
+    defs = _SvgDefs()
+    groups = {
+        group.get("id"): group
+        for group in root.iter(_tag("g"))
+        if group.get("id", "").startswith("outset-marquee-")
+    }
+    for anchor in anchors:
+        groups[anchor.get_gid()].extend(
+            _emit_capture(anchor.capture, height, defs),
+        )
+    root.insert(0, defs.element)
+    ET.ElementTree(root).write(fname, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,158 @@
+import asyncio
+from concurrent import futures
+import os
+import typing
+
+from .._render_many import _init_worker
+from ..util._RenderCache import RenderCache
+from ..util._RenderSpec import RenderSpec
+from ._render_spec import render_spec
+
+
+class Renderer:
+    """Awaitable front end that renders `RenderSpec` figures on a bounded
+    executor, without blocking the event loop.
+
+    At most `max_pending` renders are submitted to the executor at once;
+    further `render` calls wait for a slot, applying backpressure to callers
+    rather than growing the executor's queue without bound. Slots are held
+    until the executor actually finishes (or drops) a job, so cancelled or
+    timed-out renders still running in a worker continue to count against
+    the bound.
+
+    Attributes
+    ----------
+    executor : concurrent.futures.Executor
+        Executor renders are dispatched to.
+    max_pending : int
+        Maximum number of renders submitted to the executor at once.
+
+    Notes
+    -----
+    Each `Renderer` should be used from a single event loop.
+
+    With a thread executor, specs should be pyplot-free (i.e., `grid_kws`
+    with `grid_engine="gridspec"` and `pyplot=False`), as pyplot global state
+    is shared across threads. With a process executor, specs and results are
+    pickled between processes.
+
+    See Also
+    --------
+    outset.aio.render
+        Convenience wrapper around a default, process-pool `Renderer`.
+    """
+
+    executor: futures.Executor
+    max_pending: int
+
+    _owns_executor: bool
+    _semaphore: typing.Optional[asyncio.Semaphore]
+
+    def __init__(
+        self: "Renderer",
+        executor: typing.Optional[futures.Executor] = None,
+        *,
+        max_pending: typing.Optional[int] = None,
+    ) -> None:
+        """Initialize renderer.
+
+        Parameters
+        ----------
+        executor : Optional[concurrent.futures.Executor], default None
+            Executor to dispatch renders to.
+
+            If None, a process pool with headless Agg workers is created, and
+            shut down by `close`.
+        max_pending : Optional[int], default None
+            Maximum number of renders submitted to the executor at once.
+
+            If None, defaults to twice the executor's worker count.
+        """
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = futures.ProcessPoolExecutor(
+                initializer=_init_worker, initargs=(None,)
+            )
+        self.executor = executor
+
+        if max_pending is None:
+            num_workers = getattr(executor, "_max_workers", os.cpu_count())
+            max_pending = 2 * (num_workers or 1)
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be positive, not {max_pending}")
+        self.max_pending = max_pending
+        self._semaphore = None  # create within event loop, on first use
+
+    async def __aenter__(self: "Renderer") -> "Renderer":
+        return self
+
+    async def __aexit__(self: "Renderer", *args) -> None:
+        await self.close()
+
+    async def close(self: "Renderer") -> None:
+        """Shut down the executor, if created by this renderer."""
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self.executor.shutdown
+            )
+
+    async def render(
+        self: "Renderer",
+        spec: RenderSpec,
+        *,
+        cache: typing.Optional[RenderCache] = None,
+        fmt: typing.Optional[str] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> typing.Union[bytes, str]:
+        """Render a figure on the executor.
+
+        Parameters
+        ----------
+        spec : outset.util.RenderSpec
+            Figure to render.
+        cache : Optional[outset.util.RenderCache], default None
+            Cache of previously rendered figures, consulted and updated on
+            the executor.
+        fmt : Optional[str], default None
+            Image format (e.g., "png", "svg", "pdf").
+
+            If None, inferred from `spec.output` or `spec.savefig_kws`,
+            falling back to "png".
+        timeout : Optional[float], default None
+            Maximum time to wait, in seconds, including any wait for an
+            executor slot. If exceeded, `asyncio.TimeoutError` is raised and
+            the render is cancelled if it has not yet started.
+
+        Returns
+        -------
+        Union[bytes, str]
+            Rendered image bytes if `spec.output` is None, otherwise the path
+            written to.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def remaining() -> typing.Optional[float]:
+            return None if deadline is None else max(deadline - loop.time(), 0)
+
+        await asyncio.wait_for(self._semaphore.acquire(), remaining())
+        try:
+            if cache is None:
+                job = self.executor.submit(render_spec, spec, fmt)
+            else:
+                job = self.executor.submit(cache.render, spec, fmt)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        def release_slot(__: futures.Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self._semaphore.release)
+            except RuntimeError:  # event loop closed
+                pass
+
+        job.add_done_callback(release_slot)
+        # cancellation (including by timeout) propagates to job
+        return await asyncio.wait_for(asyncio.wrap_future(job), remaining())
@@ -0,0 +1,25 @@
+"""Awaitable rendering of OutsetGrid figures for asyncio applications."""
+
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._render import render
+    from ._render_spec import render_spec
+    from ._Renderer import Renderer
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._render": ["render"],
+        "._render_spec": ["render_spec"],
+        "._Renderer": ["Renderer"],
+    },
+)
+
+__all__ = [
+    "render",
+    "render_spec",
+    "Renderer",
+]
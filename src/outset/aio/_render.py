@@ -0,0 +1,81 @@
+import asyncio
+import atexit
+from concurrent import futures
+import typing
+import weakref
+
+from .._render_many import _init_worker
+from ..util._RenderCache import RenderCache
+from ..util._RenderSpec import RenderSpec
+from ._Renderer import Renderer
+
+# event loop -> {executor: Renderer}
+_renderers = weakref.WeakKeyDictionary()
+_default_executor: typing.Optional[futures.Executor] = None
+
+
+async def render(
+    spec: RenderSpec,
+    *,
+    cache: typing.Optional[RenderCache] = None,
+    fmt: typing.Optional[str] = None,
+    executor: typing.Optional[futures.Executor] = None,
+    timeout: typing.Optional[float] = None,
+) -> typing.Union[bytes, str]:
+    """Render a figure without blocking the event loop.
+
+    Dispatches to a bounded `Renderer` shared by all calls on the running
+    event loop with the same `executor`.
+
+    Parameters
+    ----------
+    spec : outset.util.RenderSpec
+        Figure to render.
+    cache : Optional[outset.util.RenderCache], default None
+        Cache of previously rendered figures.
+
+        If provided, a cached image is returned without rendering, and a
+        newly rendered image is added to the cache.
+    fmt : Optional[str], default None
+        Image format (e.g., "png", "svg", "pdf").
+
+        If None, inferred from `spec.output` or `spec.savefig_kws`, falling
+        back to "png".
+    executor : Optional[concurrent.futures.Executor], default None
+        Executor to render on.
+
+        If None, a process pool with headless Agg workers is created on first
+        use and shared for the lifetime of the process.
+    timeout : Optional[float], default None
+        Maximum time to wait, in seconds. If exceeded, `asyncio.TimeoutError`
+        is raised.
+
+    Returns
+    -------
+    Union[bytes, str]
+        Rendered image bytes if `spec.output` is None, otherwise the path
+        written to.
+
+    See Also
+    --------
+    outset.aio.Renderer
+        For control over backpressure bounds and executor lifetime.
+    """
+    global _default_executor
+    if executor is None:
+        if _default_executor is None:
+            _default_executor = futures.ProcessPoolExecutor(
+                initializer=_init_worker, initargs=(None,)
+            )
+            # shut down before interpreter teardown, while modules remain
+            atexit.register(
+                _default_executor.shutdown, wait=False, cancel_futures=True
+            )
+        executor = _default_executor
+
+    loop_renderers = _renderers.setdefault(asyncio.get_running_loop(), {})
+    if executor not in loop_renderers:
+        loop_renderers[executor] = Renderer(executor)
+    return await loop_renderers[executor].render(
+        spec, cache=cache, fmt=fmt, timeout=timeout
+    )
@@ -0,0 +1,47 @@
+import io
+import typing
+
+from matplotlib import pyplot as plt
+
+from .._render_many import _build_grid
+from ..util._RenderSpec import RenderSpec
+
+
+def render_spec(
+    spec: RenderSpec, fmt: typing.Optional[str] = None
+) -> typing.Union[bytes, str]:
+    """Build, plot, and save the figure described by `spec`, synchronously.
+
+    Parameters
+    ----------
+    spec : outset.util.RenderSpec
+        Figure to render.
+    fmt : Optional[str], default None
+        Image format (e.g., "png", "svg", "pdf").
+
+        If None, inferred from `spec.output` or `spec.savefig_kws`, falling
+        back to "png".
+
+    Returns
+    -------
+    Union[bytes, str]
+        Rendered image bytes if `spec.output` is None, otherwise the path
+        written to.
+    """
+    savefig_kws = {**spec.savefig_kws}
+    if fmt is not None:
+        savefig_kws["format"] = fmt
+    elif spec.output is None:
+        savefig_kws.setdefault("format", "png")
+
+    outset_grid = _build_grid(spec)
+    try:
+        if spec.output is None:
+            buf = io.BytesIO()
+            outset_grid.savefig(buf, **savefig_kws)
+            return buf.getvalue()
+        else:
+            outset_grid.savefig(spec.output, **savefig_kws)
+            return spec.output
+    finally:
+        plt.close(outset_grid.figure)
@@ -1,3 +1,4 @@
+import threading
 import typing
 
 from matplotlib import axes as mpl_axes
@@ -15,6 +16,7 @@ class MarkAlphabeticalBadges:
     """
 
     _counter: int
+    _lock: threading.Lock
     _step: int
     _kws: dict
 
@@ -38,9 +40,34 @@ class MarkAlphabeticalBadges:
             Additional kwargs forward to `__call__`.
         """
         self._counter = ord(start)
+        self._lock = threading.Lock()
         self._step = step
         self._kws = kwargs
 
+    def __getstate__(self: "MarkAlphabeticalBadges") -> dict:
+        """Support copying and pickling, which locks do not."""
+        with self._lock:
+            state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self: "MarkAlphabeticalBadges", state: dict) -> None:
+        """Restore copied or pickled state, with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def advance(self: "MarkAlphabeticalBadges", num_glyphs: int = 1) -> None:
+        """Skip ahead the badge count, as if `num_glyphs` badges had been
+        drawn.
+
+        Parameters
+        ----------
+        num_glyphs : int, default 1
+            The number of badges to skip.
+        """
+        with self._lock:
+            self._counter += num_glyphs * self._step
+
     def __call__(
         self: "MarkAlphabeticalBadges",
         x: float,
@@ -109,6 +136,10 @@ class MarkAlphabeticalBadges:
         -------
         None
         """
+        with self._lock:  # claim count, for concurrent use across threads
+            counter = self._counter
+            self._counter += self._step
+
         mark_inlaid_asterisk(
             **{
                 "linecolor": "none",
@@ -124,7 +155,7 @@ class MarkAlphabeticalBadges:
                     color_asterisk_face=color_letter,
                     color_badge=color_badge,
                     color_underlay=color_underlay,
-                    marker=rf"$\mathrm{{{chr(self._counter)}}}$",
+                    marker=rf"$\mathrm{{{chr(counter)}}}$",
                     marker_badge=marker_badge,
                     marker_underlay=marker_underlay,
                     markersize=markersize,
@@ -134,4 +165,3 @@ class MarkAlphabeticalBadges:
                 **kwargs,
             },
         )
-        self._counter += self._step
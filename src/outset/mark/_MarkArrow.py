@@ -1,6 +1,5 @@
 import typing
 
-import matplotlib.pyplot as plt
 from matplotlib import axes as mpl_axes
 from matplotlib import markers as mpl_markers
 
@@ -60,6 +59,8 @@ def mark_arrow(
     outset.mark.MarkArrow: Functor interface for `mark_arrow`.
     """
     if ax is None:
+        from matplotlib import pyplot as plt  # defer backend selection
+
         ax = plt.gca()
 
     if color_accent is None:
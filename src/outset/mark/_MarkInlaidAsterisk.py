@@ -1,8 +1,9 @@
 import typing
 
-import matplotlib.pyplot as plt
 from matplotlib import axes as mpl_axes
 
+from .._auxlib.make_marker_style_ import make_marker_style
+
 _color_t = typing.Union[typing.Tuple, str]
 
 
@@ -92,6 +93,8 @@ def mark_inlaid_asterisk(
         Functor interface for `mark_inlaid_asterisk`.
     """
     if ax is None:
+        from matplotlib import pyplot as plt  # defer backend selection
+
         ax = plt.gca()
 
     if color_accent is None:
@@ -152,7 +155,7 @@ def mark_inlaid_asterisk(
         x,
         y,
         color="none",
-        marker=marker,
+        marker=make_marker_style(marker),
         markeredgewidth=asterisk_edgewidth,
         markeredgecolor=colors["color_asterisk_edge"],
         markerfacecolor=colors["color_asterisk_face"],
@@ -1,6 +1,5 @@
 import typing
 
-import matplotlib.pyplot as plt
 from matplotlib import axes as mpl_axes
 from matplotlib import markers as mpl_markers
 
@@ -59,6 +58,8 @@ def mark_magnifying_glass(
     None
     """
     if ax is None:
+        from matplotlib import pyplot as plt  # defer backend selection
+
         ax = plt.gca()
 
     if color_accent is None:
@@ -1,3 +1,4 @@
+import threading
 import typing
 
 from matplotlib import axes as mpl_axes
@@ -15,6 +16,7 @@ class MarkNumericalBadges:
     """
 
     _counter: int
+    _lock: threading.Lock
     _step: int
     _kws: dict
 
@@ -33,9 +35,34 @@ class MarkNumericalBadges:
             Additional kwargs will forward to `__call_`.
         """
         self._counter = start
+        self._lock = threading.Lock()
         self._step = step
         self._kws = kwargs
 
+    def __getstate__(self: "MarkNumericalBadges") -> dict:
+        """Support copying and pickling, which locks do not."""
+        with self._lock:
+            state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self: "MarkNumericalBadges", state: dict) -> None:
+        """Restore copied or pickled state, with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def advance(self: "MarkNumericalBadges", num_glyphs: int = 1) -> None:
+        """Skip ahead the badge count, as if `num_glyphs` badges had been
+        drawn.
+
+        Parameters
+        ----------
+        num_glyphs : int, default 1
+            The number of badges to skip.
+        """
+        with self._lock:
+            self._counter += num_glyphs * self._step
+
     def __call__(
         self: "MarkNumericalBadges",
         x: float,
@@ -104,6 +131,10 @@ class MarkNumericalBadges:
         -------
         None
         """
+        with self._lock:  # claim count, for concurrent use across threads
+            counter = self._counter
+            self._counter += self._step
+
         mark_inlaid_asterisk(
             **{
                 "linecolor": "none",
@@ -119,7 +150,7 @@ class MarkNumericalBadges:
                     color_asterisk_face=color_numeral,
                     color_badge=color_badge,
                     color_underlay=color_underlay,
-                    marker=f"${self._counter}$",
+                    marker=f"${counter}$",
                     marker_badge=marker_badge,
                     marker_underlay=marker_underlay,
                     markersize=markersize,
@@ -129,4 +160,3 @@ class MarkNumericalBadges:
                 **kwargs,
             },
         )
-        self._counter += self._step
@@ -57,6 +57,17 @@ class MarkRomanBadges:
 
     ftor = MarkAlphabeticalBadges()
 
+    def advance(self: "MarkRomanBadges", num_glyphs: int = 1) -> None:
+        """Skip ahead the numeral count, as if `num_glyphs` badges had been
+        drawn.
+
+        Parameters
+        ----------
+        num_glyphs : int, default 1
+            The number of badges to skip.
+        """
+        self._ftor.advance(num_glyphs)
+
     def __call__(
         self: "MarkRomanBadges",
         x: float,
@@ -1,11 +1,34 @@
 """Markers for marquee annotations."""
 
-from ._MarkArrow import mark_arrow, MarkArrow
-from ._MarkInlaidAsterisk import mark_inlaid_asterisk, MarkInlaidAsterisk
-from ._MarkMagnifyingGlass import mark_magnifying_glass, MarkMagnifyingGlass
-from ._MarkAlphabeticalBadges import MarkAlphabeticalBadges
-from ._MarkNumericalBadges import MarkNumericalBadges
-from ._MarkRomanBadges import MarkRomanBadges
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._MarkArrow import mark_arrow, MarkArrow
+    from ._MarkInlaidAsterisk import mark_inlaid_asterisk, MarkInlaidAsterisk
+    from ._MarkMagnifyingGlass import (
+        mark_magnifying_glass,
+        MarkMagnifyingGlass,
+    )
+    from ._MarkAlphabeticalBadges import MarkAlphabeticalBadges
+    from ._MarkNumericalBadges import MarkNumericalBadges
+    from ._MarkRomanBadges import MarkRomanBadges
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._MarkArrow": ["mark_arrow", "MarkArrow"],
+        "._MarkInlaidAsterisk": ["mark_inlaid_asterisk", "MarkInlaidAsterisk"],
+        "._MarkMagnifyingGlass": [
+            "mark_magnifying_glass",
+            "MarkMagnifyingGlass",
+        ],
+        "._MarkAlphabeticalBadges": ["MarkAlphabeticalBadges"],
+        "._MarkNumericalBadges": ["MarkNumericalBadges"],
+        "._MarkRomanBadges": ["MarkRomanBadges"],
+    },
+)
 
 __all__ = [
     "mark_arrow",
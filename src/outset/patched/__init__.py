@@ -1,8 +1,22 @@
 """External functions patched or extended for outset compatibility."""
 
-from ._annotateplot import annotateplot
-from ._regplot import regplot
-from ._scatterplot import scatterplot
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._annotateplot import annotateplot
+    from ._regplot import regplot
+    from ._scatterplot import scatterplot
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._annotateplot": ["annotateplot"],
+        "._regplot": ["regplot"],
+        "._scatterplot": ["scatterplot"],
+    },
+)
 
 __all__ = [
     "annotateplot",
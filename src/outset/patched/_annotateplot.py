@@ -1,7 +1,6 @@
 import itertools as it
 import typing
 
-from adjustText import adjust_text
 from frozendict import frozendict
 import pandas as pd
 from matplotlib import pyplot as plt
@@ -56,6 +55,8 @@ def annotateplot(
         ax.text(row[x], row[y], row[text], **kwargs)
         for _idx, row in data.iterrows()
     ]
+    from adjustText import adjust_text  # defer slow import
+
     adjust_text(texts, ax=ax, **adjusttext_kws)
 
     return ax
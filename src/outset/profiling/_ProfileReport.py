@@ -0,0 +1,90 @@
+import json
+import typing
+
+from .._auxlib.profile_stage_ import StageNode
+
+
+class ProfileReport:
+    """Hierarchical stage timings and artist counts recorded by
+    `outset.profiling.profile`.
+
+    Each stage reports total elapsed seconds (including nested stages),
+    self elapsed seconds (excluding nested stages), number of calls, and
+    net number of artists added. Repeated calls to a stage at the same
+    position in the hierarchy are merged.
+    """
+
+    root: StageNode
+
+    def __init__(self: "ProfileReport", root: StageNode) -> None:
+        self.root = root
+
+    def __str__(self: "ProfileReport") -> str:
+        lines = [
+            f"{'stage':<48} {'total s':>9} {'self s':>9} {'calls':>7} "
+            f"{'artists':>8}"
+        ]
+
+        def visit(node: StageNode, depth: int) -> None:
+            for child in node.children.values():
+                self_elapsed = child.elapsed - sum(
+                    c.elapsed for c in child.children.values()
+                )
+                lines.append(
+                    f"{'  ' * depth + child.name:<48} {child.elapsed:>9.4f} "
+                    f"{self_elapsed:>9.4f} {child.calls:>7} "
+                    f"{child.artists:>8}"
+                )
+                visit(child, depth + 1)
+
+        visit(self.root, 0)
+        lines.append(
+            f"{'total':<48} {self.root.elapsed:>9.4f} {'':>9} {'':>7} "
+            f"{self.root.artists:>8}"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self: "ProfileReport") -> typing.Dict[str, typing.Any]:
+        """Convert to nested dicts, with keys "name", "elapsed",
+        "self_elapsed", "calls", "artists", and "children"."""
+
+        def convert(node: StageNode) -> typing.Dict[str, typing.Any]:
+            children = [convert(c) for c in node.children.values()]
+            return {
+                "name": node.name,
+                "elapsed": node.elapsed,
+                "self_elapsed": node.elapsed
+                - sum(c["elapsed"] for c in children),
+                "calls": node.calls,
+                "artists": node.artists,
+                "children": children,
+            }
+
+        return convert(self.root)
+
+    def to_json(self: "ProfileReport", **kwargs) -> str:
+        """Serialize `to_dict` output as JSON.
+
+        Keyword arguments forward to `json.dumps`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_folded(self: "ProfileReport") -> str:
+        """Format as folded stacks, one line per stage, for flame graph
+        tools (e.g., `flamegraph.pl`, speedscope).
+
+        Each line gives a semicolon-separated stage path and its self time,
+        in integer microseconds.
+        """
+        lines = []
+
+        def visit(node: StageNode, path: typing.List[str]) -> None:
+            self_elapsed = node.elapsed - sum(
+                c.elapsed for c in node.children.values()
+            )
+            lines.append(f"{';'.join(path)} {round(self_elapsed * 1e6)}")
+            for child in node.children.values():
+                visit(child, [*path, child.name])
+
+        visit(self.root, [self.root.name])
+        return "\n".join(lines)
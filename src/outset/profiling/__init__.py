@@ -0,0 +1,22 @@
+"""Timing of internal stages of figure construction."""
+
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._profile import profile
+    from ._ProfileReport import ProfileReport
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._profile": ["profile"],
+        "._ProfileReport": ["ProfileReport"],
+    },
+)
+
+__all__ = [
+    "profile",
+    "ProfileReport",
+]
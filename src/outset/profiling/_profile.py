@@ -0,0 +1,41 @@
+import contextlib
+import typing
+
+from .._auxlib.profile_stage_ import enable_profiling
+from ._ProfileReport import ProfileReport
+
+
+@contextlib.contextmanager
+def profile() -> typing.Iterator[ProfileReport]:
+    """Time internal stages of figure construction within the context.
+
+    Yields a `ProfileReport`, which is populated as stages complete and
+    finalized on context exit.
+
+    Stages are nested as called, e.g., "OutsetGrid" construction, then
+    "marqueeplot" for each panel, then "draw_marquee" for each marquee,
+    then "draw_callout" and its "gradient" and "mark_glyph". Layout
+    ("tight_layout", "set_aspect", "equalize_aspect") and final rendering
+    ("savefig") are also timed. Artists added to the axes or figure each
+    stage draws on are counted.
+
+    Notes
+    -----
+    Only stages run by the thread that entered the context are recorded, so
+    figures may be profiled independently across threads. Profiling contexts
+    may be nested, with each report recording stages run within it.
+
+    When no profiling context is active, stage hooks reduce to a single
+    global check.
+
+    Examples
+    --------
+    >>> from outset import profiling
+    >>> with profiling.profile() as report:
+    ...     grid = outset.OutsetGrid(data, x="x", y="y", col="outset")
+    ...     grid.marqueeplot()
+    ...     grid.savefig("figure.png")
+    >>> print(report)
+    """
+    with enable_profiling() as profiler:
+        yield ProfileReport(profiler.root)
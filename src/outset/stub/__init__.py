@@ -1,9 +1,24 @@
 """Create margin annotations for data outside axes viewport."""
 
-from ._CalcBoundsIQR import CalcBoundsIQR
-from ._rescale_clip_outliers import rescale_clip_outliers
-from ._stub_all_clipped_values import stub_all_clipped_values
-from ._stub_edge_mark import stub_edge_mark
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._CalcBoundsIQR import CalcBoundsIQR
+    from ._rescale_clip_outliers import rescale_clip_outliers
+    from ._stub_all_clipped_values import stub_all_clipped_values
+    from ._stub_edge_mark import stub_edge_mark
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._CalcBoundsIQR": ["CalcBoundsIQR"],
+        "._rescale_clip_outliers": ["rescale_clip_outliers"],
+        "._stub_all_clipped_values": ["stub_all_clipped_values"],
+        "._stub_edge_mark": ["stub_edge_mark"],
+    },
+)
 
 __all__ = [
     "CalcBoundsIQR",
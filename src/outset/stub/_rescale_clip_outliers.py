@@ -2,7 +2,6 @@ import typing
 
 from matplotlib.axes import Axes as mpl_Axes
 from matplotlib.collections import PathCollection
-from matplotlib import pyplot as plt
 import numpy as np
 
 from ._CalcBoundsIQR import CalcBoundsIQR
@@ -51,6 +50,8 @@ def rescale_clip_outliers(
     value, padding will be applied relative to that value or, if zero, one.
     """
     if ax is None:
+        from matplotlib import pyplot as plt  # defer backend selection
+
         ax = plt.gca()
 
     if calc_outlier_bounds is None:
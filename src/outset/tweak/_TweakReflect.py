@@ -1,5 +1,4 @@
 import typing
-import matplotlib.pyplot as plt
 from matplotlib import axes as mpl_axes
 import numpy as np
 
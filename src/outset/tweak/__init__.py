@@ -1,7 +1,20 @@
 """Functors to tweak callout leader layout."""
 
-from ._TweakReflect import TweakReflect
-from ._TweakSpreadArea import TweakSpreadArea
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._TweakReflect import TweakReflect
+    from ._TweakSpreadArea import TweakSpreadArea
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        "._TweakReflect": ["TweakReflect"],
+        "._TweakSpreadArea": ["TweakSpreadArea"],
+    },
+)
 
 __all__ = [
     "TweakReflect",
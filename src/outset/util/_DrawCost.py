@@ -0,0 +1,155 @@
+import dataclasses
+import typing
+
+from matplotlib.artist import Artist as mpl_Artist
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib import cbook as mpl_cbook
+from matplotlib import image as mpl_image
+from matplotlib import lines as mpl_lines
+from matplotlib import text as mpl_text
+import numpy as np
+
+from .._auxlib.count_path_vertices_ import count_path_vertices
+from .._auxlib.marquee_artists_ import get_marquees
+
+# approximate Agg draw time, in microseconds, measured on typical hardware
+_COST_PER_ARTIST = 80.0
+_COST_PER_CLIP_PATH = 10.0
+_COST_PER_IMAGE_PIXEL = 0.03
+_COST_PER_MATHTEXT = 40.0
+_COST_PER_PATH_VERTEX = 1.0
+
+
+def _count_mathtext(artist: mpl_Artist) -> int:
+    if isinstance(artist, mpl_text.Text):
+        return int(mpl_cbook.is_math_text(artist.get_text()))
+    elif isinstance(artist, mpl_lines.Line2D):
+        marker = artist.get_marker()
+        if isinstance(marker, str) and mpl_cbook.is_math_text(marker):
+            return len(artist.get_xydata())
+    return 0
+
+
+@dataclasses.dataclass(frozen=True)
+class DrawCost:
+    """Tally of artists and draw workload, for one axes or summed over
+    several.
+
+    Attributes
+    ----------
+    frame_artists : int
+        Marquee frame patches.
+    leader_artists : int
+        Marquee callout leader patches.
+    gradient_images : int
+        Marquee callout leader gradient fill images.
+    glyph_artists : int
+        Marquee glyph artists (e.g., badge markers and text).
+    data_artists : int
+        All other plotted artists (e.g., user-plotted data), excluding axes
+        furniture like spines, ticks, and titles.
+    clip_paths : int
+        Artists clipped to a path, rather than only to a bounding box.
+    path_vertices : int
+        Path vertices drawn, counting marker paths once per marker drawn.
+    mathtext : int
+        Mathtext strings rendered, as text or as markers.
+    image_pixels : int
+        Pixels of image data resampled.
+
+    See Also
+    --------
+    outset.OutsetGrid.calc_draw_cost
+        Measures each axes of a grid.
+    outset.OutsetGrid.assert_budget
+        Checks grid draw cost against limits.
+    """
+
+    frame_artists: int = 0
+    leader_artists: int = 0
+    gradient_images: int = 0
+    glyph_artists: int = 0
+    data_artists: int = 0
+    clip_paths: int = 0
+    path_vertices: int = 0
+    mathtext: int = 0
+    image_pixels: int = 0
+
+    def __add__(self: "DrawCost", other: "DrawCost") -> "DrawCost":
+        return DrawCost(
+            *(
+                getattr(self, field.name) + getattr(other, field.name)
+                for field in dataclasses.fields(self)
+            ),
+        )
+
+    @property
+    def num_artists(self: "DrawCost") -> int:
+        """Total number of artists tallied."""
+        return (
+            self.frame_artists
+            + self.leader_artists
+            + self.gradient_images
+            + self.glyph_artists
+            + self.data_artists
+        )
+
+    @property
+    def estimated_cost(self: "DrawCost") -> float:
+        """Rough estimate of Agg draw time, in milliseconds.
+
+        Weighs artist, clip path, path vertex, mathtext, and image pixel
+        counts by typical per-item draw times. Intended for comparing
+        figures and tracking regressions, not for absolute prediction.
+        """
+        return 1e-3 * (
+            _COST_PER_ARTIST * self.num_artists
+            + _COST_PER_CLIP_PATH * self.clip_paths
+            + _COST_PER_IMAGE_PIXEL * self.image_pixels
+            + _COST_PER_MATHTEXT * self.mathtext
+            + _COST_PER_PATH_VERTEX * self.path_vertices
+        )
+
+    @classmethod
+    def measure(cls: typing.Type["DrawCost"], ax: mpl_Axes) -> "DrawCost":
+        """Tally artists drawn on `ax`, and their draw workload.
+
+        Parameters
+        ----------
+        ax : matplotlib.axes.Axes
+            Axes to measure.
+
+        Returns
+        -------
+        DrawCost
+            The tally.
+        """
+        kinds = {}
+        for marquee in get_marquees(ax):
+            for kind, artists in (
+                ("frame_artists", marquee.frame_patches),
+                ("leader_artists", marquee.leader_patches),
+                ("gradient_images", marquee.leader_images),
+                ("glyph_artists", marquee.glyph_artists),
+            ):
+                kinds.update((id(artist), kind) for artist in artists)
+
+        counts = {field.name: 0 for field in dataclasses.fields(cls)}
+        for artist in (
+            *ax.collections,
+            *ax.images,
+            *ax.lines,
+            *ax.patches,
+            *ax.texts,
+            *ax.artists,
+        ):
+            counts[kinds.get(id(artist), "data_artists")] += 1
+            counts["clip_paths"] += artist.get_clip_path() is not None
+            counts["path_vertices"] += count_path_vertices(artist)
+            counts["mathtext"] += _count_mathtext(artist)
+            if isinstance(artist, mpl_image.AxesImage):
+                array = artist.get_array()
+                if array is not None:
+                    counts["image_pixels"] += int(np.prod(array.shape[:2]))
+
+        return cls(**counts)
@@ -0,0 +1,319 @@
+import collections
+import time
+import typing
+
+import numpy as np
+import pandas as pd
+
+# col value, hue value
+_Key = typing.Tuple[typing.Any, typing.Any]
+# monotonic deque of (row sequence number, timestamp, value) entries
+_Deque = typing.Deque[typing.Tuple[int, float, float]]
+
+
+def _push_monotonic(
+    deque_: _Deque,
+    seqs: np.ndarray,
+    times: np.ndarray,
+    values: np.ndarray,
+) -> None:
+    """Append a batch of entries to a deque whose values increase from front
+    to back, so that the front holds the minimum of entries not yet evicted.
+
+    Entries that can never become the minimum --- because a smaller or equal
+    value follows them --- are discarded, from the batch and from the back of
+    the deque.
+    """
+    suffix_min = np.minimum.accumulate(values[::-1])[::-1]
+    candidate = np.append(values[:-1] < suffix_min[1:], True)
+    first = values[candidate][0]
+    while deque_ and deque_[-1][2] >= first:
+        deque_.pop()
+    deque_.extend(
+        zip(
+            seqs[candidate].tolist(),
+            times[candidate].tolist(),
+            values[candidate].tolist(),
+        ),
+    )
+
+
+def _evict(deque_: _Deque, min_seq: int, min_time: float) -> None:
+    """Pop entries from the front of `deque_` that fall outside window."""
+    while deque_ and (deque_[0][0] < min_seq or deque_[0][1] < min_time):
+        deque_.popleft()
+
+
+class ExtentStore:
+    """Incrementally maintained x/y extents of append-only data, by col and
+    hue group.
+
+    Appending a batch of rows updates extents in time proportional to batch
+    size, rather than to the full history of appended rows. Optionally,
+    extents may cover only a trailing window of rows, by count and/or by
+    timestamp; windowed extents are maintained with monotonic deques.
+
+    Attributes
+    ----------
+    x : str
+        Column holding x coordinates.
+    y : str
+        Column holding y coordinates.
+    col : Optional[str]
+        Column to group extents by, as `OutsetGrid` col.
+    hue : Optional[str]
+        Column to group extents by, as `OutsetGrid` hue.
+    window_rows : Optional[int]
+        If provided, extents cover only the most recently appended
+        `window_rows` rows.
+    window_seconds : Optional[float]
+        If provided, extents cover only rows timestamped no earlier than
+        `window_seconds` before the most recently appended row.
+    time : Optional[str]
+        Column holding row timestamps, in seconds or as datetimes.
+
+        If None, rows are timestamped with `time.monotonic()` when appended.
+    num_rows : int
+        Total number of rows appended.
+
+    Notes
+    -----
+    Rows with missing x or y values are excluded from extents, but count
+    toward `window_rows`.
+
+    See Also
+    --------
+    outset.OutsetGrid.update_data
+        Accepts an `extents` kwarg to position marquee frames from an
+        `ExtentStore`.
+    """
+
+    x: str
+    y: str
+    col: typing.Optional[str]
+    hue: typing.Optional[str]
+    window_rows: typing.Optional[int]
+    window_seconds: typing.Optional[float]
+    time: typing.Optional[str]
+    num_rows: int
+
+    # unwindowed: running (xmin, ymin, xmax, ymax), by group
+    _bounds: typing.Dict[_Key, np.ndarray]
+    # windowed: monotonic deques for xmin, ymin, -xmax, -ymax, by group
+    _deques: typing.Dict[_Key, typing.Tuple[_Deque, ...]]
+    _latest_time: float
+
+    def __init__(
+        self: "ExtentStore",
+        x: str,
+        y: str,
+        col: typing.Optional[str] = None,
+        hue: typing.Optional[str] = None,
+        *,
+        window_rows: typing.Optional[int] = None,
+        window_seconds: typing.Optional[float] = None,
+        time: typing.Optional[str] = None,
+    ) -> None:
+        """Initialize an empty store.
+
+        Parameters
+        ----------
+        x : str
+            Column holding x coordinates.
+        y : str
+            Column holding y coordinates.
+        col : Optional[str], default None
+            Column to group extents by, as `OutsetGrid` col.
+        hue : Optional[str], default None
+            Column to group extents by, as `OutsetGrid` hue.
+        window_rows : Optional[int], default None
+            If provided, only the most recently appended `window_rows` rows
+            contribute to extents.
+        window_seconds : Optional[float], default None
+            If provided, only rows timestamped no earlier than
+            `window_seconds` before the most recently appended row
+            contribute to extents.
+        time : Optional[str], default None
+            Column holding nondecreasing row timestamps, in seconds or as
+            datetimes. Only used with `window_seconds`.
+
+            If None, rows are timestamped with `time.monotonic()` when
+            appended.
+        """
+        if window_rows is not None and window_rows <= 0:
+            raise ValueError(f"window_rows must be positive, not {window_rows}")
+        if window_seconds is not None and window_seconds < 0:
+            raise ValueError(
+                f"window_seconds must be nonnegative, not {window_seconds}",
+            )
+        if time is not None and window_seconds is None:
+            raise ValueError("time column requires window_seconds")
+
+        self.x, self.y, self.col, self.hue = x, y, col, hue
+        self.window_rows = window_rows
+        self.window_seconds = window_seconds
+        self.time = time
+        self.num_rows = 0
+        self._bounds = {}
+        self._deques = {}
+        self._latest_time = -np.inf
+
+    @property
+    def windowed(self: "ExtentStore") -> bool:
+        """Whether extents cover only a trailing window of rows."""
+        return self.window_rows is not None or self.window_seconds is not None
+
+    def _get_times(self: "ExtentStore", data: pd.DataFrame) -> np.ndarray:
+        """Timestamp rows of `data`, in seconds."""
+        if self.window_seconds is None:
+            return np.zeros(len(data))
+        elif self.time is None:
+            return np.full(len(data), time.monotonic())
+
+        times = data[self.time]
+        if pd.api.types.is_datetime64_any_dtype(times):
+            epoch = pd.Timestamp(0, tz=times.dt.tz)
+            times = (times - epoch).dt.total_seconds()
+        times = times.to_numpy(float)
+        if np.isnan(times).any():
+            raise ValueError(f"time column {self.time} has missing values")
+        if len(times) and (
+            times[0] < self._latest_time or (np.diff(times) < 0).any()
+        ):
+            raise ValueError(f"time column {self.time} must be nondecreasing")
+        return times
+
+    def _get_groups(
+        self: "ExtentStore", data: pd.DataFrame
+    ) -> typing.Iterator[typing.Tuple[_Key, np.ndarray]]:
+        """Yield group keys and positional indices of group rows."""
+        by = [c for c in (self.col, self.hue) if c is not None]
+        if not by:
+            if len(data):
+                yield (None, None), np.arange(len(data))
+            return
+
+        grouped = data.groupby(by if len(by) > 1 else by[0], sort=False)
+        for group, indices in grouped.indices.items():
+            values = iter(group if len(by) > 1 else (group,))
+            key = tuple(
+                next(values) if c is not None else None
+                for c in (self.col, self.hue)
+            )
+            yield key, indices
+
+    def append(self: "ExtentStore", data: pd.DataFrame) -> "ExtentStore":
+        """Update extents with a batch of newly appended rows.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            New rows, in order of appending.
+
+        Returns
+        -------
+        ExtentStore
+            Returns self.
+        """
+        for column in (self.x, self.y, self.col, self.hue, self.time):
+            if column is not None and column not in data.columns:
+                raise ValueError(f"data is missing column {column}")
+
+        times = self._get_times(data)
+        seqs = np.arange(self.num_rows, self.num_rows + len(data))
+        xy = data[[self.x, self.y]].to_numpy(float)
+        keep = ~np.isnan(xy).any(axis=1)
+        data, times, seqs, xy = data[keep], times[keep], seqs[keep], xy[keep]
+
+        touched = []
+        for key, indices in self._get_groups(data):
+            touched.append(key)
+            group_xy = xy[indices]
+            if not self.windowed:
+                batch = np.concatenate(
+                    [group_xy.min(axis=0), group_xy.max(axis=0)],
+                )
+                bounds = self._bounds.get(key)
+                if bounds is not None:
+                    batch[:2] = np.minimum(bounds[:2], batch[:2])
+                    batch[2:] = np.maximum(bounds[2:], batch[2:])
+                self._bounds[key] = batch
+                continue
+
+            deques = self._deques.setdefault(
+                key, tuple(collections.deque() for __ in range(4))
+            )
+            for deque_, values in zip(deques, (*group_xy.T, *-group_xy.T)):
+                _push_monotonic(deque_, seqs[indices], times[indices], values)
+
+        self.num_rows += len(keep)
+        if len(times):
+            self._latest_time = times[-1]
+        if self.windowed:
+            # other groups' deques are evicted lazily, on read
+            self._evict(touched)
+        return self
+
+    def _evict(self: "ExtentStore", keys: typing.Iterable[_Key]) -> None:
+        """Drop entries of groups `keys` that have left the trailing
+        window."""
+        min_seq = (
+            -1 if self.window_rows is None else self.num_rows - self.window_rows
+        )
+        min_time = (
+            -np.inf
+            if self.window_seconds is None
+            else self._latest_time - self.window_seconds
+        )
+        for key in [*keys]:
+            deques = self._deques[key]
+            for deque_ in deques:
+                _evict(deque_, min_seq, min_time)
+            # the latest row of a group is always held, so deques empty
+            # together once all of a group's rows have left the window
+            if not deques[0]:
+                del self._deques[key]
+
+    def keys(self: "ExtentStore") -> typing.List[_Key]:
+        """List (col value, hue value) groups with rows in extents."""
+        if self.windowed:
+            self._evict(self._deques)
+        return [*(self._deques if self.windowed else self._bounds)]
+
+    def get_extent(
+        self: "ExtentStore", key: _Key = (None, None)
+    ) -> typing.Tuple[float, float, float, float]:
+        """Get extent of rows in a col and hue group.
+
+        Parameters
+        ----------
+        key : Tuple[Any, Any], default (None, None)
+            Col value and hue value of group; None matches any value.
+
+        Returns
+        -------
+        Tuple[float, float, float, float]
+            Extent `(x0, y0, x1, y1)`, in the frame "extents" format.
+        """
+        if self.windowed:
+            self._evict(self._deques)
+            bounds = {
+                group: [deque_[0][2] for deque_ in deques]
+                for group, deques in self._deques.items()
+            }
+        else:
+            bounds = self._bounds
+        matches = [
+            group_bounds
+            for group, group_bounds in bounds.items()
+            if all(k is None or k == g for k, g in zip(key, group))
+        ]
+        if not matches:
+            raise ValueError(f"no rows in extents for {key}")
+
+        matches = np.array(matches, dtype=float)
+        if self.windowed:
+            matches[:, 2:] *= -1
+        x0, y0 = matches[:, :2].min(axis=0)
+        x1, y1 = matches[:, 2:].max(axis=0)
+        return float(x0), float(y0), float(x1), float(y1)
@@ -0,0 +1,215 @@
+import collections
+import contextlib
+import threading
+import typing
+import weakref
+
+import matplotlib as mpl
+from matplotlib.figure import Figure as mpl_Figure
+import numpy as np
+
+from .._auxlib.make_gridspec_axes_ import make_gridspec_axes
+from .._auxlib.reset_axes_ import get_tick_kws, reset_axes
+
+_SUBPLOT_PARAMS = ("left", "bottom", "right", "top", "wspace", "hspace")
+
+
+class GridPool:
+    """Bounded, least-recently-used pool of reusable figure-and-axes templates
+    for the "gridspec" grid engine.
+
+    Creating a figure and its subplot axes dominates `OutsetGrid` build time
+    for small grids. Grids built with `grid_pool=` check out a matching
+    template from the pool, if available, rather than creating a new one.
+    Releasing a grid back to the pool clears its plotted artists and restores
+    its figure and axes for reuse.
+
+    Templates are keyed by axes count and arrangement, figure size, and
+    GridSpec/subplot options --- i.e., by number of outsets, whether a source
+    plot is included, `col_wrap`, and figure size.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of idle templates held; least-recently-used templates
+        are evicted beyond this bound.
+    hits : int
+        Number of checkouts served from an idle template.
+    misses : int
+        Number of checkouts requiring a new template.
+    evictions : int
+        Number of idle templates discarded to respect `maxsize`.
+
+    Notes
+    -----
+    Pooling is safe across threads. A released grid must not be used again.
+
+    See Also
+    --------
+    outset.OutsetGrid
+        Accepts a `grid_pool` kwarg when using the "gridspec" grid engine.
+    """
+
+    maxsize: int
+    hits: int
+    misses: int
+    evictions: int
+
+    _idle: typing.OrderedDict[typing.Hashable, typing.List[typing.Tuple]]
+    _checked_out: "weakref.WeakKeyDictionary[mpl_Figure, typing.Tuple]"
+    _lock: threading.Lock
+    _size: int
+
+    def __init__(self: "GridPool", maxsize: int = 8) -> None:
+        """Initialize an empty pool.
+
+        Parameters
+        ----------
+        maxsize : int, default 8
+            Maximum number of idle templates to hold.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be nonnegative, not {maxsize}")
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._idle = collections.OrderedDict()
+        self._checked_out = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def __len__(self: "GridPool") -> int:
+        """Number of idle templates held."""
+        return self._size
+
+    def acquire(
+        self: "GridPool",
+        num_axes: int,
+        nrow: int,
+        ncol: int,
+        figsize: typing.Tuple[float, float],
+        gridspec_kws: typing.Optional[typing.Dict] = None,
+        subplot_kws: typing.Optional[typing.Dict] = None,
+        pyplot: bool = True,
+    ) -> typing.Tuple[mpl_Figure, np.ndarray]:
+        """Check out a figure and flat array of axes, as `make_gridspec_axes`
+        would create.
+
+        Used by `OutsetGrid`; call `release` on the built grid to return the
+        template to the pool.
+        """
+        key = (
+            num_axes,
+            nrow,
+            ncol,
+            tuple(map(float, figsize)),
+            repr(sorted((gridspec_kws or {}).items())),
+            repr(sorted((subplot_kws or {}).items())),
+            pyplot,
+        )
+        with self._lock:
+            templates = self._idle.get(key)
+            if templates:
+                fig, axes, tick_kws = templates.pop()
+                self._size -= 1
+                if not templates:
+                    del self._idle[key]
+                self.hits += 1
+            else:
+                fig = None
+                self.misses += 1
+
+        if fig is None:
+            fig, axes = make_gridspec_axes(
+                num_axes,
+                nrow,
+                ncol,
+                figsize=figsize,
+                gridspec_kws=gridspec_kws,
+                subplot_kws=subplot_kws,
+                pyplot=pyplot,
+            )
+            tick_kws = [get_tick_kws(ax) for ax in axes]
+
+        with self._lock:
+            self._checked_out[fig] = key, tick_kws
+        return fig, axes
+
+    def release(self: "GridPool", grid: typing.Any) -> None:
+        """Clear a grid built from this pool, and return its figure and axes
+        to the pool for reuse.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid built with `grid_pool=` this pool.
+        """
+        fig = grid.figure
+        with self._lock:
+            if fig not in self._checked_out:
+                raise ValueError("grid was not checked out from this pool")
+            key, tick_kws = self._checked_out.pop(fig)
+        __, __, __, figsize, *__ = key
+        axes = grid.axes.flat[:]
+
+        for ax in fig.axes:
+            if ax not in axes:  # e.g., colorbar axes
+                ax.remove()
+        for legend in [*fig.legends]:
+            legend.remove()
+        for text in [*fig.texts]:
+            text.remove()
+        fig.set_size_inches(figsize)
+        fig.subplots_adjust(
+            **{k: mpl.rcParams[f"figure.subplot.{k}"] for k in _SUBPLOT_PARAMS},
+        )  # also restores subplot positions, e.g., after inset_outsets
+        for ax, ax_tick_kws in zip(axes, tick_kws):
+            reset_axes(ax, ax_tick_kws)
+
+        with self._lock:
+            self._idle.setdefault(key, []).append((fig, axes, tick_kws))
+            self._idle.move_to_end(key)
+            self._size += 1
+            evicted = []
+            while self._size > self.maxsize:
+                (*__, pyplot), templates = next(iter(self._idle.items()))
+                evicted_fig, __, __ = templates.pop(0)
+                evicted.append((evicted_fig, pyplot))
+                if not templates:
+                    self._idle.popitem(last=False)
+                self._size -= 1
+                self.evictions += 1
+
+        for evicted_fig, pyplot in evicted:
+            if pyplot:
+                from matplotlib import pyplot as plt  # only if already in use
+
+                plt.close(evicted_fig)
+            else:  # not registered with pyplot, so just drop reference
+                evicted_fig.clear()
+
+    @contextlib.contextmanager
+    def checkout(self: "GridPool", *args, **kwargs) -> typing.Iterator:
+        """Build an `OutsetGrid` from this pool, releasing it on exit.
+
+        Arguments forward to `OutsetGrid`, with `grid_engine="gridspec"` and
+        `grid_pool=self`.
+        """
+        from .._OutsetGrid import OutsetGrid  # avoid circular import
+
+        grid = OutsetGrid(
+            *args, grid_engine="gridspec", grid_pool=self, **kwargs
+        )
+        try:
+            yield grid
+        finally:
+            self.release(grid)
+
+    def stats(self: "GridPool") -> typing.Dict[str, int]:
+        """Report pool hit, miss, and eviction counts and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": self._size,
+            }
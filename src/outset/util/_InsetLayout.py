@@ -0,0 +1,140 @@
+import dataclasses
+import typing
+
+from matplotlib.axes import Axes as mpl_Axes
+from matplotlib.figure import Figure as mpl_Figure
+from matplotlib.transforms import Bbox as mpl_Bbox
+
+from .._auxlib.render_lock_ import render_lock
+from .._auxlib.resize_figure_to_axes_ import resize_figure_to_axes
+
+
+@dataclasses.dataclass(frozen=True)
+class InsetLayout:
+    """Cached figure geometry for superimposing outset axes over source axes.
+
+    Measuring tick and label extents requires a renderer draw pass. An
+    `InsetLayout` records the outcome of that measurement once, so it can be
+    applied to the measured figure and to any other figure built from the
+    same template (i.e., same figure size, axes arrangement, and tick label
+    formatting) without further renderer draws.
+
+    Attributes
+    ----------
+    figsize : Tuple[float, float]
+        Figure size, in inches, fit to source axes tick and label extents.
+    source_bounds : Tuple[float, float, float, float]
+        Source axes position `(x0, y0, width, height)`, in inches.
+    insets : Tuple[Tuple[float, float, float, float], ...]
+        Position `(x0, y0, width, height)` of each outset axes, fractionally
+        relative to source axes.
+
+    See Also
+    --------
+    outset.inset_outsets
+        Applies an `InsetLayout` to an `OutsetGrid`, measuring a fresh layout
+        if none is provided.
+    """
+
+    figsize: typing.Tuple[float, float]
+    source_bounds: typing.Tuple[float, float, float, float]
+    insets: typing.Tuple[typing.Tuple[float, float, float, float], ...]
+
+    @classmethod
+    def measure(
+        cls: typing.Type["InsetLayout"],
+        figure: mpl_Figure,
+        source_axes: mpl_Axes,
+        insets: typing.Sequence[typing.Tuple[float, float, float, float]],
+    ) -> "InsetLayout":
+        """Fit figure to source axes tick and label extents, recording the
+        resulting geometry.
+
+        Performs a renderer draw pass, and resizes `figure` as a side effect.
+
+        Parameters
+        ----------
+        figure : matplotlib.figure.Figure
+            Figure containing source axes.
+        source_axes : matplotlib.axes.Axes
+            Axes outset axes will be superimposed over.
+        insets : Sequence[Tuple[float, float, float, float]]
+            Position `(x0, y0, width, height)` of each outset axes,
+            fractionally relative to source axes.
+
+        Returns
+        -------
+        InsetLayout
+            The measured layout.
+        """
+        with render_lock:
+            figure.tight_layout()
+            resize_figure_to_axes(figure, source_axes)
+
+        fig_width, fig_height = figure.get_size_inches()
+        pos = source_axes.get_position()
+        return cls(
+            figsize=(float(fig_width), float(fig_height)),
+            source_bounds=(
+                pos.x0 * fig_width,
+                pos.y0 * fig_height,
+                pos.width * fig_width,
+                pos.height * fig_height,
+            ),
+            insets=tuple(tuple(map(float, inset)) for inset in insets),
+        )
+
+    def apply(
+        self: "InsetLayout",
+        figure: mpl_Figure,
+        source_axes: mpl_Axes,
+        outset_axes: typing.Sequence[mpl_Axes],
+    ) -> None:
+        """Resize figure and position source and outset axes according to
+        cached layout.
+
+        Does not perform a renderer draw pass.
+
+        Parameters
+        ----------
+        figure : matplotlib.figure.Figure
+            Figure to rearrange.
+        source_axes : matplotlib.axes.Axes
+            Axes outset axes will be superimposed over.
+        outset_axes : Sequence[matplotlib.axes.Axes]
+            Axes to superimpose over source axes, one per inset.
+        """
+        if len(self.insets) != len(outset_axes):
+            raise ValueError(
+                "Num specified insets must equal number outset axes; "
+                f"{len(self.insets)} insets were specified "
+                f"for {len(outset_axes)} outset axes.",
+            )
+
+        fig_width, fig_height = self.figsize
+        figure.set_size_inches(fig_width, fig_height, forward=True)
+
+        x0, y0, width, height = self.source_bounds
+        source_pos = mpl_Bbox.from_bounds(
+            x0 / fig_width,
+            y0 / fig_height,
+            width / fig_width,
+            height / fig_height,
+        )
+        source_axes.set_position(source_pos)
+
+        for ax, (rel_x0, rel_y0, rel_w, rel_h) in zip(outset_axes, self.insets):
+            # Calculate absolute position and size of each inset subplot
+            abs_x0 = source_pos.x0 + rel_x0 * source_pos.width
+            abs_y0 = source_pos.y0 + rel_y0 * source_pos.height
+            abs_w = rel_w * source_pos.width
+            abs_h = rel_h * source_pos.height
+
+            assert -0.01 <= abs_x0 <= 1.01, abs_x0
+            assert -0.01 <= abs_y0 <= 1.01, abs_y0
+            assert -0.01 <= abs_w <= 1.01, abs_w
+            assert -0.01 <= abs_h <= 1.01, abs_h
+            assert -0.01 <= abs_x0 + abs_w <= 1.01, abs_x0 + abs_w
+            assert -0.01 <= abs_y0 + abs_h <= 1.01, abs_y0 + abs_h
+
+            ax.set_position(mpl_Bbox.from_bounds(abs_x0, abs_y0, abs_w, abs_h))
@@ -0,0 +1,175 @@
+import dataclasses
+import typing
+
+from matplotlib import collections as mpl_collections
+from matplotlib import colors as mpl_colors
+from matplotlib import widgets as mpl_widgets
+import numpy as np
+
+from .._auxlib.point_index_ import PointIndex
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+
+@dataclasses.dataclass
+class _LinkedCollection:
+    """Scatter collection brushed, with original colors to restore."""
+
+    collection: mpl_collections.PathCollection
+    point_ids: np.ndarray  # index of each offset among unique points
+    color_attr: str  # "facecolor" or "edgecolor"
+    colors: np.ndarray  # original RGBA colors, one row per offset
+    array: typing.Optional[np.ndarray]  # original colormapped values
+
+
+def _link_collection(
+    collection: mpl_collections.PathCollection, point_ids: np.ndarray
+) -> _LinkedCollection:
+    collection.update_scalarmappable()  # resolve colormapped colors
+    # highlight hollow markers by edge color
+    has_faces = len(collection.get_facecolors())
+    color_attr = "facecolor" if has_faces else "edgecolor"
+    colors = getattr(collection, f"get_{color_attr}s")()
+    return _LinkedCollection(
+        collection=collection,
+        point_ids=point_ids,
+        color_attr=color_attr,
+        colors=np.broadcast_to(colors, (len(point_ids), 4)).copy(),
+        array=collection.get_array(),
+    )
+
+
+class LinkedBrush:
+    """Linked lasso selection ("brushing") of scatter points across an
+    `OutsetGrid`'s source and outset axes.
+
+    Points lassoed on any axes are highlighted on every axes they appear
+    on. Points are matched across axes by data coordinates, so collections
+    culled to axes viewports stay linked.
+
+    Selections resolve through a spatial index over unique scatter point
+    coordinates, built once, so only points within the lasso's bounding box
+    are tested against it. Highlights update colors of existing collections
+    in place; plotters are not re-run.
+
+    Attributes
+    ----------
+    grid : outset.OutsetGrid
+        Grid brushed.
+    color : tuple of float
+        RGBA highlight color for selected points.
+
+    Notes
+    -----
+    Lassoing requires an interactive matplotlib backend, e.g.,
+    `%matplotlib widget` in Jupyter. Collections plotted after creating the
+    brush are not linked.
+
+    While a selection is active, colormapped collections show their
+    colormapped colors as fixed colors; `clear` restores colormapping.
+
+    See Also
+    --------
+    outset.util.MarqueePicker
+        Hover tooltips and click callbacks for marquees.
+    """
+
+    grid: "OutsetGrid"
+    color: typing.Tuple[float, float, float, float]
+
+    _index: PointIndex
+    _lassos: typing.List[mpl_widgets.LassoSelector]
+    _links: typing.List[_LinkedCollection]
+    _selected: np.ndarray  # selection mask over unique points
+
+    def __init__(
+        self: "LinkedBrush",
+        grid: "OutsetGrid",
+        *,
+        color: typing.Any = "red",
+        lasso: bool = True,
+    ) -> None:
+        """Link scatter collections across `grid`'s axes.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid to brush, with scatter plots complete.
+        color : color, default "red"
+            Highlight color for selected points.
+        lasso : bool, default True
+            Whether to attach a lasso selector to each axes. If False,
+            selections are made only by calling `select`.
+        """
+        grid.finalize()
+        collections = [
+            collection
+            for ax in grid.axes.flat
+            for collection in ax.collections
+            if isinstance(collection, mpl_collections.PathCollection)
+            and len(collection.get_offsets())
+        ]
+        if not collections:
+            raise ValueError("LinkedBrush requires a grid with scatter plots")
+
+        offsets = [np.asarray(c.get_offsets()) for c in collections]
+        points, point_ids = np.unique(
+            np.concatenate(offsets), axis=0, return_inverse=True
+        )
+        point_ids = np.split(
+            point_ids.ravel(), np.cumsum([len(o) for o in offsets])[:-1]
+        )
+
+        self.grid = grid
+        self.color = mpl_colors.to_rgba(color)
+        self._index = PointIndex(points)
+        self._links = [*map(_link_collection, collections, point_ids)]
+        self._selected = np.zeros(len(points), dtype=bool)
+        self._lassos = [
+            mpl_widgets.LassoSelector(ax, onselect=self.select, useblit=True)
+            for ax in grid.axes.flat
+            if lasso
+        ]
+
+    @property
+    def selected(self: "LinkedBrush") -> np.ndarray:
+        """Data coordinates of selected points, as rows of `(x, y)`."""
+        return self._index.xy[self._selected]
+
+    def select(
+        self: "LinkedBrush",
+        vertices: typing.Sequence[typing.Tuple[float, float]],
+    ) -> None:
+        """Select points within polygon `vertices`, in data coordinates,
+        replacing any previous selection."""
+        self._selected[:] = False
+        self._selected[self._index.query_polygon(vertices)] = True
+        self._update()
+
+    def clear(self: "LinkedBrush") -> None:
+        """Deselect all points, restoring original colors."""
+        self._selected[:] = False
+        self._update()
+
+    def disconnect(self: "LinkedBrush") -> None:
+        """Clear selection, and detach lasso selectors."""
+        for lasso in self._lassos:
+            lasso.disconnect_events()
+        self._lassos = []
+        self.clear()
+
+    def _update(self: "LinkedBrush") -> None:
+        """Recolor linked collections in place to show selection."""
+        any_selected = self._selected.any()
+        for link in self._links:
+            set_colors = getattr(link.collection, f"set_{link.color_attr}")
+            if any_selected:
+                colors = link.colors.copy()
+                colors[self._selected[link.point_ids]] = self.color
+                link.collection.set_array(None)
+                set_colors(colors)
+            else:
+                set_colors(link.colors)
+                link.collection.set_array(link.array)
+        self.grid.figure.canvas.draw_idle()
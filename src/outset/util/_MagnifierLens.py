@@ -0,0 +1,127 @@
+import typing
+
+from matplotlib import backend_bases as mpl_backend_bases
+import numpy as np
+
+from .._auxlib.marquee_artists_ import MarqueeArtists, get_marquees
+from .._auxlib.marquee_drag_ import MarqueeDrag
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+
+class MagnifierLens:
+    """Loupe mode, where one outset follows the mouse over the source axes.
+
+    The outset's marquee frame centers on the cursor as it moves, keeping
+    its size, and the outset axes limits follow. Each mouse move only
+    updates axes limits and marquee geometry --- plotters are not re-run ---
+    and redraws blit the marquee and outset axes over a cached background.
+
+    Works with side-by-side grids as well as grids rearranged by
+    `inset_outsets`.
+
+    Attributes
+    ----------
+    grid : outset.OutsetGrid
+        Grid to magnify within, which must include a source plot.
+    marquee : MarqueeArtists
+        Source axes marquee that follows the mouse.
+
+    Notes
+    -----
+    Requires an interactive matplotlib backend, e.g., `%matplotlib widget`
+    in Jupyter.
+
+    Any ordinary redraw of the figure (e.g., on window resize) invalidates
+    the cached background, which is recaptured at the next mouse move. Call
+    `disconnect` before saving the figure.
+
+    See Also
+    --------
+    outset.util.MarqueeEditor
+        Move and resize marquee frames by dragging.
+    """
+
+    grid: "OutsetGrid"
+    marquee: MarqueeArtists
+
+    _cids: typing.List[int]
+    _drag: typing.Optional[MarqueeDrag]
+
+    def __init__(
+        self: "MagnifierLens",
+        grid: "OutsetGrid",
+        outset: typing.Optional[typing.Any] = None,
+    ) -> None:
+        """Begin following mouse moves over `grid`'s source axes.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid to magnify within, with a source plot and marquee
+            annotation complete.
+        outset : Optional[Any], default None
+            Outset value (i.e., col value, or frame name or number) of the
+            marquee to follow the mouse.
+
+            If None, the first marquee drawn on the source axes is used.
+        """
+        if grid.source_axes is None:
+            raise ValueError("MagnifierLens requires a grid with source axes")
+        grid.finalize()
+
+        marquees = [
+            marquee
+            for marquee in get_marquees(grid.source_axes)
+            if outset is None or marquee.key[0] == outset
+        ]
+        if not marquees:
+            raise ValueError(f"no source axes marquee for outset {outset}")
+
+        self.grid = grid
+        self.marquee = marquees[0]
+        self._drag = None
+        canvas = grid.figure.canvas
+        self._cids = [
+            canvas.mpl_connect("motion_notify_event", self._on_motion),
+            canvas.mpl_connect("draw_event", self._on_draw),
+        ]
+
+    def disconnect(self: "MagnifierLens") -> None:
+        """Stop following the mouse, leaving the lens where it is."""
+        for cid in self._cids:
+            self.grid.figure.canvas.mpl_disconnect(cid)
+        self._cids = []
+        if self._drag is not None:
+            self._drag.finish()
+        self._drag = None
+
+    def move_to(self: "MagnifierLens", x: float, y: float) -> None:
+        """Center the lens at source axes data coordinates `(x, y)`."""
+        if self._drag is None:
+            self._drag = MarqueeDrag(self.grid, self.marquee)
+        half_width = np.ptp(self.marquee.frame_xlim) / 2
+        half_height = np.ptp(self.marquee.frame_ylim) / 2
+        self._drag.move(
+            np.array([x - half_width, x + half_width]),
+            np.array([y - half_height, y + half_height]),
+        )
+
+    def _on_motion(
+        self: "MagnifierLens", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        if (
+            event.inaxes is self.grid.source_axes
+            and not self.grid.figure.canvas.widgetlock.locked()
+        ):
+            self.move_to(event.xdata, event.ydata)
+
+    def _on_draw(
+        self: "MagnifierLens", event: mpl_backend_bases.DrawEvent
+    ) -> None:
+        """Invalidate cached background after ordinary redraws."""
+        if self._drag is not None:
+            # show lens marquee in subsequent ordinary redraws
+            self._drag.finish(redraw=False)
+        self._drag = None
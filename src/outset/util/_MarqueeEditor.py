@@ -0,0 +1,205 @@
+import typing
+
+from matplotlib import backend_bases as mpl_backend_bases
+import numpy as np
+
+from .._auxlib.marquee_artists_ import (
+    MarqueeArtists,
+    get_marquees,
+    unpad_frame,
+)
+from .._auxlib.marquee_drag_ import MarqueeDrag
+from ._NamedFrames import NamedFrames
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+# frame lim endpoints, named as for axes that aren't inverted
+_EDGES = ("left", "right", "bottom", "top")
+
+
+class MarqueeEditor:
+    """Interactive editing of an `OutsetGrid`'s marquee frames with the
+    mouse.
+
+    Dragging inside a marquee frame on the source axes moves it; dragging
+    near a frame edge or corner resizes it. While dragging, the frame's
+    leader and glyph, and the matching outset axes' limits and marquee,
+    update live. Redraws blit over a cached background, so only the dragged
+    marquee and matching outset axes are redrawn.
+
+    Attributes
+    ----------
+    grid : outset.OutsetGrid
+        Grid edited, which must include a source plot.
+    tolerance : float
+        Distance from a frame edge, in pixels, within which a drag resizes
+        rather than moves the frame.
+
+    Notes
+    -----
+    Requires an interactive matplotlib backend, e.g., `%matplotlib widget`
+    in Jupyter. Call `get_frames` once editing is complete, to recreate the
+    figure from a script.
+
+    Editing moves outset axes limits with their frame, so outset aspect
+    ratios follow the frame's shape; pass exported frames to a new
+    `OutsetGrid` to re-equalize aspect.
+    """
+
+    grid: "OutsetGrid"
+    tolerance: float
+
+    _cids: typing.List[int]
+    _drag: typing.Optional[MarqueeDrag]
+    # frame edges grabbed (if none, moves frame), and press data coordinates
+    _press: typing.Optional[typing.Tuple[typing.Tuple[str, ...], np.ndarray]]
+
+    def __init__(
+        self: "MarqueeEditor",
+        grid: "OutsetGrid",
+        *,
+        tolerance: float = 5.0,
+    ) -> None:
+        """Begin handling mouse events on `grid`'s figure.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid to edit, with a source plot and marquee annotation
+            complete.
+        tolerance : float, default 5.0
+            Distance from a frame edge, in pixels, within which a drag
+            resizes rather than moves the frame.
+        """
+        if grid.source_axes is None:
+            raise ValueError("MarqueeEditor requires a grid with source axes")
+        grid.finalize()
+
+        self.grid = grid
+        self.tolerance = tolerance
+        self._drag = self._press = None
+        canvas = grid.figure.canvas
+        self._cids = [
+            canvas.mpl_connect("button_press_event", self._on_press),
+            canvas.mpl_connect("motion_notify_event", self._on_motion),
+            canvas.mpl_connect("button_release_event", self._on_release),
+        ]
+
+    def disconnect(self: "MarqueeEditor") -> None:
+        """Stop handling mouse events."""
+        for cid in self._cids:
+            self.grid.figure.canvas.mpl_disconnect(cid)
+        self._cids = []
+
+    def get_frames(self: "MarqueeEditor") -> NamedFrames:
+        """Export current marquee frame coordinates.
+
+        Returns
+        -------
+        outset.util.NamedFrames
+            Frame "extents" `(x0, y0, x1, y1)`, named by outset value (or,
+            if unknown, by drawing order, starting from 1).
+
+            Frames of marquees sharing an outset value are merged.
+        """
+        frames = {}
+        for i, marquee in enumerate(get_marquees(self.grid.source_axes), 1):
+            name = i if marquee.key[0] is None else marquee.key[0]
+            (x0, x1), (y0, y1) = unpad_frame(
+                marquee.frame_xlim, marquee.frame_ylim, marquee.frame_inner_pad
+            )
+            if name in frames:
+                x0_, y0_, x1_, y1_ = frames[name]
+                x0, y0 = min(x0, x0_), min(y0, y0_)
+                x1, y1 = max(x1, x1_), max(y1, y1_)
+            frames[name] = float(x0), float(y0), float(x1), float(y1)
+        return NamedFrames(frames)
+
+    def _to_data(
+        self: "MarqueeEditor", event: mpl_backend_bases.MouseEvent
+    ) -> np.ndarray:
+        """Get source axes data coordinates of event, even if outside axes."""
+        if event.inaxes is self.grid.source_axes:
+            return np.array([event.xdata, event.ydata])
+        return self.grid.source_axes.transData.inverted().transform(
+            (event.x, event.y),
+        )
+
+    def _hit_test(
+        self: "MarqueeEditor", event: mpl_backend_bases.MouseEvent
+    ) -> typing.Optional[typing.Tuple[MarqueeArtists, typing.Tuple[str, ...]]]:
+        """Find topmost marquee under event, and frame edges grabbed."""
+        ax, tol = self.grid.source_axes, self.tolerance
+        for marquee in reversed(get_marquees(ax)):
+            (x0, y0), (x1, y1) = ax.transData.transform(
+                np.column_stack((marquee.frame_xlim, marquee.frame_ylim)),
+            )
+            if not (
+                min(x0, x1) - tol <= event.x <= max(x0, x1) + tol
+                and min(y0, y1) - tol <= event.y <= max(y0, y1) + tol
+            ):
+                continue
+            dists = np.abs(
+                np.array([x0, x1, y0, y1])
+                - [event.x, event.x, event.y, event.y],
+            )
+            near = dists <= tol
+            # for small frames, grab only nearer of opposing edges
+            for lo, hi in (0, 1), (2, 3):
+                if near[lo] and near[hi]:
+                    near[hi if dists[lo] <= dists[hi] else lo] = False
+            return marquee, tuple(e for e, n in zip(_EDGES, near) if n)
+        return None
+
+    def _on_press(
+        self: "MarqueeEditor", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        canvas = self.grid.figure.canvas
+        if (
+            event.button != 1
+            or event.inaxes is not self.grid.source_axes
+            or canvas.widgetlock.locked()
+        ):
+            return
+        hit = self._hit_test(event)
+        if hit is None:
+            return
+
+        marquee, edges = hit
+        self._press = edges, self._to_data(event)
+        self._drag = MarqueeDrag(self.grid, marquee)
+        self._drag.move(marquee.frame_xlim, marquee.frame_ylim)
+
+    def _on_motion(
+        self: "MarqueeEditor", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        drag = self._drag
+        if drag is None:
+            return
+
+        edges, press_xy = self._press
+        dx, dy = self._to_data(event) - press_xy
+        xlim, ylim = drag.frame_xlim.copy(), drag.frame_ylim.copy()
+        if not edges:
+            xlim += dx
+            ylim += dy
+        for edge, lim, i, delta in (
+            ("left", xlim, 0, dx),
+            ("right", xlim, 1, dx),
+            ("bottom", ylim, 0, dy),
+            ("top", ylim, 1, dy),
+        ):
+            if edge in edges:
+                lim[i] += delta
+        xlim.sort()
+        ylim.sort()
+        drag.move(xlim, ylim)
+
+    def _on_release(
+        self: "MarqueeEditor", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        if self._drag is None or event.button != 1:
+            return
+        self._drag.finish()
+        self._drag = self._press = None
@@ -0,0 +1,76 @@
+import dataclasses
+import typing
+
+import numpy as np
+
+from .._auxlib.marquee_geometry_ import MarqueeLayout
+
+
+@dataclasses.dataclass(frozen=True)
+class MarqueeGeometry:
+    """Geometry of marquee annotations on one axes, computed without drawing.
+
+    Attributes
+    ----------
+    keys : list of tuple
+        The `(outset, hue)` values framed by each marquee, in drawing order.
+
+        Values are None where not applicable.
+    frame_xlim : np.ndarray
+        Padded frame x limits, shape `(n, 2)`.
+    frame_ylim : np.ndarray
+        Padded frame y limits, shape `(n, 2)`.
+    leader_vertices : np.ndarray
+        Callout leader polygon vertices, shape `(n, 4, 2)`, after any leader
+        tweak. Untweaked, vertices are the frame's upper left, upper right,
+        and lower right corners followed by the outer leader vertex.
+    mark_xy : np.ndarray
+        Glyph positions, shape `(n, 2)`.
+    xlim : np.ndarray
+        Final axes x limits, shape `(2,)`.
+    ylim : np.ndarray
+        Final axes y limits, shape `(2,)`.
+
+    See Also
+    --------
+    outset.util.calc_marquee_geometry
+        Computes geometry for `marqueeplot`.
+    outset.OutsetGrid.calc_marquee_geometry
+        Computes geometry for each axes of a grid.
+    """
+
+    keys: typing.List[typing.Tuple[typing.Any, typing.Any]]
+    frame_xlim: np.ndarray
+    frame_ylim: np.ndarray
+    leader_vertices: np.ndarray
+    mark_xy: np.ndarray
+    xlim: np.ndarray
+    ylim: np.ndarray
+
+    def __len__(self: "MarqueeGeometry") -> int:
+        return len(self.keys)
+
+    @classmethod
+    def _from_layouts(
+        cls: typing.Type["MarqueeGeometry"],
+        layouts: typing.Sequence[MarqueeLayout],
+        xlim: typing.Tuple[float, float],
+        ylim: typing.Tuple[float, float],
+    ) -> "MarqueeGeometry":
+        return cls(
+            keys=[layout.key for layout in layouts],
+            frame_xlim=np.array(
+                [layout.frame_xlim for layout in layouts], float
+            ).reshape(-1, 2),
+            frame_ylim=np.array(
+                [layout.frame_ylim for layout in layouts], float
+            ).reshape(-1, 2),
+            leader_vertices=np.array(
+                [layout.leader_vertices for layout in layouts], float
+            ).reshape(-1, 4, 2),
+            mark_xy=np.array(
+                [layout.mark_xy for layout in layouts], float
+            ).reshape(-1, 2),
+            xlim=np.array(xlim, float),
+            ylim=np.array(ylim, float),
+        )
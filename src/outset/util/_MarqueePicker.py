@@ -0,0 +1,192 @@
+import typing
+
+from matplotlib import axes as mpl_axes
+from matplotlib import backend_bases as mpl_backend_bases
+
+from .._auxlib.marquee_index_ import query_marquees
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+# (outset, hue) values of marquee
+_Key = typing.Tuple[typing.Any, typing.Any]
+
+
+def _format_key(key: _Key) -> str:
+    outset, hue = key
+    if hue is None or hue == outset:
+        return str(outset)
+    return f"{outset}, {hue}"
+
+
+class MarqueePicker:
+    """Hover tooltips and click callbacks for an `OutsetGrid`'s source axes
+    marquees, scaling to many marquees.
+
+    Hit tests go through a spatial index over marquee frame and leader
+    display coordinate bounding boxes, so each mouse event checks only
+    marquees near the cursor, rather than every artist as matplotlib's
+    default picking does. The index is rebuilt only when source axes
+    position or limits change, or marquees are added or moved.
+
+    Attributes
+    ----------
+    grid : outset.OutsetGrid
+        Grid picked within, which must include a source plot.
+    on_pick : Optional[Callable[[Tuple[Any, Any], Optional[Axes]], None]]
+        Called on click with the `(outset, hue)` key of the topmost marquee
+        clicked and its outset axes (or None, if not found).
+    picked : Optional[Tuple[Any, Any]]
+        Key of the most recently clicked marquee, if any.
+
+    Notes
+    -----
+    Requires an interactive matplotlib backend, e.g., `%matplotlib widget`
+    in Jupyter. Tooltips blit over a background cached at each ordinary
+    redraw.
+
+    See Also
+    --------
+    outset.util.MagnifierLens
+        Loupe mode, where one outset follows the mouse.
+    """
+
+    grid: "OutsetGrid"
+    on_pick: typing.Optional[
+        typing.Callable[[_Key, typing.Optional[mpl_axes.Axes]], None]
+    ]
+    picked: typing.Optional[_Key]
+
+    _background: typing.Any
+    _cids: typing.List[int]
+    _format_key: typing.Callable[[_Key], str]
+    _hovered: typing.Optional[_Key]
+    _tooltip: typing.Optional[typing.Any]
+
+    def __init__(
+        self: "MarqueePicker",
+        grid: "OutsetGrid",
+        on_pick: typing.Optional[typing.Callable] = None,
+        *,
+        format_key: typing.Callable[[_Key], str] = _format_key,
+        tooltip: bool = True,
+    ) -> None:
+        """Begin handling mouse events on `grid`'s figure.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid to pick within, with a source plot and marquee annotation
+            complete.
+        on_pick : Optional[Callable], default None
+            Called on click with the `(outset, hue)` key of the topmost
+            marquee clicked and its outset axes (or None, if not found).
+        format_key : Callable[[Tuple[Any, Any]], str], optional
+            Formats a marquee's `(outset, hue)` key as tooltip text.
+
+            By default, shows outset value, followed by hue value if it
+            differs.
+        tooltip : bool, default True
+            Whether to show a tooltip when hovering over a marquee.
+        """
+        if grid.source_axes is None:
+            raise ValueError("MarqueePicker requires a grid with source axes")
+        grid.finalize()
+
+        self.grid = grid
+        self.on_pick = on_pick
+        self.picked = None
+        self._background = None
+        self._format_key = format_key
+        self._hovered = None
+        self._tooltip = None
+        if tooltip:
+            self._tooltip = grid.source_axes.annotate(
+                "",
+                xy=(0, 0),
+                xytext=(8, 8),
+                textcoords="offset points",
+                bbox={"boxstyle": "round", "fc": "white", "alpha": 0.9},
+                annotation_clip=False,
+                animated=True,
+                visible=False,
+                zorder=1e6,
+            )
+
+        canvas = grid.figure.canvas
+        self._cids = [
+            canvas.mpl_connect("button_press_event", self._on_press),
+            canvas.mpl_connect("draw_event", self._on_draw),
+            canvas.mpl_connect("motion_notify_event", self._on_motion),
+        ]
+
+    def disconnect(self: "MarqueePicker") -> None:
+        """Stop handling mouse events, and remove tooltip."""
+        for cid in self._cids:
+            self.grid.figure.canvas.mpl_disconnect(cid)
+        self._cids = []
+        if self._tooltip is not None:
+            self._tooltip.remove()
+        self._tooltip = None
+
+    def query(self: "MarqueePicker", x: float, y: float) -> typing.List[_Key]:
+        """Find `(outset, hue)` keys of source axes marquees with a frame or
+        leader under display coordinates `(x, y)`, topmost first."""
+        return [
+            marquee.key
+            for marquee in query_marquees(self.grid.source_axes, x, y)
+        ]
+
+    def _on_draw(
+        self: "MarqueePicker", event: mpl_backend_bases.DrawEvent
+    ) -> None:
+        """Recapture cached background after ordinary redraws."""
+        canvas = self.grid.figure.canvas
+        self._background = canvas.copy_from_bbox(self.grid.figure.bbox)
+
+    def _on_motion(
+        self: "MarqueePicker", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        if self._tooltip is None:
+            return
+        hits = []
+        if event.inaxes is self.grid.source_axes:
+            hits = self.query(event.x, event.y)
+        hovered = hits[0] if hits else None
+        if hovered is None and self._hovered is None:
+            return
+
+        self._hovered = hovered
+        self._tooltip.set_visible(hovered is not None)
+        if hovered is not None:
+            self._tooltip.xy = event.xdata, event.ydata
+            self._tooltip.set_text(self._format_key(hovered))
+
+        if self._background is None:
+            return
+        canvas = self.grid.figure.canvas
+        canvas.restore_region(self._background)
+        if hovered is not None:
+            self.grid.source_axes.draw_artist(self._tooltip)
+        canvas.blit(self.grid.figure.bbox)
+
+    def _on_press(
+        self: "MarqueePicker", event: mpl_backend_bases.MouseEvent
+    ) -> None:
+        if (
+            event.button != 1
+            or event.inaxes is not self.grid.source_axes
+            or self.grid.figure.canvas.widgetlock.locked()
+        ):
+            return
+        hits = self.query(event.x, event.y)
+        if not hits:
+            return
+
+        self.picked = hits[0]
+        if self.on_pick is not None:
+            outset = self.picked[0]
+            outset_ax = (
+                None if outset is None else self.grid.axes_dict.get(outset)
+            )
+            self.on_pick(self.picked, outset_ax)
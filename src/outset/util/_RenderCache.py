@@ -0,0 +1,260 @@
+import dataclasses
+import os
+import tempfile
+import threading
+import typing
+
+import matplotlib as mpl
+import seaborn as sns
+
+from .._auxlib.fingerprint_ import fingerprint
+from ._RenderSpec import RenderSpec
+
+# rc settings not affecting rendered output, e.g., interactive-only or paths
+_RC_IGNORED = (
+    "backend",
+    "backend_fallback",
+    "interactive",
+    "keymap.",
+    "savefig.directory",
+    "webagg.",
+)
+
+
+class RenderCache:
+    """Content-addressed, size-bounded on-disk cache of rendered OutsetGrid
+    figures.
+
+    Cache keys hash everything that determines a `RenderSpec`'s rendered
+    output: data contents, frames, plotting calls and their arguments,
+    `grid_kws` (e.g., figure size), `marqueeplot_kws`, `savefig_kws` (e.g.,
+    DPI), image format, rc settings (e.g., theme, style, and fonts), and
+    outset, matplotlib, and seaborn versions. A cache hit returns saved image
+    bytes without building the grid.
+
+    Attributes
+    ----------
+    directory : str
+        Directory holding cached images.
+    max_bytes : Optional[int]
+        Bound on total size of cached images, in bytes.
+
+        Least-recently-used images are evicted beyond this bound. If None,
+        the cache is unbounded.
+    hits : int
+        Number of lookups served from cache by this instance.
+    misses : int
+        Number of lookups not found in cache by this instance.
+
+    Notes
+    -----
+    Safe for concurrent use by several threads or processes sharing a cache
+    directory. Entries are written atomically, so readers never observe
+    partial images.
+
+    Plotting calls are keyed by plotter name, not implementation. Clear the
+    cache after changing a custom plotter.
+
+    See Also
+    --------
+    outset.render_many
+        Accepts a `cache` kwarg to skip rendering cached figures.
+    outset.aio.render
+        Accepts a `cache` kwarg to skip rendering cached figures.
+    """
+
+    directory: str
+    max_bytes: typing.Optional[int]
+    hits: int
+    misses: int
+
+    _lock: threading.Lock
+
+    def __init__(
+        self: "RenderCache",
+        directory: str,
+        max_bytes: typing.Optional[int] = 1 << 30,
+    ) -> None:
+        """Initialize cache, creating `directory` if needed.
+
+        Parameters
+        ----------
+        directory : str
+            Directory to hold cached images; may be shared between
+            processes.
+        max_bytes : Optional[int], default 1 GiB
+            Bound on total size of cached images, in bytes. If None, the
+            cache is unbounded.
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must be nonnegative, not {max_bytes}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self: "RenderCache") -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self: "RenderCache", state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_format(spec: RenderSpec, fmt: typing.Optional[str] = None) -> str:
+        """Resolve image format for `spec`, as `savefig` would."""
+        if fmt is None:
+            fmt = spec.savefig_kws.get("format")
+        if fmt is None and spec.output is not None:
+            __, ext = os.path.splitext(spec.output)
+            fmt = ext[1:] or None
+        if fmt is None:
+            fmt = "png"
+        return fmt.lower()
+
+    def key(
+        self: "RenderCache",
+        spec: RenderSpec,
+        fmt: typing.Optional[str] = None,
+    ) -> str:
+        """Compute cache key for rendering `spec` in format `fmt`.
+
+        The spec's `output` path does not affect the key.
+        """
+        from .. import __version__  # avoid circular import
+
+        return fingerprint(
+            {
+                field.name: getattr(spec, field.name)
+                for field in dataclasses.fields(spec)
+                if field.name != "output"
+            },
+            self.get_format(spec, fmt),
+            {
+                param: value
+                for param, value in mpl.rcParams.items()
+                if not param.startswith(_RC_IGNORED)
+            },
+            (__version__, mpl.__version__, sns.__version__),
+        )
+
+    def _path(self: "RenderCache", key: str) -> str:
+        return os.path.join(self.directory, f"{key}.img")
+
+    def get(self: "RenderCache", key: str) -> typing.Optional[bytes]:
+        """Look up cached image bytes, or None if not cached."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                content = file.read()
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:  # evicted concurrently
+            pass
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def put(self: "RenderCache", key: str, content: bytes) -> None:
+        """Store image bytes, then evict least-recently-used entries beyond
+        `max_bytes`."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, self._path(key))  # atomic
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self.evict()
+
+    def evict(self: "RenderCache") -> int:
+        """Remove least-recently-used entries beyond `max_bytes`.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        if self.max_bytes is None:
+            return 0
+
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".img"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:  # evicted concurrently
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for __, size, __ in entries)
+        num_evicted = 0
+        for __, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                num_evicted += 1
+            except FileNotFoundError:  # evicted concurrently
+                pass
+            total -= size
+        return num_evicted
+
+    def clear(self: "RenderCache") -> None:
+        """Remove all cached entries."""
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".img"):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+    def render(
+        self: "RenderCache",
+        spec: RenderSpec,
+        fmt: typing.Optional[str] = None,
+    ) -> typing.Union[bytes, str]:
+        """Render `spec` synchronously, reusing cached image if available.
+
+        Parameters
+        ----------
+        spec : outset.util.RenderSpec
+            Figure to render.
+        fmt : Optional[str], default None
+            Image format (e.g., "png", "svg", "pdf").
+
+            If None, inferred from `spec.output` or `spec.savefig_kws`,
+            falling back to "png".
+
+        Returns
+        -------
+        Union[bytes, str]
+            Rendered image bytes if `spec.output` is None, otherwise the path
+            written to.
+        """
+        from ..aio._render_spec import render_spec  # avoid circular import
+
+        fmt = self.get_format(spec, fmt)
+        key = self.key(spec, fmt)
+        content = self.get(key)
+        if content is None:
+            content = render_spec(dataclasses.replace(spec, output=None), fmt)
+            self.put(key, content)
+
+        if spec.output is None:
+            return content
+        with open(spec.output, "wb") as file:
+            file.write(content)
+        return spec.output
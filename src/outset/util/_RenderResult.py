@@ -0,0 +1,21 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderResult:
+    """Outcome of rendering one `RenderSpec` with `outset.render_many`.
+
+    Attributes
+    ----------
+    output : str
+        Path the rendered figure was saved to.
+    elapsed : float
+        Wall time spent building, plotting, and saving the figure, in
+        seconds.
+    pid : int
+        Process id of the worker that rendered the figure.
+    """
+
+    output: str
+    elapsed: float
+    pid: int
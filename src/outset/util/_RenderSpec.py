@@ -0,0 +1,59 @@
+import dataclasses
+import typing
+
+import frozendict
+import pandas as pd
+
+from ._NamedFrames import NamedFrames
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderSpec:
+    """Picklable recipe for building, plotting, and saving one OutsetGrid
+    figure.
+
+    Used to dispatch figures to workers with `outset.render_many` or
+    `outset.aio.render`.
+    Plotters in `calls` must be picklable by reference (i.e., module-level
+    functions like `seaborn.scatterplot` or `matplotlib.pyplot.plot`, not
+    lambdas or closures).
+
+    Attributes
+    ----------
+    data : pd.DataFrame or Sequence of Tuple[float, float, float, float] or
+    outset.util.NamedFrames or int
+        Data or outset frames, as for `OutsetGrid`.
+    output : Optional[str]
+        Path to save the rendered figure to.
+
+        If None, `outset.aio.render` returns rendered image bytes instead.
+        Required by `outset.render_many`.
+    calls : Sequence[Tuple[str, Callable, Tuple, Dict]], default ()
+        Plotting calls to apply to the grid, in order, as `(method, plotter,
+        args, kwargs)`; e.g., `("map_dataframe", sns.scatterplot, (), {"x":
+        "x", "y": "y"})` or `("broadcast", plt.plot, ([0, 1], [0, 1]), {})`.
+    grid_kws : Dict, default frozendict()
+        Keyword arguments forwarded to `OutsetGrid`.
+    marqueeplot : bool, default True
+        Should `OutsetGrid.marqueeplot` be called after plotting calls?
+    marqueeplot_kws : Dict, default frozendict()
+        Keyword arguments forwarded to `OutsetGrid` to adjust marquee
+        placement and styling.
+    savefig_kws : Dict, default frozendict()
+        Keyword arguments forwarded to `OutsetGrid.savefig`.
+    """
+
+    data: typing.Union[
+        pd.DataFrame,
+        typing.Sequence[typing.Tuple[float, float, float, float]],
+        NamedFrames,
+        int,
+    ]
+    output: typing.Optional[str]
+    calls: typing.Sequence[
+        typing.Tuple[str, typing.Callable, typing.Tuple, typing.Dict]
+    ] = ()
+    grid_kws: typing.Dict = frozendict.frozendict()
+    marqueeplot: bool = True
+    marqueeplot_kws: typing.Dict = frozendict.frozendict()
+    savefig_kws: typing.Dict = frozendict.frozendict()
@@ -0,0 +1,197 @@
+import typing
+
+from matplotlib import artist as mpl_artist
+from matplotlib import backend_bases as mpl_backend_bases
+from matplotlib import transforms as mpl_transforms
+import numpy as np
+
+from .._auxlib.render_lock_ import render_lock
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._OutsetGrid import OutsetGrid
+
+
+class StreamPlotter:
+    """Live-streaming plot of (x, y) samples across every axes of an
+    `OutsetGrid`, redrawn by blitting.
+
+    Samples are held in a preallocated, fixed-capacity ring buffer shared by
+    source and outset artists; pushing a batch of samples is a single array
+    write, with the oldest samples overwritten once capacity is reached.
+    Redraws restore a cached background --- everything else drawn on the
+    figure, including marquee annotations --- and draw only the streamed
+    artists over it.
+
+    Attributes
+    ----------
+    grid : outset.OutsetGrid
+        Grid streamed to.
+    capacity : int
+        Maximum number of samples held.
+    artists : List[matplotlib.artist.Artist]
+        Streamed artists, one per axes in `grid.axes.flat` order.
+
+    Notes
+    -----
+    Axes limits are fixed while streaming, as cached backgrounds hold tick
+    labels and marquee annotations. Streamed artists are animated, so they
+    are excluded from ordinary draws and saved figures until `stop` is
+    called.
+
+    Any ordinary redraw of the figure (e.g., on window resize) invalidates
+    the cached background, which is recaptured at the next `update`.
+
+    See Also
+    --------
+    outset.OutsetGrid.update_data
+        Swaps in new data for artists drawn by `map_dataframe`, without
+        blitting.
+    """
+
+    grid: "OutsetGrid"
+    capacity: int
+    artists: typing.List[mpl_artist.Artist]
+
+    _background: typing.Optional[typing.Any]
+    _buffer: np.ndarray
+    _cid: typing.Optional[int]
+    _head: int
+    _kind: str
+    _size: int
+
+    def __init__(
+        self: "StreamPlotter",
+        grid: "OutsetGrid",
+        capacity: int,
+        *,
+        kind: str = "line",
+        **kwargs,
+    ) -> None:
+        """Add empty streamed artists to every axes of `grid`.
+
+        Parameters
+        ----------
+        grid : outset.OutsetGrid
+            Grid to stream to, with plotting and marquee annotation
+            complete.
+        capacity : int
+            Maximum number of samples held.
+        kind : {"line", "scatter"}, default "line"
+            Whether to stream samples as a connected line or as scatter
+            points.
+        **kwargs : dict
+            Keyword arguments forwarded to `matplotlib.axes.Axes.plot` or
+            `matplotlib.axes.Axes.scatter`, respectively.
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, not {capacity}")
+        if kind not in ("line", "scatter"):
+            raise ValueError(f"kind must be 'line' or 'scatter', not {kind}")
+
+        grid.finalize()  # draw on final layout
+
+        self.grid = grid
+        self.capacity = capacity
+        self.artists = []
+        self._background = None
+        self._buffer = np.full((capacity, 2), np.nan)
+        self._head = self._size = 0
+        self._kind = kind
+
+        empty = np.empty(0)
+        for ax in grid.axes.flat:
+            xlim, ylim = ax.get_xlim(), ax.get_ylim()
+            if kind == "line":
+                (artist,) = ax.plot(empty, empty, animated=True, **kwargs)
+            else:
+                artist = ax.scatter(empty, empty, animated=True, **kwargs)
+            ax.set_xlim(xlim)  # also disables autoscaling
+            ax.set_ylim(ylim)
+            self.artists.append(artist)
+
+        self._cid = grid.figure.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def __len__(self: "StreamPlotter") -> int:
+        """Number of samples held."""
+        return self._size
+
+    @property
+    def data(self: "StreamPlotter") -> np.ndarray:
+        """Samples held, oldest first, as an array of shape `(len(self),
+        2)`."""
+        head, size = self._head, self._size
+        if size < self.capacity:
+            return self._buffer[:size]
+        return np.concatenate((self._buffer[head:], self._buffer[:head]))
+
+    def push(
+        self: "StreamPlotter",
+        x: typing.Union[float, typing.Sequence[float], np.ndarray],
+        y: typing.Union[float, typing.Sequence[float], np.ndarray],
+    ) -> None:
+        """Append samples to the ring buffer, overwriting the oldest samples
+        beyond capacity.
+
+        Call `update` to redraw.
+
+        Parameters
+        ----------
+        x, y : float or array-like
+            Sample coordinates, of equal length.
+        """
+        x, y = np.ravel(x), np.ravel(y)
+        if len(x) != len(y):
+            raise ValueError(
+                f"x and y must have equal length, not {len(x)} and {len(y)}",
+            )
+        capacity = self.capacity
+        samples = np.column_stack((x, y))[-capacity:]
+        num_samples = len(samples)
+        positions = (self._head + np.arange(num_samples)) % self.capacity
+        self._buffer[positions] = samples
+        self._head = (self._head + num_samples) % self.capacity
+        self._size = min(self._size + num_samples, self.capacity)
+
+    def update(self: "StreamPlotter") -> None:
+        """Redraw streamed artists, blitting over the cached background."""
+        if self._cid is None:
+            raise ValueError("cannot update stopped StreamPlotter")
+
+        data = self.data
+        for artist in self.artists:
+            if self._kind == "line":
+                artist.set_data(data[:, 0], data[:, 1])
+            else:
+                artist.set_offsets(data)
+
+        canvas = self.grid.figure.canvas
+        with render_lock:
+            if self._background is None:
+                canvas.draw()  # draws everything but animated artists
+                self._background = canvas.copy_from_bbox(self.grid.figure.bbox)
+            else:
+                canvas.restore_region(self._background)
+            for artist in self.artists:
+                artist.axes.draw_artist(artist)
+            canvas.blit(
+                mpl_transforms.Bbox.union(
+                    [ax.bbox for ax in self.grid.axes.flat],
+                ),
+            )
+        canvas.flush_events()
+
+    def stop(self: "StreamPlotter") -> None:
+        """Stop streaming, leaving streamed artists in place as ordinary,
+        non-animated artists."""
+        if self._cid is not None:
+            self.grid.figure.canvas.mpl_disconnect(self._cid)
+        self._cid = None
+        self._background = None
+        for artist in self.artists:
+            artist.set_animated(False)
+
+    def _on_draw(
+        self: "StreamPlotter", event: mpl_backend_bases.DrawEvent
+    ) -> None:
+        """Invalidate cached background after ordinary redraws."""
+        self._background = None
@@ -0,0 +1,100 @@
+import io
+import typing
+
+from matplotlib import animation as mpl_animation
+from PIL import GifImagePlugin, Image
+
+
+class StreamingGifWriter(mpl_animation.AbstractMovieWriter):
+    """Animated GIF writer that encodes and writes out each frame as it is
+    grabbed.
+
+    Memory use is constant in animation length. By contrast, matplotlib's
+    `PillowWriter` holds every frame in memory until the animation is
+    finished.
+
+    Each frame is quantized to its own 256-color palette.
+
+    See Also
+    --------
+    outset.animate_outsets
+        Writes GIFs with this writer by default.
+    """
+
+    loop: int
+
+    _file: typing.Optional[typing.BinaryIO]
+    _num_frames: int
+
+    def __init__(
+        self: "StreamingGifWriter",
+        fps: float = 5,
+        metadata: typing.Optional[typing.Dict[str, str]] = None,
+        loop: int = 0,
+    ) -> None:
+        """Initialize writer.
+
+        Parameters
+        ----------
+        fps : float, default 5
+            Frames per second.
+        metadata : Optional[Dict[str, str]], default None
+            Ignored; accepted for compatibility with matplotlib writers.
+        loop : int, default 0
+            Number of times to repeat the animation; 0 repeats forever.
+        """
+        super().__init__(fps=fps, metadata=metadata)
+        self.loop = loop
+        self._file = None
+        self._num_frames = 0
+
+    def setup(
+        self: "StreamingGifWriter",
+        fig: typing.Any,
+        outfile: str,
+        dpi: typing.Optional[float] = None,
+    ) -> None:
+        super().setup(fig, outfile, dpi=dpi)
+        self._file = open(outfile, "wb")
+        self._num_frames = 0
+
+    def grab_frame(self: "StreamingGifWriter", **savefig_kwargs) -> None:
+        for kwarg in "dpi", "bbox_inches", "format":
+            if kwarg in savefig_kwargs:
+                raise TypeError(
+                    f"grab_frame got an unexpected keyword argument {kwarg}",
+                )
+        buf = io.BytesIO()
+        self.fig.savefig(
+            buf, **{**savefig_kwargs, "format": "rgba", "dpi": self.dpi}
+        )
+        frame = (
+            Image.frombuffer(
+                "RGBA", self.frame_size, buf.getbuffer(), "raw", "RGBA", 0, 1
+            )
+            .convert("RGB")
+            .quantize()
+        )
+
+        if not self._num_frames:
+            header, __ = GifImagePlugin.getheader(
+                frame, info={"loop": self.loop}
+            )
+            self._file.writelines(header)
+        self._file.writelines(
+            GifImagePlugin.getdata(
+                frame,
+                include_color_table=True,
+                duration=int(1000 / self.fps),
+            ),
+        )
+        self._num_frames += 1
+
+    def finish(self: "StreamingGifWriter") -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.write(b";")  # GIF trailer
+        finally:
+            self._file.close()
+            self._file = None
@@ -1,15 +1,76 @@
 """Utility functions."""
 
-from .._auxlib.calc_aspect_ import calc_aspect
-from .._auxlib.set_aspect_ import set_aspect
-from ._layout_corner_insets import layout_corner_insets
-from ._NamedFrames import NamedFrames
-from ._SplitKwarg import SplitKwarg
+import typing
+
+from .._auxlib.lazy_attach_ import lazy_attach
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .._auxlib.calc_aspect_ import calc_aspect
+    from .._auxlib.set_aspect_ import set_aspect
+    from ._calc_marquee_geometry import calc_marquee_geometry
+    from ._DrawCost import DrawCost
+    from ._ExtentStore import ExtentStore
+    from ._GridPool import GridPool
+    from ._InsetLayout import InsetLayout
+    from ._layout_corner_insets import layout_corner_insets
+    from ._LinkedBrush import LinkedBrush
+    from ._MagnifierLens import MagnifierLens
+    from ._MarqueeEditor import MarqueeEditor
+    from ._MarqueeGeometry import MarqueeGeometry
+    from ._MarqueePicker import MarqueePicker
+    from ._NamedFrames import NamedFrames
+    from ._RenderCache import RenderCache
+    from ._RenderResult import RenderResult
+    from ._RenderSpec import RenderSpec
+    from ._SplitKwarg import SplitKwarg
+    from ._StreamingGifWriter import StreamingGifWriter
+    from ._StreamPlotter import StreamPlotter
+
+__getattr__, __dir__ = lazy_attach(
+    __name__,
+    submodule_attrs={
+        ".._auxlib.calc_aspect_": ["calc_aspect"],
+        ".._auxlib.set_aspect_": ["set_aspect"],
+        "._calc_marquee_geometry": ["calc_marquee_geometry"],
+        "._DrawCost": ["DrawCost"],
+        "._ExtentStore": ["ExtentStore"],
+        "._GridPool": ["GridPool"],
+        "._InsetLayout": ["InsetLayout"],
+        "._layout_corner_insets": ["layout_corner_insets"],
+        "._LinkedBrush": ["LinkedBrush"],
+        "._MagnifierLens": ["MagnifierLens"],
+        "._MarqueeEditor": ["MarqueeEditor"],
+        "._MarqueeGeometry": ["MarqueeGeometry"],
+        "._MarqueePicker": ["MarqueePicker"],
+        "._NamedFrames": ["NamedFrames"],
+        "._RenderCache": ["RenderCache"],
+        "._RenderResult": ["RenderResult"],
+        "._RenderSpec": ["RenderSpec"],
+        "._SplitKwarg": ["SplitKwarg"],
+        "._StreamingGifWriter": ["StreamingGifWriter"],
+        "._StreamPlotter": ["StreamPlotter"],
+    },
+)
 
 __all__ = [
     "calc_aspect",
+    "calc_marquee_geometry",
+    "DrawCost",
+    "ExtentStore",
+    "GridPool",
+    "InsetLayout",
     "layout_corner_insets",
+    "LinkedBrush",
+    "MagnifierLens",
+    "MarqueeEditor",
+    "MarqueeGeometry",
+    "MarqueePicker",
     "NamedFrames",
+    "RenderCache",
+    "RenderResult",
+    "RenderSpec",
     "set_aspect",
     "SplitKwarg",
+    "StreamingGifWriter",
+    "StreamPlotter",
 ]
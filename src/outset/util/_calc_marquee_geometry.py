@@ -0,0 +1,136 @@
+import dataclasses
+import typing
+
+from matplotlib import axes as mpl_axes
+from matplotlib import rcParams
+import pandas as pd
+
+from .._auxlib.identity_ import identity
+from .._auxlib.marquee_geometry_ import AxesState, layout_marqueeplot
+from ._MarqueeGeometry import MarqueeGeometry
+
+
+def _make_default_state() -> AxesState:
+    """Describe axes as created by `plt.subplots()`, with limits unset."""
+    fig_width, fig_height = rcParams["figure.figsize"]
+    left, right, bottom, top = (
+        rcParams[f"figure.subplot.{side}"]
+        for side in ("left", "right", "bottom", "top")
+    )
+    return AxesState(
+        xlim=(0.0, 1.0),
+        ylim=(0.0, 1.0),
+        axes_size=(fig_width * (right - left), fig_height * (top - bottom)),
+        figure_size=(fig_width, fig_height),
+    )
+
+
+def calc_marquee_geometry(
+    data: typing.Union[pd.DataFrame, typing.Mapping[str, typing.Any]],
+    *,
+    x: str,
+    y: str,
+    hue: typing.Optional[str] = None,
+    hue_order: typing.Optional[typing.Sequence[str]] = None,
+    outset: typing.Optional[str] = None,
+    outset_order: typing.Optional[typing.Sequence[str]] = None,
+    ax: typing.Optional[mpl_axes.Axes] = None,
+    xlim: typing.Optional[typing.Tuple[float, float]] = None,
+    ylim: typing.Optional[typing.Tuple[float, float]] = None,
+    axes_size: typing.Optional[typing.Tuple[float, float]] = None,
+    figure_size: typing.Optional[typing.Tuple[float, float]] = None,
+    frame_inner_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
+    frame_outer_pad: typing.Union[float, typing.Tuple[float, float]] = 0.1,
+    frame_outer_pad_unit: typing.Literal["axes", "figure", "inches"] = "axes",
+    leader_stretch: float = 0.2,
+    leader_stretch_unit: typing.Literal[
+        "axes", "figure", "inches", "inchesfrom"
+    ] = "inches",
+    leader_tweak: typing.Union[typing.Callable, typing.Type] = identity,
+    mark_retract: float = 0.1,
+    preserve_aspect: typing.Optional[bool] = False,
+    tight_axlim: bool = False,
+) -> MarqueeGeometry:
+    """Compute marquee geometry as `marqueeplot` would draw it, without
+    creating artists or rendering.
+
+    Intended for layout search, caching, and export to other renderers.
+    Computation is plain numpy arithmetic over per-marquee data extents, so
+    repeated calls are cheap.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Mapping[str, array-like]
+        Data to be marquee-annotated.
+    x, y, hue, hue_order, outset, outset_order
+        Data semantics, as for `marqueeplot`.
+    ax : matplotlib.axes.Axes, optional
+        Axes to take limits and size from. Not modified.
+
+        If None, describes unset axes as created by `plt.subplots()`.
+    xlim, ylim : Tuple[float, float], optional
+        Initial axes limits, overriding those of `ax`.
+    axes_size : Tuple[float, float], optional
+        Rendered axes width and height, in inches, overriding that of `ax`.
+    figure_size : Tuple[float, float], optional
+        Figure width and height, in inches, overriding that of `ax`.
+    frame_inner_pad, frame_outer_pad, frame_outer_pad_unit
+        Marquee padding, as for `marqueeplot`.
+    leader_stretch, leader_stretch_unit, leader_tweak, mark_retract
+        Callout leader and glyph placement, as for `draw_marquee`.
+
+        Leader tweaks are called with `ax`, which may be None.
+    preserve_aspect : bool, optional, default False
+        As for `marqueeplot`.
+    tight_axlim : bool, default False
+        As for `marqueeplot`.
+
+    Returns
+    -------
+    MarqueeGeometry
+        Frame bounds, leader vertices, glyph positions, and final axes
+        limits.
+
+    See Also
+    --------
+    outset.marqueeplot
+        Draws marquees with this geometry.
+    outset.OutsetGrid.calc_marquee_geometry
+        Computes geometry for each axes of a grid.
+    """
+    state = _make_default_state() if ax is None else AxesState.from_axes(ax)
+    state = dataclasses.replace(
+        state,
+        **{
+            field: value
+            for field, value in (
+                ("xlim", xlim),
+                ("ylim", ylim),
+                ("axes_size", axes_size),
+                ("figure_size", figure_size),
+            )
+            if value is not None
+        },
+    )
+    state.xlim, state.ylim = tuple(state.xlim), tuple(state.ylim)
+    layouts = layout_marqueeplot(
+        state,
+        data,
+        x=x,
+        y=y,
+        hue=hue,
+        hue_order=hue_order,
+        outset=outset,
+        outset_order=outset_order,
+        ax=ax,
+        frame_inner_pad=frame_inner_pad,
+        frame_outer_pad=frame_outer_pad,
+        frame_outer_pad_unit=frame_outer_pad_unit,
+        leader_stretch=leader_stretch,
+        leader_stretch_unit=leader_stretch_unit,
+        leader_tweak=leader_tweak,
+        mark_retract=mark_retract,
+        preserve_aspect=preserve_aspect,
+        tight_axlim=tight_axlim,
+    )
+    return MarqueeGeometry._from_layouts(layouts, state.xlim, state.ylim)
@@ -1,11 +1,20 @@
+from concurrent import futures
+import io
+import pickle
+import typing
+
 import matplotlib.cbook as mpl_cbook
+from matplotlib import collections as mpl_collections
+from matplotlib import patches as mpl_patches
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pytest
 import seaborn as sns
 
 from outset import inset_outsets, OutsetGrid
 from outset import util as otst_util
+from outset._auxlib.marquee_artists_ import get_marquees
 
 # Sample data for testing
 data = pd.DataFrame(
@@ -224,3 +233,468 @@ def test_OutsetGrid_n():
     outpath = "/tmp/test_OutsetGrid_n.png"
     plt.savefig(outpath)
     print(f"saved graphic to {outpath}")
+
+
+@pytest.mark.parametrize("col_wrap", [None, 3])
+def test_OutsetGrid_gridspec_engine(col_wrap: typing.Optional[int]):
+    data = pd.DataFrame(
+        {
+            "x": [0.825, 3.1, 0.5, 0.8, 2.2, 2, 1.1, 1.2],
+            "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7, 0.1, 0.4],
+            "outset": ["a", "a", "b", "b", "c", "c", "d", "d"],
+        }
+    )
+    kws = dict(data=data, x="x", y="y", col="outset", col_wrap=col_wrap)
+    reference = OutsetGrid(**kws)
+    g = OutsetGrid(**kws, grid_engine="gridspec")
+
+    assert g.axes.shape == reference.axes.shape
+    assert g.source_axes is g.axes.flat[0]
+    assert len(g.outset_axes) == 4
+    assert not any(ax.get_title() for ax in g.axes.flat)
+    reference_facets = [item for item in reference.facet_data() if len(item[1])]
+    facets = [*g.facet_data()]
+    assert len(reference_facets) == len(facets)
+    for (ij1, d1), (ij2, d2) in zip(reference_facets, facets):
+        assert ij1 == ij2
+        assert d1.index.equals(d2.index)
+
+    g.map_dataframe(sns.scatterplot, x="x", y="y", hue="outset", legend=False)
+    g.marqueeplot()
+    g.add_legend()
+
+    for ax, ref_ax in zip(g.outset_axes, reference.outset_axes):
+        assert ax.get_xlabel() == ref_ax.get_xlabel()
+
+    outpath = f"/tmp/test_OutsetGrid_gridspec_engine_{col_wrap}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_OutsetGrid_gridspec_engine_frames():
+    g = OutsetGrid(
+        [(0.1, 0.1, 0.2, 0.2)] * 7, col_wrap=4, grid_engine="gridspec"
+    )
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+    assert g._layout_stale
+
+    outpath = "/tmp/test_OutsetGrid_gridspec_engine_frames.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+    assert not g._layout_stale
+
+
+def test_OutsetGrid_gridspec_engine_invalid():
+    with pytest.raises(ValueError):
+        OutsetGrid(3, grid_engine="bogus")
+    with pytest.raises(ValueError):
+        OutsetGrid(3, grid_engine="gridspec", sharex=True)
+
+
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_OutsetGrid_pickle(grid_engine: str):
+    data = pd.DataFrame(
+        {
+            "x": [0.825, 3.1, 0.5, 0.8, 2.2, 2],
+            "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7],
+            "outset": ["a", "a", "b", "b", "c", "c"],
+        }
+    )
+    g = OutsetGrid(
+        data=data, x="x", y="y", col="outset", grid_engine=grid_engine
+    )
+    g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+
+    g = pickle.loads(pickle.dumps(g))
+    assert g.source_axes is g.axes.flat[0]
+    assert all(ax.figure is g.figure for ax in g.outset_axes)
+    g.marqueeplot()
+
+    g = pickle.loads(pickle.dumps(g))
+    with pytest.warns(UserWarning, match="Redundant"):
+        g.marqueeplot()
+
+    outpath = f"/tmp/test_OutsetGrid_pickle_{grid_engine}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_OutsetGrid_pickle_frames():
+    g = OutsetGrid(
+        otst_util.NamedFrames(a=(0.1, 0.1, 0.3, 0.3), b=(0.5, 0.5, 0.9, 0.9)),
+        include_sourceplot=False,
+    )
+    g = pickle.loads(pickle.dumps(g))
+    assert g.source_axes is None
+    assert len(g.outset_axes) == 2
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+
+    outpath = "/tmp/test_OutsetGrid_pickle_frames.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_OutsetGrid_pyplot_free():
+    data = pd.DataFrame(
+        {
+            "x": [0.825, 3.1, 0.5, 0.8, 2.2, 2],
+            "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7],
+            "outset": ["a", "a", "b", "b", "c", "c"],
+        }
+    )
+
+    def build(i: int) -> OutsetGrid:
+        g = OutsetGrid(
+            data=data,
+            x="x",
+            y="y",
+            col="outset",
+            hue="outset",
+            grid_engine="gridspec",
+            pyplot=False,
+        )
+        g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+        g.broadcast(lambda *, ax: ax.axhline(2, color="gray"))
+        g.marqueeplot()
+        g.add_legend()
+        g.savefig(f"/tmp/test_OutsetGrid_pyplot_free_{i}.png")
+        return g
+
+    plt.close("all")
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        grids = [*executor.map(build, range(8))]
+
+    assert not plt.get_fignums()
+    for i, g in enumerate(grids):
+        assert len(g.figure.axes) == 4
+        print(f"saved graphic to /tmp/test_OutsetGrid_pyplot_free_{i}.png")
+
+
+def test_OutsetGrid_pyplot_free_invalid():
+    with pytest.raises(ValueError):
+        OutsetGrid(3, pyplot=False)
+
+    g = OutsetGrid(3, grid_engine="gridspec", pyplot=False)
+    with pytest.raises((TypeError, AttributeError)):
+        g.broadcast(lambda: None)
+    assert not plt.get_fignums()
+
+
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_OutsetGrid_lazy(grid_engine: str):
+    rng = np.random.default_rng(1)
+    scatter = pd.DataFrame(
+        {"x": rng.uniform(0, 4, 500), "y": rng.uniform(0, 4, 500)},
+    )
+    g = OutsetGrid(
+        data=data,
+        x="x",
+        y="y",
+        col="outset",
+        grid_engine=grid_engine,
+        lazy=True,
+    )
+    g.broadcast(plt.scatter, scatter["x"], scatter["y"], s=4)
+    g.broadcast(plt.scatter, scatter["x"], scatter["y"], s=4)
+    g.map_dataframe(sns.lineplot, x="x", y="y")
+    g.marqueeplot()
+    assert not any(ax.collections for ax in g.axes.flat)  # nothing drawn
+
+    plan = g.explain()
+    assert plan.count("[skip: repeats previous step]") == 2
+    assert "marqueeplot_outset" in plan
+
+    outpath = f"/tmp/test_OutsetGrid_lazy_{grid_engine}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+    assert g.explain().startswith("OutsetGrid plan: 0 of 0")
+    scatters = [
+        [
+            c
+            for c in ax.collections
+            if isinstance(c, mpl_collections.PathCollection)
+        ]
+        for ax in g.axes.flat
+    ]
+    assert all(len(ax_scatters) == 1 for ax_scatters in scatters)
+    source_scatter, *outset_scatters = (s for s, in scatters)
+    assert len(source_scatter.get_offsets()) == len(scatter)
+    # outset panels are zoomed in, so most scatter points are culled
+    for outset_scatter in outset_scatters:
+        assert len(outset_scatter.get_offsets()) < len(scatter)
+
+
+def test_OutsetGrid_lazy_execute():
+    g = OutsetGrid(3, lazy=True)
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+    with pytest.warns(UserWarning, match="Redundant"):
+        g.marqueeplot(preserve_aspect=True, equalize_aspect=False)
+        g.execute(cull=False)
+    assert all(len(ax.lines[0].get_xdata()) == 2 for ax in g.axes.flat)
+
+    num_lines = len(g.source_axes.lines)
+    g.execute()  # no-op once plan is executed
+    g.broadcast_source(plt.plot, [0, 1], [1, 0])
+    assert len(g.source_axes.lines) == num_lines
+    g.execute()
+    assert len(g.source_axes.lines) == num_lines + 1
+
+
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_OutsetGrid_finalize(grid_engine: str):
+    g = OutsetGrid(3, grid_engine=grid_engine, lazy=True)
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+    assert not g.source_axes.lines
+    position = g.source_axes.get_position().bounds
+
+    assert g.finalize() is g
+    assert g.source_axes.lines
+    assert g.explain().startswith("OutsetGrid plan: 0 of 0")
+    assert g.source_axes.get_position().bounds != position  # laid out
+    position = g.source_axes.get_position().bounds
+    g.finalize()  # no-op once up to date
+    assert g.source_axes.get_position().bounds == position
+
+
+class _Layer:
+    def __init__(self: "_Layer", color: str) -> None:
+        self.color = color
+
+    def draw(self: "_Layer", *args, **kwargs) -> None:
+        plt.plot(*args, color=self.color, **kwargs)
+
+
+def test_OutsetGrid_lazy_bound_methods():
+    g = OutsetGrid(3, lazy=True)
+    g.broadcast(_Layer("red").draw, [0, 1], [0, 1])
+    g.broadcast(_Layer("blue").draw, [0, 1], [0, 1])
+    g.broadcast(_Layer("blue").draw, [0, 1], [0, 1])
+    assert "[skip" not in g.explain()  # instances may carry call state
+
+    g.execute(cull=False)
+    for ax in g.axes.flat:
+        assert [line.get_color() for line in ax.lines] == [
+            "red",
+            "blue",
+            "blue",
+        ]
+
+
+def test_OutsetGrid_lazy_interleaved():
+    grids = [OutsetGrid([(0, 0, 1, 1)], lazy=lazy) for lazy in (False, True)]
+    with pytest.warns(UserWarning, match="Redundant"):
+        for g in grids:
+            for color in ("red", "blue", "red"):
+                g.broadcast(plt.plot, [0, 1], [0, 1], color=color)
+            g.marqueeplot()
+            g.marqueeplot()
+        assert "[skip" not in grids[1].explain()  # red drawn on top of blue
+        eager, lazy = (g.finalize() for g in grids)
+
+    for eager_ax, lazy_ax in zip(eager.axes.flat, lazy.axes.flat):
+        colors = [
+            [line.get_color() for line in ax.lines]
+            for ax in (eager_ax, lazy_ax)
+        ]
+        assert colors[0] == colors[1]
+        assert colors[0][:3] == ["red", "blue", "red"]
+        assert np.allclose(eager_ax.get_xlim(), lazy_ax.get_xlim())
+        assert np.allclose(eager_ax.get_ylim(), lazy_ax.get_ylim())
+    plt.close("all")
+
+
+def test_OutsetGrid_lazy_invalid():
+    with pytest.raises(ValueError):
+        OutsetGrid(3).explain()
+
+
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_OutsetGrid_update_data(grid_engine: str):
+    def make_data(shift: float) -> pd.DataFrame:
+        rng = np.random.default_rng(1)
+        return pd.DataFrame(
+            {
+                "x": rng.normal(size=60) + shift,
+                "y": rng.normal(size=60) + shift,
+                "outset": rng.choice(["a", "b"], 60),
+            },
+        )
+
+    def make_grid(data: pd.DataFrame) -> OutsetGrid:
+        g = OutsetGrid(
+            data,
+            x="x",
+            y="y",
+            col="outset",
+            hue="outset",
+            grid_engine=grid_engine,
+        )
+        g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+        g.marqueeplot()
+        return g
+
+    g = make_grid(make_data(0))
+    artists = [[*ax.get_children()] for ax in g.axes.flat]
+    assert g.update_data(make_data(3)) is g
+    assert artists == [[*ax.get_children()] for ax in g.axes.flat]
+
+    expected = make_grid(make_data(3))
+    for get_lim in "get_xlim", "get_ylim":
+        assert np.allclose(
+            getattr(g.source_axes, get_lim)(),
+            getattr(expected.source_axes, get_lim)(),
+        )
+    for ax, expected_ax in zip(g.axes.flat, expected.axes.flat):
+        for patch, expected_patch in zip(ax.patches, expected_ax.patches):
+            if isinstance(patch, mpl_patches.Rectangle):  # marquee frame
+                assert np.allclose(
+                    patch.get_bbox().get_points(),
+                    expected_patch.get_bbox().get_points(),
+                )
+        (x0, y0), (x1, y1) = ax.patches[0].get_bbox().get_points()
+        assert ax.get_xlim()[0] <= x0 and x1 <= ax.get_xlim()[1]
+        assert ax.get_ylim()[0] <= y0 and y1 <= ax.get_ylim()[1]
+
+    outpath = f"/tmp/test_OutsetGrid_update_data_{grid_engine}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_OutsetGrid_update_frames():
+    g = OutsetGrid([(0.1, 0.1, 0.2, 0.2), (0.5, 0.5, 0.8, 0.9)])
+    g.marqueeplot()
+    g.update_frames([(0.2, 0.1, 0.3, 0.2), (0.4, 0.5, 0.7, 0.9)])
+
+    expected = OutsetGrid([(0.2, 0.1, 0.3, 0.2), (0.4, 0.5, 0.7, 0.9)])
+    expected.marqueeplot()
+    for ax, expected_ax in zip(g.axes.flat, expected.axes.flat):
+        assert np.allclose(ax.get_xlim(), expected_ax.get_xlim())
+        assert np.allclose(ax.get_ylim(), expected_ax.get_ylim())
+
+    outpath = "/tmp/test_OutsetGrid_update_frames.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_OutsetGrid_update_data_invalid():
+    g = OutsetGrid(data, x="x", y="y", col="outset")
+    g.map_dataframe(sns.scatterplot, x="x", y="y", size="y")
+    g.marqueeplot()
+    with pytest.raises(ValueError):
+        g.update_data(data)  # per-point sizes
+
+    g = OutsetGrid(data, x="x", y="y", col="outset")
+    g.marqueeplot()
+    with pytest.raises(ValueError):
+        g.update_data(data[data["outset"] == "A"])  # missing framed subset
+
+    g = OutsetGrid(data, x="x", y="y", col="outset", hue="outset")
+    g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+    g.marqueeplot()
+    before = [
+        (ax.get_xlim(), ax.get_ylim(), ax.collections[0].get_offsets().copy())
+        for ax in g.axes.flat
+    ]
+    with pytest.raises(ValueError):  # unknown hue value
+        g.update_data(pd.concat([data, data.assign(outset="C")]))
+    for ax, (xlim, ylim, offsets) in zip(g.axes.flat, before):
+        assert ax.get_xlim() == xlim and ax.get_ylim() == ylim
+        assert np.array_equal(ax.collections[0].get_offsets(), offsets)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_OutsetGrid_calc_draw_cost(lazy: bool):
+    g = OutsetGrid(data, x="x", y="y", col="outset", lazy=lazy)
+    g.map_dataframe(sns.scatterplot, x="x", y="y")
+    g.marqueeplot()
+    costs = g.calc_draw_cost()
+    assert len(costs) == len(g.axes.flat)
+    num_outsets = len(g.outset_axes)
+    assert costs[0].frame_artists == 2 * num_outsets
+    for cost in costs[1:]:
+        assert cost.frame_artists == 2
+        assert cost.data_artists == 1
+
+    total = sum(costs, otst_util.DrawCost())
+    g.assert_budget(max_artists=total.num_artists)
+    max_cost = max(cost.estimated_cost for cost in costs)
+    g.assert_budget(max_cost=max_cost, per_axes=True)
+    with pytest.raises(AssertionError, match="num_artists"):
+        g.assert_budget(max_artists=total.num_artists - 1)
+    with pytest.raises(AssertionError, match="axes 0 estimated_cost"):
+        g.assert_budget(max_cost=costs[0].estimated_cost / 2, per_axes=True)
+    with pytest.raises(AssertionError, match="clip_paths.*mathtext"):
+        g.assert_budget(max_clip_paths=0, max_mathtext=0)
+
+
+@pytest.mark.parametrize(
+    "kws",
+    [
+        {"col": "outset"},
+        {"col": "outset", "hue": "y"},
+        {"col": "outset", "include_sourceplot": False},
+        {"col": "outset", "marqueeplot_kws": {"frame_inner_pad": 0.3}},
+    ],
+)
+@pytest.mark.parametrize("equalize_aspect", [False, True])
+def test_OutsetGrid_calc_marquee_geometry(
+    kws: typing.Dict[str, typing.Any], equalize_aspect: bool
+):
+    g = OutsetGrid(data, x="x", y="y", **kws)
+    g.map_dataframe(sns.scatterplot, x="x", y="y")
+    lims = [(ax.get_xlim(), ax.get_ylim()) for ax in g.axes.flat]
+    geometries = g.calc_marquee_geometry(equalize_aspect=equalize_aspect)
+    assert lims == [(ax.get_xlim(), ax.get_ylim()) for ax in g.axes.flat]
+    assert len(geometries) == len(g.axes.flat)
+
+    g.marqueeplot(equalize_aspect=equalize_aspect)
+    for geometry, ax in zip(geometries, g.axes.flat):
+        marquees = get_marquees(ax)
+        assert geometry.keys == [marquee.key for marquee in marquees]
+        assert np.allclose(
+            geometry.frame_xlim, [m.frame_xlim for m in marquees]
+        )
+        assert np.allclose(
+            geometry.frame_ylim, [m.frame_ylim for m in marquees]
+        )
+        assert np.allclose(geometry.mark_xy, [m.mark_xy for m in marquees])
+        assert np.allclose(geometry.xlim, ax.get_xlim())
+        assert np.allclose(geometry.ylim, ax.get_ylim())
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_OutsetGrid_optimize_vector_export(lazy: bool):
+    xs = np.random.default_rng(1).uniform(0, 10, 4000)
+
+    def make_grid() -> OutsetGrid:
+        g = OutsetGrid([(1, 1, 2, 2), (5, 5, 6, 7), (7, 1, 8, 2)], lazy=lazy)
+        g.broadcast(plt.scatter, xs, xs[::-1])
+        g.broadcast(plt.plot, [0, 10], [0, 10])
+        g.marqueeplot()
+        return g
+
+    reference = io.BytesIO()
+    make_grid().savefig(reference, format="pdf")
+
+    g = make_grid().optimize_vector_export(rasterize_vertices=50_000)
+    num_points = [len(ax.collections[0].get_offsets()) for ax in g.axes.flat]
+    assert num_points[0] == len(xs)  # source axes shows all data
+    assert all(num < len(xs) // 4 for num in num_points[1:])
+    for ax in g.axes.flat:
+        assert ax.collections[0].get_rasterized() == (ax is g.source_axes)
+        assert not ax.lines[0].get_rasterized()
+        for marquee in get_marquees(ax):
+            for artist in (*marquee.frame_patches, *marquee.leader_patches):
+                assert not artist.get_rasterized()
+
+    buf = io.BytesIO()
+    g.savefig(buf, format="pdf")
+    assert len(buf.getvalue()) < len(reference.getvalue()) / 2
+    # one gradient image per marquee color
+    assert buf.getvalue().count(b"/Width 101 /Height 101") == 3
+    plt.close("all")
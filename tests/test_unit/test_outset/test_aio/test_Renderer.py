@@ -0,0 +1,81 @@
+import asyncio
+from concurrent import futures
+import threading
+import time
+
+import pytest
+
+from outset import aio
+from outset import util as otst_util
+
+_lock = threading.Lock()
+_running = {"now": 0, "max": 0, "calls": 0}
+
+
+def _slow_plot(*, ax, delay: float = 0.2) -> None:
+    with _lock:
+        _running["now"] += 1
+        _running["calls"] += 1
+        _running["max"] = max(_running["max"], _running["now"])
+    time.sleep(delay)
+    ax.plot([0, 1], [0, 1])
+    with _lock:
+        _running["now"] -= 1
+
+
+def _make_spec(delay: float = 0.2, output=None) -> otst_util.RenderSpec:
+    return otst_util.RenderSpec(
+        data=2,
+        output=output,
+        calls=[("broadcast", _slow_plot, (), {"delay": delay})],
+        grid_kws={"grid_engine": "gridspec", "pyplot": False},
+    )
+
+
+def test_Renderer_backpressure():
+    _running.update(now=0, max=0, calls=0)
+
+    async def main():
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            renderer = aio.Renderer(executor, max_pending=2)
+            return await asyncio.gather(
+                *(renderer.render(_make_spec()) for __ in range(5)),
+            )
+
+    results = asyncio.run(main())
+    assert all(result.startswith(b"\x89PNG") for result in results)
+    assert _running["max"] == 2
+
+
+def test_Renderer_timeout_cancel():
+    _running.update(now=0, max=0, calls=0)
+
+    async def main():
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            renderer = aio.Renderer(executor, max_pending=1)
+            blocker = asyncio.ensure_future(
+                renderer.render(_make_spec(delay=0.5)),
+            )
+            await asyncio.sleep(0.05)
+            with pytest.raises(asyncio.TimeoutError):
+                await renderer.render(_make_spec(), timeout=0.1)
+
+            waiter = asyncio.ensure_future(renderer.render(_make_spec()))
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            await blocker
+            # slot is freed once blocker completes
+            return await renderer.render(_make_spec(delay=0), fmt="svg")
+
+    result = asyncio.run(main())
+    assert b"<svg" in result
+    # timed-out and cancelled renders never ran; 3 axes plotted per render
+    assert _running["calls"] == 2 * 3
+
+
+def test_Renderer_invalid():
+    with pytest.raises(ValueError):
+        aio.Renderer(futures.ThreadPoolExecutor(), max_pending=0)
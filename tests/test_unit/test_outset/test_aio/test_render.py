@@ -0,0 +1,56 @@
+import asyncio
+import atexit
+import os
+
+import matplotlib.pyplot as plt
+import pytest
+
+from outset import aio
+from outset.aio import _render as aio_render
+from outset import util as otst_util
+
+
+def test_render():
+    outpath = "/tmp/test_aio_render.png"
+    if os.path.exists(outpath):
+        os.remove(outpath)
+
+    specs = [
+        otst_util.RenderSpec(
+            data=[(0.1, 0.1, 0.3, 0.3), (0.5, 0.5, 0.9, 0.9)],
+            output=output,
+            calls=[("broadcast", plt.plot, ([0, 1], [0, 1]), {})],
+        )
+        for output in (outpath, None)
+    ]
+
+    async def main():
+        return await asyncio.gather(
+            *(aio.render(spec, timeout=60) for spec in specs),
+        )
+
+    path, image = asyncio.run(main())
+    assert path == outpath
+    assert os.path.exists(outpath)
+    assert image.startswith(b"\x89PNG")
+    print(f"saved graphic to {outpath}")
+
+
+def test_render_spec():
+    spec = otst_util.RenderSpec(data=3, output=None)
+    assert aio.render_spec(spec, fmt="pdf").startswith(b"%PDF")
+
+
+def test_render_shutdown(monkeypatch: pytest.MonkeyPatch):
+    # default executor is shut down at exit, before interpreter teardown
+    registered = []
+    monkeypatch.setattr(
+        atexit, "register", lambda *args, **kwargs: registered.append(args)
+    )
+    monkeypatch.setattr(aio_render, "_default_executor", None)
+    spec = otst_util.RenderSpec(data=3, output=None)
+    asyncio.run(aio.render(spec, timeout=60))
+
+    executor = aio_render._default_executor
+    assert registered == [(executor.shutdown,)]
+    executor.shutdown()
@@ -0,0 +1,84 @@
+from matplotlib import animation as mpl_animation
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+import pytest
+
+from outset import OutsetGrid, animate_outsets, inset_outsets
+
+
+def _make_grid() -> OutsetGrid:
+    rng = np.random.default_rng(1)
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3), (0.6, 0.5, 0.7, 0.7)])
+    g.broadcast(plt.scatter, rng.uniform(size=500), rng.uniform(size=500))
+    g.marqueeplot()
+    return g
+
+
+@pytest.mark.parametrize("inset", [False, True])
+def test_animate_outsets_gif(inset: bool):
+    g = _make_grid()
+    if inset:
+        inset_outsets(g)
+    xlim, ylim = g.source_axes.get_xlim(), g.source_axes.get_ylim()
+
+    outpath = f"/tmp/test_animate_outsets_gif_{inset}.gif"
+    animate_outsets(g, outpath, dpi=40, hold_frames=2, transition_frames=3)
+    with Image.open(outpath) as im:
+        # leading hold, then per marquee zoom in, hold, zoom out, hold
+        assert im.n_frames == 2 + 2 * 2 * (3 + 2)
+    assert np.allclose(g.source_axes.get_xlim(), xlim)
+    assert np.allclose(g.source_axes.get_ylim(), ylim)
+    print(f"saved graphic to {outpath}")
+    plt.close(g.figure)
+
+
+class _XlimRecorder(mpl_animation.AbstractMovieWriter):
+    def __init__(self, ax) -> None:
+        super().__init__()
+        self.ax = ax
+        self.xlims = []
+
+    def setup(self, fig, outfile, dpi=None) -> None:
+        super().setup(fig, outfile, dpi=dpi)
+
+    def grab_frame(self, **savefig_kwargs) -> None:
+        self.xlims.append(self.ax.get_xlim())
+
+    def finish(self) -> None:
+        pass
+
+
+def test_animate_outsets_views():
+    g = _make_grid()
+    xlim = g.source_axes.get_xlim()
+    writer = _XlimRecorder(g.source_axes)
+    animate_outsets(
+        g,
+        "/tmp/test_animate_outsets_views.gif",
+        cull=False,
+        hold_frames=0,
+        transition_frames=4,
+        writer=writer,
+    )
+    frames = writer.xlims
+
+    assert len(frames) == 2 * 2 * 4
+    # zoomed into first marquee, padded, then back out to full view
+    assert frames[3][0] < 0.2 < 0.3 < frames[3][1]
+    assert np.ptp(frames[3]) < np.ptp(xlim) / 2
+    assert np.allclose(frames[7], xlim)
+    plt.close(g.figure)
+
+
+def test_animate_outsets_invalid():
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3)], include_sourceplot=False)
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    with pytest.raises(ValueError):
+        animate_outsets(g)
+    plt.close(g.figure)
+
+    g = _make_grid()
+    with pytest.raises(ValueError):
+        animate_outsets(g, transition_frames=0)
+    plt.close(g.figure)
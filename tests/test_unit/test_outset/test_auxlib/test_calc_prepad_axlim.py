@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from outset._auxlib.calc_prepad_axlim_ import calc_prepad_axlim
+
+
+def test_calc_prepad_axlim_unset():
+    xlim, ylim = calc_prepad_axlim(
+        (0.0, 1.0),
+        (0.0, 1.0),
+        [[2.0, 4.0]],
+        [[1.0, 2.0]],
+        frame_inner_pad=0.5,
+        frame_outer_pad=0.0,
+        frame_outer_pad_unit="axes",
+        tight_axlim=False,
+        populated=False,
+    )
+    assert np.allclose(xlim, (1.0, 5.0))
+    assert np.allclose(ylim, (0.5, 2.5))
+
+
+@pytest.mark.parametrize("tight_axlim", [False, True])
+def test_calc_prepad_axlim_populated(tight_axlim: bool):
+    xlim, ylim = calc_prepad_axlim(
+        (-10.0, 10.0),
+        (0.0, 1.0),
+        [[2.0, 4.0], [2.0, 2.0]],
+        [[1.0, 2.0], [0.0, 0.5]],
+        frame_inner_pad=(0.5, 0.5),
+        frame_outer_pad=0.0,
+        frame_outer_pad_unit="axes",
+        tight_axlim=tight_axlim,
+        populated=True,
+    )
+    assert np.allclose(xlim, (1.5, 4.5) if tight_axlim else (-10.0, 10.0))
+    assert np.allclose(ylim, (-0.5, 2.5))
+
+
+def test_calc_prepad_axlim_empty():
+    xlim, ylim = calc_prepad_axlim(
+        (0.0, 1.0),
+        (0.0, 1.0),
+        np.empty((0, 2)),
+        np.empty((0, 2)),
+        frame_inner_pad=0.1,
+        frame_outer_pad=0.1,
+        frame_outer_pad_unit="axes",
+        tight_axlim=False,
+        populated=False,
+    )
+    assert xlim == (0.0, 1.0)
+    assert ylim == (0.0, 1.0)
@@ -0,0 +1,58 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from outset._auxlib.cull_axes_ import cull_axes
+
+
+def test_cull_axes_scatter():
+    fig, ax = plt.subplots()
+    xs = np.linspace(0, 10, 101)
+    ax.scatter(xs, xs, c=xs, s=xs)
+    ax.set_xlim(2, 4)
+    ax.set_ylim(2, 4)
+
+    num_culled = cull_axes(ax)
+    offsets = ax.collections[0].get_offsets()
+    assert num_culled == len(xs) - len(offsets)
+    assert 21 <= len(offsets) < len(xs)
+    assert len(ax.collections[0].get_array()) == len(offsets)
+    assert len(ax.collections[0].get_sizes()) == len(offsets)
+    assert cull_axes(ax) == 0
+    plt.close(fig)
+
+
+def test_cull_axes_autoscale():
+    fig, ax = plt.subplots()
+    xs = np.random.default_rng(1).uniform(0, 10, 1000)
+    ax.scatter(xs, xs)  # autoscale pending, so viewport is still stale
+
+    assert cull_axes(ax) == 0
+    assert len(ax.collections[0].get_offsets()) == len(xs)
+    plt.close(fig)
+
+
+def test_cull_axes_line():
+    fig, ax = plt.subplots()
+    xs = np.linspace(0, 10, 101)
+    ax.plot(xs, np.sin(xs))
+    ax.set_xlim(2, 4)
+
+    assert cull_axes(ax) > 0
+    culled_xs = ax.lines[0].get_xdata()
+    kept_xs = culled_xs[~np.isnan(culled_xs)]
+    assert kept_xs.min() < 2 and kept_xs.max() > 4  # crossing segments kept
+    assert np.all((kept_xs > 1.5) & (kept_xs < 4.5))
+    plt.close(fig)
+
+
+def test_cull_axes_line_gap():
+    fig, ax = plt.subplots()
+    xs = np.array([0.5, 5, 9, 5, 0.5, 5, 9])
+    ax.plot(xs, np.zeros_like(xs))
+    ax.set_xlim(0, 1)
+    ax.set_ylim(-1, 1)
+
+    assert cull_axes(ax) == 2
+    culled_xs = ax.lines[0].get_xdata()
+    assert np.isnan(culled_xs).sum() == 1  # break, rather than bridge, gap
+    plt.close(fig)
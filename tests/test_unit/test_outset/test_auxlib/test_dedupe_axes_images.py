@@ -0,0 +1,76 @@
+import io
+import pickle
+
+from matplotlib import patches as mpl_patches
+import matplotlib.pyplot as plt
+import numpy as np
+
+from outset import draw_marquee
+from outset._auxlib.dedupe_axes_images_ import (
+    DedupedAxesImage,
+    dedupe_axes_images,
+    imshow_deduped,
+)
+from outset._auxlib.marquee_artists_ import get_marquees
+
+
+def test_dedupe_axes_images():
+    fig, ax = plt.subplots()
+    data = np.arange(16).reshape(4, 4)
+    images = [
+        imshow_deduped(ax, data, extent=(i, i + 1, 0, 1), cmap=cmap)
+        for i, cmap in enumerate(["viridis", "viridis", "magma"])
+    ]
+    plain = ax.imshow(data, extent=(2, 3, 0, 1))
+    ax.set_xlim(0, 3)
+    for i, image in enumerate(images):  # as leader gradients
+        image.set_clip_path(
+            mpl_patches.Polygon(
+                [(i, 0), (i + 1, 0), (i + 1, 1)], transform=ax.transData
+            ),
+        )
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="pdf")
+    assert buf.getvalue().count(b"/Subtype /Image") == 4
+
+    dedupe_axes_images([*images, plain])
+    assert all(image.get_interpolation() == "none" for image in images)
+    assert plain.get_interpolation() != "none"  # only deduped images change
+    buf = io.BytesIO()
+    fig.savefig(buf, format="pdf")
+    assert buf.getvalue().count(b"/Subtype /Image") == 3
+
+    fig.savefig(io.BytesIO(), format="png")  # raster output unaffected
+    pickle.loads(pickle.dumps(fig))
+    plt.close(fig)
+
+
+def test_imshow_deduped():
+    data = np.arange(16).reshape(4, 4)
+    fig, (ax1, ax2) = plt.subplots(1, 2)
+    expected = ax1.imshow(data, extent=(0, 2, 0, 1), alpha=0.5, vmax=10)
+    actual = imshow_deduped(ax2, data, extent=(0, 2, 0, 1), alpha=0.5, vmax=10)
+    assert isinstance(actual, DedupedAxesImage)
+    assert actual in ax2.images
+    assert ax2.get_xlim() == ax1.get_xlim()
+    assert ax2.get_ylim() == ax1.get_ylim()
+    assert ax2.get_aspect() == ax1.get_aspect()
+    assert actual.get_alpha() == expected.get_alpha()
+    assert actual.get_clim() == expected.get_clim()
+    assert np.allclose(  # clipped to axes, as imshow
+        actual.get_clip_box().extents,
+        ax2.bbox.extents,
+    )
+    plt.close(fig)
+
+
+def test_leader_gradient_clip_box():
+    fig, ax = plt.subplots()
+    draw_marquee((0, 1), (0, 1), ax)
+    (image,) = get_marquees(ax)[0].leader_images
+    assert isinstance(image, DedupedAxesImage)
+    # clip box tracks output dpi, as for vector backends
+    fig.set_dpi(72)
+    assert image.get_clip_box().extents.tolist() == fig.bbox.extents.tolist()
+    plt.close(fig)
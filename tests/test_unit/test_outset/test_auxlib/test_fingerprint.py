@@ -0,0 +1,60 @@
+import threading
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset._auxlib.fingerprint_ import fingerprint
+from outset.mark import MarkNumericalBadges
+
+
+def test_fingerprint_data():
+    data = pd.DataFrame(
+        {
+            "x": np.arange(10, dtype=float),
+            "label": ["a", "b"] * 5,
+            "outset": pd.Categorical(["a", "b"] * 5),
+        }
+    )
+    assert fingerprint(data) == fingerprint(data.copy())
+    assert fingerprint(data) != fingerprint(data.assign(x=data["x"] + 1))
+    assert fingerprint(data) != fingerprint(data.assign(label="a"))
+    assert fingerprint(data) != fingerprint(data.rename(columns={"x": "y"}))
+    assert fingerprint(data) != fingerprint(data.iloc[::-1])
+    assert fingerprint(np.arange(4)) != fingerprint(np.arange(4.0))
+
+
+def test_fingerprint_values():
+    assert fingerprint({"a": 1, "b": 2}) == fingerprint({"b": 2, "a": 1})
+    assert fingerprint([1, 2]) != fingerprint((1, 2))
+    assert fingerprint(1) != fingerprint(1.0)
+    assert fingerprint(plt.plot) == fingerprint(plt.plot)
+    assert fingerprint(plt.plot) != fingerprint(sns.scatterplot)
+    assert fingerprint(MarkNumericalBadges()) == fingerprint(
+        MarkNumericalBadges()
+    )
+    assert fingerprint(MarkNumericalBadges()) != fingerprint(
+        MarkNumericalBadges(start=2)
+    )
+    assert fingerprint(len) == fingerprint(len)
+
+
+def test_fingerprint_bound_method():
+    assert fingerprint(MarkNumericalBadges().advance) == fingerprint(
+        MarkNumericalBadges().advance
+    )
+    assert fingerprint(MarkNumericalBadges().advance) != fingerprint(
+        MarkNumericalBadges(start=2).advance
+    )
+    assert fingerprint(MarkNumericalBadges().advance) != fingerprint(
+        MarkNumericalBadges().__call__
+    )
+
+
+def test_fingerprint_invalid():
+    with pytest.raises(ValueError):
+        fingerprint(lambda: None)
+    with pytest.raises(ValueError):
+        fingerprint(threading.Lock().acquire)
@@ -1,6 +1,10 @@
 import matplotlib.pyplot as plt
 
-from outset._auxlib.is_axes_unset_ import is_axes_unset
+from outset._auxlib.is_axes_unset_ import (
+    is_axes_populated,
+    is_axes_unset,
+    is_axlim_unset,
+)
 
 
 def test_empty_axis():
@@ -30,3 +34,15 @@ def test_auto_set_limits():
     fig, ax = plt.subplots()
     ax.plot([0, 1], [0, 2])  # Add a line plot to the axis
     assert is_axes_unset(ax) is False
+
+
+def test_is_axlim_unset():
+    assert is_axlim_unset((0.0, 1.0), (0.0, 1.0), populated=False) is True
+    assert is_axlim_unset((0.0, 1.0), (0.0, 1.0), populated=True) is False
+    assert is_axlim_unset((0.0, 2.0), (0.0, 1.0), populated=False) is False
+
+    fig, ax = plt.subplots()
+    assert is_axes_populated(ax) is False
+    ax.plot([0, 1], [0, 2])
+    assert is_axes_populated(ax) is True
+    plt.close(fig)
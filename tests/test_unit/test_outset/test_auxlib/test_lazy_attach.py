@@ -0,0 +1,37 @@
+import sys
+import types
+
+import pytest
+
+from outset._auxlib.lazy_attach_ import lazy_attach
+
+
+@pytest.fixture
+def package():
+    name = "_outset_test_lazy_attach"
+    module = types.ModuleType(name)
+    module.__path__ = []
+    sys.modules[name] = module
+    yield module
+    del sys.modules[name]
+
+
+def test_lazy_attach_attrs(package: types.ModuleType):
+    getattr_, dir_ = lazy_attach(
+        package.__name__, submodule_attrs={"json": ["dumps", "loads"]}
+    )
+    assert "dumps" not in vars(package)
+    assert "dumps" in dir_()
+    assert getattr_("dumps") is sys.modules["json"].dumps
+    assert package.dumps is sys.modules["json"].dumps  # cached
+    with pytest.raises(AttributeError):
+        getattr_("load")
+
+
+def test_lazy_attach_submodules(package: types.ModuleType):
+    getattr_, dir_ = lazy_attach(package.__name__, submodules=["missing"])
+    assert "missing" in dir_()
+    with pytest.raises(ModuleNotFoundError):
+        getattr_("missing")
+    with pytest.raises(AttributeError):
+        getattr_("other")
@@ -0,0 +1,89 @@
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from outset import draw_marquee
+from outset._auxlib.marquee_artists_ import get_marquees, update_marquee
+from outset._auxlib.marquee_index_ import (
+    invalidate_marquee_index,
+    query_marquees,
+)
+
+
+def _query_brute_force(ax: plt.Axes, x: float, y: float) -> list:
+    return [
+        marquee
+        for marquee in reversed(get_marquees(ax))
+        if any(
+            patch.contains_point((x, y))
+            for patch in (*marquee.frame_patches, *marquee.leader_patches)
+        )
+    ]
+
+
+def test_query_marquees():
+    rng = np.random.default_rng(1)
+    fig, ax = plt.subplots()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    for x, y in rng.uniform(0, 0.95, size=(200, 2)):
+        draw_marquee((x, x + 0.03), (y, y + 0.03), ax, mark_glyph=None)
+
+    points = ax.transAxes.transform(rng.uniform(-0.2, 1.2, size=(100, 2)))
+    num_hits = index_elapsed = brute_elapsed = 0
+    for x, y in points:
+        start = time.perf_counter()
+        hits = query_marquees(ax, x, y)
+        index_elapsed += time.perf_counter() - start
+        start = time.perf_counter()
+        assert hits == _query_brute_force(ax, x, y)
+        brute_elapsed += time.perf_counter() - start
+        num_hits += bool(hits)
+    assert num_hits
+    print(f"index {index_elapsed:.3f}s, brute force {brute_elapsed:.3f}s")
+    assert index_elapsed < brute_elapsed
+
+    # index is reused until invalidated
+    index = ax.__dict__["_outset_marquee_index"]
+    query_marquees(ax, *points[0])
+    assert ax.__dict__["_outset_marquee_index"] is index
+    invalidate_marquee_index(ax)
+    query_marquees(ax, *points[0])
+    assert ax.__dict__["_outset_marquee_index"] is not index
+    plt.close(fig)
+
+
+def test_query_marquees_stale():
+    fig, ax = plt.subplots()
+    draw_marquee((0.2, 0.3), (0.2, 0.3), ax)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    (marquee,) = get_marquees(ax)
+    update_marquee(ax, marquee, marquee.frame_xlim, marquee.frame_ylim)
+    inside = ax.transData.transform((0.25, 0.25))
+    assert query_marquees(ax, *inside) == [marquee]
+
+    # limit change
+    ax.set_xlim(0.5, 1.5)
+    assert query_marquees(ax, *inside) == []
+    ax.set_xlim(0, 1)
+
+    # marquee moved in place
+    update_marquee(ax, marquee, np.array([0.6, 0.7]), np.array([0.6, 0.7]))
+    assert query_marquees(ax, *inside) == []
+    moved = ax.transData.transform((0.65, 0.65))
+    assert query_marquees(ax, *moved) == [marquee]
+
+    # marquee added
+    draw_marquee((0.2, 0.3), (0.2, 0.3), ax)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    assert query_marquees(ax, *inside) == [get_marquees(ax)[-1]]
+    plt.close(fig)
+
+
+def test_query_marquees_empty():
+    fig, ax = plt.subplots()
+    assert query_marquees(ax, 10, 10) == []
+    plt.close(fig)
@@ -0,0 +1,61 @@
+import time
+
+from matplotlib import path as mpl_path
+import numpy as np
+import pytest
+
+from outset._auxlib.point_index_ import PointIndex
+
+
+@pytest.mark.parametrize("num_points", [0, 1, 10, 10000])
+def test_PointIndex_query_bbox(num_points: int):
+    rng = np.random.default_rng(1)
+    xy = rng.normal(size=(num_points, 2))
+    index = PointIndex(xy)
+    for __ in range(20):
+        x0, x1, y0, y1 = rng.normal(scale=2, size=4)
+        expected = np.flatnonzero(
+            (xy[:, 0] >= min(x0, x1))
+            & (xy[:, 0] <= max(x0, x1))
+            & (xy[:, 1] >= min(y0, y1))
+            & (xy[:, 1] <= max(y0, y1))
+        )
+        assert np.array_equal(
+            np.sort(index.query_bbox(x0, y0, x1, y1)), expected
+        )
+
+
+def test_PointIndex_query_polygon():
+    rng = np.random.default_rng(1)
+    xy = rng.uniform(size=(10000, 2))
+    index = PointIndex(xy)
+    for __ in range(20):
+        vertices = rng.uniform(-0.2, 1.2, size=(5, 2))
+        expected = np.flatnonzero(mpl_path.Path(vertices).contains_points(xy))
+        assert np.array_equal(index.query_polygon(vertices), expected)
+
+    assert len(index.query_polygon([(0, 0), (1, 1)])) == 0
+
+
+def test_PointIndex_degenerate():
+    xy = np.array([[1.0, 2.0]] * 5 + [[1.0, 3.0]])
+    index = PointIndex(xy)
+    assert np.array_equal(np.sort(index.query_bbox(0, 0, 2, 2.5)), range(5))
+    assert np.array_equal(index.query_bbox(0, 2.5, 2, 4), [5])
+
+
+def test_PointIndex_query_polygon_speed():
+    rng = np.random.default_rng(1)
+    xy = rng.uniform(size=(1_000_000, 2))
+    index = PointIndex(xy)
+    vertices = [(0.4, 0.4), (0.45, 0.4), (0.45, 0.45), (0.4, 0.42)]
+
+    start = time.perf_counter()
+    result = index.query_polygon(vertices)
+    index_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = np.flatnonzero(mpl_path.Path(vertices).contains_points(xy))
+    brute_elapsed = time.perf_counter() - start
+    print(f"index {index_elapsed:.4f}s, brute force {brute_elapsed:.4f}s")
+    assert np.array_equal(result, expected)
+    assert index_elapsed < brute_elapsed
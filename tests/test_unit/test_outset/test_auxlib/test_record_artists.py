@@ -0,0 +1,44 @@
+import matplotlib.pyplot as plt
+
+from outset import draw_marquee
+from outset._auxlib.marquee_artists_ import get_marquees
+from outset._auxlib.record_artists_ import record_artists, record_children
+
+
+def test_record_artists():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    with record_artists(ax) as artists:
+        (line,) = ax.plot([0, 1], [1, 0])
+        legend = ax.legend(["a", "b"])
+    assert artists == [line, legend]
+    plt.close(fig)
+
+
+def test_record_children():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    with record_children(ax) as artists:
+        (line,) = ax.plot([0, 1], [1, 0])
+        text = ax.text(0, 0, "a")
+    assert artists == [line, text]
+    plt.close(fig)
+
+
+def test_draw_marquee_artists():
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+    with record_artists(ax) as artists:
+        draw_marquee((0, 1), (0, 1), ax)
+    (marquee,) = get_marquees(ax)
+    assert len(marquee.frame_patches) == 2
+    assert len(marquee.leader_patches) == 2
+    assert len(marquee.leader_images) == 1
+    assert marquee.glyph_artists
+    assert artists == [
+        *marquee.frame_patches,
+        *marquee.leader_patches,
+        *marquee.leader_images,
+        *marquee.glyph_artists,
+    ]
+    plt.close(fig)
@@ -2,7 +2,8 @@ from matplotlib import pyplot as plt
 import numpy as np
 
 from outset._auxlib.calc_aspect_ import calc_aspect
-from outset._auxlib.set_aspect_ import set_aspect
+from outset._auxlib.calc_axes_size_ import calc_axes_size
+from outset._auxlib.set_aspect_ import calc_aspect_axlim, set_aspect
 
 
 def test_set_aspect_square():
@@ -64,3 +65,21 @@ def test_calc_aspect_nowarning():
 
     main_ax.indicate_inset_zoom(inset_ax, edgecolor="blue")
     set_aspect(inset_ax, calc_aspect(main_ax))
+
+
+def test_calc_aspect_axlim():
+    fig, ax = plt.subplots()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 2)
+    xlim, ylim = calc_aspect_axlim(
+        ax.get_xlim(), ax.get_ylim(), calc_axes_size(ax), 1
+    )
+    set_aspect(ax, 1)
+    assert np.allclose(ax.get_xlim(), xlim)
+    assert np.allclose(ax.get_ylim(), ylim)
+
+    assert calc_aspect_axlim(xlim, ylim, calc_axes_size(ax), 1) == (
+        xlim,
+        ylim,
+    )
+    plt.close(fig)
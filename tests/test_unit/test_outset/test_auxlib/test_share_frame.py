@@ -0,0 +1,37 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from outset._auxlib.share_frame_ import (
+    SharedColumn,
+    attach_frame,
+    share_frame,
+)
+
+
+def test_share_frame():
+    data = pd.DataFrame(
+        {
+            "x": np.arange(1000, dtype=float),
+            "y": np.arange(1000, dtype=np.int32),
+            "z": np.arange(1000, dtype=np.int8),
+            "outset": pd.Categorical(["a", "b"] * 500),
+        },
+        index=np.arange(1000) * 2,
+    )
+    shared, blocks = share_frame(data, threshold=2000)
+    try:
+        assert len(blocks) == 2
+        kinds = {name: type(column) for name, column in shared.columns}
+        assert kinds["x"] is SharedColumn
+        assert kinds["y"] is SharedColumn
+        assert kinds["z"] is not SharedColumn
+        assert kinds["outset"] is not SharedColumn
+
+        attached = attach_frame(pickle.loads(pickle.dumps(shared)))
+        pd.testing.assert_frame_equal(attached, data)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
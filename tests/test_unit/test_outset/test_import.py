@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+import typing
+
+import pytest
+
+import outset
+
+# heavy dependencies that should load only once needed
+_DEFERRED_MODULES = ("adjustText", "matplotlib.pyplot", "pandas", "seaborn")
+
+
+def _time_imports(code: str) -> typing.Dict[str, int]:
+    """Run `code` in a fresh interpreter, and get cumulative import time of
+    each module imported, in microseconds."""
+    package_root = os.path.dirname(os.path.dirname(outset.__file__))
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": package_root},
+        text=True,
+    ).stderr
+    return {
+        module.strip(): int(cumulative)
+        for line in stderr.splitlines()
+        if line.startswith("import time:")
+        and not line.endswith("| imported package")
+        for _self, cumulative, module in [line.split(":", 1)[1].split("|")]
+    }
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import outset",
+        "from outset import mark, patched, stub, tweak, util",
+        "from outset.mark import MarkArrow, MarkNumericalBadges",
+        "from outset.tweak import TweakReflect",
+    ],
+)
+def test_import_defers_dependencies(statement: str):
+    loaded = _time_imports(statement)
+    for module in _DEFERRED_MODULES:
+        assert module not in loaded, statement
+
+
+def test_import_time_budget():
+    budget = 0.25  # seconds, cumulative over outset and its imports
+    assert _time_imports("import outset")["outset"] * 1e-6 < budget
+
+
+def test_lazy_exports():
+    for package in (
+        outset,
+        outset.aio,
+        outset.mark,
+        outset.patched,
+        outset.profiling,
+        outset.stub,
+        outset.tweak,
+        outset.util,
+    ):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+
+def test_lazy_exports_invalid():
+    with pytest.raises(AttributeError):
+        outset.not_an_export
+    with pytest.raises(AttributeError):
+        outset.util.not_an_export
@@ -104,3 +104,40 @@ def test_inset_outsets_three(corner: str):
     outpath = f"/tmp/test_inset_outsets_three_{corner}.png"
     plt.savefig(outpath)
     print(f"saved graphic to {outpath}")
+
+
+def test_inset_outsets_reuse_layout(monkeypatch: pytest.MonkeyPatch):
+    grids = []
+    for __ in range(2):
+        og = OutsetGrid(
+            data=data,
+            x="x",
+            y="y",
+            col="outset",
+            col_order=["A", "C"],
+        )
+        og.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+        grids.append(og)
+
+    layout = inset_outsets(grids[0], insets="NW")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("renderer draw pass should be skipped")
+
+    monkeypatch.setattr(grids[1].figure, "tight_layout", fail)
+    monkeypatch.setattr(grids[1].figure.canvas, "get_renderer", fail)
+    assert inset_outsets(grids[1], layout=layout) is layout
+    monkeypatch.undo()
+
+    for ax1, ax2 in zip(grids[0].axes.flat, grids[1].axes.flat):
+        assert ax1.get_position().bounds == pytest.approx(
+            ax2.get_position().bounds,
+        )
+    assert grids[1]._is_inset()
+
+    for og in grids:
+        og.marqueeplot()
+
+    outpath = "/tmp/test_inset_outsets_reuse_layout.png"
+    grids[1].savefig(outpath)
+    print(f"saved graphic to {outpath}")
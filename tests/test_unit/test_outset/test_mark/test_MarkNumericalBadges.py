@@ -1,3 +1,8 @@
+from concurrent import futures
+import copy
+import pickle
+
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 
 from outset.mark._MarkNumericalBadges import MarkNumericalBadges
@@ -21,3 +26,42 @@ def test_MarkNumericalBadges():
     outpath = "/tmp/test_MarkNumericalBadges.png"
     plt.savefig(outpath)
     print(f"saved graphic to {outpath}")
+
+
+def test_MarkNumericalBadges_threadsafe():
+    ftor = MarkNumericalBadges()
+    figs = [Figure() for __ in range(4)]
+    axes = [fig.add_subplot() for fig in figs]
+
+    def mark(ax):
+        for i in range(10):
+            ftor(x=i, y=i, ax=ax)
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        [*executor.map(mark, axes)]
+
+    assert ftor._counter == 41
+    numerals = sorted(
+        int(line.get_marker().strip("$"))
+        for ax in axes
+        for line in ax.lines
+        if line.get_marker().startswith("$")
+    )
+    assert numerals == [*range(1, 41)]
+
+
+def test_MarkNumericalBadges_copy():
+    ftor = MarkNumericalBadges(start=3)
+    ftor_copy = pickle.loads(pickle.dumps(copy.deepcopy(ftor)))
+    assert ftor_copy._counter == 3
+    ftor_copy(x=0, y=0, ax=Figure().add_subplot())
+    assert ftor_copy._counter == 4
+    assert ftor._counter == 3
+
+
+def test_MarkNumericalBadges_advance():
+    ftor = MarkNumericalBadges(start=3, step=2)
+    ftor.advance(4)
+    assert ftor._counter == 11
+    ftor.advance()
+    assert ftor._counter == 13
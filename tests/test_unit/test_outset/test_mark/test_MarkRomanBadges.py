@@ -60,3 +60,12 @@ def test_MarkRomanBadges_start():
     outpath = "/tmp/test_MarkRomanBadges_start.png"
     plt.savefig(outpath)
     print(f"saved graphic to {outpath}")
+
+
+def test_MarkRomanBadges_advance():
+    ax = plt.figure().add_subplot()
+    ftor = MarkRomanBadges(upper=True)
+    ftor.advance(3)
+    ftor(x=0.5, y=0.5, ax=ax)
+    assert any(line.get_marker() == r"$\mathrm{Ⅳ}$" for line in ax.lines)
+    plt.close(ax.figure)
@@ -0,0 +1,79 @@
+import os
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import paginate_outsets
+from outset import mark as otst_mark
+from outset._paginate_outsets import _advance_glyph
+
+data = pd.DataFrame(
+    {
+        "x": [0.825, 3.1, 0.5, 0.8, 2.2, 2, 1.1, 1.2, 0.3, 0.4],
+        "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7, 0.1, 0.4, 3.0, 3.2],
+        "outset": ["a", "a", "b", "b", "c", "c", "d", "d", "e", "e"],
+    }
+)
+
+
+def test_paginate_outsets_pdf():
+    outpath = "/tmp/test_paginate_outsets_pdf.pdf"
+    num_pages = paginate_outsets(
+        [(0.1 * i, 0.1 * i, 0.1 * i + 0.2, 0.1 * i + 0.2) for i in range(7)],
+        outsets_per_page=3,
+        output=outpath,
+        plot=lambda g: g.broadcast(plt.plot, [0, 1], [0, 1]).marqueeplot(),
+    )
+    assert num_pages == 3
+    assert not plt.get_fignums()
+    print(f"saved graphic to {outpath}")
+
+
+@pytest.mark.parametrize("repeat_sourceplot", [True, False])
+def test_paginate_outsets_png(repeat_sourceplot: bool):
+    outpattern = (
+        f"/tmp/test_paginate_outsets_png_{repeat_sourceplot}_{{page}}.png"
+    )
+    num_pages = paginate_outsets(
+        data,
+        outsets_per_page=2,
+        output=outpattern,
+        x="x",
+        y="y",
+        col="outset",
+        hue="outset",
+        plot=lambda g: g.map_dataframe(
+            sns.scatterplot, x="x", y="y", legend=False
+        ).marqueeplot(),
+        repeat_sourceplot=repeat_sourceplot,
+    )
+    assert num_pages == 3
+    for page in range(num_pages):
+        outpath = outpattern.format(page=page)
+        assert os.path.exists(outpath)
+        print(f"saved graphic to {outpath}")
+
+
+def test_paginate_outsets_glyph_numbering():
+    mark_glyph = otst_mark.MarkNumericalBadges(start=1, step=2)
+    advanced = _advance_glyph(mark_glyph, 3)
+    assert advanced._counter == 7
+    assert mark_glyph._counter == 1
+    assert _advance_glyph(otst_mark.MarkNumericalBadges, 2)._counter == 3
+    assert _advance_glyph(otst_mark.MarkArrow(), 2) is not None
+
+    num_pages = paginate_outsets(
+        5,
+        outsets_per_page=2,
+        output="/tmp/test_paginate_outsets_glyph_numbering_{page}.png",
+        marqueeplot_kws={"mark_glyph": mark_glyph},
+    )
+    assert num_pages == 3
+    assert mark_glyph._counter == 1
+
+
+def test_paginate_outsets_invalid():
+    with pytest.raises(ValueError):
+        paginate_outsets(3, outsets_per_page=0, output="/tmp/{page}.png")
@@ -0,0 +1,123 @@
+from concurrent import futures
+import json
+
+from matplotlib import artist as mpl_artist
+from matplotlib.figure import Figure
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from outset import OutsetGrid, profiling
+from outset._auxlib import profile_stage_
+
+
+def _find(node: dict, name: str) -> list:
+    found = [node] if node["name"] == name else []
+    for child in node["children"]:
+        found.extend(_find(child, name))
+    return found
+
+
+def test_profile():
+    rng = np.random.default_rng(1)
+    artist_init = mpl_artist.Artist.__init__
+    with profiling.profile() as report:
+        g = OutsetGrid([(0.2, 0.2, 0.3, 0.3), (0.6, 0.5, 0.7, 0.7)])
+        g.broadcast(plt.scatter, rng.uniform(size=100), rng.uniform(size=100))
+        g.marqueeplot()
+        g.savefig("/tmp/test_profile.png")
+    assert mpl_artist.Artist.__init__ is artist_init
+    assert profile_stage_._num_active == 0
+
+    stats = report.to_dict()
+    assert stats["elapsed"] > 0
+    assert stats["artists"] > 0
+    assert [child["name"] for child in stats["children"]][0] == "OutsetGrid"
+
+    # grid -> panel -> marquee hierarchy
+    (source_marqueeplot,) = _find(stats, "OutsetGrid.marqueeplot_source")
+    (panel,) = _find(source_marqueeplot, "marqueeplot")
+    assert panel["calls"] == 1
+    (groupby,) = _find(panel, "groupby")
+    assert groupby["artists"] == 0
+    assert not _find(groupby, "draw_marquee")
+    (marquee,) = _find(panel, "draw_marquee")
+    assert marquee["calls"] == 2
+    assert marquee["artists"] > 0
+    assert panel["artists"] >= marquee["artists"]
+    assert {"draw_frame", "draw_callout"} <= {
+        child["name"] for child in marquee["children"]
+    }
+    (outset_marqueeplot,) = _find(stats, "OutsetGrid.marqueeplot_outset")
+    (panel,) = _find(outset_marqueeplot, "marqueeplot")
+    assert panel["calls"] == 2
+    assert len(_find(stats, "gradient")) == 2
+    assert len(_find(stats, "mark_glyph")) == 2
+    assert _find(stats, "set_aspect")
+    assert _find(stats, "OutsetGrid.tight_layout")
+    (savefig,) = _find(stats, "OutsetGrid.savefig")
+    assert savefig["elapsed"] > 0
+
+    for node in _find(stats, "draw_marquee"):
+        assert node["elapsed"] >= node["self_elapsed"] >= 0
+        assert node["elapsed"] >= sum(c["elapsed"] for c in node["children"])
+    assert json.loads(report.to_json()) == stats
+
+    folded = report.to_folded().splitlines()
+    assert len(folded) == len(str(report).splitlines()) - 1
+    assert any(
+        line.startswith("root;OutsetGrid.marqueeplot_source;marqueeplot;")
+        for line in folded
+    )
+    for line in folded:
+        stack, self_us = line.rsplit(" ", 1)
+        assert int(self_us) >= 0
+    print(report)
+    plt.close(g.figure)
+
+
+def test_profile_disabled():
+    assert profile_stage_._num_active == 0
+    assert profile_stage_.profile_stage("x") is profile_stage_._null_context
+
+    with pytest.raises(ValueError):
+        with profiling.profile() as report:
+            with profile_stage_.profile_stage("outer"):
+                raise ValueError
+    assert profile_stage_._num_active == 0
+    assert [*report.root.children] == ["outer"]
+    assert report.root.children["outer"].calls == 1
+
+
+def test_profile_nested():
+    fig = Figure()
+    with profiling.profile() as outer:
+        with profile_stage_.profile_stage("setup", fig):
+            ax = fig.add_subplot()
+            num_added = 1 + len(ax.get_children())  # axes, spines, axis, etc.
+        with profiling.profile() as inner:
+            with profile_stage_.profile_stage("plot", ax):
+                ax.plot([0, 1], [0, 1])
+    assert [*outer.root.children] == ["setup", "plot"]
+    assert [*inner.root.children] == ["plot"]
+    assert outer.root.children["setup"].artists == num_added
+    assert outer.root.children["plot"].artists == 1
+    assert inner.root.artists == 1
+
+
+def test_profile_threads():
+    def plot(num_lines: int) -> int:
+        ax = Figure().add_subplot()
+        with profiling.profile() as report:
+            with profile_stage_.profile_stage("plot", ax):
+                for __ in range(num_lines):
+                    ax.plot([0, 1], [0, 1])
+        return report.root.artists
+
+    num_lines = [*range(1, 9)]
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        assert [*executor.map(plot, num_lines)] == num_lines
+    with profiling.profile() as report:
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            [*executor.map(plot, num_lines)]
+    assert not report.root.children  # stages on other threads not recorded
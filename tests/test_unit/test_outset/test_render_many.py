@@ -0,0 +1,63 @@
+import os
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+from outset import render_many
+from outset import util as otst_util
+
+data = pd.DataFrame(
+    {
+        "x": np.linspace(0, 3, 8),
+        "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7, 0.1, 0.4],
+        "outset": pd.Categorical(["a", "a", "b", "b", "c", "c", "d", "d"]),
+    }
+)
+
+
+def test_render_many():
+    specs = [
+        otst_util.RenderSpec(
+            data=data,
+            output=f"/tmp/test_render_many_{i}.png",
+            calls=[
+                (
+                    "map_dataframe",
+                    sns.scatterplot,
+                    (),
+                    {"x": "x", "y": "y", "legend": False},
+                ),
+            ],
+            grid_kws={"x": "x", "y": "y", "col": "outset", "col_wrap": i + 2},
+        )
+        for i in range(3)
+    ] + [
+        otst_util.RenderSpec(
+            data=[(0.1, 0.1, 0.3, 0.3), (0.5, 0.5, 0.9, 0.9)],
+            output="/tmp/test_render_many_frames.png",
+            calls=[("broadcast", plt.plot, ([0, 1], [0, 1]), {})],
+            marqueeplot_kws={"mark_glyph": None},
+        ),
+    ]
+
+    for spec in specs:
+        if os.path.exists(spec.output):
+            os.remove(spec.output)
+
+    results = render_many(
+        specs,
+        max_workers=2,
+        memory_limit=1 << 34,
+        shared_memory_threshold=0,
+    )
+
+    assert [result.output for result in results] == [
+        spec.output for spec in specs
+    ]
+    for result in results:
+        assert result.elapsed > 0
+        assert result.pid != os.getpid()
+        assert os.path.exists(result.output)
+        print(f"saved graphic to {result.output}")
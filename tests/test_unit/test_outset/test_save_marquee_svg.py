@@ -0,0 +1,150 @@
+import io
+import typing
+from xml.etree import ElementTree as ET
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import draw_marquee, marqueeplot, OutsetGrid, save_marquee_svg
+from outset import mark as otst_mark
+from outset import tweak as otst_tweak
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+data = pd.DataFrame(
+    {
+        "x": np.linspace(0, 3, 8),
+        "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7, 0.1, 0.4],
+        "outset": ["a", "a", "b", "b", "c", "c", "d", "d"],
+    }
+)
+
+
+def _count(root: ET.Element, tag: str) -> int:
+    return sum(1 for __ in root.iter(f"{SVG}{tag}"))
+
+
+def test_save_marquee_svg():
+    fig, ax = plt.subplots()
+    ax.scatter(data["x"], data["y"])
+    marqueeplot(data, x="x", y="y", hue="outset", outset="outset", ax=ax)
+    children = ax.get_children()
+    visible = [artist.get_visible() for artist in children]
+
+    buf = io.BytesIO()
+    save_marquee_svg(fig, buf)
+    root = ET.fromstring(buf.getvalue())
+    assert ax.get_children() == children
+    assert [artist.get_visible() for artist in children] == visible
+
+    assert _count(root, "image") == 0
+    assert _count(root, "radialGradient") == 4  # one per color
+    # frame face and edge, and leader underlay, edge, and gradient fill
+    assert _count(root, "rect") >= 2 * 4
+    assert _count(root, "polygon") == 3 * 4
+    # badge circles are shared between glyphs
+    assert _count(root, "symbol") < _count(root, "use")
+    frame_patch = ax.patches[1]  # frame edge of first marquee
+    # svg backend renders at 72 dpi
+    (x0, __), (x1, __) = frame_patch.get_window_extent().get_points()
+    x0, x1 = x0 * 72 / fig.dpi, x1 * 72 / fig.dpi
+    assert any(
+        np.isclose(float(rect.get("x")), x0, atol=0.01)
+        and np.isclose(float(rect.get("width")), x1 - x0, atol=0.02)
+        for rect in root.iter(f"{SVG}rect")
+    )
+
+    reference = io.BytesIO()
+    fig.savefig(reference, format="svg")
+    assert len(buf.getvalue()) < len(reference.getvalue())
+    plt.close(fig)
+
+
+@pytest.mark.parametrize(
+    "mark_glyph",
+    [
+        otst_mark.MarkAlphabeticalBadges,
+        otst_mark.MarkArrow,
+        otst_mark.MarkInlaidAsterisk,
+        otst_mark.MarkMagnifyingGlass,
+        otst_mark.MarkRomanBadges,
+    ],
+)
+def test_save_marquee_svg_glyphs(mark_glyph: typing.Type):
+    fig, ax = plt.subplots()
+    for i in range(3):
+        draw_marquee(
+            (i, i + 1),
+            (i, i + 0.5),
+            ax,
+            color="red" if i else "blue",
+            mark_glyph=mark_glyph(),
+            leader_tweak=otst_tweak.TweakReflect(vertical=bool(i)),
+        )
+
+    buf = io.BytesIO()
+    save_marquee_svg(fig, buf)
+    root = ET.fromstring(buf.getvalue())
+    assert _count(root, "image") == 0
+    assert _count(root, "radialGradient") == 2
+    assert _count(root, "use") >= 3
+    plt.close(fig)
+
+
+def test_save_marquee_svg_text_glyph():
+    def mark_text(x: float, y: float, ax: plt.Axes, **kwargs) -> None:
+        ax.text(x, y, "hello", color=kwargs["color"], zorder=kwargs["zorder"])
+
+    fig, ax = plt.subplots()
+    draw_marquee((0, 1), (0, 1), ax, mark_glyph=mark_text)
+    (text,) = ax.texts
+
+    buf = io.BytesIO()
+    save_marquee_svg(fig, buf)
+    root = ET.fromstring(buf.getvalue())
+    assert text.get_visible()
+    assert _count(root, "polygon") == 3  # leader still written directly
+    assert any(  # text glyph rendered by matplotlib
+        group.get("id", "").startswith("text") for group in root.iter(f"{SVG}g")
+    )
+    plt.close(fig)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_save_marquee_svg_OutsetGrid(lazy: bool):
+    g = OutsetGrid(data, x="x", y="y", col="outset", col_wrap=3, lazy=lazy)
+    g.map_dataframe(sns.scatterplot, x="x", y="y")
+    g.marqueeplot()
+
+    output = f"/tmp/test_save_marquee_svg_OutsetGrid_{lazy}.svg"
+    save_marquee_svg(g, output)
+    root = ET.parse(output).getroot()
+    assert _count(root, "image") == 0
+    assert _count(root, "polygon") == 3 * 2 * 4  # source and outset axes
+    plt.close(g.figure)
+
+
+def test_save_marquee_svg_namespaces(monkeypatch: pytest.MonkeyPatch):
+    # namespaces are registered once, at import, not per call
+    def register_namespace(prefix: str, uri: str) -> None:
+        assert False
+
+    monkeypatch.setattr(ET, "register_namespace", register_namespace)
+    fig, ax = plt.subplots()
+    draw_marquee((0, 1), (0, 1), ax)
+
+    buf = io.BytesIO()
+    save_marquee_svg(fig, buf)
+    assert b"<svg " in buf.getvalue()
+    assert b"ns0:" not in buf.getvalue()  # svg namespace kept as default
+    plt.close(fig)
+
+
+def test_save_marquee_svg_invalid():
+    fig, ax = plt.subplots()
+    with pytest.raises(ValueError):
+        save_marquee_svg(fig, io.BytesIO(), format="png")
+    plt.close(fig)
@@ -0,0 +1,47 @@
+import matplotlib.pyplot as plt
+import numpy as np
+
+from outset import draw_marquee
+from outset import mark as otst_mark
+from outset import util as otst_util
+
+
+def test_DrawCost_measure():
+    fig, ax = plt.subplots()
+    baseline = otst_util.DrawCost.measure(ax)
+    assert baseline == otst_util.DrawCost()
+    assert baseline.num_artists == 0
+    assert baseline.estimated_cost == 0
+
+    ax.scatter(np.arange(100), np.arange(100))
+    ax.plot([0, 1, 2], [0, 1, 0])
+    ax.text(0.5, 0.5, r"$\alpha$")
+    draw_marquee(
+        (10, 20), (10, 20), ax, mark_glyph=otst_mark.MarkNumericalBadges()
+    )
+    cost = otst_util.DrawCost.measure(ax)
+    assert cost.data_artists == 3
+    assert cost.frame_artists == 2
+    assert cost.leader_artists == 2
+    assert cost.gradient_images == 1
+    assert cost.glyph_artists > 0
+    assert cost.num_artists == 8 + cost.glyph_artists
+    assert cost.clip_paths == 1  # gradient, clipped to leader
+    assert cost.mathtext == 2  # text and badge marker
+    assert cost.image_pixels > 0
+    assert cost.path_vertices > 100  # a marker path per scatter point
+    assert cost.estimated_cost > 0
+    plt.close(fig)
+
+
+def test_DrawCost_add():
+    a = otst_util.DrawCost(frame_artists=1, path_vertices=10)
+    b = otst_util.DrawCost(data_artists=2, path_vertices=5)
+    assert a + b == otst_util.DrawCost(
+        frame_artists=1, data_artists=2, path_vertices=15
+    )
+    assert sum([a, b], otst_util.DrawCost()) == a + b
+    assert (a + b).num_artists == 3
+    assert np.isclose(
+        (a + b).estimated_cost, a.estimated_cost + b.estimated_cost
+    )
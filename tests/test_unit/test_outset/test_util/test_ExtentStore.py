@@ -0,0 +1,147 @@
+import typing
+
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import OutsetGrid
+from outset import util as otst_util
+
+
+def _make_data(num_rows: int, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        {
+            "x": rng.normal(size=num_rows),
+            "y": rng.normal(size=num_rows),
+            "outset": rng.choice(["a", "b"], num_rows),
+            "hue": rng.choice([1, 2, 3], num_rows),
+            "time": np.cumsum(rng.uniform(0, 1, num_rows)),
+        },
+    )
+    data.loc[rng.uniform(size=num_rows) < 0.05, "x"] = np.nan
+    return data
+
+
+def _expected_extent(
+    data: pd.DataFrame, key: typing.Tuple[typing.Any, typing.Any]
+) -> typing.Tuple[float, float, float, float]:
+    for column, value in zip(("outset", "hue"), key):
+        if value is not None:
+            data = data[data[column] == value]
+    data = data.dropna(subset=["x", "y"])
+    return data["x"].min(), data["y"].min(), data["x"].max(), data["y"].max()
+
+
+@pytest.mark.parametrize(
+    "window_kws",
+    [
+        {},
+        {"window_rows": 1},
+        {"window_rows": 37},
+        {"window_seconds": 20.0, "time": "time"},
+        {"window_rows": 50, "window_seconds": 20.0, "time": "time"},
+    ],
+)
+def test_ExtentStore(window_kws: typing.Dict):
+    data = _make_data(400)
+    store = otst_util.ExtentStore("x", "y", "outset", "hue", **window_kws)
+    splits = [0, 1, 2, 50, 51, 120, 300, 400]
+    for start, stop in zip(splits, splits[1:]):
+        assert store.append(data.iloc[start:stop]) is store
+        assert store.num_rows == stop
+
+        history = data.iloc[:stop]
+        if "window_rows" in window_kws:
+            history = history.iloc[-window_kws["window_rows"] :]
+        if "window_seconds" in window_kws:
+            latest = data["time"].iloc[stop - 1]
+            window_seconds = window_kws["window_seconds"]
+            history = history[history["time"] >= latest - window_seconds]
+
+        for key in [(None, None), ("a", None), (None, 2), ("b", 3)]:
+            expected = _expected_extent(history, key)
+            if not np.isnan(expected[0]):
+                assert np.allclose(store.get_extent(key), expected)
+            else:  # no rows in window
+                with pytest.raises(ValueError):
+                    store.get_extent(key)
+
+
+def test_ExtentStore_ungrouped():
+    data = _make_data(100)
+    store = otst_util.ExtentStore("x", "y", window_rows=10)
+    store.append(data.iloc[:60]).append(data.iloc[:0]).append(data.iloc[60:])
+    assert store.keys() == [(None, None)]
+    assert np.allclose(
+        store.get_extent(), _expected_extent(data.iloc[-10:], (None, None))
+    )
+
+
+def test_ExtentStore_evict_touched():
+    store = otst_util.ExtentStore("x", "y", "outset", window_rows=2)
+    store.append(pd.DataFrame({"x": [0, 1], "y": [0, 1], "outset": "a"}))
+    store.append(pd.DataFrame({"x": [5, 6], "y": [5, 6], "outset": "b"}))
+    assert len(store._deques) == 2  # untouched group is not yet evicted
+    assert store.keys() == [("b", None)]
+    assert store.get_extent() == (5, 5, 6, 6)
+
+
+def test_ExtentStore_datetime():
+    data = _make_data(100)
+    data["time"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        data["time"], unit="s"
+    )
+    store = otst_util.ExtentStore(
+        "x", "y", window_seconds=10.0, time="time"
+    ).append(data)
+    latest = data["time"].iloc[-1]
+    expected = data[data["time"] >= latest - pd.Timedelta(seconds=10)]
+    assert np.allclose(
+        store.get_extent(), _expected_extent(expected, (None, None))
+    )
+
+
+def test_ExtentStore_invalid():
+    with pytest.raises(ValueError):
+        otst_util.ExtentStore("x", "y", window_rows=0)
+    with pytest.raises(ValueError):
+        otst_util.ExtentStore("x", "y", time="time")
+
+    data = _make_data(10)
+    store = otst_util.ExtentStore("x", "y", window_seconds=1.0, time="time")
+    store.append(data.iloc[5:])
+    with pytest.raises(ValueError):
+        store.append(data.iloc[:5])  # time goes backwards
+    with pytest.raises(ValueError):
+        store.get_extent(("a", None))  # not grouped by col
+    with pytest.raises(ValueError):
+        otst_util.ExtentStore("x", "z").append(data)
+
+
+def test_ExtentStore_update_data():
+    data = _make_data(200).dropna().reset_index(drop=True)
+    g = OutsetGrid(data.iloc[:100], x="x", y="y", col="outset")
+    g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+    g.marqueeplot()
+
+    store = otst_util.ExtentStore("x", "y", "outset", window_rows=100)
+    store.append(data.iloc[:100]).append(data.iloc[100:])
+    g.update_data(data.iloc[-100:], extents=store)
+
+    expected = OutsetGrid(data.iloc[-100:], x="x", y="y", col="outset")
+    expected.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+    expected.marqueeplot()
+    for ax, expected_ax in zip(g.axes.flat, expected.axes.flat):
+        assert np.allclose(
+            ax.patches[0].get_bbox().get_points(),
+            expected_ax.patches[0].get_bbox().get_points(),
+        )
+
+    outpath = "/tmp/test_ExtentStore_update_data.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+    with pytest.raises(ValueError):
+        g.update_data(data, extents=otst_util.ExtentStore("x", "y", "hue"))
@@ -0,0 +1,120 @@
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import OutsetGrid, inset_outsets
+from outset import util as otst_util
+
+data = pd.DataFrame(
+    {
+        "x": [0.825, 3.1, 0.5, 0.8, 2.2, 2],
+        "y": [1.2, 0.8, 2.5, 2.3, 1.1, 3.7],
+        "outset": ["a", "a", "b", "b", "c", "c"],
+    }
+)
+
+
+def _render(pool: otst_util.GridPool, **kwargs) -> np.ndarray:
+    with pool.checkout(data, x="x", y="y", col="outset", **kwargs) as g:
+        g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+        g.marqueeplot()
+        g.add_legend()
+        buf = io.BytesIO()
+        g.savefig(buf, format="png")
+    buf.seek(0)
+    return plt.imread(buf)
+
+
+def test_GridPool_reuse():
+    pool = otst_util.GridPool(maxsize=2)
+    first = _render(pool, pyplot=False)
+    assert pool.stats() == {"hits": 0, "misses": 1, "evictions": 0, "size": 1}
+
+    second = _render(pool, pyplot=False)
+    assert pool.stats() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+    assert np.array_equal(first, second)
+
+    outpath = "/tmp/test_GridPool_reuse.png"
+    plt.imsave(outpath, second)
+    print(f"saved graphic to {outpath}")
+
+
+def test_GridPool_reset():
+    pool = otst_util.GridPool()
+    g = OutsetGrid(
+        data,
+        x="x",
+        y="y",
+        col="outset",
+        grid_engine="gridspec",
+        grid_pool=pool,
+    )
+    inset_outsets(g, strip_spines=True)
+    g.map_dataframe(sns.scatterplot, x="x", y="y", legend=False)
+    g.marqueeplot()
+    figure = g.figure
+    pool.release(g)
+    with pytest.raises(ValueError):
+        pool.release(g)
+
+    reference = OutsetGrid(
+        data, x="x", y="y", col="outset", grid_engine="gridspec"
+    )
+    g = OutsetGrid(
+        data,
+        x="x",
+        y="y",
+        col="outset",
+        grid_engine="gridspec",
+        grid_pool=pool,
+    )
+    assert g.figure is figure
+    assert np.allclose(
+        g.figure.get_size_inches(), reference.figure.get_size_inches()
+    )
+    for ax, ref_ax in zip(g.axes.flat, reference.axes.flat):
+        assert len(ax.get_children()) == len(ref_ax.get_children())
+        assert ax.get_xlim() == ref_ax.get_xlim()
+        assert ax.get_ylim() == ref_ax.get_ylim()
+        assert ax.get_aspect() == ref_ax.get_aspect()
+        assert ax.get_xlabel() == ref_ax.get_xlabel()
+        assert np.allclose(
+            ax.get_position().bounds, ref_ax.get_position().bounds
+        )
+        assert [s.get_visible() for s in ax.spines.values()] == [
+            s.get_visible() for s in ref_ax.spines.values()
+        ]
+
+
+def test_GridPool_eviction():
+    pool = otst_util.GridPool(maxsize=2)
+    grids = [
+        OutsetGrid(n, grid_engine="gridspec", grid_pool=pool, pyplot=False)
+        for n in (1, 2, 3)
+    ]
+    for g in grids:
+        pool.release(g)
+    assert pool.stats() == {"hits": 0, "misses": 3, "evictions": 1, "size": 2}
+
+    g = OutsetGrid(1, grid_engine="gridspec", grid_pool=pool, pyplot=False)
+    assert pool.misses == 4  # least recently used template was evicted
+    g = OutsetGrid(3, grid_engine="gridspec", grid_pool=pool, pyplot=False)
+    assert pool.hits == 1
+    assert len(pool) == 1
+    assert not grids[0].figure.axes  # evicted figure was cleared
+
+    plt.close("all")
+    for n in (1, 2, 3):
+        pool.release(OutsetGrid(n, grid_engine="gridspec", grid_pool=pool))
+    assert len(plt.get_fignums()) == 2  # evicted pyplot figure was closed
+
+
+def test_GridPool_invalid():
+    with pytest.raises(ValueError):
+        otst_util.GridPool(maxsize=-1)
+    with pytest.raises(ValueError):
+        OutsetGrid(3, grid_pool=otst_util.GridPool())
@@ -0,0 +1,74 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import OutsetGrid
+from outset.util import InsetLayout
+
+data = pd.DataFrame(
+    {
+        "x": [1, 10, 1.5, 4, 7, 7.4, 4, 5],
+        "y": [1.5, 3, 2, 11, 2.05, 2, 4, 5],
+        "outset": ["A", "B", "A", "B", "C", "C", "D", "D"],
+    }
+)
+
+
+def _make_grid() -> OutsetGrid:
+    og = OutsetGrid(data=data, x="x", y="y", col="outset", col_order=["A"])
+    og.map_dataframe(sns.scatterplot, x="x", y="y")
+    return og
+
+
+def test_InsetLayout_measure():
+    og = _make_grid()
+    layout = InsetLayout.measure(
+        og.figure, og.source_axes, [(0.6, 0.6, 0.3, 0.3)]
+    )
+
+    assert np.allclose(layout.figsize, og.figure.get_size_inches())
+    x0, y0, width, height = layout.source_bounds
+    assert 0 < x0 < layout.figsize[0]
+    assert 0 < y0 < layout.figsize[1]
+    assert 0 < width < layout.figsize[0]
+    assert 0 < height < layout.figsize[1]
+    assert layout.insets == ((0.6, 0.6, 0.3, 0.3),)
+
+
+def test_InsetLayout_apply(monkeypatch: pytest.MonkeyPatch):
+    og1 = _make_grid()
+    layout = InsetLayout.measure(
+        og1.figure, og1.source_axes, [(0.6, 0.6, 0.3, 0.3)]
+    )
+
+    og2 = _make_grid()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("renderer draw pass should be skipped")
+
+    monkeypatch.setattr(og2.figure, "tight_layout", fail)
+    monkeypatch.setattr(og2.figure.canvas, "get_renderer", fail)
+    layout.apply(og2.figure, og2.source_axes, og2.outset_axes)
+
+    assert np.allclose(
+        og1.figure.get_size_inches(), og2.figure.get_size_inches()
+    )
+    assert np.allclose(
+        og1.source_axes.get_position().bounds,
+        og2.source_axes.get_position().bounds,
+    )
+    source_pos = og2.source_axes.get_position()
+    inset_pos = og2.outset_axes[0].get_position()
+    assert np.isclose(inset_pos.x0, source_pos.x0 + 0.6 * source_pos.width)
+    assert np.isclose(inset_pos.height, 0.3 * source_pos.height)
+
+
+def test_InsetLayout_apply_mismatch():
+    og = _make_grid()
+    layout = InsetLayout.measure(
+        og.figure, og.source_axes, [(0.6, 0.6, 0.3, 0.3)] * 2
+    )
+    with pytest.raises(ValueError):
+        layout.apply(og.figure, og.source_axes, og.outset_axes)
@@ -0,0 +1,113 @@
+from matplotlib.backend_bases import MouseEvent
+from matplotlib import colors as mpl_colors
+from matplotlib import path as mpl_path
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from outset import OutsetGrid
+from outset import util as otst_util
+
+
+def _make_grid(**kwargs) -> OutsetGrid:
+    rng = np.random.default_rng(1)
+    g = OutsetGrid([(0.2, 0.2, 0.4, 0.4), (0.5, 0.5, 0.8, 0.7)])
+    g.broadcast(
+        plt.scatter, rng.uniform(size=5000), rng.uniform(size=5000), **kwargs
+    )
+    g.marqueeplot()
+    return g
+
+
+def _get_highlighted(collection, color: str) -> np.ndarray:
+    offsets = np.asarray(collection.get_offsets())
+    highlighted = np.all(
+        collection.get_facecolors() == mpl_colors.to_rgba(color), axis=1
+    )
+    return offsets[highlighted]
+
+
+def _sort_rows(xy: np.ndarray) -> np.ndarray:
+    return xy[np.lexsort(xy.T[::-1])]
+
+
+def test_LinkedBrush():
+    g = _make_grid()
+    brush = otst_util.LinkedBrush(g, color="magenta", lasso=False)
+    vertices = [(0.25, 0.25), (0.7, 0.3), (0.6, 0.65), (0.3, 0.55)]
+    brush.select(vertices)
+
+    xy = np.asarray(g.source_axes.collections[0].get_offsets())
+    expected = xy[mpl_path.Path(vertices).contains_points(xy)]
+    assert len(expected)
+    assert np.array_equal(_sort_rows(brush.selected), _sort_rows(expected))
+    for ax in g.axes.flat:
+        (collection,) = ax.collections
+        offsets = np.asarray(collection.get_offsets())
+        inside = mpl_path.Path(vertices).contains_points(offsets)
+        highlighted = _get_highlighted(collection, "magenta")
+        assert np.array_equal(
+            _sort_rows(highlighted), _sort_rows(offsets[inside])
+        )
+
+    outpath = "/tmp/test_LinkedBrush.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+    brush.clear()
+    assert len(brush.selected) == 0
+    for ax in g.axes.flat:
+        assert not len(_get_highlighted(ax.collections[0], "magenta"))
+    plt.close(g.figure)
+
+
+def test_LinkedBrush_lasso():
+    g = _make_grid()
+    g.figure.canvas.draw()
+    brush = otst_util.LinkedBrush(g)
+
+    # lasso within first outset
+    ax = g.axes.flat[1]
+    vertices = [(0.25, 0.25), (0.35, 0.25), (0.35, 0.35), (0.25, 0.35)]
+    for i, xy in enumerate(vertices):
+        name = "button_press_event" if i == 0 else "motion_notify_event"
+        x, y = ax.transData.transform(xy)
+        MouseEvent(name, g.figure.canvas, x, y, button=1)._process()
+    x, y = ax.transData.transform(vertices[-1])
+    MouseEvent(
+        "button_release_event", g.figure.canvas, x, y, button=1
+    )._process()
+
+    selected = brush.selected
+    assert len(selected)
+    assert np.all((selected >= 0.25) & (selected <= 0.35))
+    # linked to source axes
+    highlighted = _get_highlighted(g.source_axes.collections[0], "red")
+    assert np.array_equal(_sort_rows(highlighted), _sort_rows(selected))
+
+    brush.disconnect()
+    assert len(brush.selected) == 0
+    plt.close(g.figure)
+
+
+def test_LinkedBrush_colormapped():
+    g = _make_grid(c=np.linspace(0, 1, 5000))
+    brush = otst_util.LinkedBrush(g, lasso=False)
+    collection = g.source_axes.collections[0]
+    array = collection.get_array().copy()
+    facecolors = collection.get_facecolors().copy()
+    brush.select([(0, 0), (0.5, 0), (0.5, 0.5), (0, 0.5)])
+    assert collection.get_array() is None
+    brush.clear()
+    assert np.array_equal(collection.get_array(), array)
+    collection.update_scalarmappable()
+    assert np.array_equal(collection.get_facecolors(), facecolors)
+    plt.close(g.figure)
+
+
+def test_LinkedBrush_no_scatter():
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3)])
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    with pytest.raises(ValueError):
+        otst_util.LinkedBrush(g)
+    plt.close(g.figure)
@@ -0,0 +1,65 @@
+import time
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+import numpy as np
+import pytest
+
+from outset import OutsetGrid, inset_outsets
+from outset import util as otst_util
+
+
+def _move(g: OutsetGrid, xy: tuple) -> None:
+    x, y = g.source_axes.transData.transform(xy)
+    MouseEvent("motion_notify_event", g.figure.canvas, x, y)._process()
+
+
+@pytest.mark.parametrize("inset", [False, True])
+def test_MagnifierLens(inset: bool):
+    rng = np.random.default_rng(1)
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3), (0.6, 0.5, 0.7, 0.7)])
+    g.broadcast(plt.scatter, rng.uniform(size=5000), rng.uniform(size=5000))
+    g.marqueeplot()
+    if inset:
+        inset_outsets(g)
+    g.figure.canvas.draw()
+
+    lens = otst_util.MagnifierLens(g, outset=2)
+    xlim, ylim = g.axes.flat[2].get_xlim(), g.axes.flat[2].get_ylim()
+    _move(g, (0.3, 0.8))
+    assert np.allclose(np.mean(g.axes.flat[2].get_xlim()), 0.3)
+    assert np.allclose(np.mean(g.axes.flat[2].get_ylim()), 0.8)
+    assert np.allclose(np.ptp(g.axes.flat[2].get_xlim()), np.ptp(xlim))
+    assert np.allclose(np.ptp(g.axes.flat[2].get_ylim()), np.ptp(ylim))
+    assert g.axes.flat[1].get_xlim() != g.axes.flat[2].get_xlim()
+
+    # mouse moves are cheaper than full redraws
+    num_moves = 10
+    start = time.perf_counter()
+    for x in np.linspace(0.2, 0.8, num_moves):
+        _move(g, (x, 0.5))
+    move_elapsed = (time.perf_counter() - start) / num_moves
+    start = time.perf_counter()
+    for __ in range(num_moves):
+        g.figure.canvas.draw()
+    draw_elapsed = (time.perf_counter() - start) / num_moves
+    print(f"move {move_elapsed * 1e3:.1f}ms, draw {draw_elapsed * 1e3:.1f}ms")
+    assert move_elapsed < draw_elapsed
+
+    _move(g, (0.5, 0.5))
+    lens.disconnect()
+    _move(g, (0.2, 0.2))  # no longer handled
+    assert np.allclose(np.mean(g.axes.flat[2].get_xlim()), 0.5)
+
+    outpath = f"/tmp/test_MagnifierLens_inset={inset}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+
+def test_MagnifierLens_invalid():
+    with pytest.raises(ValueError):
+        otst_util.MagnifierLens(OutsetGrid(2, include_sourceplot=False))
+    g = OutsetGrid(2)
+    g.marqueeplot()
+    with pytest.raises(ValueError):
+        otst_util.MagnifierLens(g, outset="bogus")
@@ -0,0 +1,72 @@
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+import numpy as np
+import pytest
+
+from outset import OutsetGrid
+from outset import util as otst_util
+
+
+def _mouse(g: OutsetGrid, name: str, xy: tuple) -> None:
+    x, y = g.source_axes.transData.transform(xy)
+    MouseEvent(name, g.figure.canvas, x, y, button=1)._process()
+
+
+def _drag(g: OutsetGrid, start: tuple, stop: tuple) -> None:
+    _mouse(g, "button_press_event", start)
+    _mouse(g, "motion_notify_event", np.mean([start, stop], axis=0))
+    _mouse(g, "motion_notify_event", stop)
+    _mouse(g, "button_release_event", stop)
+
+
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_MarqueeEditor(grid_engine: str):
+    frames = [(0.2, 0.2, 0.4, 0.4), (0.6, 0.5, 0.8, 0.9)]
+    g = OutsetGrid(frames, grid_engine=grid_engine)
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+    g.figure.canvas.draw()
+
+    editor = otst_util.MarqueeEditor(g)
+    assert np.allclose([*editor.get_frames().values()], frames)
+
+    # move first frame
+    xlim, ylim = g.axes.flat[1].get_xlim(), g.axes.flat[1].get_ylim()
+    _drag(g, (0.3, 0.3), (0.35, 0.25))
+    assert np.allclose(editor.get_frames()[1], (0.25, 0.15, 0.45, 0.35))
+    assert np.allclose(g.axes.flat[1].get_xlim(), np.add(xlim, 0.05))
+    assert np.allclose(g.axes.flat[1].get_ylim(), np.subtract(ylim, 0.05))
+
+    # resize second frame by its top right corner
+    x0, y0, x1, y1 = frames[1]
+    *__, frame = (
+        p for p in g.source_axes.patches if isinstance(p, plt.Rectangle)
+    )
+    (__, __), (px1, py1) = frame.get_bbox().get_points()
+    _drag(g, (px1, py1), (px1 + 0.1, py1 + 0.05))
+    assert np.allclose(editor.get_frames()[2], (x0, y0, x1 + 0.1, y1 + 0.05))
+
+    # exported frames recreate edited figure
+    expected = OutsetGrid(editor.get_frames(), grid_engine=grid_engine)
+    expected.marqueeplot()
+    for patch, expected_patch in zip(
+        g.source_axes.patches, expected.source_axes.patches
+    ):
+        if isinstance(patch, plt.Rectangle):
+            assert np.allclose(
+                patch.get_bbox().get_points(),
+                expected_patch.get_bbox().get_points(),
+            )
+
+    outpath = f"/tmp/test_MarqueeEditor_{grid_engine}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+
+    editor.disconnect()
+    _drag(g, (0.35, 0.25), (0.5, 0.5))  # no longer handled
+    assert np.allclose(editor.get_frames()[1], (0.25, 0.15, 0.45, 0.35))
+
+
+def test_MarqueeEditor_invalid():
+    with pytest.raises(ValueError):
+        otst_util.MarqueeEditor(OutsetGrid(2, include_sourceplot=False))
@@ -0,0 +1,57 @@
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+import pytest
+
+from outset import OutsetGrid
+from outset import util as otst_util
+
+
+def _mouse(g: OutsetGrid, name: str, xy: tuple) -> None:
+    x, y = g.source_axes.transData.transform(xy)
+    MouseEvent(name, g.figure.canvas, x, y, button=1)._process()
+
+
+@pytest.mark.parametrize("tooltip", [True, False])
+def test_MarqueePicker(tooltip: bool):
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3), (0.6, 0.5, 0.7, 0.7)])
+    g.broadcast(plt.plot, [0, 1], [0, 1])
+    g.marqueeplot()
+    g.figure.canvas.draw()
+
+    picks = []
+    picker = otst_util.MarqueePicker(
+        g, lambda key, ax: picks.append((key, ax)), tooltip=tooltip
+    )
+    x, y = g.source_axes.transData.transform((0.25, 0.25))
+    assert picker.query(x, y) == [(1, 1)]
+    x, y = g.source_axes.transData.transform((0.45, 0.45))
+    assert picker.query(x, y) == []
+
+    _mouse(g, "motion_notify_event", (0.65, 0.6))
+    if tooltip:
+        assert picker._tooltip.get_visible()
+        assert picker._tooltip.get_text() == "2"
+    outpath = f"/tmp/test_MarqueePicker_{tooltip}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+    _mouse(g, "motion_notify_event", (0.45, 0.45))
+    if tooltip:
+        assert not picker._tooltip.get_visible()
+
+    _mouse(g, "button_press_event", (0.45, 0.45))
+    assert picker.picked is None and not picks
+    _mouse(g, "button_press_event", (0.65, 0.6))
+    assert picker.picked == (2, 2)
+    assert picks == [((2, 2), g.axes_dict[2])]
+
+    picker.disconnect()
+    _mouse(g, "button_press_event", (0.25, 0.25))
+    assert picker.picked == (2, 2)
+    plt.close(g.figure)
+
+
+def test_MarqueePicker_no_source():
+    g = OutsetGrid([(0.2, 0.2, 0.3, 0.3)], include_sourceplot=False)
+    with pytest.raises(ValueError):
+        otst_util.MarqueePicker(g)
+    plt.close(g.figure)
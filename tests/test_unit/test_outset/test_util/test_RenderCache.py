@@ -0,0 +1,158 @@
+import asyncio
+from concurrent import futures
+import os
+import pickle
+import shutil
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+import seaborn as sns
+
+from outset import aio, render_many
+from outset import util as otst_util
+
+data = pd.DataFrame(
+    {
+        "x": [0.0, 0.5, 1.0, 1.5],
+        "y": [1.2, 0.8, 2.5, 2.3],
+        "outset": ["a", "a", "b", "b"],
+    }
+)
+
+
+def _make_spec(output=None, **kwargs) -> otst_util.RenderSpec:
+    return otst_util.RenderSpec(
+        **{
+            "data": data,
+            "output": output,
+            "calls": [
+                (
+                    "map_dataframe",
+                    sns.scatterplot,
+                    (),
+                    {"x": "x", "y": "y", "legend": False},
+                ),
+            ],
+            "grid_kws": {"x": "x", "y": "y", "col": "outset"},
+            **kwargs,
+        }
+    )
+
+
+@pytest.fixture
+def cache_dir():
+    directory = "/tmp/test_RenderCache"
+    shutil.rmtree(directory, ignore_errors=True)
+    yield directory
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def test_RenderCache_key(cache_dir):
+    cache = otst_util.RenderCache(cache_dir)
+    key = cache.key(_make_spec())
+    assert key == cache.key(_make_spec(data=data.copy()))
+    assert key == cache.key(_make_spec(output="/tmp/foo.png"))
+    assert key != cache.key(_make_spec(output="/tmp/foo.pdf"))
+    assert key != cache.key(_make_spec(), fmt="svg")
+    assert key != cache.key(_make_spec(data=data.assign(y=0.0)))
+    assert key != cache.key(_make_spec(savefig_kws={"dpi": 42}))
+    assert key != cache.key(_make_spec(marqueeplot_kws={"mark_glyph": None}))
+    assert key != cache.key(
+        _make_spec(grid_kws={"x": "x", "y": "y", "col": "outset", "height": 2}),
+    )
+
+
+def test_RenderCache_key_rc(cache_dir):
+    cache = otst_util.RenderCache(cache_dir)
+    with plt.rc_context():
+        key = cache.key(_make_spec())
+        with plt.rc_context({"savefig.directory": "/tmp"}):
+            assert cache.key(_make_spec()) == key  # path-only setting
+        with plt.rc_context({"font.size": 42}):
+            assert cache.key(_make_spec()) != key
+        sns.set_theme(style="whitegrid")
+        assert cache.key(_make_spec()) != key
+
+
+def test_RenderCache_render(cache_dir):
+    cache = otst_util.RenderCache(cache_dir)
+    first = cache.render(_make_spec())
+    assert first.startswith(b"\x89PNG")
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    outpath = "/tmp/test_RenderCache_render.png"
+    assert cache.render(_make_spec(output=outpath)) == outpath
+    assert (cache.hits, cache.misses) == (1, 1)
+    with open(outpath, "rb") as file:
+        assert file.read() == first
+    print(f"saved graphic to {outpath}")
+
+    # cache is shared through directory
+    other = otst_util.RenderCache(cache_dir)
+    assert other.render(_make_spec()) == first
+    assert (other.hits, other.misses) == (1, 0)
+
+    assert pickle.loads(pickle.dumps(cache)).render(_make_spec()) == first
+
+    cache.clear()
+    assert cache.get(cache.key(_make_spec())) is None
+
+
+def test_RenderCache_evict(cache_dir):
+    cache = otst_util.RenderCache(cache_dir, max_bytes=25)
+    for i in range(5):
+        cache.put(f"key{i}", b"0123456789")
+        # distinct mtimes, with most recent put newest
+        os.utime(cache._path(f"key{i}"), (i, i))
+    assert cache.get("key0") is None
+    assert cache.get("key1") is None
+    assert cache.get("key2") is None
+    assert cache.get("key3") == b"0123456789"  # bumps recency
+    cache.put("key5", b"0123456789")
+    assert cache.get("key3") is not None
+    assert cache.get("key4") is None
+    assert cache.get("key5") is not None
+
+    with pytest.raises(ValueError):
+        otst_util.RenderCache(cache_dir, max_bytes=-1)
+
+
+def test_RenderCache_render_many(cache_dir):
+    cache = otst_util.RenderCache(cache_dir)
+    specs = [
+        _make_spec(output=f"/tmp/test_RenderCache_render_many_{i}.png")
+        for i in range(2)
+    ] + [
+        otst_util.RenderSpec(
+            data=2,
+            output="/tmp/test_RenderCache_render_many_frames.png",
+            calls=[("broadcast", plt.plot, ([0, 1], [0, 1]), {})],
+        ),
+    ]
+    first = render_many(specs, cache=cache, max_workers=2)
+    assert (cache.hits, cache.misses) == (0, 3)
+    second = render_many(specs, cache=cache, max_workers=2)
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert all(result.pid == os.getpid() for result in second)
+    assert [r.output for r in first] == [r.output for r in second]
+
+
+def test_RenderCache_aio(cache_dir):
+    cache = otst_util.RenderCache(cache_dir)
+    spec = otst_util.RenderSpec(
+        data=2,
+        output=None,
+        grid_kws={"grid_engine": "gridspec", "pyplot": False},
+    )
+
+    async def main():
+        with futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return [
+                await aio.render(spec, cache=cache, executor=executor)
+                for __ in range(2)
+            ]
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,82 @@
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from outset import OutsetGrid
+from outset import util as otst_util
+
+
+@pytest.mark.parametrize("kind", ["line", "scatter"])
+@pytest.mark.parametrize("grid_engine", ["facetgrid", "gridspec"])
+def test_StreamPlotter(kind: str, grid_engine: str):
+    g = OutsetGrid(
+        [(0.2, 0.2, 0.4, 0.4), (0.6, 0.5, 0.8, 0.9)],
+        grid_engine=grid_engine,
+    )
+    g.marqueeplot()
+    lims = [(ax.get_xlim(), ax.get_ylim()) for ax in g.axes.flat]
+
+    stream = otst_util.StreamPlotter(g, capacity=64, kind=kind)
+    assert len(stream.artists) == len(g.axes.flat)
+    assert lims == [(ax.get_xlim(), ax.get_ylim()) for ax in g.axes.flat]
+
+    t = np.linspace(0, 4 * np.pi, 100)
+    x, y = t / (4 * np.pi), 0.5 + 0.4 * np.sin(t)
+    stream.push(x[0], y[0])
+    assert len(stream) == 1
+    for start in range(1, 100, 7):
+        stream.push(x[start : start + 7], y[start : start + 7])
+        stream.update()
+    assert len(stream) == 64
+    assert np.array_equal(stream.data, np.column_stack((x, y))[-64:])
+
+    # blitted frame matches full redraw, up to antialiasing where streamed
+    # artists are drawn over rather than under spines
+    canvas = g.figure.canvas
+    blitted = np.array(canvas.buffer_rgba())
+    stream.stop()
+    canvas.draw()
+    differs = np.any(blitted != np.array(canvas.buffer_rgba()), axis=-1)
+    assert differs.mean() < 1e-3
+
+    outpath = f"/tmp/test_StreamPlotter_{kind}_{grid_engine}.png"
+    g.savefig(outpath)
+    print(f"saved graphic to {outpath}")
+    plt.close(g.figure)
+
+
+def test_StreamPlotter_frame_rate():
+    g = OutsetGrid([(0.1 * i, 0.1, 0.1 * i + 0.1, 0.2) for i in range(8)])
+    g.marqueeplot()
+    stream = otst_util.StreamPlotter(g, capacity=1000)
+    stream.update()
+
+    rng = np.random.default_rng(1)
+    num_frames, batch_size = 30, 50
+    x = np.linspace(0, 1, num_frames * batch_size).reshape(num_frames, -1)
+    y = 0.5 + np.cumsum(rng.normal(0, 0.01, x.shape)).reshape(x.shape)
+    start = time.perf_counter()
+    for x_batch, y_batch in zip(x, y):
+        stream.push(x_batch, y_batch)
+        stream.update()
+    elapsed = time.perf_counter() - start
+    print(f"streamed {num_frames / elapsed:.1f} fps")
+    plt.close(g.figure)
+
+
+def test_StreamPlotter_invalid():
+    g = OutsetGrid(2)
+    with pytest.raises(ValueError):
+        otst_util.StreamPlotter(g, capacity=0)
+    with pytest.raises(ValueError):
+        otst_util.StreamPlotter(g, capacity=10, kind="bar")
+
+    stream = otst_util.StreamPlotter(g, capacity=10)
+    with pytest.raises(ValueError):
+        stream.push([0, 1], [0])
+    stream.stop()
+    with pytest.raises(ValueError):
+        stream.update()
+    plt.close(g.figure)
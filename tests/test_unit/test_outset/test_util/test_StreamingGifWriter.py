@@ -0,0 +1,44 @@
+from matplotlib import animation as mpl_animation
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+import pytest
+
+from outset import util as otst_util
+
+
+@pytest.mark.parametrize("loop", [0, 2])
+def test_StreamingGifWriter(loop: int):
+    fig, ax = plt.subplots(figsize=(2, 2))
+    (line,) = ax.plot([], [])
+    ax.set_xlim(0, 2 * np.pi)
+    ax.set_ylim(-1, 1)
+    xs = np.linspace(0, 2 * np.pi, 50)
+
+    def update(phase: float) -> list:
+        line.set_data(xs, np.sin(xs + phase))
+        return [line]
+
+    animation = mpl_animation.FuncAnimation(
+        fig, update, frames=np.linspace(0, np.pi, 7), blit=False
+    )
+    outpath = f"/tmp/test_StreamingGifWriter_{loop}.gif"
+    animation.save(
+        outpath, writer=otst_util.StreamingGifWriter(fps=10, loop=loop)
+    )
+    with Image.open(outpath) as im:
+        assert im.n_frames == 7
+        assert im.size == (2 * fig.dpi, 2 * fig.dpi)
+        assert im.info["duration"] == 100
+        assert im.info["loop"] == loop
+    print(f"saved graphic to {outpath}")
+    plt.close(fig)
+
+
+def test_StreamingGifWriter_invalid_kwarg():
+    fig, ax = plt.subplots()
+    writer = otst_util.StreamingGifWriter()
+    with writer.saving(fig, "/tmp/test_StreamingGifWriter_invalid.gif", 50):
+        with pytest.raises(TypeError):
+            writer.grab_frame(dpi=100)
+    plt.close(fig)
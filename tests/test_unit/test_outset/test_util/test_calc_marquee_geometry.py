@@ -0,0 +1,121 @@
+import typing
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from outset import marqueeplot
+from outset import tweak as otst_tweak
+from outset import util as otst_util
+from outset._auxlib.marquee_artists_ import get_marquees
+
+rng = np.random.default_rng(1)
+data = pd.DataFrame(
+    {
+        "x": rng.normal(size=40),
+        "y": rng.normal(size=40),
+        "outset": np.repeat(["A", "B"], 20),
+        "hue": np.tile(["p", "q"], 20),
+    }
+)
+
+
+def _assert_matches(geometry: otst_util.MarqueeGeometry, ax: plt.Axes) -> None:
+    marquees = get_marquees(ax)
+    assert len(geometry) == len(marquees)
+    assert geometry.keys == [marquee.key for marquee in marquees]
+    for actual, expected in (
+        (geometry.frame_xlim, [m.frame_xlim for m in marquees]),
+        (geometry.frame_ylim, [m.frame_ylim for m in marquees]),
+        (
+            geometry.leader_vertices,
+            [m.leader_patches[-1].get_xy()[:-1] for m in marquees],
+        ),
+        (geometry.mark_xy, [m.mark_xy for m in marquees]),
+        (geometry.xlim, ax.get_xlim()),
+        (geometry.ylim, ax.get_ylim()),
+    ):
+        assert np.allclose(actual, np.reshape(expected, np.shape(actual)))
+
+
+@pytest.mark.parametrize("prior_plot", [False, True])
+@pytest.mark.parametrize(
+    "kws",
+    [
+        {"outset": "outset"},
+        {"outset": "outset", "hue": "hue"},
+        {"hue": "outset", "outset": "outset", "preserve_aspect": True},
+        {
+            "outset": "outset",
+            "outset_order": ["B", "A"],
+            "frame_outer_pad": (0.2, 0.1),
+            "frame_outer_pad_unit": "inches",
+            "leader_stretch": 0.1,
+            "leader_stretch_unit": "axes",
+        },
+        {
+            "outset": "outset",
+            "frame_outer_pad_unit": "figure",
+            "leader_stretch_unit": "inchesfrom",
+            "leader_tweak": otst_tweak.TweakReflect(vertical=True),
+            "tight_axlim": True,
+        },
+    ],
+)
+def test_calc_marquee_geometry(
+    kws: typing.Dict[str, typing.Any], prior_plot: bool
+):
+    fig, ax = plt.subplots()
+    if prior_plot:
+        ax.scatter(data["x"], data["y"])
+
+    geometry = otst_util.calc_marquee_geometry(data, x="x", y="y", ax=ax, **kws)
+    assert len(ax.get_children()) == 10 + prior_plot  # no artists created
+    marqueeplot(data, x="x", y="y", ax=ax, **kws)
+    _assert_matches(geometry, ax)
+    plt.close(fig)
+
+
+def test_calc_marquee_geometry_no_axes():
+    geometry = otst_util.calc_marquee_geometry(
+        data.to_dict("list"), x="x", y="y", outset="outset"
+    )
+    assert len(plt.get_fignums()) == 0  # no figure created
+
+    fig, ax = plt.subplots()
+    marqueeplot(data, x="x", y="y", outset="outset", ax=ax)
+    _assert_matches(geometry, ax)
+    plt.close(fig)
+
+
+def test_calc_marquee_geometry_overrides():
+    geometry = otst_util.calc_marquee_geometry(
+        data, x="x", y="y", xlim=(-10, 10), ylim=(-5, 5), axes_size=(4, 2)
+    )
+    assert geometry.keys == [(None, None)]
+    assert geometry.xlim.tolist() == [-10, 10]
+    assert geometry.ylim.tolist() == [-5, 5]
+
+    # leader stretch is in inches, so spans fewer data units on larger axes
+    large = otst_util.calc_marquee_geometry(
+        data, x="x", y="y", xlim=(-10, 10), ylim=(-5, 5), axes_size=(8, 4)
+    )
+    assert np.allclose(large.frame_xlim, geometry.frame_xlim)
+    (offset,) = np.diff(geometry.leader_vertices[0, 2:, 0])
+    assert np.isclose(*np.diff(large.leader_vertices[0, 2:, 0]), offset / 2)
+
+
+def test_calc_marquee_geometry_invalid():
+    with pytest.raises(ValueError):
+        otst_util.calc_marquee_geometry(data, x="x", y="z")
+    with pytest.raises(ValueError):
+        otst_util.calc_marquee_geometry(data.assign(y=np.nan), x="x", y="y")
+    with pytest.raises(ValueError):
+        otst_util.calc_marquee_geometry(
+            data, x="x", y="y", frame_outer_pad_unit="bad"
+        )
+    with pytest.raises(ValueError):
+        otst_util.calc_marquee_geometry(
+            data, x="x", y="y", leader_stretch_unit="bad"
+        )